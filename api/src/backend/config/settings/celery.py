@@ -11,3 +11,6 @@ CELERY_TASK_TRACK_STARTED = True
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 
 CELERY_DEADLOCK_ATTEMPTS = env.int("DJANGO_CELERY_DEADLOCK_ATTEMPTS", default=5)
+
+# Number of shards of services every scan is split into, run in parallel by the scan workers
+CELERY_SCAN_SHARDS = env.int("DJANGO_CELERY_SCAN_SHARDS", default=1)
@@ -442,7 +442,7 @@ def send_findings_to_jira(
         integration = Integration.objects.get(id=integration_id)
         jira_integration = initialize_prowler_integration(integration)
 
-    num_tickets_created = 0
+    findings = []
     for finding_id in finding_ids:
         with rls_transaction(tenant_id):
             finding_instance = (
@@ -472,35 +472,45 @@ def send_findings_to_jira(
             recommendation = remediation.get("recommendation", {})
             remediation_code = remediation.get("code", {})
 
-            # Send the individual finding to Jira
-            result = jira_integration.send_finding(
-                check_id=finding_instance.check_id,
-                check_title=check_metadata.get("checktitle", ""),
-                severity=finding_instance.severity,
-                status=finding_instance.status,
-                status_extended=finding_instance.status_extended or "",
-                provider=finding_instance.scan.provider.provider,
-                region=region,
-                resource_uid=resource_uid,
-                resource_name=resource_name,
-                risk=check_metadata.get("risk", ""),
-                recommendation_text=recommendation.get("text", ""),
-                recommendation_url=recommendation.get("url", ""),
-                remediation_code_native_iac=remediation_code.get("nativeiac", ""),
-                remediation_code_terraform=remediation_code.get("terraform", ""),
-                remediation_code_cli=remediation_code.get("cli", ""),
-                remediation_code_other=remediation_code.get("other", ""),
-                resource_tags=resource_tags,
-                compliance=finding_instance.compliance or {},
-                project_key=project_key,
-                issue_type=issue_type,
+            findings.append(
+                {
+                    "finding_uid": finding_instance.uid,
+                    "check_id": finding_instance.check_id,
+                    "check_title": check_metadata.get("checktitle", ""),
+                    "severity": finding_instance.severity,
+                    "status": finding_instance.status,
+                    "status_extended": finding_instance.status_extended or "",
+                    "provider": finding_instance.scan.provider.provider,
+                    "region": region,
+                    "resource_uid": resource_uid,
+                    "resource_name": resource_name,
+                    "risk": check_metadata.get("risk", ""),
+                    "recommendation_text": recommendation.get("text", ""),
+                    "recommendation_url": recommendation.get("url", ""),
+                    "remediation_code_native_iac": remediation_code.get(
+                        "nativeiac", ""
+                    ),
+                    "remediation_code_terraform": remediation_code.get("terraform", ""),
+                    "remediation_code_cli": remediation_code.get("cli", ""),
+                    "remediation_code_other": remediation_code.get("other", ""),
+                    "resource_tags": resource_tags,
+                    "compliance": finding_instance.compliance or {},
+                }
             )
-            if result:
-                num_tickets_created += 1
-            else:
-                logger.error(f"Failed to send finding {finding_id} to Jira")
 
-    return {
-        "created_count": num_tickets_created,
-        "failed_count": len(finding_ids) - num_tickets_created,
-    }
+    # The issues are created in bulk, skipping the findings that already have an open issue
+    try:
+        result = jira_integration.send_findings_bulk(
+            findings=findings, project_key=project_key, issue_type=issue_type
+        )
+    except Exception as error:
+        logger.error(f"Failed to send findings to Jira: {error}")
+        return {
+            "created_count": 0,
+            "failed_count": len(finding_ids),
+            "skipped_count": 0,
+        }
+
+    if result["failed_count"]:
+        logger.error(f"Failed to send {result['failed_count']} findings to Jira")
+    return result
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from celery.utils.log import get_task_logger
 from config.settings.celery import CELERY_DEADLOCK_ATTEMPTS
 from django.db import IntegrityError, OperationalError
-from django.db.models import Case, Count, IntegerField, Prefetch, Sum, When
+from django.db.models import Case, Count, IntegerField, Prefetch, Q, Sum, When
 from tasks.utils import CustomEncoder
 
 from api.compliance import (
@@ -35,8 +35,11 @@ from api.models import (
 from api.models import StatusChoices as FindingStatus
 from api.utils import initialize_prowler_provider, return_prowler_provider
 from api.v1.serializers import ScanTaskSerializer
+from prowler.lib.check.checks_loader import load_checks_to_execute
+from prowler.lib.check.models import CheckMetadata
 from prowler.lib.outputs.finding import Finding as ProwlerFinding
 from prowler.lib.scan.scan import Scan as ProwlerScan
+from prowler.lib.scan.scan import get_service_checks_to_execute
 
 logger = get_task_logger(__name__)
 
@@ -112,6 +115,7 @@ def perform_prowler_scan(
     scan_id: str,
     provider_id: str,
     checks_to_execute: list[str] | None = None,
+    shard: bool = False,
 ):
     """
     Perform a scan using Prowler and store the findings and resources in the database.
@@ -121,9 +125,12 @@ def perform_prowler_scan(
         scan_id (str): The ID of the scan instance.
         provider_id (str): The ID of the provider to scan.
         checks_to_execute (list[str], optional): A list of specific checks to execute. Defaults to None.
+        shard (bool, optional): Whether the checks are a shard of a sharded scan. Shards only store their findings
+            and resources, the state, progress and resource counts of the scan are set by `finalize_sharded_scan`
+            once every shard has finished. Defaults to False.
 
     Returns:
-        dict: Serialized data of the completed scan instance.
+        dict: Serialized data of the completed scan instance, or the number of findings and resources of the shard.
 
     Raises:
         ValueError: If the provider cannot be connected.
@@ -138,9 +145,10 @@ def perform_prowler_scan(
     with rls_transaction(tenant_id):
         provider_instance = Provider.objects.get(pk=provider_id)
         scan_instance = Scan.objects.get(pk=scan_id)
-        scan_instance.state = StateChoices.EXECUTING
-        scan_instance.started_at = datetime.now(tz=timezone.utc)
-        scan_instance.save()
+        if not shard:
+            scan_instance.state = StateChoices.EXECUTING
+            scan_instance.started_at = datetime.now(tz=timezone.utc)
+            scan_instance.save()
 
     # Find the mutelist processor if it exists
     with rls_transaction(tenant_id):
@@ -184,6 +192,7 @@ def perform_prowler_scan(
         tag_cache = {}
         last_status_cache = {}
         resource_failed_findings_cache = defaultdict(int)
+        findings_count = 0
 
         for progress, findings in prowler_scan.scan():
             for finding in findings:
@@ -324,6 +333,7 @@ def perform_prowler_scan(
                         compliance=finding.compliance,
                     )
                     finding_instance.add_resources([resource_instance])
+                    findings_count += 1
 
                     # Increment failed_findings_count cache if the finding status is FAIL and not muted
                     if status == FindingStatus.FAIL and not finding.muted:
@@ -340,15 +350,17 @@ def perform_prowler_scan(
                     )
                 )
 
-            # Update scan progress
-            with rls_transaction(tenant_id):
-                scan_instance.progress = progress
-                scan_instance.save()
+            # Update scan progress, the shards do not since they run in parallel
+            if not shard:
+                with rls_transaction(tenant_id):
+                    scan_instance.progress = progress
+                    scan_instance.save()
 
         scan_instance.state = StateChoices.COMPLETED
 
         # Update failed_findings_count for all resources in batches if scan completed successfully
-        if resource_failed_findings_cache:
+        # The resources of a sharded scan can have findings in several shards, so it is updated once all finish
+        if resource_failed_findings_cache and not shard:
             resources_to_update = []
             for resource_uid, failed_count in resource_failed_findings_cache.items():
                 if resource_uid in resource_cache:
@@ -371,11 +383,12 @@ def perform_prowler_scan(
         scan_instance.state = StateChoices.FAILED
 
     finally:
-        with rls_transaction(tenant_id):
-            scan_instance.duration = time.time() - start_time
-            scan_instance.completed_at = datetime.now(tz=timezone.utc)
-            scan_instance.unique_resource_count = len(unique_resources)
-            scan_instance.save()
+        if not shard:
+            with rls_transaction(tenant_id):
+                scan_instance.duration = time.time() - start_time
+                scan_instance.completed_at = datetime.now(tz=timezone.utc)
+                scan_instance.unique_resource_count = len(unique_resources)
+                scan_instance.save()
 
     if exception is not None:
         raise exception
@@ -404,6 +417,127 @@ def perform_prowler_scan(
             f"Error storing filter values for scan {scan_id}: {filter_exception}"
         )
 
+    if shard:
+        return {"findings": findings_count, "resources": len(unique_resources)}
+
+    serializer = ScanTaskSerializer(instance=scan_instance)
+    return serializer.data
+
+
+def get_scan_shards(
+    provider_type: str, shard_count: int, checks_to_execute: list[str] | None = None
+) -> list[list[str]]:
+    """
+    Split the checks of a scan into shards of whole services with a similar number of checks.
+
+    The checks are the ones an unsharded scan would execute. The checks of a service are never split across shards,
+    so every service is only loaded by one of them.
+
+    Args:
+        provider_type (str): The type of the provider to scan, e.g. aws.
+        shard_count (int): The maximum number of shards.
+        checks_to_execute (list[str], optional): A list of specific checks to execute. Defaults to None.
+
+    Returns:
+        list[list[str]]: The sorted checks of every shard, without empty shards.
+    """
+    checks = load_checks_to_execute(
+        provider=provider_type,
+        bulk_checks_metadata=CheckMetadata.get_bulk(provider_type),
+        check_list=checks_to_execute,
+    )
+    shards = [[] for _ in range(max(shard_count, 1))]
+    service_checks = get_service_checks_to_execute(checks)
+    # Assign the services with more checks first to the shard with less checks
+    for service in sorted(
+        service_checks, key=lambda service: (-len(service_checks[service]), service)
+    ):
+        min(shards, key=len).extend(service_checks[service])
+    return [sorted(shard) for shard in shards if shard]
+
+
+def start_sharded_scan(tenant_id: str, scan_id: str):
+    """
+    Mark a sharded scan as executing before its shards are dispatched.
+
+    Args:
+        tenant_id (str): The ID of the tenant for which the scan is performed.
+        scan_id (str): The ID of the scan instance.
+    """
+    with rls_transaction(tenant_id):
+        scan_instance = Scan.objects.get(pk=scan_id)
+        scan_instance.state = StateChoices.EXECUTING
+        scan_instance.started_at = datetime.now(tz=timezone.utc)
+        scan_instance.progress = 0
+        scan_instance.save()
+
+
+def finalize_sharded_scan(tenant_id: str, scan_id: str, shard_results: list[dict]):
+    """
+    Complete a sharded scan once all its shards have finished.
+
+    It sets the failed_findings_count of the resources of the scan from the findings of all the shards, since a
+    resource can have findings in several of them, and the state, progress, duration and unique resource count of
+    the scan.
+
+    Args:
+        tenant_id (str): The ID of the tenant for which the scan is performed.
+        scan_id (str): The ID of the scan instance.
+        shard_results (list[dict]): The results of the shards, with an `error` key for the shards that failed.
+
+    Returns:
+        dict: Serialized data of the completed scan instance.
+
+    Raises:
+        ValueError: If any of the shards failed.
+    """
+    shard_errors = [result["error"] for result in shard_results if "error" in result]
+
+    with rls_transaction(tenant_id):
+        scan_instance = Scan.objects.get(pk=scan_id)
+        resources_to_update = list(
+            Resource.objects.filter(
+                tenant_id=tenant_id, findings__scan_id=scan_id
+            ).annotate(
+                scan_failed_findings_count=Count(
+                    "findings",
+                    filter=Q(
+                        findings__status=FindingStatus.FAIL, findings__muted=False
+                    ),
+                )
+            )
+        )
+    for resource_instance in resources_to_update:
+        resource_instance.failed_findings_count = (
+            resource_instance.scan_failed_findings_count
+        )
+    if resources_to_update and not shard_errors:
+        update_objects_in_batches(
+            tenant_id=tenant_id,
+            model=Resource,
+            objects=resources_to_update,
+            fields=["failed_findings_count"],
+            batch_size=1000,
+        )
+
+    with rls_transaction(tenant_id):
+        if shard_errors:
+            scan_instance.state = StateChoices.FAILED
+        else:
+            scan_instance.state = StateChoices.COMPLETED
+            scan_instance.progress = 100
+        scan_instance.completed_at = datetime.now(tz=timezone.utc)
+        scan_instance.duration = (
+            scan_instance.completed_at - scan_instance.started_at
+        ).total_seconds()
+        scan_instance.unique_resource_count = len(resources_to_update)
+        scan_instance.save()
+
+    if shard_errors:
+        raise ValueError(
+            f"{len(shard_errors)} shards of scan {scan_id} failed: {'; '.join(shard_errors)}"
+        )
+
     serializer = ScanTaskSerializer(instance=scan_instance)
     return serializer.data
 
@@ -2,10 +2,11 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from shutil import rmtree
 
-from celery import chain, group, shared_task
+from celery import chain, chord, group, shared_task
 from celery.utils.log import get_task_logger
 from config.celery import RLSTask
 from config.django.base import DJANGO_FINDINGS_BATCH_SIZE, DJANGO_TMP_OUTPUT_DIRECTORY
+from config.settings.celery import CELERY_SCAN_SHARDS
 from django_celery_beat.models import PeriodicTask
 from tasks.jobs.backfill import backfill_resource_scan_summaries
 from tasks.jobs.connection import (
@@ -29,7 +30,10 @@ from tasks.jobs.integrations import (
 from tasks.jobs.scan import (
     aggregate_findings,
     create_compliance_requirements,
+    finalize_sharded_scan,
+    get_scan_shards,
     perform_prowler_scan,
+    start_sharded_scan,
 )
 from tasks.utils import batched, get_next_execution_datetime
 
@@ -71,6 +75,54 @@ def _perform_scan_complete_tasks(tenant_id: str, scan_id: str, provider_id: str)
     ).apply_async()
 
 
+def _get_sharded_scan(
+    tenant_id: str,
+    scan_id: str,
+    provider_id: str,
+    checks_to_execute: list[str] = None,
+):
+    """
+    Helper function to split a scan into shards of services run in parallel as a chord.
+
+    The shards store their findings under the same scan, and the chord callback completes the scan and performs the
+    tasks after a scan is completed once all of them have finished. The scan task must be replaced with the chord, so
+    the callback inherits its task ID and the scan task is only completed once the scan is.
+
+    Args:
+        tenant_id (str): The tenant ID under which the scan is being performed.
+        scan_id (str): The ID of the scan to be performed.
+        provider_id (str): The primary key of the Provider instance to scan.
+        checks_to_execute (list[str], optional): A list of specific checks to perform during the scan. Defaults to None.
+
+    Returns:
+        chord: The chord of the shards, or None if the scan does not have more than one shard.
+    """
+    if CELERY_SCAN_SHARDS <= 1:
+        return None
+
+    with rls_transaction(tenant_id):
+        provider_type = Provider.objects.get(pk=provider_id).provider
+    shards = get_scan_shards(provider_type, CELERY_SCAN_SHARDS, checks_to_execute)
+    if len(shards) <= 1:
+        return None
+
+    start_sharded_scan(tenant_id=tenant_id, scan_id=scan_id)
+    return chord(
+        group(
+            perform_scan_shard_task.si(
+                tenant_id=tenant_id,
+                scan_id=scan_id,
+                provider_id=provider_id,
+                checks_to_execute=shard,
+            )
+            for shard in shards
+        ),
+        finalize_sharded_scan_task.s(
+            tenant_id=tenant_id, scan_id=scan_id, provider_id=provider_id
+        ),
+    )
+
+
 @shared_task(base=RLSTask, name="provider-connection-check")
 @set_tenant
 def check_provider_connection_task(provider_id: str):
@@ -122,9 +174,13 @@ def delete_provider_task(provider_id: str, tenant_id: str):
     return delete_provider(tenant_id=tenant_id, pk=provider_id)
 
 
-@shared_task(base=RLSTask, name="scan-perform", queue="scans")
+@shared_task(base=RLSTask, bind=True, name="scan-perform", queue="scans")
 def perform_scan_task(
-    tenant_id: str, scan_id: str, provider_id: str, checks_to_execute: list[str] = None
+    self,
+    tenant_id: str,
+    scan_id: str,
+    provider_id: str,
+    checks_to_execute: list[str] = None,
 ):
     """
     Task to perform a Prowler scan on a given provider.
@@ -134,6 +190,7 @@ def perform_scan_task(
     for tracking purposes.
 
     Args:
+        self: The task instance (automatically passed when bind=True).
         tenant_id (str): The tenant ID under which the scan is being performed.
         scan_id (str): The ID of the scan to be performed.
         provider_id (str): The primary key of the Provider instance to scan.
@@ -141,7 +198,13 @@ def perform_scan_task(
 
     Returns:
         dict: The result of the scan execution, typically including the status and results of the performed checks.
+            If the scan is split into shards (see `DJANGO_CELERY_SCAN_SHARDS`), the task is replaced with the shards
+            and completes with the result of the last step, once all of them have finished.
     """
+    sharded_scan = _get_sharded_scan(tenant_id, scan_id, provider_id, checks_to_execute)
+    if sharded_scan:
+        return self.replace(sharded_scan)
+
     result = perform_prowler_scan(
         tenant_id=tenant_id,
         scan_id=scan_id,
@@ -154,6 +217,62 @@ def perform_scan_task(
     return result
 
 
+@shared_task(base=RLSTask, name="scan-perform-shard", queue="scans")
+def perform_scan_shard_task(
+    tenant_id: str, scan_id: str, provider_id: str, checks_to_execute: list[str]
+):
+    """
+    Task to perform a shard of a sharded Prowler scan.
+
+    The errors are returned instead of raised so the chord callback always runs and marks the scan as failed.
+
+    Args:
+        tenant_id (str): The tenant ID under which the scan is being performed.
+        scan_id (str): The ID of the scan the shard belongs to.
+        provider_id (str): The primary key of the Provider instance to scan.
+        checks_to_execute (list[str]): The checks of the shard.
+
+    Returns:
+        dict: The number of findings and resources of the shard, or the error if it failed.
+    """
+    try:
+        return perform_prowler_scan(
+            tenant_id=tenant_id,
+            scan_id=scan_id,
+            provider_id=provider_id,
+            checks_to_execute=checks_to_execute,
+            shard=True,
+        )
+    except Exception as e:
+        logger.error(f"Error performing a shard of scan {scan_id}: {e}")
+        return {"error": str(e)}
+
+
+@shared_task(base=RLSTask, name="scan-finalize-shards", queue="scans")
+def finalize_sharded_scan_task(
+    shard_results: list[dict], tenant_id: str, scan_id: str, provider_id: str
+):
+    """
+    Task to complete a sharded Prowler scan once all its shards have finished.
+
+    Args:
+        shard_results (list[dict]): The results of the shards, passed by the chord.
+        tenant_id (str): The tenant ID under which the scan was performed.
+        scan_id (str): The ID of the scan that was performed.
+        provider_id (str): The primary key of the Provider instance that was scanned.
+
+    Returns:
+        dict: The result of the scan execution.
+    """
+    result = finalize_sharded_scan(
+        tenant_id=tenant_id, scan_id=scan_id, shard_results=shard_results
+    )
+
+    _perform_scan_complete_tasks(tenant_id, scan_id, provider_id)
+
+    return result
+
+
 @shared_task(base=RLSTask, bind=True, name="scan-perform-scheduled", queue="scans")
 def perform_scheduled_scan_task(self, tenant_id: str, provider_id: str):
     """
@@ -235,6 +354,10 @@ def perform_scheduled_scan_task(self, tenant_id: str, provider_id: str):
         scan_instance.save()
 
     try:
+        sharded_scan = _get_sharded_scan(tenant_id, str(scan_instance.id), provider_id)
+        if sharded_scan:
+            # The last step of the shards performs the tasks after the scan is completed
+            return self.replace(sharded_scan)
         result = perform_prowler_scan(
             tenant_id=tenant_id,
             scan_id=str(scan_instance.id),
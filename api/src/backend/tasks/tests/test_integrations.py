@@ -1573,7 +1573,7 @@ class TestJiraIntegration:
         mock_finding_model,
         mock_rls_transaction,
     ):
-        """Test successful sending of findings to Jira using send_finding method"""
+        """Test successful sending of findings to Jira using send_findings_bulk method"""
         tenant_id = "tenant-123"
         integration_id = "integration-456"
         project_key = "PROJ"
@@ -1590,7 +1590,11 @@ class TestJiraIntegration:
 
         # Mock Jira integration
         mock_jira_integration = MagicMock()
-        mock_jira_integration.send_finding.side_effect = [True, True]  # Both succeed
+        mock_jira_integration.send_findings_bulk.return_value = {
+            "created_count": 2,
+            "failed_count": 0,
+            "skipped_count": 0,
+        }
         mock_initialize_integration.return_value = mock_jira_integration
 
         # Mock findings with resources
@@ -1608,6 +1612,7 @@ class TestJiraIntegration:
 
         finding1 = MagicMock()
         finding1.id = "finding-1"
+        finding1.uid = "prowler-aws-check_001-resource-uid-1"
         finding1.check_id = "check_001"
         finding1.severity = "high"
         finding1.status = "FAIL"
@@ -1665,32 +1670,35 @@ class TestJiraIntegration:
         )
 
         # Assertions
-        assert result == {"created_count": 2, "failed_count": 0}
+        assert result == {"created_count": 2, "failed_count": 0, "skipped_count": 0}
 
         # Verify Jira integration was initialized
         mock_initialize_integration.assert_called_once_with(integration)
 
-        # Verify send_finding was called twice with correct parameters
-        assert mock_jira_integration.send_finding.call_count == 2
-
-        # Verify first call
-        first_call = mock_jira_integration.send_finding.call_args_list[0]
-        assert first_call.kwargs["check_id"] == "check_001"
-        assert first_call.kwargs["check_title"] == "Check Title 1"
-        assert first_call.kwargs["severity"] == "high"
-        assert first_call.kwargs["status"] == "FAIL"
-        assert first_call.kwargs["resource_uid"] == "resource-uid-1"
-        assert first_call.kwargs["resource_name"] == "resource-name-1"
-        assert first_call.kwargs["region"] == "us-east-1"
-        assert first_call.kwargs["provider"] == "aws"
-        assert first_call.kwargs["project_key"] == project_key
-        assert first_call.kwargs["issue_type"] == issue_type
-
-        # Verify second call
-        second_call = mock_jira_integration.send_finding.call_args_list[1]
-        assert second_call.kwargs["check_id"] == "check_002"
-        assert second_call.kwargs["severity"] == "medium"
-        assert second_call.kwargs["status"] == "PASS"
+        # Verify send_findings_bulk was called once with both findings
+        mock_jira_integration.send_findings_bulk.assert_called_once()
+        call_kwargs = mock_jira_integration.send_findings_bulk.call_args.kwargs
+        assert call_kwargs["project_key"] == project_key
+        assert call_kwargs["issue_type"] == issue_type
+        assert len(call_kwargs["findings"]) == 2
+
+        # Verify first finding
+        first_finding = call_kwargs["findings"][0]
+        assert first_finding["finding_uid"] == "prowler-aws-check_001-resource-uid-1"
+        assert first_finding["check_id"] == "check_001"
+        assert first_finding["check_title"] == "Check Title 1"
+        assert first_finding["severity"] == "high"
+        assert first_finding["status"] == "FAIL"
+        assert first_finding["resource_uid"] == "resource-uid-1"
+        assert first_finding["resource_name"] == "resource-name-1"
+        assert first_finding["region"] == "us-east-1"
+        assert first_finding["provider"] == "aws"
+
+        # Verify second finding
+        second_finding = call_kwargs["findings"][1]
+        assert second_finding["check_id"] == "check_002"
+        assert second_finding["severity"] == "medium"
+        assert second_finding["status"] == "PASS"
 
     @patch("tasks.jobs.integrations.rls_transaction")
     @patch("tasks.jobs.integrations.Finding")
@@ -1722,11 +1730,11 @@ class TestJiraIntegration:
 
         # Mock Jira integration with mixed results
         mock_jira_integration = MagicMock()
-        mock_jira_integration.send_finding.side_effect = [
-            True,
-            False,
-            True,
-        ]  # Second fails
+        mock_jira_integration.send_findings_bulk.return_value = {
+            "created_count": 2,
+            "failed_count": 1,
+            "skipped_count": 0,
+        }  # One of them fails
         mock_initialize_integration.return_value = mock_jira_integration
 
         # Mock findings (simplified for this test)
@@ -1759,10 +1767,10 @@ class TestJiraIntegration:
         )
 
         # Assertions
-        assert result == {"created_count": 2, "failed_count": 1}
+        assert result == {"created_count": 2, "failed_count": 1, "skipped_count": 0}
 
         # Verify error was logged for the failed finding
-        mock_logger.error.assert_called_with("Failed to send finding finding-2 to Jira")
+        mock_logger.error.assert_called_with("Failed to send 1 findings to Jira")
 
     @patch("tasks.jobs.integrations.rls_transaction")
     @patch("tasks.jobs.integrations.Finding")
@@ -1792,7 +1800,11 @@ class TestJiraIntegration:
 
         # Mock Jira integration
         mock_jira_integration = MagicMock()
-        mock_jira_integration.send_finding.return_value = True
+        mock_jira_integration.send_findings_bulk.return_value = {
+            "created_count": 1,
+            "failed_count": 0,
+            "skipped_count": 0,
+        }
         mock_initialize_integration.return_value = mock_jira_integration
 
         # Mock finding without resources
@@ -1833,10 +1845,12 @@ class TestJiraIntegration:
         )
 
         # Assertions
-        assert result == {"created_count": 1, "failed_count": 0}
+        assert result == {"created_count": 1, "failed_count": 0, "skipped_count": 0}
 
-        # Verify send_finding was called with empty resource fields
-        call_kwargs = mock_jira_integration.send_finding.call_args.kwargs
+        # Verify the finding was sent with empty resource fields
+        call_kwargs = mock_jira_integration.send_findings_bulk.call_args.kwargs[
+            "findings"
+        ][0]
         assert call_kwargs["resource_uid"] == ""
         assert call_kwargs["resource_name"] == ""
         assert call_kwargs["resource_tags"] == {}
@@ -1870,7 +1884,11 @@ class TestJiraIntegration:
 
         # Mock Jira integration
         mock_jira_integration = MagicMock()
-        mock_jira_integration.send_finding.return_value = True
+        mock_jira_integration.send_findings_bulk.return_value = {
+            "created_count": 1,
+            "failed_count": 0,
+            "skipped_count": 0,
+        }
         mock_initialize_integration.return_value = mock_jira_integration
 
         # Mock finding with minimal/empty check_metadata
@@ -1896,10 +1914,12 @@ class TestJiraIntegration:
         )
 
         # Assertions
-        assert result == {"created_count": 1, "failed_count": 0}
+        assert result == {"created_count": 1, "failed_count": 0, "skipped_count": 0}
 
-        # Verify send_finding was called with default/empty values
-        call_kwargs = mock_jira_integration.send_finding.call_args.kwargs
+        # Verify the finding was sent with default/empty values
+        call_kwargs = mock_jira_integration.send_findings_bulk.call_args.kwargs[
+            "findings"
+        ][0]
         assert call_kwargs["check_title"] == ""
         assert call_kwargs["risk"] == ""
         assert call_kwargs["recommendation_text"] == ""
@@ -1909,3 +1929,41 @@ class TestJiraIntegration:
         assert call_kwargs["remediation_code_cli"] == ""
         assert call_kwargs["remediation_code_other"] == ""
         assert call_kwargs["compliance"] == {}
+
+    @patch("tasks.jobs.integrations.rls_transaction")
+    @patch("tasks.jobs.integrations.Finding")
+    @patch("tasks.jobs.integrations.Integration")
+    @patch("tasks.jobs.integrations.initialize_prowler_integration")
+    @patch("tasks.jobs.integrations.logger")
+    def test_send_findings_to_jira_bulk_error(
+        self,
+        mock_logger,
+        mock_initialize_integration,
+        mock_integration_model,
+        mock_finding_model,
+        mock_rls_transaction,
+    ):
+        """Test that all the findings are failed when the bulk creation raises"""
+        mock_rls_transaction.return_value.__enter__ = MagicMock()
+        mock_rls_transaction.return_value.__exit__ = MagicMock()
+        mock_integration_model.objects.get.return_value = MagicMock()
+
+        mock_jira_integration = MagicMock()
+        mock_jira_integration.send_findings_bulk.side_effect = Exception(
+            "Invalid project key"
+        )
+        mock_initialize_integration.return_value = mock_jira_integration
+
+        finding = MagicMock()
+        finding.resources.exists.return_value = False
+        finding.check_metadata = {}
+        mock_finding_model.all_objects.select_related.return_value.prefetch_related.return_value.get.return_value = finding
+
+        result = send_findings_to_jira(
+            "tenant-123", "integration-456", "PROJ", "Task", ["finding-1", "finding-2"]
+        )
+
+        assert result == {"created_count": 0, "failed_count": 2, "skipped_count": 0}
+        mock_logger.error.assert_called_with(
+            "Failed to send findings to Jira: Invalid project key"
+        )
@@ -8,13 +8,17 @@ from tasks.jobs.scan import (
     _create_finding_delta,
     _store_resources,
     create_compliance_requirements,
+    finalize_sharded_scan,
+    get_scan_shards,
     perform_prowler_scan,
 )
 from tasks.utils import CustomEncoder
 
 from api.exceptions import ProviderConnectionError
 from api.models import Finding, Provider, Resource, Scan, StateChoices, StatusChoices
-from prowler.lib.check.models import Severity
+from prowler.lib.check.checks_loader import load_checks_to_execute
+from prowler.lib.check.models import CheckMetadata, Severity
+from prowler.lib.scan.scan import get_service_name_from_check_name
 
 
 @pytest.mark.django_db
@@ -1045,3 +1049,100 @@ class TestCreateComplianceRequirements:
 
             assert "requirements_created" in result
             assert result["requirements_created"] >= 0
+
+
+class TestGetScanShards:
+    def test_get_scan_shards(self):
+        shards = get_scan_shards("aws", 4)
+
+        assert len(shards) == 4
+        # The shards have the checks of an unsharded scan
+        checks = [check for shard in shards for check in shard]
+        assert len(checks) == len(set(checks))
+        assert set(checks) == load_checks_to_execute(
+            provider="aws", bulk_checks_metadata=CheckMetadata.get_bulk("aws")
+        )
+        # The checks of a service are in only one shard
+        shard_services = [
+            {get_service_name_from_check_name(check) for check in shard}
+            for shard in shards
+        ]
+        for index, services in enumerate(shard_services):
+            for other_services in shard_services[index + 1 :]:
+                assert not services & other_services
+
+    def test_get_scan_shards_checks_to_execute(self):
+        shards = get_scan_shards(
+            "aws",
+            4,
+            [
+                "s3_bucket_default_encryption",
+                "s3_bucket_public_access",
+                "iam_root_mfa_enabled",
+            ],
+        )
+
+        assert shards == [
+            ["s3_bucket_default_encryption", "s3_bucket_public_access"],
+            ["iam_root_mfa_enabled"],
+        ]
+
+    def test_get_scan_shards_one_shard(self):
+        shards = get_scan_shards(
+            "aws", 1, ["s3_bucket_default_encryption", "iam_root_mfa_enabled"]
+        )
+
+        assert shards == [["iam_root_mfa_enabled", "s3_bucket_default_encryption"]]
+
+
+@pytest.mark.django_db
+class TestFinalizeShardedScan:
+    def test_finalize_sharded_scan(
+        self, tenants_fixture, scans_fixture, findings_fixture
+    ):
+        tenant = tenants_fixture[0]
+        scan = scans_fixture[0]
+        resources = {
+            resource
+            for finding in findings_fixture
+            for resource in finding.resources.all()
+        }
+
+        finalize_sharded_scan(
+            str(tenant.id),
+            str(scan.id),
+            [{"findings": 1, "resources": 1}, {"findings": 1, "resources": 1}],
+        )
+
+        scan.refresh_from_db()
+        assert scan.state == StateChoices.COMPLETED
+        assert scan.progress == 100
+        assert scan.completed_at is not None
+        assert scan.duration is not None
+        assert scan.unique_resource_count == len(resources)
+        for resource in resources:
+            resource.refresh_from_db()
+            assert (
+                resource.failed_findings_count
+                == Finding.objects.filter(
+                    scan=scan,
+                    resources=resource,
+                    status=StatusChoices.FAIL,
+                    muted=False,
+                ).count()
+            )
+
+    def test_finalize_sharded_scan_failed_shard(self, tenants_fixture, scans_fixture):
+        tenant = tenants_fixture[0]
+        scan = scans_fixture[0]
+
+        with pytest.raises(ValueError, match="Connection error"):
+            finalize_sharded_scan(
+                str(tenant.id),
+                str(scan.id),
+                [{"findings": 1, "resources": 1}, {"error": "Connection error"}],
+            )
+
+        scan.refresh_from_db()
+        assert scan.state == StateChoices.FAILED
+        assert scan.completed_at is not None
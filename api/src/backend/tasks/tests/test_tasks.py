@@ -1,16 +1,23 @@
 import uuid
 from unittest.mock import MagicMock, patch
 
+import boto3
 import pytest
+from moto import mock_aws
+from tasks.jobs.scan import get_scan_shards
 from tasks.tasks import (
     _perform_scan_complete_tasks,
     check_integrations_task,
     generate_outputs_task,
+    perform_scan_task,
     s3_integration_task,
     security_hub_integration_task,
 )
 
-from api.models import Integration
+from api.models import Finding, Integration, Resource, StateChoices
+from prowler.providers.aws.aws_provider import AwsProvider
+
+AWS_REGION = "us-east-1"
 
 
 # TODO Move this to outputs/reports jobs
@@ -1029,3 +1036,135 @@ class TestCheckIntegrationsTask:
 
         assert result is False
         mock_upload.assert_called_once_with(self.tenant_id, self.provider_id, scan_id)
+
+
+SHARDED_SCAN_CHECKS = [
+    "s3_bucket_default_encryption",
+    "s3_bucket_public_access",
+    "iam_password_policy_minimum_length_14",
+    "ec2_instance_public_ip",
+    "ec2_ebs_default_encryption",
+]
+
+
+@pytest.fixture
+def moto_aws_provider():
+    """Yields a function to initialize an AWS provider that audits the resources created with moto"""
+    with mock_aws():
+        s3_client = boto3.client("s3", region_name=AWS_REGION)
+        s3_client.create_bucket(Bucket="bucket-sharded-scan")
+        ec2_resource = boto3.resource("ec2", region_name=AWS_REGION)
+        ec2_resource.create_instances(ImageId="ami-12c6146b", MinCount=1, MaxCount=1)
+
+        yield lambda provider, mutelist_processor: AwsProvider(regions={AWS_REGION})
+
+
+@pytest.mark.django_db
+class TestPerformShardedScan:
+    def perform_scan(self, scan, shards: int, moto_aws_provider) -> tuple:
+        with (
+            patch("tasks.tasks.CELERY_SCAN_SHARDS", shards),
+            patch("tasks.tasks._perform_scan_complete_tasks") as mock_complete_tasks,
+            patch(
+                "tasks.jobs.scan.initialize_prowler_provider",
+                side_effect=moto_aws_provider,
+            ),
+        ):
+            result = perform_scan_task.apply(
+                kwargs={
+                    "tenant_id": str(scan.tenant_id),
+                    "scan_id": str(scan.id),
+                    "provider_id": str(scan.provider_id),
+                    "checks_to_execute": SHARDED_SCAN_CHECKS,
+                }
+            ).get()
+            mock_complete_tasks.assert_called_once_with(
+                str(scan.tenant_id), str(scan.id), str(scan.provider_id)
+            )
+
+        findings = {
+            (
+                finding.uid,
+                finding.check_id,
+                finding.status,
+                finding.muted,
+                tuple(finding.resources.values_list("uid", flat=True)),
+            )
+            for finding in Finding.objects.filter(scan=scan)
+        }
+        failed_findings_counts = dict(
+            Resource.objects.filter(findings__scan=scan)
+            .distinct()
+            .values_list("uid", "failed_findings_count")
+        )
+        return result, findings, failed_findings_counts
+
+    def test_sharded_scan_findings_match_unsharded_scan(
+        self, scans_fixture, moto_aws_provider
+    ):
+        sharded_scan, unsharded_scan, *_ = scans_fixture
+        assert len(get_scan_shards("aws", 2, SHARDED_SCAN_CHECKS)) == 2
+
+        sharded_result, sharded_findings, sharded_failed_findings_counts = (
+            self.perform_scan(sharded_scan, 2, moto_aws_provider)
+        )
+        unsharded_result, unsharded_findings, unsharded_failed_findings_counts = (
+            self.perform_scan(unsharded_scan, 1, moto_aws_provider)
+        )
+
+        assert {finding[1] for finding in sharded_findings} == set(SHARDED_SCAN_CHECKS)
+        assert sharded_findings == unsharded_findings
+        assert sharded_failed_findings_counts == unsharded_failed_findings_counts
+        for scan, result in (
+            (sharded_scan, sharded_result),
+            (unsharded_scan, unsharded_result),
+        ):
+            scan.refresh_from_db()
+            assert scan.state == StateChoices.COMPLETED
+            assert scan.progress == 100
+            assert scan.unique_resource_count == len(sharded_failed_findings_counts)
+            # The scan task completes with the completed scan, also when it is sharded
+            assert result["state"] == StateChoices.COMPLETED
+
+    def test_sharded_scan_replaces_task(self, scans_fixture):
+        scan, *_ = scans_fixture
+
+        with (
+            patch("tasks.tasks.CELERY_SCAN_SHARDS", 2),
+            patch("tasks.tasks.start_sharded_scan") as mock_start_sharded_scan,
+            patch("tasks.tasks.perform_prowler_scan") as mock_perform_prowler_scan,
+            patch.object(perform_scan_task, "replace") as mock_replace,
+        ):
+            perform_scan_task(
+                tenant_id=str(scan.tenant_id),
+                scan_id=str(scan.id),
+                provider_id=str(scan.provider_id),
+                checks_to_execute=SHARDED_SCAN_CHECKS,
+            )
+
+        mock_start_sharded_scan.assert_called_once_with(
+            tenant_id=str(scan.tenant_id), scan_id=str(scan.id)
+        )
+        mock_perform_prowler_scan.assert_not_called()
+        sharded_scan = mock_replace.call_args.args[0]
+        assert len(sharded_scan.tasks) == 2
+        assert sharded_scan.body.name == "scan-finalize-shards"
+
+    def test_sharded_scan_one_shard(self, scans_fixture):
+        scan, *_ = scans_fixture
+
+        with (
+            patch("tasks.tasks.CELERY_SCAN_SHARDS", 4),
+            patch("tasks.tasks._perform_scan_complete_tasks"),
+            patch("tasks.tasks.perform_prowler_scan") as mock_perform_prowler_scan,
+            patch.object(perform_scan_task, "replace") as mock_replace,
+        ):
+            perform_scan_task(
+                tenant_id=str(scan.tenant_id),
+                scan_id=str(scan.id),
+                provider_id=str(scan.provider_id),
+                checks_to_execute=["s3_bucket_default_encryption"],
+            )
+
+        mock_replace.assert_not_called()
+        mock_perform_prowler_scan.assert_called_once()
@@ -0,0 +1,78 @@
+import os
+from typing import Callable, Optional
+
+import pandas as pd
+
+from prowler.lib.logger import logger
+
+
+class DataStore:
+    """
+    DataStore keeps the dashboard files loaded in memory, indexed by path with their modification time and size.
+
+    refresh() only reads the files that are new or have changed since the last call and forgets the removed
+    ones, so the callbacks can refresh the store on every update without parsing the output folder again.
+
+    Attributes:
+        - list_files: Returns the paths of the files to load.
+        - read_file: Reads a file into a DataFrame, or returns None to skip it.
+
+    Usage:
+        store = DataStore(list_files, read_file)
+        store.refresh()
+        data = store.get_data()
+    """
+
+    def __init__(
+        self,
+        list_files: Callable[[], list],
+        read_file: Callable[[str], Optional[pd.DataFrame]],
+    ) -> None:
+        self.list_files = list_files
+        self.read_file = read_file
+        # {path: ((mtime_ns, size), DataFrame or None)}
+        self._files = {}
+
+    def refresh(self) -> bool:
+        """Load the new and changed files and forget the removed ones, returns True if any file changed"""
+        files = {}
+        changed = False
+        for path in self.list_files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            version = (stat.st_mtime_ns, stat.st_size)
+            entry = self._files.get(path)
+            if entry is None or entry[0] != version:
+                try:
+                    entry = (version, self.read_file(path))
+                except Exception as error:
+                    logger.error(f"Error reading file {path}: {error}")
+                    entry = (version, None)
+                changed = True
+            files[path] = entry
+        if files.keys() != self._files.keys():
+            changed = True
+        self._files = files
+        return changed
+
+    @property
+    def files(self) -> list:
+        """The paths of the loaded files, in the order returned by list_files"""
+        return [path for path, (_, frame) in self._files.items() if frame is not None]
+
+    def get_frame(self, path: str) -> Optional[pd.DataFrame]:
+        """Returns the DataFrame of a loaded file, it is shared so it must not be modified"""
+        entry = self._files.get(path)
+        return entry[1] if entry else None
+
+    def get_data(self, files: list = None) -> Optional[pd.DataFrame]:
+        """Returns a new DataFrame with the rows of the given loaded files, or all of them, or None if there are none"""
+        if files is None:
+            files = self.files
+        frames = [self.get_frame(file) for file in files]
+        frames = [frame for frame in frames if frame is not None]
+        if not frames:
+            return None
+        return pd.concat(frames, ignore_index=True)
@@ -1,5 +1,4 @@
 # Standard library imports
-import csv
 import glob
 import importlib
 import os
@@ -23,6 +22,7 @@ from dashboard.config import (
     manual_color,
     pass_color,
 )
+from dashboard.lib.data_store import DataStore
 from dashboard.lib.dropdowns import (
     create_account_dropdown_compliance,
     create_compliance_dropdown,
@@ -30,7 +30,6 @@ from dashboard.lib.dropdowns import (
     create_region_dropdown_compliance,
 )
 from dashboard.lib.layouts import create_layout_compliance
-from prowler.lib.logger import logger
 
 # Suppress warnings
 warnings.filterwarnings("ignore")
@@ -38,18 +37,31 @@ warnings.filterwarnings("ignore")
 # Global variables
 # TODO: Create a flag to let the user put a custom path
 
-csv_files = []
-for file in glob.glob(os.path.join(folder_path_compliance, "*.csv")):
-    try:
-        with open(
-            file, "r", newline="", encoding=encoding_format, errors=error_action
-        ) as csvfile:
-            reader = csv.reader(csvfile)
-            num_rows = sum(1 for row in reader)
-            if num_rows > 1:
-                csv_files.append(file)
-    except UnicodeDecodeError:
-        logger.error(f"Error decoding file: {file}")
+
+def list_compliance_files():
+    """List the compliance CSV files of the output folder."""
+    return glob.glob(os.path.join(folder_path_compliance, "*.csv"))
+
+
+def read_compliance_file(file):
+    """Read a compliance CSV file as strings, None if it has no rows."""
+    df = pd.read_csv(
+        file,
+        sep=";",
+        on_bad_lines="skip",
+        encoding=encoding_format,
+        encoding_errors=error_action,
+        dtype=str,
+    )
+    if df.empty:
+        return None
+    return df
+
+
+# Each compliance file is read once and kept in memory, the callbacks only read the new files
+compliance_store = DataStore(list_compliance_files, read_compliance_file)
+compliance_store.refresh()
+csv_files = compliance_store.files
 
 
 def load_csv_files(csv_files):
@@ -57,7 +69,7 @@ def load_csv_files(csv_files):
     dfs = []
     results = []
     for file in csv_files:
-        df = pd.read_csv(file, sep=";", on_bad_lines="skip", encoding=encoding_format)
+        df = compliance_store.get_frame(file)
         if "CHECKID" in df.columns:
             dfs.append(df)
             result = file
@@ -240,22 +252,14 @@ def display_data(
     is_level_1 = "level_1" in analytics_input
     analytics_input = analytics_input.replace("_level_1", "").replace("_level_2", "")
 
-    # Filter the data based on the compliance selected
-    files = [file for file in csv_files if analytics_input in file]
-
-    def load_csv_files(files):
-        """Load CSV files into a single pandas DataFrame."""
-        dfs = []
-        for file in files:
-            df = pd.read_csv(
-                file, sep=";", on_bad_lines="skip", encoding=encoding_format, dtype=str
-            )
-            df = df.astype(str).fillna("nan")
-            df.columns = df.columns.astype(str)
-            dfs.append(df)
-        return pd.concat(dfs, ignore_index=True)
+    # Filter the data based on the compliance selected, reading only the new files
+    compliance_store.refresh()
+    files = [file for file in compliance_store.files if analytics_input in file]
 
-    data = load_csv_files(files)
+    data = pd.concat(
+        [compliance_store.get_frame(file).astype(str) for file in files],
+        ignore_index=True,
+    )
 
     # Rename the column LOCATION to REGION for GCP or Azure
     if "gcp" in analytics_input or "azure" in analytics_input:
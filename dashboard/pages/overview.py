@@ -13,6 +13,7 @@ import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import pyarrow.parquet as pq
 from dash import callback, callback_context, ctx, dcc, html
 from dash.dependencies import Input, Output
 
@@ -33,6 +34,7 @@ from dashboard.config import (
     pass_color,
 )
 from dashboard.lib.cards import create_provider_card
+from dashboard.lib.data_store import DataStore
 from dashboard.lib.dropdowns import (
     create_account_dropdown,
     create_date_dropdown,
@@ -44,95 +46,76 @@ from dashboard.lib.dropdowns import (
     create_table_row_dropdown,
 )
 from dashboard.lib.layouts import create_layout_overview
-from prowler.lib.logger import logger
+from prowler.config.config import parquet_file_suffix
 
 # Suppress warnings
 warnings.filterwarnings("ignore")
 
 # Global variables
 # TODO: Create a flag to let the user put a custom path
-csv_files = []
 
-for file in glob.glob(os.path.join(folder_path_overview, "*.csv")):
-    try:
-        df = pd.read_csv(file, sep=";")
-        num_rows = len(df)
-        if num_rows > 1:
-            csv_files.append(file)
-    except Exception:
-        logger.error(f"Error reading file {file}")
 
+def list_findings_files():
+    """List the findings files of the output folder, preferring the Parquet output of a scan over its CSV output."""
+    parquet_files = glob.glob(
+        os.path.join(folder_path_overview, f"*{parquet_file_suffix}")
+    )
+    csv_files = [
+        file
+        for file in glob.glob(os.path.join(folder_path_overview, "*.csv"))
+        if f"{file.removesuffix('.csv')}{parquet_file_suffix}" not in parquet_files
+    ]
+    return parquet_files + csv_files
 
-# Import logos providers
-aws_provider_logo = html.Img(
-    src="assets/images/providers/aws_provider.png", alt="aws provider"
-)
-azure_provider_logo = html.Img(
-    src="assets/images/providers/azure_provider.png", alt="azure provider"
-)
-gcp_provider_logo = html.Img(
-    src="assets/images/providers/gcp_provider.png", alt="gcp provider"
-)
-ks8_provider_logo = html.Img(
-    src="assets/images/providers/k8s_provider.png", alt="k8s provider"
-)
-m365_provider_logo = html.Img(
-    src="assets/images/providers/m365_provider.png", alt="m365 provider"
-)
 
+def read_parquet_file(file):
+    """Read a Parquet findings file into a pandas DataFrame with the values of the CSV reader."""
+    df = pd.read_parquet(file).astype(object)
+    # Empty values are NaN when reading the CSV files
+    return df.mask(df.isna() | (df == ""))
 
-def load_csv_files(csv_files):
-    """Load CSV files into a single pandas DataFrame."""
-    dfs = []
-    for file in csv_files:
-        account_columns = ["ACCOUNT_ID", "ACCOUNT_UID", "SUBSCRIPTION"]
 
-        df_sample = pd.read_csv(file, sep=";", on_bad_lines="skip", nrows=1)
+def read_findings_file(file):
+    """Read a CSV or Parquet findings file into a DataFrame of strings, None if it is not a findings file."""
+    if file.endswith(parquet_file_suffix):
+        # The number of rows is read from the Parquet footer, without loading the data
+        if pq.ParquetFile(file).metadata.num_rows <= 1:
+            return None
+        df = read_parquet_file(file)
+        if "CHECK_ID" in df.columns and "TIMESTAMP" in df.columns:
+            return df.astype(str)
+        return None
 
-        dtype_dict = {}
-        for col in account_columns:
-            if col in df_sample.columns:
-                dtype_dict[col] = str
+    account_columns = ["ACCOUNT_ID", "ACCOUNT_UID", "SUBSCRIPTION"]
 
-        # Read the full file with proper dtypes
-        df = pd.read_csv(file, sep=";", on_bad_lines="skip", dtype=dtype_dict)
+    df_sample = pd.read_csv(file, sep=";", on_bad_lines="skip", nrows=1)
 
-        if "CHECK_ID" in df.columns:
-            if "TIMESTAMP" in df.columns or df["PROVIDER"].unique() == "aws":
-                dfs.append(df.astype(str))
-    # Handle the case where there are no files
-    try:
-        data = pd.concat(dfs, ignore_index=True)
-    except ValueError:
-        data = None
-    return data
+    dtype_dict = {}
+    for col in account_columns:
+        if col in df_sample.columns:
+            dtype_dict[col] = str
 
+    # Read the full file with proper dtypes
+    df = pd.read_csv(file, sep=";", on_bad_lines="skip", dtype=dtype_dict)
 
-data = load_csv_files(csv_files)
+    if len(df) > 1 and "CHECK_ID" in df.columns:
+        if "TIMESTAMP" in df.columns or df["PROVIDER"].unique() == "aws":
+            return df.astype(str)
+    return None
 
-if data is None:
-    # Initializing the Dash App
-    dash.register_page(__name__, path="/")
 
-    layout = html.Div(
-        [
-            html.H1(
-                "No data available",
-                className="text-prowler-stone-900 text-2xxl font-bold",
-            ),
-            html.Div(className="flex justify-between border-b border-prowler-500 pb-3"),
-            html.Div(
-                [
-                    html.Div(
-                        "Check the data folder to see if the files are in the correct format",
-                        className="text-prowler-stone-900 text-lg font-bold",
-                    )
-                ],
-                className="grid gap-x-4 gap-y-4 sm:grid-cols-2 lg:grid-cols-3 lg:gap-y-0",
-            ),
-        ]
-    )
-else:
+def get_assessment_date(df):
+    """Return the date of the first finding of a findings file as YYYY-MM-DD."""
+    if "TIMESTAMP" in df.columns:
+        timestamp = df["TIMESTAMP"].iloc[0]
+    else:
+        # This handles the case where we are using v3 outputs
+        timestamp = df["ASSESSMENT_START_TIME"].iloc[0].replace("T", " ")
+    return pd.to_datetime(timestamp).strftime("%Y-%m-%d")
+
+
+def prepare_overview_data(data):
+    """Unify the columns of the v3 and v4 outputs and keep the last assessment of each day per account."""
     # This handles the case where we are using v3 outputs
     if "ASSESSMENT_START_TIME" in data.columns:
         data["ASSESSMENT_START_TIME"] = data["ASSESSMENT_START_TIME"].str.replace(
@@ -230,6 +213,83 @@ else:
     data["TIMESTAMP"] = data["TIMESTAMP"].dt.strftime("%Y-%m-%d")
     data["TIMESTAMP"] = pd.to_datetime(data["TIMESTAMP"])
 
+    # Handle the case where there is location column
+    if "LOCATION" in data.columns:
+        data["REGION"] = data["LOCATION"]
+    # Handle the case where there is no region column
+    if "REGION" not in data.columns:
+        data["REGION"] = "-"
+    # Handle the case where the region is null
+    data["REGION"].fillna("-")
+    # Add to the status the values 'MUTED (FAIL)', 'MUTED (PASS)' and 'MUTED (MANUAL)' depending on the column 'MUTED', once for all the filters
+    if "MUTED" in data.columns:
+        muted = (data["MUTED"] == "True") & data["STATUS"].isin(
+            ["FAIL", "PASS", "MANUAL"]
+        )
+        data.loc[muted, "STATUS"] = "MUTED (" + data.loc[muted, "STATUS"] + ")"
+    return data
+
+
+def get_overview_data():
+    """Refresh the findings store and return the overview data, prepared again only if a findings file changed."""
+    global data
+    if findings_store.refresh():
+        refreshed_data = findings_store.get_data()
+        # Keep the last data if every findings file was removed
+        if refreshed_data is not None:
+            data = prepare_overview_data(refreshed_data)
+    return data
+
+
+# Each findings file is read once and kept in memory
+findings_store = DataStore(list_findings_files, read_findings_file)
+findings_store.refresh()
+
+# Import logos providers
+aws_provider_logo = html.Img(
+    src="assets/images/providers/aws_provider.png", alt="aws provider"
+)
+azure_provider_logo = html.Img(
+    src="assets/images/providers/azure_provider.png", alt="azure provider"
+)
+gcp_provider_logo = html.Img(
+    src="assets/images/providers/gcp_provider.png", alt="gcp provider"
+)
+ks8_provider_logo = html.Img(
+    src="assets/images/providers/k8s_provider.png", alt="k8s provider"
+)
+m365_provider_logo = html.Img(
+    src="assets/images/providers/m365_provider.png", alt="m365 provider"
+)
+
+
+data = findings_store.get_data()
+
+if data is None:
+    # Initializing the Dash App
+    dash.register_page(__name__, path="/")
+
+    layout = html.Div(
+        [
+            html.H1(
+                "No data available",
+                className="text-prowler-stone-900 text-2xxl font-bold",
+            ),
+            html.Div(className="flex justify-between border-b border-prowler-500 pb-3"),
+            html.Div(
+                [
+                    html.Div(
+                        "Check the data folder to see if the files are in the correct format",
+                        className="text-prowler-stone-900 text-lg font-bold",
+                    )
+                ],
+                className="grid gap-x-4 gap-y-4 sm:grid-cols-2 lg:grid-cols-3 lg:gap-y-0",
+            ),
+        ]
+    )
+else:
+    data = prepare_overview_data(data)
+
     # Assessment Date Dropdown
     assesment_times = list(data["ASSESSMENT_TIME"].unique())
     assesment_times.sort()
@@ -257,14 +317,6 @@ else:
     account_dropdown = create_account_dropdown(accounts)
 
     # Region Dropdown
-    # Handle the case where there is location column
-    if "LOCATION" in data.columns:
-        data["REGION"] = data["LOCATION"]
-    # Handle the case where there is no region column
-    if "REGION" not in data.columns:
-        data["REGION"] = "-"
-    # Handle the case where the region is null
-    data["REGION"].fillna("-")
     regions = ["All"] + list(data["REGION"].unique())
     regions = [x for x in regions if str(x) != "nan" and x.__class__.__name__ == "str"]
     # Correct the values
@@ -336,6 +388,7 @@ else:
     status = [x for x in status if str(x) != "nan" and x.__class__.__name__ == "str"]
 
     status_dropdown = create_status_dropdown(status)
+
     table_div_header = []
     table_div_header.append(
         html.Div(
@@ -588,76 +641,57 @@ def filter_data(
     # Use n_clicks for vulture
     n_clicks_csv = n_clicks_csv
     n_clicks_xlsx = n_clicks_xlsx
-    # Filter the data
-    filtered_data = data.copy()
+    # Pick up the new, changed and removed findings files of the output folder
+    data = get_overview_data()
+    # Filter the data with a mask over the shared data, the filters below return new DataFrames
+    providers = set(data["PROVIDER"].unique())
+    provider_filter = None
 
     if aws_clicks > 0:
-        filtered_data = data.copy()
-        if aws_clicks % 2 != 0 and "aws" in list(data["PROVIDER"]):
-            filtered_data = filtered_data[filtered_data["PROVIDER"] == "aws"]
+        provider_filter = None
+        if aws_clicks % 2 != 0 and "aws" in providers:
+            provider_filter = "aws"
             azure_clicks = 0
             gcp_clicks = 0
             k8s_clicks = 0
             m365_clicks = 0
     if azure_clicks > 0:
-        filtered_data = data.copy()
-        if azure_clicks % 2 != 0 and "azure" in list(data["PROVIDER"]):
-            filtered_data = filtered_data[filtered_data["PROVIDER"] == "azure"]
+        provider_filter = None
+        if azure_clicks % 2 != 0 and "azure" in providers:
+            provider_filter = "azure"
             aws_clicks = 0
             gcp_clicks = 0
             k8s_clicks = 0
             m365_clicks = 0
     if gcp_clicks > 0:
-        filtered_data = data.copy()
-        if gcp_clicks % 2 != 0 and "gcp" in list(data["PROVIDER"]):
-            filtered_data = filtered_data[filtered_data["PROVIDER"] == "gcp"]
+        provider_filter = None
+        if gcp_clicks % 2 != 0 and "gcp" in providers:
+            provider_filter = "gcp"
             aws_clicks = 0
             azure_clicks = 0
             k8s_clicks = 0
             m365_clicks = 0
     if k8s_clicks > 0:
-        filtered_data = data.copy()
-        if k8s_clicks % 2 != 0 and "kubernetes" in list(data["PROVIDER"]):
-            filtered_data = filtered_data[filtered_data["PROVIDER"] == "kubernetes"]
+        provider_filter = None
+        if k8s_clicks % 2 != 0 and "kubernetes" in providers:
+            provider_filter = "kubernetes"
             aws_clicks = 0
             azure_clicks = 0
             gcp_clicks = 0
             m365_clicks = 0
     if m365_clicks > 0:
-        filtered_data = data.copy()
-        if m365_clicks % 2 != 0 and "m365" in list(data["PROVIDER"]):
-            filtered_data = filtered_data[filtered_data["PROVIDER"] == "m365"]
+        provider_filter = None
+        if m365_clicks % 2 != 0 and "m365" in providers:
+            provider_filter = "m365"
             aws_clicks = 0
             azure_clicks = 0
             gcp_clicks = 0
             k8s_clicks = 0
 
-    # For all the data, we will add to the status column the value 'MUTED (FAIL)' and 'MUTED (PASS)' depending on the value of the column 'STATUS' and 'MUTED'
-    if "MUTED" in filtered_data.columns:
-        filtered_data["STATUS"] = filtered_data.apply(
-            lambda x: (
-                "MUTED (FAIL)"
-                if x["STATUS"] == "FAIL" and x["MUTED"] == "True"
-                else x["STATUS"]
-            ),
-            axis=1,
-        )
-        filtered_data["STATUS"] = filtered_data.apply(
-            lambda x: (
-                "MUTED (PASS)"
-                if x["STATUS"] == "PASS" and x["MUTED"] == "True"
-                else x["STATUS"]
-            ),
-            axis=1,
-        )
-        filtered_data["STATUS"] = filtered_data.apply(
-            lambda x: (
-                "MUTED (MANUAL)"
-                if x["STATUS"] == "MANUAL" and x["MUTED"] == "True"
-                else x["STATUS"]
-            ),
-            axis=1,
-        )
+    if provider_filter:
+        filtered_data = data[data["PROVIDER"] == provider_filter]
+    else:
+        filtered_data = data
 
     # Take the latest date of de data
     account_date = filtered_data["ASSESSMENT_TIME"].unique()
@@ -683,25 +717,12 @@ def filter_data(
     ]
 
     # Select the files in the list_files that have the same date as the selected date
-    list_files = []
-    for file in csv_files:
-        df = pd.read_csv(file, sep=";", on_bad_lines="skip")
-        if "CHECK_ID" in df.columns:
-            if "TIMESTAMP" in df.columns or df["PROVIDER"].unique() == "aws":
-                # This handles the case where we are using v3 outputs
-                if "TIMESTAMP" not in df.columns and df["PROVIDER"].unique() == "aws":
-                    # Rename the column 'ASSESSMENT_START_TIME' to 'TIMESTAMP'
-                    df["ASSESSMENT_START_TIME"] = df[
-                        "ASSESSMENT_START_TIME"
-                    ].str.replace("T", " ")
-                    df.rename(
-                        columns={"ASSESSMENT_START_TIME": "TIMESTAMP"}, inplace=True
-                    )
-                    df["TIMESTAMP"] = df["TIMESTAMP"].str.replace("T", " ")
-                df["TIMESTAMP"] = pd.to_datetime(df["TIMESTAMP"])
-                df["TIMESTAMP"] = df["TIMESTAMP"].dt.strftime("%Y-%m-%d")
-                if df["TIMESTAMP"][0] == updated_assessment_value:
-                    list_files.append(file)
+    list_files = [
+        file
+        for file in findings_store.files
+        if get_assessment_date(findings_store.get_frame(file))
+        == updated_assessment_value
+    ]
     # append all the names of the files
     files_names = []
     for file in list_files:
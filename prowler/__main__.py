@@ -10,9 +10,13 @@ from colorama import init as colorama_init
 from prowler.config.config import (
     csv_file_suffix,
     get_available_compliance_frameworks,
+    html_compact_file_suffix,
     html_file_suffix,
     json_asff_file_suffix,
     json_ocsf_file_suffix,
+    ndjson_ocsf_file_suffix,
+    parquet_file_suffix,
+    profile_file_suffix,
 )
 from prowler.lib.banner import print_banner
 from prowler.lib.check.check import (
@@ -34,6 +38,7 @@ from prowler.lib.check.check import (
     remove_custom_checks_module,
     run_fixer,
 )
+from prowler.lib.check.checks_index import get_checks_index
 from prowler.lib.check.checks_loader import load_checks_to_execute
 from prowler.lib.check.compliance import update_checks_metadata_with_compliance
 from prowler.lib.check.compliance_models import Compliance
@@ -44,67 +49,16 @@ from prowler.lib.check.custom_checks_metadata import (
 from prowler.lib.check.models import CheckMetadata
 from prowler.lib.cli.parser import ProwlerArgumentParser
 from prowler.lib.logger import logger, set_logging_config
-from prowler.lib.outputs.asff.asff import ASFF
-from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
-    AWSWellArchitected,
+from prowler.lib.outputs.compliance.registry import get_compliance_output_class
+from prowler.lib.scan.profiler import (
+    Profiler,
+    display_profile_summary,
+    profile,
+    set_profiler,
 )
-from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
-from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
-from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
-from prowler.lib.outputs.compliance.cis.cis_github import GithubCIS
-from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
-from prowler.lib.outputs.compliance.cis.cis_m365 import M365CIS
-from prowler.lib.outputs.compliance.compliance import display_compliance_table
-from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
-from prowler.lib.outputs.compliance.ens.ens_azure import AzureENS
-from prowler.lib.outputs.compliance.ens.ens_gcp import GCPENS
-from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
-from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_azure import AzureISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_gcp import GCPISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_kubernetes import (
-    KubernetesISO27001,
-)
-from prowler.lib.outputs.compliance.iso27001.iso27001_m365 import M365ISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_nhn import NHNISO27001
-from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import AWSKISAISMSP
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import AWSMitreAttack
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
-    AzureMitreAttack,
-)
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import GCPMitreAttack
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_aws import (
-    ProwlerThreatScoreAWS,
-)
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_azure import (
-    ProwlerThreatScoreAzure,
-)
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_gcp import (
-    ProwlerThreatScoreGCP,
-)
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365 import (
-    ProwlerThreatScoreM365,
-)
-from prowler.lib.outputs.csv.csv import CSV
-from prowler.lib.outputs.finding import Finding
-from prowler.lib.outputs.html.html import HTML
-from prowler.lib.outputs.ocsf.ocsf import OCSF
-from prowler.lib.outputs.outputs import extract_findings_statistics
-from prowler.lib.outputs.slack.slack import Slack
-from prowler.lib.outputs.summary_table import display_summary_table
-from prowler.providers.aws.lib.s3.s3 import S3
-from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
-from prowler.providers.aws.models import AWSOutputOptions
-from prowler.providers.azure.models import AzureOutputOptions
-from prowler.providers.common.provider import Provider
-from prowler.providers.common.quick_inventory import run_provider_quick_inventory
-from prowler.providers.gcp.models import GCPOutputOptions
-from prowler.providers.github.models import GithubOutputOptions
-from prowler.providers.iac.models import IACOutputOptions
-from prowler.providers.kubernetes.models import KubernetesOutputOptions
-from prowler.providers.m365.models import M365OutputOptions
-from prowler.providers.mongodbatlas.models import MongoDBAtlasOutputOptions
-from prowler.providers.nhn.models import NHNOutputOptions
+
+# The providers, output formats and compliance outputs are imported when they are used, so the listing commands and
+# the scans of a provider do not import the SDKs of the other providers or the outputs that are not requested.
 
 
 def prowler():
@@ -160,33 +114,58 @@ def prowler():
     # Set Logger configuration
     set_logging_config(args.log_level, args.log_file, args.only_logs)
 
+    # The listing commands are answered from the prebuilt checks index instead of loading all the metadata files,
+    # unless the index is outdated or the checks metadata is customized
+    checks_index = None
+    if (
+        (
+            args.list_services
+            or args.list_categories
+            or args.list_compliance
+            or args.list_checks
+            or args.list_checks_json
+        )
+        and not custom_checks_metadata_file
+        and provider != "iac"
+    ):
+        checks_index = get_checks_index(provider)
+
     if args.list_services:
-        print_services(list_services(provider))
+        if checks_index:
+            print_services(checks_index.get_services())
+        else:
+            print_services(list_services(provider))
         sys.exit()
 
     if args.list_fixer:
         print_fixers(list_fixers(provider))
         sys.exit()
 
-    # Load checks metadata
-    logger.debug("Loading checks metadata from .metadata.json files")
-    bulk_checks_metadata = CheckMetadata.get_bulk(provider)
+    if checks_index:
+        logger.debug("Loading checks metadata and compliance frameworks from the index")
+        bulk_checks_metadata = checks_index.get_bulk_checks_metadata()
+        bulk_compliance_frameworks = checks_index.get_bulk_compliance_frameworks()
+    else:
+        # Load checks metadata
+        logger.debug("Loading checks metadata from .metadata.json files")
+        bulk_checks_metadata = CheckMetadata.get_bulk(provider)
 
     if args.list_categories:
         print_categories(list_categories(bulk_checks_metadata))
         sys.exit()
 
-    bulk_compliance_frameworks = {}
-    # Load compliance frameworks
-    logger.debug("Loading compliance frameworks from .json files")
-
-    # Skip compliance frameworks for IAC provider
-    if provider != "iac":
-        bulk_compliance_frameworks = Compliance.get_bulk(provider)
-        # Complete checks metadata with the compliance framework specification
-        bulk_checks_metadata = update_checks_metadata_with_compliance(
-            bulk_compliance_frameworks, bulk_checks_metadata
-        )
+    if not checks_index:
+        bulk_compliance_frameworks = {}
+        # Load compliance frameworks
+        logger.debug("Loading compliance frameworks from .json files")
+
+        # Skip compliance frameworks for IAC provider
+        if provider != "iac":
+            bulk_compliance_frameworks = Compliance.get_bulk(provider)
+            # Complete checks metadata with the compliance framework specification
+            bulk_checks_metadata = update_checks_metadata_with_compliance(
+                bulk_compliance_frameworks, bulk_checks_metadata
+            )
 
     # Update checks metadata if the --custom-checks-metadata-file is present
     custom_checks_metadata = None
@@ -230,8 +209,22 @@ def prowler():
         print_checks(provider, sorted(checks_to_execute), bulk_checks_metadata)
         sys.exit()
 
+    # Time the provider, services, checks and outputs of the scan
+    profiler = None
+    if args.scan_profile:
+        profiler = Profiler()
+        set_profiler(profiler)
+
+    # Imported once the listing commands are done, they are only needed to scan
+    from prowler.lib.outputs.compliance.compliance import display_compliance_table
+    from prowler.lib.outputs.finding import Finding
+    from prowler.lib.outputs.statistics import FindingsStatistics
+    from prowler.lib.outputs.summary_table import display_summary_table
+    from prowler.providers.common.provider import Provider
+
     # Provider to scan
-    Provider.init_global_provider(args)
+    with profile("provider", provider):
+        Provider.init_global_provider(args)
     global_provider = Provider.get_global_provider()
 
     # Print Provider Credentials
@@ -289,42 +282,64 @@ def prowler():
 
     # Setup Output Options
     if provider == "aws":
+        from prowler.providers.aws.models import AWSOutputOptions
+
         output_options = AWSOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "azure":
+        from prowler.providers.azure.models import AzureOutputOptions
+
         output_options = AzureOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "gcp":
+        from prowler.providers.gcp.models import GCPOutputOptions
+
         output_options = GCPOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "kubernetes":
+        from prowler.providers.kubernetes.models import KubernetesOutputOptions
+
         output_options = KubernetesOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "github":
+        from prowler.providers.github.models import GithubOutputOptions
+
         output_options = GithubOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "m365":
+        from prowler.providers.m365.models import M365OutputOptions
+
         output_options = M365OutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "mongodbatlas":
+        from prowler.providers.mongodbatlas.models import MongoDBAtlasOutputOptions
+
         output_options = MongoDBAtlasOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "nhn":
+        from prowler.providers.nhn.models import NHNOutputOptions
+
         output_options = NHNOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "iac":
+        from prowler.providers.iac.models import IACOutputOptions
+
         output_options = IACOutputOptions(args, bulk_checks_metadata)
 
     # Run the quick inventory for the provider if available
     if hasattr(args, "quick_inventory") and args.quick_inventory:
+        from prowler.providers.common.quick_inventory import (
+            run_provider_quick_inventory,
+        )
+
         run_provider_quick_inventory(global_provider, args)
         sys.exit()
 
@@ -347,6 +362,11 @@ def prowler():
             "There are no checks to execute. Please, check your input arguments"
         )
 
+    # Save the API responses of the scan to replay it later
+    snapshot = getattr(global_provider, "snapshot", None)
+    if snapshot and not snapshot.replay:
+        snapshot.save()
+
     # Prowler Fixer
     if output_options.fixer:
         print(f"{Style.BRIGHT}\nRunning Prowler Fixer, please wait...{Style.RESET_ALL}")
@@ -369,16 +389,21 @@ def prowler():
     # TODO: this part is needed since the checks generates a Check_Report_XXX and the output uses Finding
     # This will be refactored for the outputs generate directly the Finding
     finding_outputs = []
+    # The statistics for the stats, summary and compliance tables are aggregated while the outputs are generated
+    findings_statistics = FindingsStatistics()
     for finding in findings:
         try:
-            finding_outputs.append(
-                Finding.generate_output(global_provider, finding, output_options)
+            finding_output = Finding.generate_output(
+                global_provider, finding, output_options
             )
         except Exception:
             continue
+        finding_outputs.append(finding_output)
+        findings_statistics.add(finding_output)
 
     # Extract findings stats
-    stats = extract_findings_statistics(finding_outputs)
+    logger.info("Extracting audit statistics...")
+    stats = findings_statistics.get_stats()
 
     if args.slack:
         # TODO: this should be also in a config file
@@ -391,6 +416,8 @@ def prowler():
                 if "SLACK_CHANNEL_NAME" in environ
                 else environ["SLACK_CHANNEL_ID"]
             )
+            from prowler.lib.outputs.slack.slack import Slack
+
             prowler_args = " ".join(sys.argv[1:])
             slack = Slack(token, channel, global_provider)
             _ = slack.send(stats, prowler_args)
@@ -409,6 +436,8 @@ def prowler():
                 f"{output_options.output_directory}/{output_options.output_filename}"
             )
             if mode == "csv":
+                from prowler.lib.outputs.csv.csv import CSV
+
                 csv_output = CSV(
                     findings=finding_outputs,
                     file_path=f"{filename}{csv_file_suffix}",
@@ -418,6 +447,8 @@ def prowler():
                 csv_output.batch_write_data_to_file()
 
             if mode == "json-asff":
+                from prowler.lib.outputs.asff.asff import ASFF
+
                 asff_output = ASFF(
                     findings=finding_outputs,
                     file_path=f"{filename}{json_asff_file_suffix}",
@@ -427,13 +458,29 @@ def prowler():
                 asff_output.batch_write_data_to_file()
 
             if mode == "json-ocsf":
+                from prowler.lib.outputs.ocsf.ocsf import OCSF
+
                 json_output = OCSF(
-                    findings=finding_outputs,
+                    findings=[],
                     file_path=f"{filename}{json_ocsf_file_suffix}",
                 )
                 generated_outputs["regular"].append(json_output)
-                json_output.batch_write_data_to_file()
+                # Stream the OCSF findings to the file instead of keeping them in memory
+                if finding_outputs:
+                    json_output.write_findings(finding_outputs)
+            if mode == "ndjson-ocsf":
+                from prowler.lib.outputs.ocsf.ocsf import OCSF
+
+                ndjson_output = OCSF(
+                    findings=[],
+                    file_path=f"{filename}{ndjson_ocsf_file_suffix}",
+                )
+                generated_outputs["regular"].append(ndjson_output)
+                if finding_outputs:
+                    ndjson_output.write_findings(finding_outputs)
             if mode == "html":
+                from prowler.lib.outputs.html.html import HTML
+
                 html_output = HTML(
                     findings=finding_outputs,
                     file_path=f"{filename}{html_file_suffix}",
@@ -442,424 +489,47 @@ def prowler():
                 html_output.batch_write_data_to_file(
                     provider=global_provider, stats=stats
                 )
+            if mode == "html-compact":
+                from prowler.lib.outputs.html.compact_html import CompactHTML
 
-    # Compliance Frameworks
-    input_compliance_frameworks = set(output_options.output_modes).intersection(
-        get_available_compliance_frameworks(provider)
-    )
-    if provider == "aws":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = AWSCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_aws":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = AWSMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            elif compliance_name.startswith("ens_"):
-                # Generate ENS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                ens = AWSENS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(ens)
-                ens.batch_write_data_to_file()
-            elif compliance_name.startswith("aws_well_architected_framework"):
-                # Generate AWS Well-Architected Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                aws_well_architected = AWSWellArchitected(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(aws_well_architected)
-                aws_well_architected.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = AWSISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            elif compliance_name.startswith("kisa"):
-                # Generate KISA-ISMS-P Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                kisa_ismsp = AWSKISAISMSP(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(kisa_ismsp)
-                kisa_ismsp.batch_write_data_to_file()
-            elif compliance_name == "prowler_threatscore_aws":
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                prowler_threatscore = ProwlerThreatScoreAWS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(prowler_threatscore)
-                prowler_threatscore.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "azure":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = AzureCIS(
+                compact_html_output = CompactHTML(
                     findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_azure":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = AzureMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            elif compliance_name.startswith("ens_"):
-                # Generate ENS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                ens = AzureENS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(ens)
-                ens.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = AzureISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            elif compliance_name == "prowler_threatscore_azure":
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
+                    file_path=f"{filename}{html_compact_file_suffix}",
                 )
-                prowler_threatscore = ProwlerThreatScoreAzure(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(prowler_threatscore)
-                prowler_threatscore.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "gcp":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = GCPCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "mitre_attack_gcp":
-                # Generate MITRE ATT&CK Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                mitre_attack = GCPMitreAttack(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(mitre_attack)
-                mitre_attack.batch_write_data_to_file()
-            elif compliance_name.startswith("ens_"):
-                # Generate ENS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                ens = GCPENS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(ens)
-                ens.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = GCPISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            elif compliance_name == "prowler_threatscore_gcp":
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                prowler_threatscore = ProwlerThreatScoreGCP(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(prowler_threatscore)
-                prowler_threatscore.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "kubernetes":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = KubernetesCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = KubernetesISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
-
-    elif provider == "m365":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = M365CIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            elif compliance_name == "prowler_threatscore_m365":
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                prowler_threatscore = ProwlerThreatScoreM365(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(prowler_threatscore)
-                prowler_threatscore.batch_write_data_to_file()
-            elif compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = M365ISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
+                generated_outputs["regular"].append(compact_html_output)
+                compact_html_output.batch_write_data_to_file(
+                    provider=global_provider, stats=stats
                 )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
+            if mode == "parquet":
+                from prowler.lib.outputs.parquet.parquet import Parquet
 
-    elif provider == "nhn":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("iso27001_"):
-                # Generate ISO27001 Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                iso27001 = NHNISO27001(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(iso27001)
-                iso27001.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
+                parquet_output = Parquet(
                     findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
+                    file_path=f"{filename}{parquet_file_suffix}",
                 )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
+                generated_outputs["regular"].append(parquet_output)
+                parquet_output.batch_write_data_to_file()
 
-    elif provider == "github":
-        for compliance_name in input_compliance_frameworks:
-            if compliance_name.startswith("cis_"):
-                # Generate CIS Finding Object
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                cis = GithubCIS(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(cis)
-                cis.batch_write_data_to_file()
-            else:
-                filename = (
-                    f"{output_options.output_directory}/compliance/"
-                    f"{output_options.output_filename}_{compliance_name}.csv"
-                )
-                generic_compliance = GenericCompliance(
-                    findings=finding_outputs,
-                    compliance=bulk_compliance_frameworks[compliance_name],
-                    create_file_descriptor=True,
-                    file_path=filename,
-                )
-                generated_outputs["compliance"].append(generic_compliance)
-                generic_compliance.batch_write_data_to_file()
+    # Compliance Frameworks
+    input_compliance_frameworks = set(output_options.output_modes).intersection(
+        get_available_compliance_frameworks(provider)
+    )
+    for compliance_name in input_compliance_frameworks:
+        # Only the compliance output of the framework is imported
+        compliance_output_class = get_compliance_output_class(provider, compliance_name)
+        if not compliance_output_class:
+            continue
+        filename = (
+            f"{output_options.output_directory}/compliance/"
+            f"{output_options.output_filename}_{compliance_name}.csv"
+        )
+        compliance_output = compliance_output_class(
+            findings=finding_outputs,
+            compliance=bulk_compliance_frameworks[compliance_name],
+            file_path=filename,
+        )
+        generated_outputs["compliance"].append(compliance_output)
+        compliance_output.batch_write_data_to_file()
 
     # AWS Security Hub Integration
     if provider == "aws":
@@ -871,10 +541,13 @@ def prowler():
             if args.output_bucket_no_assume:
                 output_bucket = args.output_bucket_no_assume
                 bucket_session = global_provider.session.original_session
+            from prowler.providers.aws.lib.s3.s3 import S3
+
             s3 = S3(
                 session=bucket_session,
                 bucket_name=output_bucket,
                 output_directory=args.output_directory,
+                compress=args.output_bucket_compress,
             )
             s3.send_to_bucket(generated_outputs)
         if args.security_hub:
@@ -892,6 +565,8 @@ def prowler():
                 else global_provider.identity.audited_regions
             )
 
+            from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
+
             security_hub = SecurityHub(
                 aws_account_id=global_provider.identity.account,
                 aws_partition=global_provider.identity.partition,
@@ -924,11 +599,10 @@ def prowler():
             findings,
             global_provider,
             output_options,
+            findings_statistics=findings_statistics,
         )
         # Only display compliance table if there are findings (not all MANUAL) and it is a default execution
-        if (
-            findings and not all(finding.status == "MANUAL" for finding in findings)
-        ) and default_execution:
+        if findings_statistics.has_results() and default_execution:
             compliance_overview = False
             if not compliance_framework:
                 compliance_framework = get_available_compliance_frameworks(provider)
@@ -945,12 +619,22 @@ def prowler():
                     output_options.output_filename,
                     output_options.output_directory,
                     compliance_overview,
+                    findings_statistics=findings_statistics,
                 )
             if compliance_overview:
                 print(
                     f"\nDetailed compliance results are in {Fore.YELLOW}{output_options.output_directory}/compliance/{Style.RESET_ALL}\n"
                 )
 
+    # Save the scan profile next to the outputs
+    if profiler:
+        set_profiler(None)
+        profiler.save(
+            f"{output_options.output_directory}/{output_options.output_filename}{profile_file_suffix}"
+        )
+        if not args.only_logs:
+            display_profile_summary(profiler)
+
     # If custom checks were passed, remove the modules
     if checks_folder:
         remove_custom_checks_module(checks_folder, provider)
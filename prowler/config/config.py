@@ -1,10 +1,10 @@
 import os
 import pathlib
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from enum import Enum
 from os import getcwd
 
-import requests
 import yaml
 from packaging import version
 
@@ -54,7 +54,33 @@ def get_available_compliance_frameworks(provider=None):
     return available_compliance_frameworks
 
 
-available_compliance_frameworks = get_available_compliance_frameworks()
+class AvailableComplianceFrameworks(Sequence):
+    """Lazy list of every available compliance framework.
+
+    The compliance folders are only scanned the first time the list is used,
+    e.g. when argparse validates a --compliance value or prints the help, so
+    importing this module does not pay for the scan.
+    """
+
+    def __init__(self):
+        self._frameworks = None
+
+    def _load(self) -> list:
+        if self._frameworks is None:
+            self._frameworks = get_available_compliance_frameworks()
+        return self._frameworks
+
+    def __getitem__(self, index):
+        return self._load()[index]
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        return repr(self._load())
+
+
+available_compliance_frameworks = AvailableComplianceFrameworks()
 
 
 # AWS services-regions matrix json
@@ -69,7 +95,11 @@ csv_file_suffix = ".csv"
 json_file_suffix = ".json"
 json_asff_file_suffix = ".asff.json"
 json_ocsf_file_suffix = ".ocsf.json"
+ndjson_ocsf_file_suffix = ".ocsf.ndjson"
 html_file_suffix = ".html"
+html_compact_file_suffix = ".compact.html"
+parquet_file_suffix = ".parquet"
+profile_file_suffix = ".profile.json"
 default_config_file_path = (
     f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__)))}/config.yaml"
 )
@@ -77,7 +107,15 @@ default_fixer_config_file_path = (
     f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__)))}/fixer_config.yaml"
 )
 encoding_format_utf_8 = "utf-8"
-available_output_formats = ["csv", "json-asff", "json-ocsf", "html"]
+available_output_formats = [
+    "csv",
+    "json-asff",
+    "json-ocsf",
+    "ndjson-ocsf",
+    "html",
+    "html-compact",
+    "parquet",
+]
 
 
 def get_default_mute_file_path(provider: str):
@@ -92,6 +130,9 @@ def get_default_mute_file_path(provider: str):
 
 
 def check_current_version():
+    # requests is only needed here, import it lazily to keep it out of the CLI startup
+    import requests
+
     try:
         prowler_version_string = f"Prowler {prowler_version}"
         release_response = requests.get(
@@ -18,6 +18,7 @@ from prowler.lib.check.models import Check
 from prowler.lib.check.utils import recover_checks_from_provider
 from prowler.lib.logger import logger
 from prowler.lib.outputs.outputs import report
+from prowler.lib.scan.profiler import profile
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.common.models import Audit_Metadata
 
@@ -604,7 +605,8 @@ def execute(
         check_findings = []
         logger.debug(f"Executing check: {check.CheckID}")
         try:
-            check_findings = check.execute()
+            with profile("check", check.CheckID):
+                check_findings = check.execute()
         except Exception as error:
             if not only_logs:
                 print(
@@ -0,0 +1,188 @@
+import json
+import os
+import pathlib
+from dataclasses import dataclass, field
+from typing import Optional
+
+from prowler.config.config import get_available_compliance_frameworks
+from prowler.lib.check.models import Severity
+from prowler.lib.logger import logger
+
+CHECKS_INDEX_VERSION = 1
+checks_index_file = f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__))).parent.parent}/config/checks_index.json"
+providers_directory = f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__))).parent.parent}/providers"
+
+
+@dataclass(frozen=True)
+class IndexedCheckMetadata:
+    """The metadata fields of a check needed to list and filter the checks, with the names of CheckMetadata"""
+
+    CheckID: str
+    CheckTitle: str
+    ServiceName: str
+    Severity: Severity
+    Categories: list[str] = field(default_factory=list)
+    CheckAliases: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class IndexedRequirement:
+    Checks: list[str]
+
+
+@dataclass(frozen=True)
+class IndexedCompliance:
+    """The checks of a compliance framework, as a single requirement with all of them"""
+
+    Requirements: list[IndexedRequirement]
+
+
+def get_provider_checks(provider: str) -> dict[str, str]:
+    """
+    Returns the checks of the provider with their service, found from the check directories without importing them.
+
+    Args:
+        provider (str): The provider name.
+
+    Returns:
+        dict[str, str]: The service of every check, by check name.
+    """
+    checks = {}
+    services_directory = f"{providers_directory}/{provider}/services"
+    if not os.path.isdir(services_directory):
+        return checks
+    with os.scandir(services_directory) as services:
+        for service in services:
+            if not os.path.isfile(f"{service.path}/__init__.py"):
+                continue
+            with os.scandir(service.path) as service_entries:
+                for entry in service_entries:
+                    # The same checks as recover_checks_from_provider(), the check packages outside the service libraries
+                    if (
+                        os.path.isfile(f"{entry.path}/__init__.py")
+                        and os.path.isfile(f"{entry.path}/{entry.name}.py")
+                        and "lib"
+                        not in f"{provider}.services.{service.name}.{entry.name}"
+                    ):
+                        checks[entry.name] = service.name
+    return checks
+
+
+def build_checks_index(providers: list[str]) -> dict:
+    """
+    Builds the checks index of the providers from the metadata of their checks and their compliance frameworks.
+
+    Args:
+        providers (list[str]): The providers to index.
+
+    Returns:
+        dict: The checks index, to be written to the checks_index.json file.
+    """
+    # Imported here, since loading all the metadata is what the index avoids
+    from prowler.lib.check.compliance_models import Compliance
+    from prowler.lib.check.models import CheckMetadata
+
+    index = {"version": CHECKS_INDEX_VERSION, "providers": {}}
+    for provider in sorted(providers):
+        bulk_checks_metadata = CheckMetadata.get_bulk(provider)
+        bulk_compliance_frameworks = Compliance.get_bulk(provider)
+        index["providers"][provider] = {
+            "checks": {
+                check_id: {
+                    "CheckTitle": metadata.CheckTitle,
+                    "ServiceName": metadata.ServiceName,
+                    "Severity": metadata.Severity.value,
+                    "Categories": metadata.Categories,
+                    "CheckAliases": metadata.CheckAliases,
+                }
+                for check_id, metadata in sorted(bulk_checks_metadata.items())
+            },
+            "compliance": {
+                name: sorted(
+                    {
+                        check
+                        for requirement in framework.Requirements
+                        for check in requirement.Checks
+                    }
+                )
+                for name, framework in sorted(bulk_compliance_frameworks.items())
+            },
+        }
+    return index
+
+
+class ChecksIndex:
+    """
+    ChecksIndex answers the listing commands of the CLI from the prebuilt checks_index.json file, instead of loading
+    the metadata of every check and compliance framework of the provider.
+
+    The index of a provider is only used if it has the same checks and compliance frameworks that are found in the
+    provider directories, so the CLI falls back to the metadata files when a check was added or removed without
+    updating the index with util/generate_checks_index.py.
+
+    Usage:
+        checks_index = ChecksIndex("aws")
+        if checks_index.is_available():
+            bulk_checks_metadata = checks_index.get_bulk_checks_metadata()
+    """
+
+    def __init__(self, provider: str, path: str = checks_index_file) -> None:
+        self.provider = provider
+        self._provider_index = None
+        self._provider_checks = get_provider_checks(provider)
+        try:
+            with open(path, encoding="utf-8") as index_file:
+                index = json.load(index_file)
+            if index.get("version") == CHECKS_INDEX_VERSION:
+                self._provider_index = index["providers"].get(provider)
+        except (OSError, ValueError, KeyError) as error:
+            logger.debug(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def is_available(self) -> bool:
+        """Returns True if the index of the provider is up to date with its checks and compliance frameworks"""
+        if not self._provider_index:
+            return False
+        if set(self._provider_index["checks"]) != set(self._provider_checks):
+            logger.debug(f"The checks index of {self.provider} is outdated")
+            return False
+        if set(self._provider_index["compliance"]) != set(
+            get_available_compliance_frameworks(self.provider)
+        ):
+            logger.debug(
+                f"The compliance frameworks index of {self.provider} is outdated"
+            )
+            return False
+        return True
+
+    def get_bulk_checks_metadata(self) -> dict[str, IndexedCheckMetadata]:
+        """Returns the indexed metadata of the checks, by CheckID like CheckMetadata.get_bulk()"""
+        return {
+            check_id: IndexedCheckMetadata(
+                CheckID=check_id,
+                CheckTitle=metadata["CheckTitle"],
+                ServiceName=metadata["ServiceName"],
+                Severity=Severity(metadata["Severity"]),
+                Categories=metadata["Categories"],
+                CheckAliases=metadata["CheckAliases"],
+            )
+            for check_id, metadata in self._provider_index["checks"].items()
+        }
+
+    def get_bulk_compliance_frameworks(self) -> dict[str, IndexedCompliance]:
+        """Returns the indexed checks of the compliance frameworks, by name like Compliance.get_bulk()"""
+        return {
+            name: IndexedCompliance(Requirements=[IndexedRequirement(Checks=checks)])
+            for name, checks in self._provider_index["compliance"].items()
+        }
+
+    def get_services(self) -> list[str]:
+        """Returns the services of the provider checks, like list_services()"""
+        return sorted(set(self._provider_checks.values()))
+
+
+def get_checks_index(provider: str) -> Optional[ChecksIndex]:
+    """Returns the checks index of the provider, or None if it is not available or outdated"""
+    checks_index = ChecksIndex(provider)
+    return checks_index if checks_index.is_available() else None
@@ -473,12 +473,16 @@ class Check_Report:
         """Initialize the Check's finding information.
 
         Args:
-            metadata: The metadata of the check.
+            metadata: The metadata of the check, as a JSON string or an already parsed CheckMetadata.
             resource: Basic information about the resource. Defaults to None.
                       Only accepted dict, list, BaseModels (dict attribute), custom models (with to_dict attribute) and dataclasses.
         """
         self.status = ""
-        self.check_metadata = CheckMetadata.parse_raw(metadata)
+        self.check_metadata = (
+            metadata
+            if isinstance(metadata, CheckMetadata)
+            else CheckMetadata.parse_raw(metadata)
+        )
         if isinstance(resource, dict):
             self.resource = resource
         elif hasattr(resource, "dict"):
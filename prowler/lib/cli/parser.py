@@ -71,6 +71,7 @@ Detailed documentation at https://docs.prowler.com
         self.__init_list_checks_parser__()
         self.__init_mutelist_parser__()
         self.__init_config_parser__()
+        self.__init_snapshot_parser__()
         self.__init_custom_checks_metadata_parser__()
         self.__init_third_party_integrations_parser__()
 
@@ -125,6 +126,15 @@ Detailed documentation at https://docs.prowler.com
         if args.provider != "dashboard" and (args.only_logs or args.list_checks_json):
             args.no_banner = True
 
+        # Only the AWS, Azure and GCP API responses can be recorded and replayed
+        if (
+            getattr(args, "snapshot_record", None)
+            or getattr(args, "snapshot_replay", None)
+        ) and args.provider not in ("aws", "azure", "gcp"):
+            self.parser.error(
+                f"{args.provider}: --snapshot-record and --snapshot-replay are only available for the aws, azure and gcp providers"
+            )
+
         # Extra validation for provider arguments
         valid, message = validate_provider_arguments(args)
         if not valid:
@@ -193,6 +203,11 @@ Detailed documentation at https://docs.prowler.com
             help="Disable color codes in output",
         )
 
+        common_outputs_parser.add_argument(
+            "--scan-profile",
+            action="store_true",
+            help="Time the services, checks and outputs of the scan and count its API calls, saving them to a JSON profile next to the outputs and showing the slowest components",
+        )
         common_outputs_parser.add_argument(
             "--unix-timestamp",
             action="store_true",
@@ -370,6 +385,24 @@ Detailed documentation at https://docs.prowler.com
             help="Set configuration fixer file path",
         )
 
+    def __init_snapshot_parser__(self):
+        snapshot_parser = self.common_providers_parser.add_argument_group("Snapshot")
+        snapshot_group = snapshot_parser.add_mutually_exclusive_group()
+        snapshot_group.add_argument(
+            "--snapshot-record",
+            nargs="?",
+            default=None,
+            metavar="SNAPSHOT_FILE",
+            help="Save the API responses of the scan to a compressed snapshot file, to replay the scan later with --snapshot-replay",
+        )
+        snapshot_group.add_argument(
+            "--snapshot-replay",
+            nargs="?",
+            default=None,
+            metavar="SNAPSHOT_FILE",
+            help="Run the checks with the API responses of a snapshot file instead of calling the provider APIs, e.g. after changing the mutelist or the configuration",
+        )
+
     def __init_custom_checks_metadata_parser__(self):
         # CustomChecksMetadata
         custom_checks_metadata_subparser = (
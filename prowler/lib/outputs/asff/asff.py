@@ -8,6 +8,7 @@ from prowler.config.config import prowler_version, timestamp_utc
 from prowler.lib.logger import logger
 from prowler.lib.outputs.finding import Finding
 from prowler.lib.outputs.output import Output
+from prowler.lib.scan.profiler import profiled
 from prowler.lib.utils.utils import hash_sha512
 
 
@@ -122,6 +123,7 @@ class ASFF(Output):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    @profiled("output")
     def batch_write_data_to_file(self) -> None:
         """
         Writes the findings data to a file in JSON ASFF format.
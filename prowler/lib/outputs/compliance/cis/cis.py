@@ -2,10 +2,11 @@ from colorama import Fore, Style
 from tabulate import tabulate
 
 from prowler.config.config import orange_color
+from prowler.lib.outputs.statistics import FindingsStatistics
 
 
 def get_cis_table(
-    findings: list,
+    findings_statistics: FindingsStatistics,
     bulk_checks_metadata: dict,
     compliance_framework: str,
     output_filename: str,
@@ -20,52 +21,60 @@ def get_cis_table(
         "Level 2": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
-    for index, finding in enumerate(findings):
-        check = bulk_checks_metadata[finding.check_metadata.CheckID]
-        check_compliances = check.Compliance
-        for compliance in check_compliances:
-            version_in_name = compliance_framework.split("_")[1]
-            if compliance.Framework == "CIS" and version_in_name in compliance.Version:
-                for requirement in compliance.Requirements:
-                    for attribute in requirement.Attributes:
-                        section = attribute.Section
-                        # Check if Section exists
-                        if section not in sections:
-                            sections[section] = {
-                                "Status": f"{Fore.GREEN}PASS{Style.RESET_ALL}",
-                                "Level 1": {"FAIL": 0, "PASS": 0},
-                                "Level 2": {"FAIL": 0, "PASS": 0},
-                                "Muted": 0,
-                            }
-                        if finding.muted:
-                            if index not in muted_count:
-                                muted_count.append(index)
-                                sections[section]["Muted"] += 1
-                        else:
-                            if finding.status == "FAIL" and index not in fail_count:
-                                fail_count.append(index)
-                            elif finding.status == "PASS" and index not in pass_count:
-                                pass_count.append(index)
-                        if "Level 1" in attribute.Profile:
-                            if not finding.muted:
-                                if finding.status == "FAIL":
-                                    sections[section]["Level 1"]["FAIL"] += 1
-                                else:
-                                    sections[section]["Level 1"]["PASS"] += 1
-                        elif "Level 2" in attribute.Profile:
-                            if not finding.muted:
-                                if finding.status == "FAIL":
-                                    sections[section]["Level 2"]["FAIL"] += 1
-                                else:
-                                    sections[section]["Level 2"]["PASS"] += 1
+    pass_count = 0
+    fail_count = 0
+    muted_count = 0
+    version_in_name = compliance_framework.split("_")[1]
+    for (
+        compliances,
+        status,
+        muted,
+        findings_count,
+    ) in findings_statistics.get_framework_check_status_count(
+        bulk_checks_metadata,
+        lambda compliance: compliance.Framework == "CIS"
+        and version_in_name in compliance.Version,
+    ):
+        counted = False
+        for compliance in compliances:
+            provider = compliance.Provider
+            for requirement in compliance.Requirements:
+                for attribute in requirement.Attributes:
+                    section = attribute.Section
+                    # Check if Section exists
+                    if section not in sections:
+                        sections[section] = {
+                            "Status": f"{Fore.GREEN}PASS{Style.RESET_ALL}",
+                            "Level 1": {"FAIL": 0, "PASS": 0},
+                            "Level 2": {"FAIL": 0, "PASS": 0},
+                            "Muted": 0,
+                        }
+                    if not counted:
+                        counted = True
+                        if muted:
+                            muted_count += findings_count
+                            sections[section]["Muted"] += findings_count
+                        elif status == "FAIL":
+                            fail_count += findings_count
+                        elif status == "PASS":
+                            pass_count += findings_count
+                    if "Level 1" in attribute.Profile:
+                        if not muted:
+                            if status == "FAIL":
+                                sections[section]["Level 1"]["FAIL"] += findings_count
+                            else:
+                                sections[section]["Level 1"]["PASS"] += findings_count
+                    elif "Level 2" in attribute.Profile:
+                        if not muted:
+                            if status == "FAIL":
+                                sections[section]["Level 2"]["FAIL"] += findings_count
+                            else:
+                                sections[section]["Level 2"]["PASS"] += findings_count
 
     # Add results to table
     sections = dict(sorted(sections.items()))
     for section in sections:
-        cis_compliance_table["Provider"].append(compliance.Provider)
+        cis_compliance_table["Provider"].append(provider)
         cis_compliance_table["Section"].append(section)
         if sections[section]["Level 1"]["FAIL"] > 0:
             cis_compliance_table["Level 1"].append(
@@ -87,17 +96,17 @@ def get_cis_table(
             f"{orange_color}{sections[section]['Muted']}{Style.RESET_ALL}"
         )
     if (
-        len(fail_count) + len(pass_count) + len(muted_count) > 1
+        fail_count + pass_count + muted_count > 1
     ):  # If there are no resources, don't print the compliance table
         print(
             f"\nCompliance Status of {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL} Framework:"
         )
-        total_findings_count = len(fail_count) + len(pass_count) + len(muted_count)
+        total_findings_count = fail_count + pass_count + muted_count
         overview_table = [
             [
-                f"{Fore.RED}{round(len(fail_count) / total_findings_count * 100, 2)}% ({len(fail_count)}) FAIL{Style.RESET_ALL}",
-                f"{Fore.GREEN}{round(len(pass_count) / total_findings_count * 100, 2)}% ({len(pass_count)}) PASS{Style.RESET_ALL}",
-                f"{orange_color}{round(len(muted_count) / total_findings_count * 100, 2)}% ({len(muted_count)}) MUTED{Style.RESET_ALL}",
+                f"{Fore.RED}{round(fail_count / total_findings_count * 100, 2)}% ({fail_count}) FAIL{Style.RESET_ALL}",
+                f"{Fore.GREEN}{round(pass_count / total_findings_count * 100, 2)}% ({pass_count}) PASS{Style.RESET_ALL}",
+                f"{orange_color}{round(muted_count / total_findings_count * 100, 2)}% ({muted_count}) MUTED{Style.RESET_ALL}",
             ]
         ]
         print(tabulate(overview_table, tablefmt="rounded_grid"))
@@ -14,6 +14,7 @@ from prowler.lib.outputs.compliance.mitre_attack.mitre_attack import (
 from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore import (
     get_prowler_threatscore_table,
 )
+from prowler.lib.outputs.statistics import FindingsStatistics
 
 
 def display_compliance_table(
@@ -23,6 +24,7 @@ def display_compliance_table(
     output_filename: str,
     output_directory: str,
     compliance_overview: bool,
+    findings_statistics: FindingsStatistics = None,
 ) -> None:
     """
     display_compliance_table generates the compliance table for the given compliance framework.
@@ -34,14 +36,17 @@ def display_compliance_table(
         output_filename (str): The output filename
         output_directory (str): The output directory
         compliance_overview (bool): The compliance
+        findings_statistics (FindingsStatistics): The statistics already aggregated from the findings, to not go through them for every framework
 
     Returns:
         None
     """
     try:
+        if findings_statistics is None:
+            findings_statistics = FindingsStatistics(findings)
         if "ens_" in compliance_framework:
             get_ens_table(
-                findings,
+                findings_statistics,
                 bulk_checks_metadata,
                 compliance_framework,
                 output_filename,
@@ -50,7 +55,7 @@ def display_compliance_table(
             )
         elif "cis_" in compliance_framework:
             get_cis_table(
-                findings,
+                findings_statistics,
                 bulk_checks_metadata,
                 compliance_framework,
                 output_filename,
@@ -59,7 +64,7 @@ def display_compliance_table(
             )
         elif "mitre_attack" in compliance_framework:
             get_mitre_attack_table(
-                findings,
+                findings_statistics,
                 bulk_checks_metadata,
                 compliance_framework,
                 output_filename,
@@ -68,7 +73,7 @@ def display_compliance_table(
             )
         elif "kisa_isms_" in compliance_framework:
             get_kisa_ismsp_table(
-                findings,
+                findings_statistics,
                 bulk_checks_metadata,
                 compliance_framework,
                 output_filename,
@@ -77,7 +82,7 @@ def display_compliance_table(
             )
         elif "threatscore_" in compliance_framework:
             get_prowler_threatscore_table(
-                findings,
+                findings_statistics,
                 bulk_checks_metadata,
                 compliance_framework,
                 output_filename,
@@ -86,7 +91,7 @@ def display_compliance_table(
             )
         else:
             get_generic_compliance_table(
-                findings,
+                findings_statistics,
                 bulk_checks_metadata,
                 compliance_framework,
                 output_filename,
@@ -6,6 +6,7 @@ from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.logger import logger
 from prowler.lib.outputs.finding import Finding
 from prowler.lib.outputs.output import Output
+from prowler.lib.scan.profiler import profile, profiled
 
 
 class ComplianceOutput(Output):
@@ -54,10 +55,12 @@ class ComplianceOutput(Output):
                 if compliance.Version
                 else compliance.Framework
             )
-            self.transform(findings, compliance, compliance_name)
+            with profile("output", f"{self.__class__.__name__}.transform"):
+                self.transform(findings, compliance, compliance_name)
             if not self._file_descriptor and file_path:
                 self.create_file_descriptor(self.file_path)
 
+    @profiled("output")
     def batch_write_data_to_file(self) -> None:
         """
         Writes the findings data to a CSV file in the specific compliance format.
@@ -2,10 +2,11 @@ from colorama import Fore, Style
 from tabulate import tabulate
 
 from prowler.config.config import orange_color
+from prowler.lib.outputs.statistics import FindingsStatistics
 
 
 def get_ens_table(
-    findings: list,
+    findings_statistics: FindingsStatistics,
     bulk_checks_metadata: dict,
     compliance_framework: str,
     output_filename: str,
@@ -23,55 +24,61 @@ def get_ens_table(
         "Opcional": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
-    for index, finding in enumerate(findings):
-        check = bulk_checks_metadata[finding.check_metadata.CheckID]
-        check_compliances = check.Compliance
-        for compliance in check_compliances:
-            if compliance.Framework == "ENS":
-                for requirement in compliance.Requirements:
-                    for attribute in requirement.Attributes:
-                        marco_categoria = f"{attribute.Marco}/{attribute.Categoria}"
-                        # Check if Marco/Categoria exists
-                        if marco_categoria not in marcos:
-                            marcos[marco_categoria] = {
-                                "Estado": f"{Fore.GREEN}CUMPLE{Style.RESET_ALL}",
-                                "Opcional": 0,
-                                "Alto": 0,
-                                "Medio": 0,
-                                "Bajo": 0,
-                                "Muted": 0,
-                            }
-                        if finding.muted:
-                            if index not in muted_count:
-                                muted_count.append(index)
-                                marcos[marco_categoria]["Muted"] += 1
-                        else:
-                            if finding.status == "FAIL":
-                                if (
-                                    attribute.Tipo != "recomendacion"
-                                    and index not in fail_count
-                                ):
-                                    fail_count.append(index)
-                                    marcos[marco_categoria][
-                                        "Estado"
-                                    ] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
-                            elif finding.status == "PASS" and index not in pass_count:
-                                pass_count.append(index)
-                        if attribute.Nivel == "opcional":
-                            marcos[marco_categoria]["Opcional"] += 1
-                        elif attribute.Nivel == "alto":
-                            marcos[marco_categoria]["Alto"] += 1
-                        elif attribute.Nivel == "medio":
-                            marcos[marco_categoria]["Medio"] += 1
-                        elif attribute.Nivel == "bajo":
-                            marcos[marco_categoria]["Bajo"] += 1
+    pass_count = 0
+    fail_count = 0
+    muted_count = 0
+    for (
+        compliances,
+        status,
+        muted,
+        findings_count,
+    ) in findings_statistics.get_framework_check_status_count(
+        bulk_checks_metadata,
+        lambda compliance: compliance.Framework == "ENS",
+    ):
+        counted = False
+        for compliance in compliances:
+            provider = compliance.Provider
+            for requirement in compliance.Requirements:
+                for attribute in requirement.Attributes:
+                    marco_categoria = f"{attribute.Marco}/{attribute.Categoria}"
+                    # Check if Marco/Categoria exists
+                    if marco_categoria not in marcos:
+                        marcos[marco_categoria] = {
+                            "Estado": f"{Fore.GREEN}CUMPLE{Style.RESET_ALL}",
+                            "Opcional": 0,
+                            "Alto": 0,
+                            "Medio": 0,
+                            "Bajo": 0,
+                            "Muted": 0,
+                        }
+                    if not counted:
+                        if muted:
+                            counted = True
+                            muted_count += findings_count
+                            marcos[marco_categoria]["Muted"] += findings_count
+                        elif status == "FAIL":
+                            if attribute.Tipo != "recomendacion":
+                                counted = True
+                                fail_count += findings_count
+                                marcos[marco_categoria][
+                                    "Estado"
+                                ] = f"{Fore.RED}NO CUMPLE{Style.RESET_ALL}"
+                        elif status == "PASS":
+                            counted = True
+                            pass_count += findings_count
+                    if attribute.Nivel == "opcional":
+                        marcos[marco_categoria]["Opcional"] += findings_count
+                    elif attribute.Nivel == "alto":
+                        marcos[marco_categoria]["Alto"] += findings_count
+                    elif attribute.Nivel == "medio":
+                        marcos[marco_categoria]["Medio"] += findings_count
+                    elif attribute.Nivel == "bajo":
+                        marcos[marco_categoria]["Bajo"] += findings_count
 
     # Add results to table
     for marco in sorted(marcos):
-        ens_compliance_table["Proveedor"].append(compliance.Provider)
+        ens_compliance_table["Proveedor"].append(provider)
         ens_compliance_table["Marco/Categoria"].append(marco)
         ens_compliance_table["Estado"].append(marcos[marco]["Estado"])
         ens_compliance_table["Opcional"].append(
@@ -90,17 +97,17 @@ def get_ens_table(
             f"{orange_color}{marcos[marco]['Muted']}{Style.RESET_ALL}"
         )
     if (
-        len(fail_count) + len(pass_count) + len(muted_count) > 1
+        fail_count + pass_count + muted_count > 1
     ):  # If there are no resources, don't print the compliance table
         print(
             f"\nEstado de Cumplimiento de {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL}:"
         )
-        total_findings_count = len(fail_count) + len(pass_count) + len(muted_count)
+        total_findings_count = fail_count + pass_count + muted_count
         overview_table = [
             [
-                f"{Fore.RED}{round(len(fail_count) / total_findings_count * 100, 2)}% ({len(fail_count)}) NO CUMPLE{Style.RESET_ALL}",
-                f"{Fore.GREEN}{round(len(pass_count) / total_findings_count * 100, 2)}% ({len(pass_count)}) CUMPLE{Style.RESET_ALL}",
-                f"{orange_color}{round(len(muted_count) / total_findings_count * 100, 2)}% ({len(muted_count)}) MUTED{Style.RESET_ALL}",
+                f"{Fore.RED}{round(fail_count / total_findings_count * 100, 2)}% ({fail_count}) NO CUMPLE{Style.RESET_ALL}",
+                f"{Fore.GREEN}{round(pass_count / total_findings_count * 100, 2)}% ({pass_count}) CUMPLE{Style.RESET_ALL}",
+                f"{orange_color}{round(muted_count / total_findings_count * 100, 2)}% ({muted_count}) MUTED{Style.RESET_ALL}",
             ]
         ]
         print(tabulate(overview_table, tablefmt="rounded_grid"))
@@ -2,49 +2,50 @@ from colorama import Fore, Style
 from tabulate import tabulate
 
 from prowler.config.config import orange_color
+from prowler.lib.outputs.statistics import FindingsStatistics
 
 
 def get_generic_compliance_table(
-    findings: list,
+    findings_statistics: FindingsStatistics,
     bulk_checks_metadata: dict,
     compliance_framework: str,
     output_filename: str,
     output_directory: str,
     compliance_overview: bool,
 ):
-    pass_count = []
-    fail_count = []
-    muted_count = []
-    for index, finding in enumerate(findings):
-        check = bulk_checks_metadata[finding.check_metadata.CheckID]
-        check_compliances = check.Compliance
-        for compliance in check_compliances:
-            if (
-                compliance.Framework.upper()
-                in compliance_framework.upper().replace("_", "-")
-                and compliance.Version in compliance_framework.upper()
-                and compliance.Provider.upper() in compliance_framework.upper()
-            ):
-                if finding.muted:
-                    if index not in muted_count:
-                        muted_count.append(index)
-                else:
-                    if finding.status == "FAIL" and index not in fail_count:
-                        fail_count.append(index)
-                    elif finding.status == "PASS" and index not in pass_count:
-                        pass_count.append(index)
+    pass_count = 0
+    fail_count = 0
+    muted_count = 0
+    for (
+        _,
+        status,
+        muted,
+        findings_count,
+    ) in findings_statistics.get_framework_check_status_count(
+        bulk_checks_metadata,
+        lambda compliance: compliance.Framework.upper()
+        in compliance_framework.upper().replace("_", "-")
+        and compliance.Version in compliance_framework.upper()
+        and compliance.Provider.upper() in compliance_framework.upper(),
+    ):
+        if muted:
+            muted_count += findings_count
+        elif status == "FAIL":
+            fail_count += findings_count
+        elif status == "PASS":
+            pass_count += findings_count
     if (
-        len(fail_count) + len(pass_count) + len(muted_count) > 1
+        fail_count + pass_count + muted_count > 1
     ):  # If there are no resources, don't print the compliance table
         print(
             f"\nCompliance Status of {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL} Framework:"
         )
-        total_findings_count = len(fail_count) + len(pass_count) + len(muted_count)
+        total_findings_count = fail_count + pass_count + muted_count
         overview_table = [
             [
-                f"{Fore.RED}{round(len(fail_count) / total_findings_count * 100, 2)}% ({len(fail_count)}) FAIL{Style.RESET_ALL}",
-                f"{Fore.GREEN}{round(len(pass_count) / total_findings_count * 100, 2)}% ({len(pass_count)}) PASS{Style.RESET_ALL}",
-                f"{orange_color}{round(len(muted_count) / total_findings_count * 100, 2)}% ({len(muted_count)}) MUTED{Style.RESET_ALL}",
+                f"{Fore.RED}{round(fail_count / total_findings_count * 100, 2)}% ({fail_count}) FAIL{Style.RESET_ALL}",
+                f"{Fore.GREEN}{round(pass_count / total_findings_count * 100, 2)}% ({pass_count}) PASS{Style.RESET_ALL}",
+                f"{orange_color}{round(muted_count / total_findings_count * 100, 2)}% ({muted_count}) MUTED{Style.RESET_ALL}",
             ]
         ]
         print(tabulate(overview_table, tablefmt="rounded_grid"))
@@ -2,10 +2,11 @@ from colorama import Fore, Style
 from tabulate import tabulate
 
 from prowler.config.config import orange_color
+from prowler.lib.outputs.statistics import FindingsStatistics
 
 
 def get_mitre_attack_table(
-    findings: list,
+    findings_statistics: FindingsStatistics,
     bulk_checks_metadata: dict,
     compliance_framework: str,
     output_filename: str,
@@ -19,38 +20,41 @@ def get_mitre_attack_table(
         "Status": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
-    for index, finding in enumerate(findings):
-        check = bulk_checks_metadata[finding.check_metadata.CheckID]
-        check_compliances = check.Compliance
-        for compliance in check_compliances:
-            if (
-                "MITRE-ATTACK" in compliance.Framework
-                and compliance.Version in compliance_framework
-            ):
-                for requirement in compliance.Requirements:
-                    for tactic in requirement.Tactics:
-                        if tactic not in tactics:
-                            tactics[tactic] = {"FAIL": 0, "PASS": 0, "Muted": 0}
-                        if finding.muted:
-                            if index not in muted_count:
-                                muted_count.append(index)
-                                tactics[tactic]["Muted"] += 1
-                        else:
-                            if finding.status == "FAIL":
-                                if index not in fail_count:
-                                    fail_count.append(index)
-                                    tactics[tactic]["FAIL"] += 1
-                            elif finding.status == "PASS":
-                                if index not in pass_count:
-                                    pass_count.append(index)
-                                    tactics[tactic]["PASS"] += 1
+    pass_count = 0
+    fail_count = 0
+    muted_count = 0
+    for (
+        compliances,
+        status,
+        muted,
+        findings_count,
+    ) in findings_statistics.get_framework_check_status_count(
+        bulk_checks_metadata,
+        lambda compliance: "MITRE-ATTACK" in compliance.Framework
+        and compliance.Version in compliance_framework,
+    ):
+        counted = False
+        for compliance in compliances:
+            provider = compliance.Provider
+            for requirement in compliance.Requirements:
+                for tactic in requirement.Tactics:
+                    if tactic not in tactics:
+                        tactics[tactic] = {"FAIL": 0, "PASS": 0, "Muted": 0}
+                    if not counted:
+                        counted = True
+                        if muted:
+                            muted_count += findings_count
+                            tactics[tactic]["Muted"] += findings_count
+                        elif status == "FAIL":
+                            fail_count += findings_count
+                            tactics[tactic]["FAIL"] += findings_count
+                        elif status == "PASS":
+                            pass_count += findings_count
+                            tactics[tactic]["PASS"] += findings_count
     # Add results to table
     tactics = dict(sorted(tactics.items()))
     for tactic in tactics:
-        mitre_compliance_table["Provider"].append(compliance.Provider)
+        mitre_compliance_table["Provider"].append(provider)
         mitre_compliance_table["Tactic"].append(tactic)
         if tactics[tactic]["FAIL"] > 0:
             mitre_compliance_table["Status"].append(
@@ -64,17 +68,17 @@ def get_mitre_attack_table(
             f"{orange_color}{tactics[tactic]['Muted']}{Style.RESET_ALL}"
         )
     if (
-        len(fail_count) + len(pass_count) + len(muted_count) > 1
+        fail_count + pass_count + muted_count > 1
     ):  # If there are no resources, don't print the compliance table
         print(
             f"\nCompliance Status of {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL} Framework:"
         )
-        total_findings_count = len(fail_count) + len(pass_count) + len(muted_count)
+        total_findings_count = fail_count + pass_count + muted_count
         overview_table = [
             [
-                f"{Fore.RED}{round(len(fail_count) / total_findings_count * 100, 2)}% ({len(fail_count)}) FAIL{Style.RESET_ALL}",
-                f"{Fore.GREEN}{round(len(pass_count) / total_findings_count * 100, 2)}% ({len(pass_count)}) PASS{Style.RESET_ALL}",
-                f"{orange_color}{round(len(muted_count) / total_findings_count * 100, 2)}% ({len(muted_count)}) MUTED{Style.RESET_ALL}",
+                f"{Fore.RED}{round(fail_count / total_findings_count * 100, 2)}% ({fail_count}) FAIL{Style.RESET_ALL}",
+                f"{Fore.GREEN}{round(pass_count / total_findings_count * 100, 2)}% ({pass_count}) PASS{Style.RESET_ALL}",
+                f"{orange_color}{round(muted_count / total_findings_count * 100, 2)}% ({muted_count}) MUTED{Style.RESET_ALL}",
             ]
         ]
         print(tabulate(overview_table, tablefmt="rounded_grid"))
@@ -2,10 +2,11 @@ from colorama import Fore, Style
 from tabulate import tabulate
 
 from prowler.config.config import orange_color
+from prowler.lib.outputs.statistics import FindingsStatistics
 
 
 def get_prowler_threatscore_table(
-    findings: list,
+    findings_statistics: FindingsStatistics,
     bulk_checks_metadata: dict,
     compliance_framework: str,
     output_filename: str,
@@ -19,59 +20,65 @@ def get_prowler_threatscore_table(
         "Score": [],
         "Muted": [],
     }
-    pass_count = []
-    fail_count = []
-    muted_count = []
+    pass_count = 0
+    fail_count = 0
+    muted_count = 0
     pillars = {}
     score_per_pillar = {}
     max_score_per_pillar = {}
-    counted_findings = []
-    for index, finding in enumerate(findings):
-        check = bulk_checks_metadata[finding.check_metadata.CheckID]
-        check_compliances = check.Compliance
-        for compliance in check_compliances:
-            if compliance.Framework == "ProwlerThreatScore":
-                for requirement in compliance.Requirements:
-                    for attribute in requirement.Attributes:
-                        pillar = attribute.Section
+    for (
+        compliances,
+        status,
+        muted,
+        findings_count,
+    ) in findings_statistics.get_framework_check_status_count(
+        bulk_checks_metadata,
+        lambda compliance: compliance.Framework == "ProwlerThreatScore",
+    ):
+        counted = False
+        for compliance in compliances:
+            provider = compliance.Provider
+            for requirement in compliance.Requirements:
+                for attribute in requirement.Attributes:
+                    pillar = attribute.Section
 
-                        if not any(
-                            [
-                                pillar in score_per_pillar.keys(),
-                                pillar in max_score_per_pillar.keys(),
-                            ]
-                        ):
-                            score_per_pillar[pillar] = 0
-                            max_score_per_pillar[pillar] = 0
+                    if not any(
+                        [
+                            pillar in score_per_pillar.keys(),
+                            pillar in max_score_per_pillar.keys(),
+                        ]
+                    ):
+                        score_per_pillar[pillar] = 0
+                        max_score_per_pillar[pillar] = 0
 
-                        if index not in counted_findings:
-                            if finding.status == "PASS":
-                                score_per_pillar[pillar] += (
-                                    attribute.LevelOfRisk * attribute.Weight
-                                )
-                            max_score_per_pillar[pillar] += (
-                                attribute.LevelOfRisk * attribute.Weight
-                            )
-                            counted_findings.append(index)
+                    if pillar not in pillars:
+                        pillars[pillar] = {"FAIL": 0, "PASS": 0, "Muted": 0}
 
-                        if pillar not in pillars:
-                            pillars[pillar] = {"FAIL": 0, "PASS": 0, "Muted": 0}
+                    if not counted:
+                        counted = True
+                        if status == "PASS":
+                            score_per_pillar[pillar] += (
+                                attribute.LevelOfRisk
+                                * attribute.Weight
+                                * findings_count
+                            )
+                        max_score_per_pillar[pillar] += (
+                            attribute.LevelOfRisk * attribute.Weight * findings_count
+                        )
 
-                        if finding.muted:
-                            if index not in muted_count:
-                                muted_count.append(index)
-                                pillars[pillar]["Muted"] += 1
-                        else:
-                            if finding.status == "FAIL" and index not in fail_count:
-                                fail_count.append(index)
-                                pillars[pillar]["FAIL"] += 1
-                            elif finding.status == "PASS" and index not in pass_count:
-                                pass_count.append(index)
-                                pillars[pillar]["PASS"] += 1
+                        if muted:
+                            muted_count += findings_count
+                            pillars[pillar]["Muted"] += findings_count
+                        elif status == "FAIL":
+                            fail_count += findings_count
+                            pillars[pillar]["FAIL"] += findings_count
+                        elif status == "PASS":
+                            pass_count += findings_count
+                            pillars[pillar]["PASS"] += findings_count
 
     pillars = dict(sorted(pillars.items()))
     for pillar in pillars:
-        pillar_table["Provider"].append(compliance.Provider)
+        pillar_table["Provider"].append(provider)
         pillar_table["Pillar"].append(pillar)
         pillar_table["Score"].append(
             f"{Style.BRIGHT}{Fore.RED}{(score_per_pillar[pillar] / max_score_per_pillar[pillar]) * 100:.2f}%{Style.RESET_ALL}"
@@ -89,22 +96,22 @@ def get_prowler_threatscore_table(
         )
 
     if (
-        len(fail_count) + len(pass_count) + len(muted_count) > 1
+        fail_count + pass_count + muted_count > 1
     ):  # If there are no resources, don't print the compliance table
         print(
             f"\nCompliance Status of {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL} Framework:"
         )
-        total_findings_count = len(fail_count) + len(pass_count) + len(muted_count)
+        total_findings_count = fail_count + pass_count + muted_count
         overview_table = [
             [
-                f"{Fore.RED}{round(len(fail_count) / total_findings_count * 100, 2)}% ({len(fail_count)}) FAIL{Style.RESET_ALL}",
-                f"{Fore.GREEN}{round(len(pass_count) / total_findings_count * 100, 2)}% ({len(pass_count)}) PASS{Style.RESET_ALL}",
-                f"{orange_color}{round(len(muted_count) / total_findings_count * 100, 2)}% ({len(muted_count)}) MUTED{Style.RESET_ALL}",
+                f"{Fore.RED}{round(fail_count / total_findings_count * 100, 2)}% ({fail_count}) FAIL{Style.RESET_ALL}",
+                f"{Fore.GREEN}{round(pass_count / total_findings_count * 100, 2)}% ({pass_count}) PASS{Style.RESET_ALL}",
+                f"{orange_color}{round(muted_count / total_findings_count * 100, 2)}% ({muted_count}) MUTED{Style.RESET_ALL}",
             ]
         ]
         print(tabulate(overview_table, tablefmt="rounded_grid"))
         if not compliance_overview:
-            if len(fail_count) > 0 and len(pillar_table["Pillar"]) > 0:
+            if fail_count > 0 and len(pillar_table["Pillar"]) > 0:
                 print(
                     f"\nFramework {Fore.YELLOW}{compliance_framework.upper()}{Style.RESET_ALL} Results:"
                 )
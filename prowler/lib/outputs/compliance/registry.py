@@ -0,0 +1,90 @@
+from fnmatch import fnmatchcase
+from importlib import import_module
+from typing import Optional
+
+compliance_outputs_path = "prowler.lib.outputs.compliance"
+
+# Compliance output of the frameworks of every provider, as (framework name pattern, "<module>.<class>") in order.
+# The frameworks that do not match any pattern use the generic compliance output.
+# The classes are imported only when a framework is written, since every output imports its compliance models.
+COMPLIANCE_OUTPUTS = {
+    "aws": [
+        ("cis_*", "cis.cis_aws.AWSCIS"),
+        ("mitre_attack_aws", "mitre_attack.mitre_attack_aws.AWSMitreAttack"),
+        ("ens_*", "ens.ens_aws.AWSENS"),
+        (
+            "aws_well_architected_framework*",
+            "aws_well_architected.aws_well_architected.AWSWellArchitected",
+        ),
+        ("iso27001_*", "iso27001.iso27001_aws.AWSISO27001"),
+        ("kisa*", "kisa_ismsp.kisa_ismsp_aws.AWSKISAISMSP"),
+        (
+            "prowler_threatscore_aws",
+            "prowler_threatscore.prowler_threatscore_aws.ProwlerThreatScoreAWS",
+        ),
+    ],
+    "azure": [
+        ("cis_*", "cis.cis_azure.AzureCIS"),
+        ("mitre_attack_azure", "mitre_attack.mitre_attack_azure.AzureMitreAttack"),
+        ("ens_*", "ens.ens_azure.AzureENS"),
+        ("iso27001_*", "iso27001.iso27001_azure.AzureISO27001"),
+        (
+            "prowler_threatscore_azure",
+            "prowler_threatscore.prowler_threatscore_azure.ProwlerThreatScoreAzure",
+        ),
+    ],
+    "gcp": [
+        ("cis_*", "cis.cis_gcp.GCPCIS"),
+        ("mitre_attack_gcp", "mitre_attack.mitre_attack_gcp.GCPMitreAttack"),
+        ("ens_*", "ens.ens_gcp.GCPENS"),
+        ("iso27001_*", "iso27001.iso27001_gcp.GCPISO27001"),
+        (
+            "prowler_threatscore_gcp",
+            "prowler_threatscore.prowler_threatscore_gcp.ProwlerThreatScoreGCP",
+        ),
+    ],
+    "kubernetes": [
+        ("cis_*", "cis.cis_kubernetes.KubernetesCIS"),
+        ("iso27001_*", "iso27001.iso27001_kubernetes.KubernetesISO27001"),
+    ],
+    "m365": [
+        ("cis_*", "cis.cis_m365.M365CIS"),
+        (
+            "prowler_threatscore_m365",
+            "prowler_threatscore.prowler_threatscore_m365.ProwlerThreatScoreM365",
+        ),
+        ("iso27001_*", "iso27001.iso27001_m365.M365ISO27001"),
+    ],
+    "nhn": [
+        ("iso27001_*", "iso27001.iso27001_nhn.NHNISO27001"),
+    ],
+    "github": [
+        ("cis_*", "cis.cis_github.GithubCIS"),
+    ],
+}
+GENERIC_COMPLIANCE_OUTPUT = "generic.generic.GenericCompliance"
+
+
+def get_compliance_output_class(provider: str, compliance_name: str) -> Optional[type]:
+    """
+    Returns the compliance output class of the framework, importing only its module.
+
+    Args:
+        provider (str): The provider name.
+        compliance_name (str): The compliance framework name, e.g. cis_2.0_aws.
+
+    Returns:
+        type: The ComplianceOutput class of the framework, or None if the provider has no compliance outputs.
+    """
+    if provider not in COMPLIANCE_OUTPUTS:
+        return None
+    compliance_output = next(
+        (
+            output
+            for pattern, output in COMPLIANCE_OUTPUTS[provider]
+            if fnmatchcase(compliance_name, pattern)
+        ),
+        GENERIC_COMPLIANCE_OUTPUT,
+    )
+    module, class_name = compliance_output.rsplit(".", 1)
+    return getattr(import_module(f"{compliance_outputs_path}.{module}"), class_name)
@@ -0,0 +1,384 @@
+import base64
+import json
+import zlib
+from io import TextIOWrapper
+
+from prowler.lib.logger import logger
+from prowler.lib.outputs.html.html import HTML
+from prowler.lib.outputs.output import Finding
+from prowler.lib.outputs.utils import unroll_dict
+from prowler.lib.scan.profiler import profiled
+from prowler.providers.common.provider import Provider
+
+
+class CompactHTML(HTML):
+    """
+    CompactHTML class that writes a single file HTML report for large scans.
+
+    The findings are embedded as gzip compressed JSON and rendered by the browser in a virtualized
+    table, so only the visible rows are in the DOM. The check metadata (title, risk, recommendation)
+    and the compliance requirements are stored once per check in lookup tables that the findings
+    reference, so the markup and the markdown rendering grow with the number of checks instead of
+    the number of findings.
+
+    Attributes:
+        - _data: The findings pending to be written, as lists of values.
+        - _checks: The index of every check in the checks table, by check ID.
+        - _compliances: The index of every compliance requirements string, by string.
+
+    Methods:
+        - transform(findings: list[Finding]) -> None: Transforms the findings into rows of the report.
+        - batch_write_data_to_file(provider: Provider, stats: dict) -> None: Writes the rows compressed into the report.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._checks = {}
+        self._check_rows = []
+        self._compliances = {}
+        self._compressor = None
+        self._pending_bytes = b""
+        self._findings_written = 0
+        super().__init__(*args, **kwargs)
+
+    def transform(self, findings: list[Finding]) -> None:
+        """Transforms the findings into rows of the compact HTML report.
+
+        Args:
+            findings (list[Finding]): a list of Finding objects
+        """
+        try:
+            for finding in findings:
+                check_index = self._checks.get(finding.metadata.CheckID)
+                if check_index is None:
+                    check_index = len(self._check_rows)
+                    self._checks[finding.metadata.CheckID] = check_index
+                    self._check_rows.append(
+                        [
+                            finding.metadata.CheckID,
+                            finding.metadata.CheckTitle,
+                            finding.metadata.ServiceName,
+                            finding.metadata.Severity.value,
+                            HTML.process_markdown(finding.metadata.Risk),
+                            HTML.process_markdown(
+                                finding.metadata.Remediation.Recommendation.Text
+                            ),
+                            finding.metadata.Remediation.Recommendation.Url,
+                        ]
+                    )
+                compliance = unroll_dict(finding.compliance, separator=": ")
+                compliance_index = self._compliances.setdefault(
+                    compliance, len(self._compliances)
+                )
+                finding_status = finding.status.value
+                # Change the status of the finding if it's muted
+                if finding.muted:
+                    finding_status = f"MUTED ({finding_status})"
+                self._data.append(
+                    [
+                        check_index,
+                        finding_status,
+                        finding.region.lower(),
+                        finding.resource_uid,
+                        unroll_dict(finding.resource_tags),
+                        finding.status_extended,
+                        compliance_index,
+                    ]
+                )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    @profiled("output")
+    def batch_write_data_to_file(self, provider: Provider, stats: dict) -> None:
+        """
+        Writes the findings to the report using the `Output._file_descriptor`.
+
+        The JSON document is compressed and base64 encoded while it is written, so the findings of
+        every batch are released once written and the lookup tables are only added when closing.
+
+        Args:
+            provider (Provider): the provider object
+            stats (dict): the statistics of the findings
+        """
+        try:
+            if (
+                getattr(self, "_file_descriptor", None)
+                and not self._file_descriptor.closed
+                and self._data
+            ):
+                if self._file_descriptor.tell() == 0:
+                    CompactHTML.write_header(
+                        self._file_descriptor, provider, stats, self._from_cli
+                    )
+                    # gzip container so the browser can use DecompressionStream
+                    self._compressor = zlib.compressobj(wbits=31)
+                    self._write_compressed('{"findings":[')
+                for finding in self._data:
+                    self._write_compressed(
+                        ("," if self._findings_written else "")
+                        + json.dumps(finding, separators=(",", ":"))
+                    )
+                    self._findings_written += 1
+                if self.close_file or self._from_cli:
+                    self._write_compressed(
+                        '],"checks":'
+                        + json.dumps(self._check_rows, separators=(",", ":"))
+                        + ',"compliances":'
+                        + json.dumps(list(self._compliances), separators=(",", ":"))
+                        + "}"
+                    )
+                    self._file_descriptor.write(
+                        base64.b64encode(
+                            self._pending_bytes + self._compressor.flush()
+                        ).decode("ascii")
+                    )
+                    self._pending_bytes = b""
+                    CompactHTML.write_footer(self._file_descriptor)
+                    self._file_descriptor.close()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def _write_compressed(self, text: str) -> None:
+        """Compresses the text and writes it base64 encoded, keeping the bytes that do not fill a base64 block."""
+        data = self._pending_bytes + self._compressor.compress(text.encode("utf-8"))
+        complete_blocks = len(data) - len(data) % 3
+        self._file_descriptor.write(
+            base64.b64encode(data[:complete_blocks]).decode("ascii")
+        )
+        self._pending_bytes = data[complete_blocks:]
+
+    @staticmethod
+    def write_header(
+        file_descriptor: TextIOWrapper,
+        provider: Provider,
+        stats: dict,
+        from_cli: bool = True,
+    ) -> None:
+        """
+        Writes the header of the compact HTML file, up to the opening of the embedded data.
+
+        Args:
+            file_descriptor (file): the file descriptor to write the header
+            provider (Provider): the provider object
+            stats (dict): the statistics of the findings
+            from_cli (bool): whether the request is from the CLI or not
+        """
+        try:
+            file_descriptor.write(
+                f"""<!DOCTYPE html>
+    <html lang="en">
+    <head>
+    <meta http-equiv="Content-Type" content="text/html; charset=UTF-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1, shrink-to-fit=no" />
+    <link rel="stylesheet" href="https://stackpath.bootstrapcdn.com/bootstrap/4.5.0/css/bootstrap.min.css"
+        integrity="sha384-9aIt2nRpC12Uk9gS9baDl411NQApFmC26EwAOH8WgZl5MYYxFfc+NcPb1dKGj7Sk" crossorigin="anonymous" />
+    <style>
+        .container-fluid {{font-size: 14px;}}
+
+        .float-left {{ float: left !important; max-width: 100%; }}
+
+        #findingsViewport {{height: 70vh; overflow-y: auto; border: 1px solid #dee2e6;}}
+
+        #findingsSpacer {{position: relative;}}
+
+        .findings-row, .findings-head {{display: grid; grid-template-columns: 8% 7% 8% 9% 16% 18% 16% 18%; align-items: center;}}
+
+        .findings-head {{font-weight: bold; background-color: #e9ecef; cursor: pointer; user-select: none;}}
+
+        .findings-row {{position: absolute; left: 0; right: 0; height: 32px; cursor: pointer; border-bottom: 1px solid #dee2e6;}}
+
+        .findings-row > div, .findings-head > div {{overflow: hidden; white-space: nowrap; text-overflow: ellipsis; padding: 0 6px;}}
+
+        .row-pass {{background-color: #98dea7;}}
+
+        .row-fail {{background-color: #f28484;}}
+
+        .row-manual {{background-color: #bee5eb;}}
+
+        .row-muted {{background-color: #ffeeba;}}
+    </style>
+    <title>Prowler - The Handy Cloud Security Tool</title>
+    </head>
+    <body>
+    <div class="container-fluid">{HTML.get_report_summary(provider, stats, from_cli)}
+        <div class="row mt-3">
+        <div class="col-md-12">
+            <div class="form-row mb-2">
+                <div class="col-md-4"><input id="findingsSearch" class="form-control form-control-sm" type="search" placeholder="Search" /></div>
+                <div class="col-md-2"><select id="statusFilter" class="form-control form-control-sm"><option value="">All Statuses</option></select></div>
+                <div class="col-md-2"><select id="severityFilter" class="form-control form-control-sm"><option value="">All Severities</option></select></div>
+                <div class="col-md-2"><select id="serviceFilter" class="form-control form-control-sm"><option value="">All Services</option></select></div>
+                <div class="col-md-2 pt-1" id="findingsCount"></div>
+            </div>
+            <div class="findings-head" id="findingsHead">
+                <div data-column="status">Status</div>
+                <div data-column="severity">Severity</div>
+                <div data-column="service">Service Name</div>
+                <div data-column="region">{"Line Range" if provider.type == "iac" else "Region"}</div>
+                <div data-column="checkId">Check ID</div>
+                <div data-column="checkTitle">Check Title</div>
+                <div data-column="resource">Resource ID</div>
+                <div data-column="statusExtended">Status Extended</div>
+            </div>
+            <div id="findingsViewport"><div id="findingsSpacer"></div></div>
+            <div class="card mt-3 d-none" id="findingDetails">
+                <div class="card-header" id="findingDetailsTitle"></div>
+                <ul class="list-group list-group-flush">
+                    <li class="list-group-item"><b>Resource ID:</b> <span id="findingDetailsResource"></span></li>
+                    <li class="list-group-item"><b>Resource Tags:</b> <span id="findingDetailsTags"></span></li>
+                    <li class="list-group-item"><b>Status Extended:</b> <span id="findingDetailsStatusExtended"></span></li>
+                    <li class="list-group-item"><b>Risk:</b> <span id="findingDetailsRisk"></span></li>
+                    <li class="list-group-item"><b>Recommendation:</b> <span id="findingDetailsRecommendation"></span> <a id="findingDetailsRecommendationUrl" target="_blank" rel="noopener noreferrer">Link</a></li>
+                    <li class="list-group-item"><b>Compliance:</b> <span id="findingDetailsCompliance"></span></li>
+                </ul>
+            </div>
+        </div>
+        </div>
+    </div>
+    <script id="findingsData" type="application/octet-stream">"""
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
+            )
+
+    @staticmethod
+    def write_footer(file_descriptor: TextIOWrapper) -> None:
+        """
+        Writes the footer of the compact HTML file, closing the embedded data and adding the table rendering.
+
+        Args:
+            file_descriptor (file): the file descriptor to write the footer
+        """
+        try:
+            file_descriptor.write(
+                """</script>
+    <script>
+        const ROW_HEIGHT = 32;
+        const STATUS_CLASSES = {PASS: "row-pass", FAIL: "row-fail", MANUAL: "row-manual"};
+
+        async function loadReport() {
+            const encoded = document.getElementById("findingsData").textContent.trim();
+            const bytes = Uint8Array.from(atob(encoded), (character) => character.charCodeAt(0));
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+            return JSON.parse(await new Response(stream).text());
+        }
+
+        function fillSelect(select, values) {
+            Array.from(new Set(values)).sort().forEach((value) => {
+                const option = document.createElement("option");
+                option.value = value;
+                option.textContent = value;
+                select.appendChild(option);
+            });
+        }
+
+        loadReport().then((report) => {
+            const findings = report.findings.map((row) => {
+                const check = report.checks[row[0]];
+                return {
+                    check: check,
+                    checkId: check[0],
+                    checkTitle: check[1],
+                    service: check[2],
+                    severity: check[3],
+                    status: row[1],
+                    region: row[2],
+                    resource: row[3],
+                    tags: row[4],
+                    statusExtended: row[5],
+                    compliance: report.compliances[row[6]],
+                };
+            });
+            const viewport = document.getElementById("findingsViewport");
+            const spacer = document.getElementById("findingsSpacer");
+            const search = document.getElementById("findingsSearch");
+            const filters = {
+                status: document.getElementById("statusFilter"),
+                severity: document.getElementById("severityFilter"),
+                service: document.getElementById("serviceFilter"),
+            };
+            Object.entries(filters).forEach(([column, select]) => {
+                fillSelect(select, findings.map((finding) => finding[column]));
+                select.addEventListener("change", update);
+            });
+            search.addEventListener("input", update);
+
+            let visibleFindings = findings;
+            let sortColumn = "checkTitle";
+            let sortAscending = true;
+            document.getElementById("findingsHead").addEventListener("click", (event) => {
+                const column = event.target.dataset.column;
+                if (!column) return;
+                sortAscending = column === sortColumn ? !sortAscending : true;
+                sortColumn = column;
+                update();
+            });
+
+            function update() {
+                const text = search.value.toLowerCase();
+                visibleFindings = findings.filter((finding) =>
+                    Object.entries(filters).every(([column, select]) => !select.value || finding[column] === select.value) &&
+                    (!text || [finding.checkId, finding.checkTitle, finding.resource, finding.statusExtended, finding.region]
+                        .some((value) => value.toLowerCase().includes(text)))
+                );
+                visibleFindings.sort((a, b) => a[sortColumn].localeCompare(b[sortColumn]) * (sortAscending ? 1 : -1));
+                document.getElementById("findingsCount").textContent = `${visibleFindings.length} of ${findings.length} findings`;
+                spacer.style.height = `${visibleFindings.length * ROW_HEIGHT}px`;
+                viewport.scrollTop = 0;
+                render();
+            }
+
+            function render() {
+                // Only the rows in the viewport, plus a margin, are kept in the DOM
+                const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - 10);
+                const last = Math.min(visibleFindings.length, first + Math.ceil(viewport.clientHeight / ROW_HEIGHT) + 20);
+                const rows = document.createDocumentFragment();
+                for (let index = first; index < last; index++) {
+                    const finding = visibleFindings[index];
+                    const row = document.createElement("div");
+                    const status = finding.status.startsWith("MUTED") ? "row-muted" : STATUS_CLASSES[finding.status];
+                    row.className = `findings-row ${status || ""}`;
+                    row.style.top = `${index * ROW_HEIGHT}px`;
+                    [finding.status, finding.severity, finding.service, finding.region, finding.checkId,
+                        finding.checkTitle, finding.resource, finding.statusExtended].forEach((value) => {
+                        const cell = document.createElement("div");
+                        cell.textContent = value;
+                        cell.title = value;
+                        row.appendChild(cell);
+                    });
+                    row.addEventListener("click", () => showDetails(finding));
+                    rows.appendChild(row);
+                }
+                spacer.replaceChildren(rows);
+            }
+
+            function showDetails(finding) {
+                document.getElementById("findingDetails").classList.remove("d-none");
+                document.getElementById("findingDetailsTitle").textContent = `${finding.checkId} - ${finding.checkTitle}`;
+                document.getElementById("findingDetailsResource").textContent = finding.resource;
+                document.getElementById("findingDetailsTags").textContent = finding.tags;
+                document.getElementById("findingDetailsStatusExtended").textContent = finding.statusExtended;
+                // Risk and recommendation are the markdown rendered on report generation
+                document.getElementById("findingDetailsRisk").innerHTML = finding.check[4];
+                document.getElementById("findingDetailsRecommendation").innerHTML = finding.check[5];
+                document.getElementById("findingDetailsRecommendationUrl").href = finding.check[6];
+                document.getElementById("findingDetailsCompliance").textContent = finding.compliance;
+            }
+
+            viewport.addEventListener("scroll", () => window.requestAnimationFrame(render));
+            update();
+        });
+    </script>
+</body>
+
+</html>
+"""
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
+            )
@@ -1,4 +1,5 @@
 import sys
+from functools import lru_cache
 from io import TextIOWrapper
 
 import markdown
@@ -12,15 +13,19 @@ from prowler.config.config import (
 from prowler.lib.logger import logger
 from prowler.lib.outputs.output import Finding, Output
 from prowler.lib.outputs.utils import parse_html_string, unroll_dict
+from prowler.lib.scan.profiler import profiled
 from prowler.providers.common.provider import Provider
 
 
 class HTML(Output):
     @staticmethod
+    @lru_cache(maxsize=4096)
     def process_markdown(text: str) -> str:
         """
         Process markdown syntax in text and convert to HTML using the markdown library.
 
+        The texts are per check, not per finding, so the conversions are cached.
+
         Args:
             text (str): Text containing markdown syntax
 
@@ -95,6 +100,7 @@ class HTML(Output):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    @profiled("output")
     def batch_write_data_to_file(self, provider: Provider, stats: dict) -> None:
         """
         Writes the findings to a file using the HTML format using the `Output._file_descriptor`.
@@ -176,7 +182,49 @@ class HTML(Output):
     <title>Prowler - The Handy Cloud Security Tool</title>
     </head>
     <body>
-    <div class="container-fluid">
+    <div class="container-fluid">{HTML.get_report_summary(provider, stats, from_cli)}
+        <div class="row-mt-3">
+        <div class="col-md-12">
+            <table class="table compact stripe row-border ordering" id="findingsTable" data-order='[[ 5, "asc" ]]' data-page-length='100'>
+            <thead class="thead-light">
+                <tr>
+                    <th scope="col">Status</th>
+                    <th scope="col">Severity</th>
+                    <th scope="col">Service Name</th>
+                    <th scope="col">{"Line Range" if provider.type == "iac" else "Region"}</th>
+                    <th style="width:20%" scope="col">Check ID</th>
+                    <th style="width:20%" scope="col">Check Title</th>
+                    <th scope="col">Resource ID</th>
+                    <th scope="col">Resource Tags</th>
+                    <th scope="col">Status Extended</th>
+                    <th scope="col">Risk</th>
+                    <th scope="col">Recommendation</th>
+                    <th scope="col">Compliance</th>
+                </tr>
+            </thead>
+            <tbody>"""
+            )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
+            )
+
+    @staticmethod
+    def get_report_summary(
+        provider: Provider, stats: dict, from_cli: bool = True
+    ) -> str:
+        """
+        Gets the report information, assessment summary and overview cards of the HTML report.
+
+        Args:
+            provider (Provider): the provider object
+            stats (dict): the statistics of the findings
+            from_cli (bool): whether the request is from the CLI or not
+
+        Returns:
+            str: the HTML of the cards
+        """
+        return f"""
         <div class="row mt-3">
         <div class="col-md-4">
             <a href="{html_logo_url}"><img class="float-left card-img-left mt-4 mr-4 ml-4"
@@ -232,32 +280,7 @@ class HTML(Output):
             </div>
         </div>
         </div>
-        </div>
-        <div class="row-mt-3">
-        <div class="col-md-12">
-            <table class="table compact stripe row-border ordering" id="findingsTable" data-order='[[ 5, "asc" ]]' data-page-length='100'>
-            <thead class="thead-light">
-                <tr>
-                    <th scope="col">Status</th>
-                    <th scope="col">Severity</th>
-                    <th scope="col">Service Name</th>
-                    <th scope="col">{"Line Range" if provider.type == "iac" else "Region"}</th>
-                    <th style="width:20%" scope="col">Check ID</th>
-                    <th style="width:20%" scope="col">Check Title</th>
-                    <th scope="col">Resource ID</th>
-                    <th scope="col">Resource Tags</th>
-                    <th scope="col">Status Extended</th>
-                    <th scope="col">Risk</th>
-                    <th scope="col">Recommendation</th>
-                    <th scope="col">Compliance</th>
-                </tr>
-            </thead>
-            <tbody>"""
-            )
-        except Exception as error:
-            logger.error(
-                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
-            )
+        </div>"""
 
     @staticmethod
     def write_footer(file_descriptor: TextIOWrapper) -> None:
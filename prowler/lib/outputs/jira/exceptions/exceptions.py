@@ -94,6 +94,10 @@ class JiraBaseException(ProwlerException):
             "message": "Jira project requires custom fields that are not supported.",
             "remediation": "Please configure the Jira project to not require custom fields, or use a different project.",
         },
+        (9022, "JiraSearchIssuesError"): {
+            "message": "Failed to search the open issues in Jira.",
+            "remediation": "Please check the connection settings and permissions and try again.",
+        },
     }
 
     def __init__(self, code, file=None, original_exception=None, message=None):
@@ -262,3 +266,10 @@ class JiraRequiredCustomFieldsError(JiraBaseException):
         super().__init__(
             9021, file=file, original_exception=original_exception, message=message
         )
+
+
+class JiraSearchIssuesError(JiraBaseException):
+    def __init__(self, file=None, original_exception=None, message=None):
+        super().__init__(
+            9022, file=file, original_exception=original_exception, message=message
+        )
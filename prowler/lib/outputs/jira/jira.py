@@ -1,11 +1,15 @@
 import base64
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict
 
 import requests
 import requests.compat
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from prowler.lib.logger import logger
 from prowler.lib.outputs.finding import Finding
@@ -30,6 +34,7 @@ from prowler.lib.outputs.jira.exceptions.exceptions import (
     JiraRefreshTokenError,
     JiraRefreshTokenResponseError,
     JiraRequiredCustomFieldsError,
+    JiraSearchIssuesError,
     JiraSendFindingsResponseError,
     JiraTestConnectionError,
 )
@@ -81,6 +86,7 @@ class Jira:
         - get_available_issue_types: Get the available issue types for a project
         - get_available_issue_labels: Get the available labels for a project
         - send_findings: Send the findings to Jira and create an issue
+        - send_findings_bulk: Send the findings to Jira using the bulk endpoint, skipping the ones with an open issue
 
     Raises:
         - JiraGetAuthResponseError: Failed to get the access token and refresh token
@@ -102,6 +108,7 @@ class Jira:
         - JiraTestConnectionError: Failed to test the connection
         - JiraBasicAuthError: Failed to authenticate using basic auth
         - JiraInvalidParameterError: The provided parameters in Init are invalid
+        - JiraSearchIssuesError: Failed to search the open issues in Jira
 
     Usage:
         jira = Jira(
@@ -141,6 +148,19 @@ class Jira:
         "X-Force-Accept-Language": "true",
         "Accept-Language": "en",
     }
+    API_BASE_URL = "https://api.atlassian.com/ex/jira"
+    # Jira accepts up to 50 issues per bulk creation request
+    BULK_CREATE_MAX_ISSUES = 50
+    BULK_CREATE_MAX_WORKERS = 4
+    SEARCH_MAX_LABELS = 50
+    SEARCH_MAX_RESULTS = 100
+    FINDING_LABEL_PREFIX = "prowler-finding-"
+    # Rate limited requests are not processed by Jira so they are safe to retry, even the non idempotent issue creation,
+    # other errors like 503 can be returned once the issues are created so retrying them could duplicate the issues
+    RETRY_STATUS_CODES = (429,)
+    MAX_RETRIES = 5
+    RETRY_BACKOFF_FACTOR = 1
+    _session: requests.Session = None
 
     def __init__(
         self,
@@ -230,6 +250,34 @@ class Jira:
 
         return headers
 
+    @property
+    def session(self) -> requests.Session:
+        """Session shared by the bulk requests, reusing the connections and retrying rate limited requests
+
+        Only the 429 responses are retried, for any method since Jira did not process the request, honouring the
+        `Retry-After` header returned by Jira, otherwise an exponential backoff is used.
+        """
+        if self._session is None:
+            retries = Retry(
+                total=self.MAX_RETRIES,
+                connect=self.MAX_RETRIES,
+                read=0,
+                status=self.MAX_RETRIES,
+                status_forcelist=self.RETRY_STATUS_CODES,
+                allowed_methods=None,
+                backoff_factor=self.RETRY_BACKOFF_FACTOR,
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_maxsize=self.BULK_CREATE_MAX_WORKERS, max_retries=retries
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
     def get_params(self, state_encoded):
         return {
             **self.PARAMS_TEMPLATE,
@@ -1547,6 +1595,91 @@ class Jira:
             ],
         }
 
+    def get_issue_fields(
+        self,
+        project_key: str = "",
+        issue_type: str = "",
+        issue_labels: list[str] = None,
+        check_id: str = "",
+        check_title: str = "",
+        severity: str = "",
+        status: str = "",
+        status_extended: str = "",
+        provider: str = "",
+        region: str = "",
+        resource_uid: str = "",
+        resource_name: str = "",
+        risk: str = "",
+        recommendation_text: str = "",
+        recommendation_url: str = "",
+        remediation_code_native_iac: str = "",
+        remediation_code_terraform: str = "",
+        remediation_code_cli: str = "",
+        remediation_code_other: str = "",
+        resource_tags: dict = "",
+        compliance: dict = "",
+        finding_url: str = "",
+        tenant_info: str = "",
+    ) -> dict:
+        """
+        Get the fields of the Jira issue created for a finding
+
+        Args:
+            - project_key: The project key
+            - issue_type: The issue type
+            - issue_labels: The issue labels
+            - The rest of the arguments are the finding attributes, see send_finding
+
+        Returns:
+            - dict: The issue fields with the project, summary, ADF description, issue type and labels
+        """
+        status_color = self.get_color_from_status(status)
+        severity_color = self.get_severity_color(severity.lower())
+        adf_description = self.get_adf_description(
+            check_id=check_id,
+            check_title=check_title,
+            severity=severity.upper(),
+            severity_color=severity_color,
+            status=status,
+            status_color=status_color,
+            status_extended=status_extended,
+            provider=provider,
+            region=region,
+            resource_uid=resource_uid,
+            resource_name=resource_name,
+            risk=risk,
+            recommendation_text=recommendation_text,
+            recommendation_url=recommendation_url,
+            remediation_code_native_iac=remediation_code_native_iac,
+            remediation_code_terraform=remediation_code_terraform,
+            remediation_code_cli=remediation_code_cli,
+            remediation_code_other=remediation_code_other,
+            resource_tags=resource_tags,
+            compliance=compliance,
+            finding_url=finding_url,
+            tenant_info=tenant_info,
+        )
+
+        summary_parts = ["[Prowler]"]
+        if severity:
+            summary_parts.append(severity.upper())
+        if check_id:
+            summary_parts.append(check_id)
+        if resource_uid:
+            summary_parts.append(resource_uid)
+        summary = " - ".join(summary_parts[1:])
+        summary = f"{summary_parts[0]} {summary}"
+
+        fields = {
+            "project": {"key": project_key},
+            "summary": summary,
+            "description": adf_description,
+            "issuetype": {"name": issue_type},
+        }
+        if issue_labels:
+            fields["labels"] = issue_labels
+        return fields
+
     def send_findings(
         self,
         findings: list[Finding] = None,
@@ -1603,55 +1736,33 @@ class Jira:
             headers = self.get_headers(access_token, content_type_json=True)
 
             for finding in findings:
-                status_color = self.get_color_from_status(finding.status.value)
-                severity_color = self.get_severity_color(
-                    finding.metadata.Severity.value.lower()
-                )
-                adf_description = self.get_adf_description(
-                    check_id=finding.metadata.CheckID,
-                    check_title=finding.metadata.CheckTitle,
-                    severity=finding.metadata.Severity.value.upper(),
-                    severity_color=severity_color,
-                    status=finding.status.value,
-                    status_color=status_color,
-                    status_extended=finding.status_extended,
-                    provider=finding.metadata.Provider,
-                    region=finding.region,
-                    resource_uid=finding.resource_uid,
-                    resource_name=finding.resource_name,
-                    risk=finding.metadata.Risk,
-                    recommendation_text=finding.metadata.Remediation.Recommendation.Text,
-                    recommendation_url=finding.metadata.Remediation.Recommendation.Url,
-                    remediation_code_native_iac=finding.metadata.Remediation.Code.NativeIaC,
-                    remediation_code_terraform=finding.metadata.Remediation.Code.Terraform,
-                    remediation_code_cli=finding.metadata.Remediation.Code.CLI,
-                    remediation_code_other=finding.metadata.Remediation.Code.Other,
-                    resource_tags=finding.resource_tags,
-                    compliance=finding.compliance,
-                    finding_url=finding_url,
-                    tenant_info=tenant_info,
-                )
-                summary_parts = ["[Prowler]"]
-                if finding.metadata.Severity.value:
-                    summary_parts.append(finding.metadata.Severity.value.upper())
-                if finding.metadata.CheckID:
-                    summary_parts.append(finding.metadata.CheckID)
-                if finding.resource_uid:
-                    summary_parts.append(finding.resource_uid)
-
-                summary = " - ".join(summary_parts[1:])
-                summary = f"{summary_parts[0]} {summary}"
-
                 payload = {
-                    "fields": {
-                        "project": {"key": project_key},
-                        "summary": summary,
-                        "description": adf_description,
-                        "issuetype": {"name": issue_type},
-                    }
+                    "fields": self.get_issue_fields(
+                        project_key=project_key,
+                        issue_type=issue_type,
+                        issue_labels=issue_labels,
+                        check_id=finding.metadata.CheckID,
+                        check_title=finding.metadata.CheckTitle,
+                        severity=finding.metadata.Severity.value,
+                        status=finding.status.value,
+                        status_extended=finding.status_extended,
+                        provider=finding.metadata.Provider,
+                        region=finding.region,
+                        resource_uid=finding.resource_uid,
+                        resource_name=finding.resource_name,
+                        risk=finding.metadata.Risk,
+                        recommendation_text=finding.metadata.Remediation.Recommendation.Text,
+                        recommendation_url=finding.metadata.Remediation.Recommendation.Url,
+                        remediation_code_native_iac=finding.metadata.Remediation.Code.NativeIaC,
+                        remediation_code_terraform=finding.metadata.Remediation.Code.Terraform,
+                        remediation_code_cli=finding.metadata.Remediation.Code.CLI,
+                        remediation_code_other=finding.metadata.Remediation.Code.Other,
+                        resource_tags=finding.resource_tags,
+                        compliance=finding.compliance,
+                        finding_url=finding_url,
+                        tenant_info=tenant_info,
+                    )
                 }
-                if issue_labels:
-                    payload["fields"]["labels"] = issue_labels
 
                 response = requests.post(
                     f"https://api.atlassian.com/ex/jira/{self.cloud_id}/rest/api/3/issue",
@@ -1809,53 +1920,33 @@ class Jira:
 
             headers = self.get_headers(access_token, content_type_json=True)
 
-            status_color = self.get_color_from_status(status)
-            severity_color = self.get_severity_color(severity.lower())
-            adf_description = self.get_adf_description(
-                check_id=check_id,
-                check_title=check_title,
-                severity=severity.upper(),
-                severity_color=severity_color,
-                status=status,
-                status_color=status_color,
-                status_extended=status_extended,
-                provider=provider,
-                region=region,
-                resource_uid=resource_uid,
-                resource_name=resource_name,
-                risk=risk,
-                recommendation_text=recommendation_text,
-                recommendation_url=recommendation_url,
-                remediation_code_native_iac=remediation_code_native_iac,
-                remediation_code_terraform=remediation_code_terraform,
-                remediation_code_cli=remediation_code_cli,
-                remediation_code_other=remediation_code_other,
-                resource_tags=resource_tags,
-                compliance=compliance,
-                finding_url=finding_url,
-                tenant_info=tenant_info,
-            )
-
-            summary_parts = ["[Prowler]"]
-            if severity:
-                summary_parts.append(severity.upper())
-            if check_id:
-                summary_parts.append(check_id)
-            if resource_uid:
-                summary_parts.append(resource_uid)
-            summary = " - ".join(summary_parts[1:])
-            summary = f"{summary_parts[0]} {summary}"
-
             payload = {
-                "fields": {
-                    "project": {"key": project_key},
-                    "summary": summary,
-                    "description": adf_description,
-                    "issuetype": {"name": issue_type},
-                }
+                "fields": self.get_issue_fields(
+                    project_key=project_key,
+                    issue_type=issue_type,
+                    issue_labels=issue_labels,
+                    check_id=check_id,
+                    check_title=check_title,
+                    severity=severity,
+                    status=status,
+                    status_extended=status_extended,
+                    provider=provider,
+                    region=region,
+                    resource_uid=resource_uid,
+                    resource_name=resource_name,
+                    risk=risk,
+                    recommendation_text=recommendation_text,
+                    recommendation_url=recommendation_url,
+                    remediation_code_native_iac=remediation_code_native_iac,
+                    remediation_code_terraform=remediation_code_terraform,
+                    remediation_code_cli=remediation_code_cli,
+                    remediation_code_other=remediation_code_other,
+                    resource_tags=resource_tags,
+                    compliance=compliance,
+                    finding_url=finding_url,
+                    tenant_info=tenant_info,
+                )
             }
-            if issue_labels:
-                payload["fields"]["labels"] = issue_labels
 
             response = requests.post(
                 f"https://api.atlassian.com/ex/jira/{self.cloud_id}/rest/api/3/issue",
@@ -1913,3 +2004,289 @@ class Jira:
         except Exception as e:
             logger.error(f"Failed to send finding: {e}")
             return False
+
+    @classmethod
+    def get_finding_label(cls, finding_uid: str) -> str:
+        """Get the label that identifies the issues of a finding
+
+        Jira labels cannot contain spaces and are limited to 255 characters, so the finding UID is hashed.
+
+        Args:
+            - finding_uid: The finding UID
+
+        Returns:
+            - str: The finding label
+        """
+        return f"{cls.FINDING_LABEL_PREFIX}{hashlib.sha256(finding_uid.encode()).hexdigest()[:32]}"
+
+    def get_open_finding_labels(
+        self, project_key: str = None, labels: set[str] = None, headers: dict = None
+    ) -> set[str]:
+        """Get which of the given finding labels belong to an issue that is not done in the project
+
+        Args:
+            - project_key: The project key
+            - labels: The finding labels to look for
+            - headers: The headers for the requests, built from the access token if not provided
+
+        Returns:
+            - set[str]: The finding labels with an open issue
+
+        Raises:
+            - JiraRefreshTokenError: Failed to refresh the access token
+            - JiraRefreshTokenResponseError: Failed to refresh the access token, response code did not match 200
+            - JiraSearchIssuesError: Failed to search the open issues in Jira
+        """
+        try:
+            if not headers:
+                headers = self.get_headers(
+                    self.get_access_token(), content_type_json=True
+                )
+
+            labels = sorted(labels or [])
+            open_labels = set()
+            url = f"{self.API_BASE_URL}/{self.cloud_id}/rest/api/3/search/jql"
+            for start in range(0, len(labels), self.SEARCH_MAX_LABELS):
+                chunk = labels[start : start + self.SEARCH_MAX_LABELS]
+                jql_labels = ", ".join(f'"{label}"' for label in chunk)
+                body = {
+                    "jql": f'project = "{project_key}" AND statusCategory != Done AND labels in ({jql_labels})',
+                    "fields": ["labels"],
+                    "maxResults": self.SEARCH_MAX_RESULTS,
+                }
+                while True:
+                    response = self.session.post(url, json=body, headers=headers)
+                    if response.status_code != 200:
+                        response_error = f"Failed to search the open issues: {response.status_code} - {response.text}"
+                        logger.error(response_error)
+                        raise JiraSearchIssuesError(
+                            message=response_error, file=os.path.basename(__file__)
+                        )
+
+                    response_json = response.json()
+                    for issue in response_json.get("issues", []):
+                        open_labels.update(
+                            set(issue.get("fields", {}).get("labels", [])).intersection(
+                                chunk
+                            )
+                        )
+
+                    next_page_token = response_json.get("nextPageToken")
+                    if response_json.get("isLast", True) or not next_page_token:
+                        break
+                    body["nextPageToken"] = next_page_token
+            return open_labels
+        except JiraSearchIssuesError as search_error:
+            raise search_error
+        except JiraRefreshTokenError as refresh_error:
+            raise refresh_error
+        except JiraRefreshTokenResponseError as response_error:
+            raise response_error
+        except Exception as e:
+            logger.error(f"Failed to search the open issues: {e}")
+            raise JiraSearchIssuesError(
+                message="Failed to search the open issues in Jira",
+                file=os.path.basename(__file__),
+            )
+
+    def create_issues(
+        self, issue_updates: list[dict] = None, headers: dict = None
+    ) -> tuple[int, int]:
+        """Create the issues with a single request to the bulk endpoint
+
+        Args:
+            - issue_updates: The issues to create, up to BULK_CREATE_MAX_ISSUES, in the format {"fields": {...}}
+            - headers: The headers for the request
+
+        Returns:
+            - tuple[int, int]: The number of issues created and failed
+        """
+        response = self.session.post(
+            f"{self.API_BASE_URL}/{self.cloud_id}/rest/api/3/issue/bulk",
+            json={"issueUpdates": issue_updates},
+            headers=headers,
+        )
+
+        try:
+            response_json = response.json()
+        except (ValueError, requests.exceptions.JSONDecodeError):
+            response_json = {}
+
+        # Jira answers with a 400 including the errors of each issue when none of them is created
+        if response.status_code != 201 and not response_json.get("errors"):
+            logger.error(
+                f"Failed to send findings: {response.status_code} - {response.text}"
+            )
+            return 0, len(issue_updates)
+
+        for error in response_json.get("errors", []):
+            element_errors = error.get("elementErrors", {})
+            custom_field_errors = {
+                k: v
+                for k, v in element_errors.get("errors", {}).items()
+                if k.startswith("customfield_")
+            }
+            if custom_field_errors:
+                custom_fields_formatted = ", ".join(
+                    [f"'{k}': '{v}'" for k, v in custom_field_errors.items()]
+                )
+                logger.error(
+                    f"Jira project requires custom fields that are not supported: {custom_fields_formatted}"
+                )
+            else:
+                logger.error(
+                    f"Failed to send finding {error.get('failedElementNumber')}: {error.get('status')} - {element_errors}"
+                )
+
+        created = len(response_json.get("issues", []))
+        logger.info(f"Findings sent successfully: {created} issues created")
+        return created, len(issue_updates) - created
+
+    def send_findings_bulk(
+        self,
+        findings: list[dict] = None,
+        project_key: str = None,
+        issue_type: str = None,
+        issue_labels: list[str] = None,
+        deduplicate: bool = True,
+    ) -> dict:
+        """
+        Send the findings to Jira creating the issues in bulk
+
+        The project and issue type are validated once, the issues are created in chunks of BULK_CREATE_MAX_ISSUES
+        sent concurrently through a pooled session that retries the rate limited requests.
+
+        Args:
+            - findings: The findings to send, each of them a dictionary with the finding arguments of send_finding
+              (check_id, check_title, severity, status...) and an optional finding_uid
+            - project_key: The project key
+            - issue_type: The issue type
+            - issue_labels: The issue labels
+            - deduplicate: Skip the findings with an open issue in the project or repeated, identified by the finding_uid
+
+        Returns:
+            - dict: The number of issues created and findings failed and skipped, {"created_count": 0, "failed_count": 0, "skipped_count": 0}
+
+        Raises:
+            - JiraRefreshTokenError: Failed to refresh the access token
+            - JiraRefreshTokenResponseError: Failed to refresh the access token, response code did not match 200
+            - JiraNoTokenError: No access token was found
+            - JiraInvalidProjectKeyError: The project key is invalid
+            - JiraInvalidIssueTypeError: The issue type is invalid
+            - JiraSearchIssuesError: Failed to search the open issues in Jira
+            - JiraCreateIssueError: Failed to create the issues in Jira
+        """
+        try:
+            access_token = self.get_access_token()
+
+            if not access_token:
+                raise JiraNoTokenError(
+                    message="No token was found",
+                    file=os.path.basename(__file__),
+                )
+
+            projects = self.get_projects()
+
+            if project_key not in projects:
+                logger.error("The project key is invalid")
+                raise JiraInvalidProjectKeyError(
+                    message="The project key is invalid",
+                    file=os.path.basename(__file__),
+                )
+
+            available_issue_types = self.get_available_issue_types(project_key)
+
+            if issue_type not in available_issue_types:
+                logger.error("The issue type is invalid")
+                raise JiraInvalidIssueTypeError(
+                    message="The issue type is invalid", file=os.path.basename(__file__)
+                )
+
+            headers = self.get_headers(access_token, content_type_json=True)
+
+            findings = findings or []
+            open_labels = set()
+            if deduplicate:
+                open_labels = self.get_open_finding_labels(
+                    project_key=project_key,
+                    labels={
+                        self.get_finding_label(finding["finding_uid"])
+                        for finding in findings
+                        if finding.get("finding_uid")
+                    },
+                    headers=headers,
+                )
+
+            skipped = 0
+            issue_updates = []
+            for finding in findings:
+                finding_arguments = dict(finding)
+                finding_uid = finding_arguments.pop("finding_uid", None)
+                labels = list(issue_labels or [])
+                if finding_uid:
+                    finding_label = self.get_finding_label(finding_uid)
+                    if deduplicate:
+                        if finding_label in open_labels:
+                            skipped += 1
+                            continue
+                        open_labels.add(finding_label)
+                    labels.append(finding_label)
+                issue_updates.append(
+                    {
+                        "fields": self.get_issue_fields(
+                            project_key=project_key,
+                            issue_type=issue_type,
+                            issue_labels=labels,
+                            **finding_arguments,
+                        )
+                    }
+                )
+
+            created = 0
+            failed = 0
+            chunks = [
+                issue_updates[start : start + self.BULK_CREATE_MAX_ISSUES]
+                for start in range(0, len(issue_updates), self.BULK_CREATE_MAX_ISSUES)
+            ]
+            if chunks:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.BULK_CREATE_MAX_WORKERS, len(chunks))
+                ) as executor:
+                    futures = {
+                        executor.submit(self.create_issues, chunk, headers): chunk
+                        for chunk in chunks
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            chunk_created, chunk_failed = future.result()
+                        except Exception as error:
+                            logger.error(
+                                f"Failed to send findings: {error.__class__.__name__} - {error}"
+                            )
+                            chunk_created, chunk_failed = 0, len(futures[future])
+                        created += chunk_created
+                        failed += chunk_failed
+
+            return {
+                "created_count": created,
+                "failed_count": failed,
+                "skipped_count": skipped,
+            }
+        except JiraNoTokenError as no_token_error:
+            raise no_token_error
+        except JiraInvalidProjectKeyError as project_key_error:
+            raise project_key_error
+        except JiraInvalidIssueTypeError as issue_type_error:
+            raise issue_type_error
+        except JiraSearchIssuesError as search_error:
+            raise search_error
+        except JiraRefreshTokenError as refresh_error:
+            raise refresh_error
+        except JiraRefreshTokenResponseError as response_error:
+            raise response_error
+        except Exception as e:
+            logger.error(f"Failed to send findings: {e}")
+            raise JiraCreateIssueError(
+                message="Failed to create the issues in Jira",
+                file=os.path.basename(__file__),
+            )
@@ -1,8 +1,13 @@
+import gzip
+import json
 import os
-from datetime import datetime
-from typing import List
+from datetime import datetime, timezone
+from typing import Iterable, List
 
+from py_ocsf_models import OCSF_VERSION
 from py_ocsf_models.events.base_event import SeverityID, StatusID
+from py_ocsf_models.events.findings.category_uid import CategoryUID
+from py_ocsf_models.events.findings.class_uid import ClassUID
 from py_ocsf_models.events.findings.detection_finding import (
     DetectionFinding,
     DetectionFindingTypeID,
@@ -16,11 +21,15 @@ from py_ocsf_models.objects.organization import Organization
 from py_ocsf_models.objects.product import Product
 from py_ocsf_models.objects.remediation import Remediation
 from py_ocsf_models.objects.resource_details import ResourceDetails
+from pydantic.v1.json import pydantic_encoder
 
+from prowler.config.config import encoding_format_utf_8
 from prowler.lib.logger import logger
 from prowler.lib.outputs.finding import Finding
 from prowler.lib.outputs.output import Output
 from prowler.lib.outputs.utils import unroll_dict_to_list
+from prowler.lib.scan.profiler import profiled
+from prowler.lib.utils.utils import open_file
 
 
 class OCSF(Output):
@@ -36,6 +45,9 @@ class OCSF(Output):
     Methods:
         - transform(findings: List[Finding]) -> None: Transforms the findings into the OCSF Detection Finding format.
         - batch_write_data_to_file() -> None: Writes the findings to a file using the OCSF Detection Finding format using the `Output._file_descriptor`.
+        - write_findings(findings: Iterable[Finding]) -> None: Streams the findings to `file_path` in the OCSF Detection Finding format without keeping them in memory.
+        - get_finding_dict(finding: Finding) -> dict: Returns the OCSF Detection Finding of a finding as a dictionary, without building the models.
+        - get_detection_finding(finding: Finding) -> DetectionFinding: Returns the OCSF Detection Finding of a finding.
         - get_account_type_id_by_provider(provider: str) -> TypeID: Returns the TypeID based on the provider.
         - get_finding_status_id(muted: bool) -> StatusID: Returns the StatusID based on the muted value.
 
@@ -52,142 +64,13 @@ class OCSF(Output):
         """
         try:
             for finding in findings:
-                finding_activity = ActivityID.Create
-                cloud_account_type = self.get_account_type_id_by_provider(
-                    finding.metadata.Provider
-                )
-                finding_severity = getattr(
-                    SeverityID,
-                    finding.metadata.Severity.capitalize(),
-                    SeverityID.Unknown,
-                )
-                finding_status = self.get_finding_status_id(finding.muted)
-
-                detection_finding = DetectionFinding(
-                    message=finding.status_extended,
-                    activity_id=finding_activity.value,
-                    activity_name=finding_activity.name,
-                    finding_info=FindingInformation(
-                        created_time_dt=finding.timestamp,
-                        created_time=(
-                            int(finding.timestamp.timestamp())
-                            if isinstance(finding.timestamp, datetime)
-                            else finding.timestamp
-                        ),
-                        desc=finding.metadata.Description,
-                        title=finding.metadata.CheckTitle,
-                        uid=finding.uid,
-                        name=finding.resource_name,
-                        types=finding.metadata.CheckType,
-                    ),
-                    time_dt=finding.timestamp,
-                    time=(
-                        int(finding.timestamp.timestamp())
-                        if isinstance(finding.timestamp, datetime)
-                        else finding.timestamp
-                    ),
-                    remediation=Remediation(
-                        desc=finding.metadata.Remediation.Recommendation.Text,
-                        references=list(
-                            filter(
-                                None,
-                                [
-                                    finding.metadata.Remediation.Recommendation.Url,
-                                ],
-                            )
-                        ),
-                    ),
-                    severity_id=finding_severity.value,
-                    severity=finding_severity.name,
-                    status_id=finding_status.value,
-                    status=finding_status.name,
-                    status_code=finding.status,
-                    status_detail=finding.status_extended,
-                    risk_details=finding.metadata.Risk,
-                    resources=(
-                        [
-                            ResourceDetails(
-                                labels=unroll_dict_to_list(finding.resource_tags),
-                                name=finding.resource_name,
-                                uid=finding.resource_uid,
-                                group=Group(name=finding.metadata.ServiceName),
-                                type=finding.metadata.ResourceType,
-                                # TODO: this should be included only if using the Cloud profile
-                                cloud_partition=finding.partition,
-                                region=finding.region,
-                                data={
-                                    "details": finding.resource_details,
-                                    "metadata": finding.resource_metadata,
-                                },
-                            )
-                        ]
-                        if finding.metadata.Provider != "kubernetes"
-                        else [
-                            ResourceDetails(
-                                labels=unroll_dict_to_list(finding.resource_tags),
-                                name=finding.resource_name,
-                                uid=finding.resource_uid,
-                                group=Group(name=finding.metadata.ServiceName),
-                                type=finding.metadata.ResourceType,
-                                data={
-                                    "details": finding.resource_details,
-                                    "metadata": finding.resource_metadata,
-                                },
-                                namespace=finding.region.replace("namespace: ", ""),
-                            )
-                        ]
-                    ),
-                    metadata=Metadata(
-                        event_code=finding.metadata.CheckID,
-                        product=Product(
-                            uid="prowler",
-                            name="Prowler",
-                            vendor_name="Prowler",
-                            version=finding.prowler_version,
-                        ),
-                        profiles=(
-                            ["cloud", "datetime"]
-                            if finding.metadata.Provider != "kubernetes"
-                            else ["container", "datetime"]
-                        ),
-                        tenant_uid=finding.account_organization_uid,
-                    ),
-                    type_uid=DetectionFindingTypeID.Create,
-                    type_name=f"Detection Finding: {DetectionFindingTypeID.Create.name}",
-                    unmapped={
-                        "related_url": finding.metadata.RelatedUrl,
-                        "categories": finding.metadata.Categories,
-                        "depends_on": finding.metadata.DependsOn,
-                        "related_to": finding.metadata.RelatedTo,
-                        "additional_urls": finding.metadata.AdditionalURLs,
-                        "notes": finding.metadata.Notes,
-                        "compliance": finding.compliance,
-                    },
-                )
-                if finding.provider != "kubernetes":
-                    detection_finding.cloud = Cloud(
-                        account=Account(
-                            name=finding.account_name,
-                            type_id=cloud_account_type.value,
-                            type=cloud_account_type.name.replace("_", " "),
-                            uid=finding.account_uid,
-                            labels=unroll_dict_to_list(finding.account_tags),
-                        ),
-                        org=Organization(
-                            uid=finding.account_organization_uid,
-                            name=finding.account_organization_name,
-                            # TODO: add the org unit id and name
-                        ),
-                        provider=finding.provider,
-                        region=finding.region,
-                    )
-
-                self._data.append(detection_finding)
+                self._data.append(self.get_detection_finding(finding))
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    @profiled("output")
     def batch_write_data_to_file(self) -> None:
         """Writes the findings to a file using the OCSF format using the `Output._file_descriptor`."""
         try:
@@ -200,9 +83,7 @@ class OCSF(Output):
                     self._file_descriptor.write("[")
                 for finding in self._data:
                     try:
-                        self._file_descriptor.write(
-                            finding.json(exclude_none=True, indent=4)
-                        )
+                        self._file_descriptor.write(finding.json(exclude_none=True))
                         self._file_descriptor.write(",")
                     except Exception as error:
                         logger.error(
@@ -221,6 +102,334 @@ class OCSF(Output):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    @profiled("output")
+    def write_findings(self, findings: Iterable[Finding]) -> None:
+        """Streams the findings to `file_path` in the OCSF Detection Finding format.
+
+        Each finding is built with `get_finding_dict` and serialized to compact JSON as soon as it
+        is transformed, so neither the OCSF objects nor the output are kept in memory. The file is
+        a JSON array unless it ends with `.ndjson` (or `.ndjson.gz`), which writes a finding per
+        line, and it is gzip compressed if it ends with `.gz`.
+
+        Args:
+            findings (Iterable[Finding]): the findings to write, they can be a generator
+        """
+        try:
+            compressed = self.file_path.endswith(".gz")
+            ndjson = self.file_path.removesuffix(".gz").endswith(".ndjson")
+            if compressed:
+                self._file_descriptor = gzip.open(
+                    self.file_path, "wt", encoding=encoding_format_utf_8
+                )
+            else:
+                self._file_descriptor = open_file(self.file_path, "w")
+            encoder = json.JSONEncoder(
+                default=pydantic_encoder, separators=(",", ":")
+            ).encode
+            with self._file_descriptor as file_descriptor:
+                if not ndjson:
+                    file_descriptor.write("[")
+                first_finding = True
+                for finding in findings:
+                    try:
+                        serialized_finding = encoder(self.get_finding_dict(finding))
+                    except Exception as error:
+                        logger.error(
+                            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+                        continue
+                    if ndjson:
+                        file_descriptor.write(serialized_finding)
+                        file_descriptor.write("\n")
+                    else:
+                        if not first_finding:
+                            file_descriptor.write(",")
+                        file_descriptor.write(serialized_finding)
+                    first_finding = False
+                if not ndjson:
+                    file_descriptor.write("]")
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    @classmethod
+    def get_finding_dict(cls, finding: Finding) -> dict:
+        """Returns the OCSF Detection Finding of a finding as a dictionary.
+
+        It is the same document `transform` builds with the py-ocsf-models classes once serialized
+        with `exclude_none`, but built directly, without instantiating and validating the models.
+
+        Args:
+            finding (Finding): the finding to transform
+
+        Returns:
+            dict: the OCSF Detection Finding
+        """
+        finding_activity = ActivityID.Create
+        finding_severity = getattr(
+            SeverityID,
+            finding.metadata.Severity.capitalize(),
+            SeverityID.Unknown,
+        )
+        finding_status = cls.get_finding_status_id(finding.muted)
+        if isinstance(finding.timestamp, datetime):
+            finding_time = int(finding.timestamp.timestamp())
+            finding_time_dt = finding.timestamp.isoformat()
+        else:
+            finding_time = finding.timestamp
+            finding_time_dt = datetime.fromtimestamp(
+                finding.timestamp, tz=timezone.utc
+            ).isoformat()
+
+        resource = {
+            "data": {
+                "details": finding.resource_details,
+                "metadata": finding.resource_metadata,
+            },
+            "group": {"name": finding.metadata.ServiceName},
+            "labels": unroll_dict_to_list(finding.resource_tags),
+            "name": finding.resource_name,
+            "type": finding.metadata.ResourceType,
+            "uid": finding.resource_uid,
+        }
+        if finding.metadata.Provider != "kubernetes":
+            if finding.partition is not None:
+                resource["cloud_partition"] = finding.partition
+            resource["region"] = finding.region
+        else:
+            resource["namespace"] = finding.region.replace("namespace: ", "")
+
+        metadata = {
+            "event_code": finding.metadata.CheckID,
+            "product": {
+                "name": "Prowler",
+                "uid": "prowler",
+                "vendor_name": "Prowler",
+                "version": finding.prowler_version,
+            },
+            "profiles": (
+                ["cloud", "datetime"]
+                if finding.metadata.Provider != "kubernetes"
+                else ["container", "datetime"]
+            ),
+            "version": OCSF_VERSION,
+        }
+        if finding.account_organization_uid is not None:
+            metadata["tenant_uid"] = finding.account_organization_uid
+
+        detection_finding = {
+            "message": finding.status_extended,
+            "metadata": metadata,
+            "severity_id": finding_severity.value,
+            "severity": finding_severity.name,
+            "status": finding_status.name,
+            "status_code": finding.status,
+            "status_detail": finding.status_extended,
+            "status_id": finding_status.value,
+            "unmapped": {
+                "related_url": finding.metadata.RelatedUrl,
+                "categories": finding.metadata.Categories,
+                "depends_on": finding.metadata.DependsOn,
+                "related_to": finding.metadata.RelatedTo,
+                "additional_urls": finding.metadata.AdditionalURLs,
+                "notes": finding.metadata.Notes,
+                "compliance": finding.compliance,
+            },
+            "activity_name": finding_activity.name,
+            "activity_id": finding_activity.value,
+            "finding_info": {
+                "created_time": finding_time,
+                "created_time_dt": finding_time_dt,
+                "desc": finding.metadata.Description,
+                "title": finding.metadata.CheckTitle,
+                "types": finding.metadata.CheckType,
+                "uid": finding.uid,
+            },
+            "resources": [resource],
+            "category_name": CategoryUID.Findings.name,
+            "class_name": "Detection Finding",
+            "remediation": {
+                "desc": finding.metadata.Remediation.Recommendation.Text,
+                "references": list(
+                    filter(None, [finding.metadata.Remediation.Recommendation.Url])
+                ),
+            },
+            "risk_details": finding.metadata.Risk,
+            "time": finding_time,
+            "time_dt": finding_time_dt,
+            "type_uid": DetectionFindingTypeID.Create.value,
+            "type_name": f"Detection Finding: {DetectionFindingTypeID.Create.name}",
+            "category_uid": CategoryUID.Findings.value,
+            "class_uid": ClassUID.DetectionFinding.value,
+        }
+        if finding.provider != "kubernetes":
+            cloud_account_type = cls.get_account_type_id_by_provider(
+                finding.metadata.Provider
+            )
+            organization = {}
+            if finding.account_organization_name is not None:
+                organization["name"] = finding.account_organization_name
+            if finding.account_organization_uid is not None:
+                organization["uid"] = finding.account_organization_uid
+            account = {
+                "type": cloud_account_type.name.replace("_", " "),
+                "type_id": cloud_account_type.value,
+                "uid": finding.account_uid,
+                "labels": unroll_dict_to_list(finding.account_tags),
+            }
+            if finding.account_name is not None:
+                account["name"] = finding.account_name
+            detection_finding["cloud"] = {
+                "account": account,
+                "org": organization,
+                "provider": finding.provider,
+                "region": finding.region,
+            }
+        return detection_finding
+
+    @classmethod
+    def get_detection_finding(cls, finding: Finding) -> DetectionFinding:
+        """Returns the OCSF Detection Finding of a finding.
+
+        Args:
+            finding (Finding): the finding to transform
+
+        Returns:
+            DetectionFinding: the OCSF Detection Finding
+        """
+        finding_activity = ActivityID.Create
+        cloud_account_type = cls.get_account_type_id_by_provider(
+            finding.metadata.Provider
+        )
+        finding_severity = getattr(
+            SeverityID,
+            finding.metadata.Severity.capitalize(),
+            SeverityID.Unknown,
+        )
+        finding_status = cls.get_finding_status_id(finding.muted)
+
+        detection_finding = DetectionFinding(
+            message=finding.status_extended,
+            activity_id=finding_activity.value,
+            activity_name=finding_activity.name,
+            finding_info=FindingInformation(
+                created_time_dt=finding.timestamp,
+                created_time=(
+                    int(finding.timestamp.timestamp())
+                    if isinstance(finding.timestamp, datetime)
+                    else finding.timestamp
+                ),
+                desc=finding.metadata.Description,
+                title=finding.metadata.CheckTitle,
+                uid=finding.uid,
+                name=finding.resource_name,
+                types=finding.metadata.CheckType,
+            ),
+            time_dt=finding.timestamp,
+            time=(
+                int(finding.timestamp.timestamp())
+                if isinstance(finding.timestamp, datetime)
+                else finding.timestamp
+            ),
+            remediation=Remediation(
+                desc=finding.metadata.Remediation.Recommendation.Text,
+                references=list(
+                    filter(
+                        None,
+                        [
+                            finding.metadata.Remediation.Recommendation.Url,
+                        ],
+                    )
+                ),
+            ),
+            severity_id=finding_severity.value,
+            severity=finding_severity.name,
+            status_id=finding_status.value,
+            status=finding_status.name,
+            status_code=finding.status,
+            status_detail=finding.status_extended,
+            risk_details=finding.metadata.Risk,
+            resources=(
+                [
+                    ResourceDetails(
+                        labels=unroll_dict_to_list(finding.resource_tags),
+                        name=finding.resource_name,
+                        uid=finding.resource_uid,
+                        group=Group(name=finding.metadata.ServiceName),
+                        type=finding.metadata.ResourceType,
+                        # TODO: this should be included only if using the Cloud profile
+                        cloud_partition=finding.partition,
+                        region=finding.region,
+                        data={
+                            "details": finding.resource_details,
+                            "metadata": finding.resource_metadata,
+                        },
+                    )
+                ]
+                if finding.metadata.Provider != "kubernetes"
+                else [
+                    ResourceDetails(
+                        labels=unroll_dict_to_list(finding.resource_tags),
+                        name=finding.resource_name,
+                        uid=finding.resource_uid,
+                        group=Group(name=finding.metadata.ServiceName),
+                        type=finding.metadata.ResourceType,
+                        data={
+                            "details": finding.resource_details,
+                            "metadata": finding.resource_metadata,
+                        },
+                        namespace=finding.region.replace("namespace: ", ""),
+                    )
+                ]
+            ),
+            metadata=Metadata(
+                event_code=finding.metadata.CheckID,
+                product=Product(
+                    uid="prowler",
+                    name="Prowler",
+                    vendor_name="Prowler",
+                    version=finding.prowler_version,
+                ),
+                profiles=(
+                    ["cloud", "datetime"]
+                    if finding.metadata.Provider != "kubernetes"
+                    else ["container", "datetime"]
+                ),
+                tenant_uid=finding.account_organization_uid,
+            ),
+            type_uid=DetectionFindingTypeID.Create,
+            type_name=f"Detection Finding: {DetectionFindingTypeID.Create.name}",
+            unmapped={
+                "related_url": finding.metadata.RelatedUrl,
+                "categories": finding.metadata.Categories,
+                "depends_on": finding.metadata.DependsOn,
+                "related_to": finding.metadata.RelatedTo,
+                "additional_urls": finding.metadata.AdditionalURLs,
+                "notes": finding.metadata.Notes,
+                "compliance": finding.compliance,
+            },
+        )
+        if finding.provider != "kubernetes":
+            detection_finding.cloud = Cloud(
+                account=Account(
+                    name=finding.account_name,
+                    type_id=cloud_account_type.value,
+                    type=cloud_account_type.name.replace("_", " "),
+                    uid=finding.account_uid,
+                    labels=unroll_dict_to_list(finding.account_tags),
+                ),
+                org=Organization(
+                    uid=finding.account_organization_uid,
+                    name=finding.account_organization_name,
+                    # TODO: add the org unit id and name
+                ),
+                provider=finding.provider,
+                region=finding.region,
+            )
+
+        return detection_finding
+
     @staticmethod
     def get_account_type_id_by_provider(provider: str) -> TypeID:
         """
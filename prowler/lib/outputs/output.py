@@ -5,6 +5,7 @@ from typing import List
 
 from prowler.lib.logger import logger
 from prowler.lib.outputs.finding import Finding
+from prowler.lib.scan.profiler import profile
 from prowler.lib.utils.utils import open_file
 
 
@@ -50,7 +51,8 @@ class Output(ABC):
             self.file_path = f"{file_path}{self.file_extension}"
 
         if findings:
-            self.transform(findings)
+            with profile("output", f"{self.__class__.__name__}.transform"):
+                self.transform(findings)
             if not self._file_descriptor and file_path:
                 self.create_file_descriptor(self.file_path)
 
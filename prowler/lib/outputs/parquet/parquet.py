@@ -0,0 +1,163 @@
+from typing import List
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from prowler.lib.logger import logger
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.output import Output
+from prowler.lib.scan.profiler import profiled
+
+
+class Parquet(Output):
+    """
+    Parquet class that writes the findings in the Apache Parquet columnar format.
+
+    It has the same columns as the CSV output. The columns that repeat the same values across
+    findings (check metadata, account, region, status, ...) are dictionary encoded, so they are
+    stored once per row group and loaded as categoricals by pandas, and the file is compressed with
+    ZSTD. Each call to batch_write_data_to_file writes a row group, so the API can write in batches.
+
+    Attributes:
+        - DICTIONARY_COLUMNS: The columns stored with dictionary encoding.
+        - _writer: The Parquet writer, created with the first batch.
+
+    Methods:
+        - transform(findings: list[Finding]) -> None: Transforms the findings into the CSV columns.
+        - batch_write_data_to_file() -> None: Writes the findings as a row group of the Parquet file.
+    """
+
+    DICTIONARY_COLUMNS = [
+        "AUTH_METHOD",
+        "TIMESTAMP",
+        "ACCOUNT_UID",
+        "ACCOUNT_NAME",
+        "ACCOUNT_EMAIL",
+        "ACCOUNT_ORGANIZATION_UID",
+        "ACCOUNT_ORGANIZATION_NAME",
+        "ACCOUNT_TAGS",
+        "PROVIDER",
+        "CHECK_ID",
+        "CHECK_TITLE",
+        "CHECK_TYPE",
+        "STATUS",
+        "SERVICE_NAME",
+        "SUBSERVICE_NAME",
+        "SEVERITY",
+        "RESOURCE_TYPE",
+        "PARTITION",
+        "REGION",
+        "DESCRIPTION",
+        "RISK",
+        "RELATED_URL",
+        "REMEDIATION_RECOMMENDATION_TEXT",
+        "REMEDIATION_RECOMMENDATION_URL",
+        "REMEDIATION_CODE_NATIVEIAC",
+        "REMEDIATION_CODE_TERRAFORM",
+        "REMEDIATION_CODE_CLI",
+        "REMEDIATION_CODE_OTHER",
+        "COMPLIANCE",
+        "CATEGORIES",
+        "DEPENDS_ON",
+        "RELATED_TO",
+        "NOTES",
+        "PROWLER_VERSION",
+        "ADDITIONAL_URLS",
+    ]
+    _writer: pq.ParquetWriter = None
+
+    def transform(self, findings: List[Finding]) -> None:
+        """Transforms the findings into the columns of the Parquet file.
+
+        Args:
+            findings (list[Finding]): a list of Finding objects
+        """
+        try:
+            for finding in findings:
+                self._data.append(CSV.get_finding_dict(finding))
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def create_file_descriptor(self, file_path: str) -> None:
+        """Creates a binary file descriptor for writing the Parquet file.
+
+        Args:
+            file_path (str): The path to the file where the data will be written.
+        """
+        try:
+            self._file_descriptor = open(file_path, "wb")
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    @classmethod
+    def get_schema(cls, columns: List[str]) -> pa.Schema:
+        """Returns the Arrow schema of the Parquet file for the given columns.
+
+        Args:
+            columns (list[str]): the names of the columns
+
+        Returns:
+            pa.Schema: MUTED as boolean, the DICTIONARY_COLUMNS dictionary encoded and the rest as strings
+        """
+        fields = []
+        for column in columns:
+            if column == "MUTED":
+                fields.append(pa.field(column, pa.bool_()))
+            elif column in cls.DICTIONARY_COLUMNS:
+                fields.append(pa.field(column, pa.dictionary(pa.int32(), pa.string())))
+            else:
+                fields.append(pa.field(column, pa.string()))
+        return pa.schema(fields)
+
+    def get_table(self) -> pa.Table:
+        """Returns the pending findings as an Arrow table."""
+        schema = self._writer.schema if self._writer else None
+        if schema is None:
+            schema = self.get_schema(list(self._data[0].keys()))
+        columns = []
+        for field in schema:
+            if field.name == "MUTED":
+                values = [finding[field.name] for finding in self._data]
+            else:
+                values = [
+                    None if finding[field.name] is None else str(finding[field.name])
+                    for finding in self._data
+                ]
+            columns.append(pa.array(values, type=field.type))
+        return pa.Table.from_arrays(columns, schema=schema)
+
+    @profiled("output")
+    def batch_write_data_to_file(self) -> None:
+        """Writes the findings as a row group of the Parquet file using the `Output._file_descriptor`."""
+        try:
+            if (
+                getattr(self, "_file_descriptor", None)
+                and not self._file_descriptor.closed
+            ):
+                if self._data:
+                    table = self.get_table()
+                    if not self._writer:
+                        self._writer = pq.ParquetWriter(
+                            self._file_descriptor,
+                            table.schema,
+                            compression="zstd",
+                            use_dictionary=[
+                                column
+                                for column in self.DICTIONARY_COLUMNS
+                                if column in table.schema.names
+                            ],
+                        )
+                    self._writer.write_table(table)
+                if self.close_file or self._from_cli:
+                    if self._writer:
+                        self._writer.close()
+                    self._file_descriptor.close()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
@@ -0,0 +1,155 @@
+from collections import defaultdict
+from typing import Callable, Generator, Iterable
+
+from prowler.lib.check.models import Severity
+from prowler.lib.outputs.common import Status
+
+
+class FindingsStatistics:
+    """
+    FindingsStatistics aggregates the findings in a single pass, as they are produced, keeping every counter needed by the reporting:
+        - The statistics returned by extract_findings_statistics
+        - The per-service rows of the summary table
+        - The findings per check, status and muted, used by the compliance tables to tally each framework requirement once per check instead of once per finding
+
+    It accepts both the Check_Report and the Finding objects.
+
+    Usage:
+        findings_statistics = FindingsStatistics()
+        for finding in findings:
+            findings_statistics.add(finding)
+        stats = findings_statistics.get_stats()
+    """
+
+    def __init__(self, findings: Iterable = None) -> None:
+        self.findings_count = 0
+        self.manual_count = 0
+        self.pass_count = 0
+        self.fail_count = 0
+        self.muted_count = 0
+        self.muted_pass_count = 0
+        self.muted_fail_count = 0
+        self.all_fails_are_muted = True
+        self.resources = set()
+        # {(severity, status): count}
+        self.severity_count = defaultdict(int)
+        # {service: {"Provider": ..., "Total": 0, "Pass": 0, ...}}
+        self.services = {}
+        # {(check_id, status, muted): count}
+        self.check_status_count = defaultdict(int)
+        if findings:
+            self.add_findings(findings)
+
+    def add(self, finding) -> None:
+        """Add a finding, either a Check_Report or a Finding, to the statistics"""
+        metadata = (
+            finding.metadata if hasattr(finding, "metadata") else finding.check_metadata
+        )
+        status = getattr(finding.status, "value", finding.status)
+        severity = getattr(metadata.Severity, "value", metadata.Severity)
+        muted = finding.muted is True
+
+        self.findings_count += 1
+        self.check_status_count[(metadata.CheckID, status, muted)] += 1
+        resource_uid = getattr(finding, "resource_uid", None)
+        if resource_uid is not None:
+            self.resources.add(resource_uid)
+
+        service = self.services.get(metadata.ServiceName)
+        if service is None:
+            service = self.services[metadata.ServiceName] = {
+                "Provider": "",
+                "Total": 0,
+                "Pass": 0,
+                "Critical": 0,
+                "High": 0,
+                "Medium": 0,
+                "Low": 0,
+                "Muted": 0,
+            }
+        service["Provider"] = metadata.Provider
+        service["Total"] += 1
+
+        if muted:
+            self.muted_count += 1
+            service["Muted"] += 1
+        if status == Status.PASS:
+            self.pass_count += 1
+            self.severity_count[(severity, status)] += 1
+            service["Pass"] += 1
+            if muted:
+                self.muted_pass_count += 1
+        elif status == Status.FAIL:
+            self.fail_count += 1
+            self.severity_count[(severity, status)] += 1
+            if severity in ("critical", "high", "medium", "low"):
+                service[severity.capitalize()] += 1
+            if muted:
+                self.muted_fail_count += 1
+            else:
+                self.all_fails_are_muted = False
+        elif status == Status.MANUAL:
+            self.manual_count += 1
+
+    def add_findings(self, findings: Iterable) -> None:
+        """Add every finding to the statistics"""
+        for finding in findings:
+            self.add(finding)
+
+    def get_framework_check_status_count(
+        self, bulk_checks_metadata: dict, is_framework: Callable
+    ) -> Generator[tuple[list, str, bool, int], None, None]:
+        """
+        Yields the findings per check, status and muted of the checks in a compliance framework, as (compliances, status, muted, findings_count)
+
+        Every finding of a check with the same status and muted adds the same to a compliance table, so the tables tally each of them at once
+        with findings_count instead of once per finding. The compliances are the ones of the check for which is_framework(compliance) is True.
+        """
+        for (
+            check_id,
+            status,
+            muted,
+        ), findings_count in self.check_status_count.items():
+            compliances = [
+                compliance
+                for compliance in bulk_checks_metadata[check_id].Compliance
+                if is_framework(compliance)
+            ]
+            if compliances:
+                yield compliances, status, muted, findings_count
+
+    def get_stats(self) -> dict:
+        """
+        get_stats returns the aggregated statistics of the PASS and FAIL findings
+        {
+            "total_pass": 0,
+            "total_muted_pass": 0,
+            "total_fail": 0,
+            "total_muted_fail": 0,
+            "resources_count": 0,
+            "findings_count": 0,
+            "total_critical_severity_fail": 0,
+            "total_critical_severity_pass": 0,
+            ...
+            "all_fails_are_muted": True
+        }
+        """
+        stats = {
+            "total_pass": self.pass_count,
+            "total_muted_pass": self.muted_pass_count,
+            "total_fail": self.fail_count,
+            "total_muted_fail": self.muted_fail_count,
+            "resources_count": len(self.resources),
+            "findings_count": self.pass_count + self.fail_count,
+        }
+        for severity in Severity:
+            for status in (Status.FAIL, Status.PASS):
+                stats[f"total_{severity.value}_severity_{status.value.lower()}"] = (
+                    self.severity_count[(severity.value, status.value)]
+                )
+        stats["all_fails_are_muted"] = self.all_fails_are_muted
+        return stats
+
+    def has_results(self) -> bool:
+        """Return True if there are findings and not all of them are MANUAL"""
+        return self.findings_count > self.manual_count
@@ -5,12 +5,16 @@ from tabulate import tabulate
 
 from prowler.config.config import (
     csv_file_suffix,
+    html_compact_file_suffix,
     html_file_suffix,
     json_asff_file_suffix,
     json_ocsf_file_suffix,
+    ndjson_ocsf_file_suffix,
     orange_color,
+    parquet_file_suffix,
 )
 from prowler.lib.logger import logger
+from prowler.lib.outputs.statistics import FindingsStatistics
 from prowler.providers.github.models import GithubAppIdentityInfo, GithubIdentityInfo
 
 
@@ -18,7 +22,17 @@ def display_summary_table(
     findings: list,
     provider,
     output_options,
+    findings_statistics: FindingsStatistics = None,
 ):
+    """
+    display_summary_table prints the overview and the per-service results of the scan.
+
+    Args:
+        findings (list): The list of findings, only used if findings_statistics is not provided
+        provider: The provider
+        output_options: The output options
+        findings_statistics (FindingsStatistics): The statistics already aggregated from the findings
+    """
     output_directory = output_options.output_directory
     output_filename = output_options.output_filename
     try:
@@ -65,19 +79,11 @@ def display_summary_table(
                 entity_type = "Directory"
                 audited_entities = provider.scan_path
 
+        if findings_statistics is None:
+            findings_statistics = FindingsStatistics(findings)
+
         # Check if there are findings and that they are not all MANUAL
-        if findings and not all(finding.status == "MANUAL" for finding in findings):
-            current = {
-                "Service": "",
-                "Provider": "",
-                "Total": 0,
-                "Pass": 0,
-                "Critical": 0,
-                "High": 0,
-                "Medium": 0,
-                "Low": 0,
-                "Muted": 0,
-            }
+        if findings_statistics.has_results():
             findings_table = {
                 "Provider": [],
                 "Service": [],
@@ -88,52 +94,25 @@ def display_summary_table(
                 "Low": [],
                 "Muted": [],
             }
-            pass_count = fail_count = muted_count = 0
-            # Sort findings by ServiceName
-            findings.sort(key=lambda x: x.check_metadata.ServiceName)
-            for finding in findings:
-                # If new service and not first, add previous row
-                if (
-                    current["Service"] != finding.check_metadata.ServiceName
-                    and current["Service"]
-                ):
-                    add_service_to_table(findings_table, current)
-
-                    current["Total"] = current["Pass"] = current["Muted"] = current[
-                        "Critical"
-                    ] = current["High"] = current["Medium"] = current["Low"] = 0
-
-                current["Service"] = finding.check_metadata.ServiceName
-                current["Provider"] = finding.check_metadata.Provider
-
-                current["Total"] += 1
-                if finding.muted:
-                    muted_count += 1
-                    current["Muted"] += 1
-                if finding.status == "PASS":
-                    pass_count += 1
-                    current["Pass"] += 1
-                elif finding.status == "FAIL":
-                    fail_count += 1
-                    if finding.check_metadata.Severity == "critical":
-                        current["Critical"] += 1
-                    elif finding.check_metadata.Severity == "high":
-                        current["High"] += 1
-                    elif finding.check_metadata.Severity == "medium":
-                        current["Medium"] += 1
-                    elif finding.check_metadata.Severity == "low":
-                        current["Low"] += 1
-
-            # Add final service
-
-            add_service_to_table(findings_table, current)
+            for service in sorted(findings_statistics.services):
+                add_service_to_table(
+                    findings_table,
+                    {
+                        "Service": service,
+                        **findings_statistics.services[service],
+                    },
+                )
+            findings_count = findings_statistics.findings_count
+            pass_count = findings_statistics.pass_count
+            fail_count = findings_statistics.fail_count
+            muted_count = findings_statistics.muted_count
 
             print("\nOverview Results:")
             overview_table = [
                 [
-                    f"{Fore.RED}{round(fail_count / len(findings) * 100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
-                    f"{Fore.GREEN}{round(pass_count / len(findings) * 100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
-                    f"{orange_color}{round(muted_count / len(findings) * 100, 2)}% ({muted_count}) Muted{Style.RESET_ALL}",
+                    f"{Fore.RED}{round(fail_count / findings_count * 100, 2)}% ({fail_count}) Failed{Style.RESET_ALL}",
+                    f"{Fore.GREEN}{round(pass_count / findings_count * 100, 2)}% ({pass_count}) Passed{Style.RESET_ALL}",
+                    f"{orange_color}{round(muted_count / findings_count * 100, 2)}% ({muted_count}) Muted{Style.RESET_ALL}",
                 ]
             ]
             print(tabulate(overview_table, tablefmt="rounded_grid"))
@@ -158,12 +137,24 @@ def display_summary_table(
                 print(
                     f" - JSON-OCSF: {output_directory}/{output_filename}{json_ocsf_file_suffix}"
                 )
+            if "ndjson-ocsf" in output_options.output_modes:
+                print(
+                    f" - NDJSON-OCSF: {output_directory}/{output_filename}{ndjson_ocsf_file_suffix}"
+                )
             if "csv" in output_options.output_modes:
                 print(f" - CSV: {output_directory}/{output_filename}{csv_file_suffix}")
             if "html" in output_options.output_modes:
                 print(
                     f" - HTML: {output_directory}/{output_filename}{html_file_suffix}"
                 )
+            if "html-compact" in output_options.output_modes:
+                print(
+                    f" - HTML (compact): {output_directory}/{output_filename}{html_compact_file_suffix}"
+                )
+            if "parquet" in output_options.output_modes:
+                print(
+                    f" - Parquet: {output_directory}/{output_filename}{parquet_file_suffix}"
+                )
 
         else:
             print(
@@ -0,0 +1,257 @@
+import json
+import time
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock, local
+from typing import Callable, Generator, Optional
+
+from colorama import Fore, Style
+from tabulate import tabulate
+
+from prowler.lib.logger import logger
+
+# Profiler of the CLI scan, used outside of a scan context, None when the scan is not profiled
+_profiler: Optional["Profiler"] = None
+
+
+def get_profiler() -> Optional["Profiler"]:
+    """Returns the profiler of the running scan, or None if the scan is not profiled
+
+    The profiler of the ScanContext active in the current thread takes precedence over the global one, so each scan
+    is only timed by its own profiler.
+    """
+    # Imported here since the scan context module is profiled
+    from prowler.providers.common.context import get_scan_context
+
+    context = get_scan_context()
+    if context is not None:
+        return context.profiler
+    return _profiler
+
+
+def set_profiler(profiler: Optional["Profiler"]) -> None:
+    """Sets the profiler of the scan run outside of a scan context, None to stop profiling"""
+    global _profiler
+    _profiler = profiler
+
+
+class Timing:
+    """Aggregated timing of a component: number of calls, total, self (without the nested components) and max time"""
+
+    __slots__ = ("count", "total", "self_time", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.self_time = 0.0
+        self.max = 0.0
+
+
+class Profiler:
+    """
+    Profiler aggregates the time spent by the components of a scan and the API calls done by the providers.
+
+    The components are identified by a category and a name, e.g. ("service", "EC2"), ("threading_call",
+    "EC2._describe_instances"), ("check", "ec2_ami_public") or ("output", "CSV.batch_write_data_to_file"). The time
+    of the components nested in the same thread, e.g. a service built by the first check that uses it, is not part
+    of the self time of the outer component.
+
+    Attributes:
+        - timings: The Timing of every component, by (category, name).
+        - api_calls: The number of calls, retries and errors of every API operation, by (service, operation).
+
+    Usage:
+        profiler = Profiler()
+        context = ScanContext(provider, profiler)
+        with context.activate():
+            ...
+        profiler.save("output/prowler-output.profile.json")
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self.timings = {}
+        self.api_calls = {}
+        self._start = clock()
+        self._lock = Lock()
+        # Stack of the child time of the components running in each thread
+        self._local = local()
+
+    @contextmanager
+    def time(self, category: str, name: str) -> Generator[None, None, None]:
+        """Times the block as a call of the component"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+        start = self.clock()
+        try:
+            yield
+        finally:
+            elapsed = self.clock() - start
+            child_time = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.add_timing(category, name, elapsed, elapsed - child_time)
+
+    def add_timing(
+        self, category: str, name: str, elapsed: float, self_time: float = None
+    ) -> None:
+        """Adds a call of the component that took elapsed seconds"""
+        with self._lock:
+            timing = self.timings.get((category, name))
+            if timing is None:
+                timing = self.timings[(category, name)] = Timing()
+            timing.count += 1
+            timing.total += elapsed
+            timing.self_time += elapsed if self_time is None else self_time
+            timing.max = max(timing.max, elapsed)
+
+    def add_api_call(
+        self, service: str, operation: str, retries: int = 0, error: bool = False
+    ) -> None:
+        """Adds a call of the API operation, with the number of retries it needed and if it failed"""
+        with self._lock:
+            api_call = self.api_calls.get((service, operation))
+            if api_call is None:
+                api_call = self.api_calls[(service, operation)] = {
+                    "calls": 0,
+                    "retries": 0,
+                    "errors": 0,
+                }
+            api_call["calls"] += 1
+            api_call["retries"] += retries
+            api_call["errors"] += int(error)
+
+    def get_slowest(self, limit: int = 10) -> list[tuple[str, str, Timing]]:
+        """Returns the components that took more self time, as (category, name, timing)"""
+        with self._lock:
+            timings = sorted(
+                self.timings.items(), key=lambda item: item[1].self_time, reverse=True
+            )
+        return [(category, name, timing) for (category, name), timing in timings][
+            :limit
+        ]
+
+    def to_dict(self) -> dict:
+        """Returns the profile, with the components sorted by self time and the API operations by calls"""
+        with self._lock:
+            api_calls = sorted(
+                self.api_calls.items(), key=lambda item: item[1]["calls"], reverse=True
+            )
+        return {
+            "duration": round(self.clock() - self._start, 6),
+            "timings": [
+                {
+                    "category": category,
+                    "name": name,
+                    "count": timing.count,
+                    "total": round(timing.total, 6),
+                    "self": round(timing.self_time, 6),
+                    "max": round(timing.max, 6),
+                }
+                for category, name, timing in self.get_slowest(limit=None)
+            ],
+            "api_calls": [
+                {"service": service, "operation": operation, **api_call}
+                for (service, operation), api_call in api_calls
+            ],
+        }
+
+    def save(self, path: str) -> None:
+        """Writes the profile to a JSON file"""
+        with open(path, "w", encoding="utf-8") as profile_file:
+            json.dump(self.to_dict(), profile_file, indent=2)
+        logger.info(f"Scan profile saved to {path}")
+
+
+@contextmanager
+def profile(category: str, name: str) -> Generator[None, None, None]:
+    """Times the block with the profiler of the running scan, if any"""
+    profiler = get_profiler()
+    if profiler is None:
+        yield
+    else:
+        with profiler.time(category, name):
+            yield
+
+
+def profile_call(category: str, name: str, call: Callable) -> Callable:
+    """Returns the call timed with the profiler of the running scan, or the same call if the scan is not profiled"""
+    profiler = get_profiler()
+    if profiler is None:
+        return call
+
+    @wraps(call)
+    def profiled_call(*args, **kwargs):
+        with profiler.time(category, name):
+            return call(*args, **kwargs)
+
+    return profiled_call
+
+
+def profiled(category: str) -> Callable:
+    """Decorator to time a method as the component "<class name>.<method name>" of the category"""
+
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def profiled_method(self, *args, **kwargs):
+            with profile(category, f"{self.__class__.__name__}.{method.__name__}"):
+                return method(self, *args, **kwargs)
+
+        return profiled_method
+
+    return decorator
+
+
+def display_profile_summary(profiler: Profiler, limit: int = 10) -> None:
+    """Prints the slowest components and the most called API operations of the scan"""
+    print(
+        f"\n{Style.BRIGHT}Scan profile, {limit} slowest components in {profiler.to_dict()['duration']:.2f}s:{Style.RESET_ALL}"
+    )
+    print(
+        tabulate(
+            [
+                [
+                    category,
+                    name,
+                    timing.count,
+                    f"{timing.self_time:.2f}",
+                    f"{timing.total:.2f}",
+                    f"{timing.max:.2f}",
+                ]
+                for category, name, timing in profiler.get_slowest(limit)
+            ],
+            headers=["Category", "Name", "Calls", "Self (s)", "Total (s)", "Max (s)"],
+            tablefmt="rounded_grid",
+        )
+    )
+    api_calls = sorted(
+        profiler.api_calls.items(), key=lambda item: item[1]["calls"], reverse=True
+    )[:limit]
+    if api_calls:
+        print(f"\n{Style.BRIGHT}{limit} most called API operations:{Style.RESET_ALL}")
+        print(
+            tabulate(
+                [
+                    [
+                        service,
+                        operation,
+                        api_call["calls"],
+                        (
+                            f"{Fore.YELLOW}{api_call['retries']}{Style.RESET_ALL}"
+                            if api_call["retries"]
+                            else 0
+                        ),
+                        (
+                            f"{Fore.RED}{api_call['errors']}{Style.RESET_ALL}"
+                            if api_call["errors"]
+                            else 0
+                        ),
+                    ]
+                    for (service, operation), api_call in api_calls
+                ],
+                headers=["Service", "Operation", "Calls", "Retries", "Errors"],
+                tablefmt="rounded_grid",
+            )
+        )
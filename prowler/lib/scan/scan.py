@@ -23,12 +23,15 @@ from prowler.lib.scan.exceptions.exceptions import (
     ScanInvalidSeverityError,
     ScanInvalidStatusError,
 )
+from prowler.lib.scan.profiler import Profiler
+from prowler.providers.common.context import ScanContext
 from prowler.providers.common.models import Audit_Metadata, ProviderOutputOptions
 from prowler.providers.common.provider import Provider
 
 
 class Scan:
     _provider: Provider
+    _context: ScanContext
     # Refactor(Core): This should replace the Audit_Metadata
     _number_of_checks_to_execute: int = 0
     _number_of_checks_completed: int = 0
@@ -39,6 +42,7 @@ class Scan:
     _progress: float = 0.0
     _duration: int = 0
     _status: list[str] = None
+    _profiler: Profiler = None
     _bulk_checks_metadata: dict[str, CheckMetadata]
     _bulk_compliance_frameworks: dict
 
@@ -53,6 +57,7 @@ class Scan:
         excluded_checks: list[str] = None,
         excluded_services: list[str] = None,
         status: list[str] = None,
+        profiler: Profiler = None,
     ):
         """
         Scan is the class that executes the checks and yields the progress and the findings.
@@ -67,6 +72,7 @@ class Scan:
             excluded_checks: list[str] -> The checks to exclude
             excluded_services: list[str] -> The services to exclude
             status: list[str] -> The status of the checks
+            profiler: Profiler -> The profiler to time the services and checks of the scan and count its API calls
 
         Raises:
             ScanInvalidCheckError: If the check does not exist in the provider or is from another provider.
@@ -77,6 +83,9 @@ class Scan:
             ScanInvalidStatusError: If the status does not exist in the provider.
         """
         self._provider = provider
+        # The services and cache of this scan, so it does not share them with other scans in the process
+        self._context = ScanContext(provider, profiler)
+        self._profiler = profiler
 
         # Validate the status
         if status:
@@ -208,6 +217,14 @@ class Scan:
     def provider(self) -> Provider:
         return self._provider
 
+    @property
+    def context(self) -> ScanContext:
+        return self._context
+
+    @property
+    def profiler(self) -> Profiler:
+        return self._profiler
+
     @property
     def progress(self) -> float:
         return (
@@ -270,25 +287,27 @@ class Scan:
                 try:
                     # Recover service from check name
                     service = get_service_name_from_check_name(check_name)
-                    try:
-                        # Import check module
-                        check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
-                        lib = import_check(check_module_path)
-                        # Recover functions from check
-                        check_to_execute = getattr(lib, check_name)
-                        check = check_to_execute()
-                    except ModuleNotFoundError:
-                        logger.error(
-                            f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
+                    # The service clients used by the check resolve to the services of this scan
+                    with self._context.activate():
+                        try:
+                            # Import check module
+                            check_module_path = f"prowler.providers.{self._provider.type}.services.{service}.{check_name}.{check_name}"
+                            lib = import_check(check_module_path)
+                            # Recover functions from check
+                            check_to_execute = getattr(lib, check_name)
+                            check = check_to_execute()
+                        except ModuleNotFoundError:
+                            logger.error(
+                                f"Check '{check_name}' was not found for the {self._provider.type.upper()} provider"
+                            )
+                            continue
+                        # Execute the check
+                        check_findings = execute(
+                            check,
+                            self._provider,
+                            custom_checks_metadata,
+                            output_options=None,
                         )
-                        continue
-                    # Execute the check
-                    check_findings = execute(
-                        check,
-                        self._provider,
-                        custom_checks_metadata,
-                        output_options=None,
-                    )
 
                     # Filter the findings by the status
                     if self._status:
@@ -344,6 +363,8 @@ class Scan:
             logger.error(
                 f"{check_name} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
+        finally:
+            self._context.close()
 
     def get_completed_services(self) -> set[str]:
         """
@@ -1,6 +1,67 @@
 from prowler.lib.logger import logger
 
 
+class AuditResources(list):
+    """
+    AuditResources is the list of ARNs of the resources to audit, indexed once to check them while the services are enumerated:
+        - A set of the ARNs, so checking if a resource is filtered does not depend on the number of audit resources
+        - The regions of the ARNs
+        - The resource types of the ARNs by service and region, so the services can skip the listing of resources with no audit resources
+
+    It is a list so it can be used wherever the audit resources are expected, but it must not be modified after it is created.
+
+    Usage:
+        audit_resources = AuditResources(["arn:aws:ec2:us-east-1:123456789012:instance/i-1234567890abcdef0"])
+        "arn:aws:ec2:us-east-1:123456789012:instance/i-1234567890abcdef0" in audit_resources  # True
+        audit_resources.has_resources("ec2", "us-east-1", "instance")  # True
+    """
+
+    def __init__(self, resources: list = None) -> None:
+        super().__init__(resources or [])
+        self._resources = frozenset(self)
+        self.regions = set()
+        # {service: {region: {resource_type}}}
+        self.services = {}
+        for resource in self._resources:
+            arn = resource.split(":", 5)
+            if len(arn) < 6:
+                continue
+            service, region = arn[2], arn[3]
+            if region:
+                self.regions.add(region)
+            # The resource type is the prefix of the resource, before a "/" or ":"
+            resource_type = arn[5].split(":")[0].split("/")[0]
+            self.services.setdefault(service, {}).setdefault(region, set()).add(
+                resource_type
+            )
+
+    def __contains__(self, resource: str) -> bool:
+        return resource in self._resources
+
+    @property
+    def resource_types(self) -> set:
+        """The (service, resource_type) pairs of the audit resources"""
+        return {
+            (service, resource_type)
+            for service, regions in self.services.items()
+            for resource_types in regions.values()
+            for resource_type in resource_types
+        }
+
+    def has_resources(
+        self, service: str, region: str = None, resource_type: str = None
+    ) -> bool:
+        """Return True if any audit resource belongs to the service and, if passed, to the region and resource type"""
+        regions = self.services.get(service, {})
+        if region is not None:
+            regions = {region: regions.get(region, set())}
+        if resource_type is None:
+            return any(regions.values())
+        return any(
+            resource_type in resource_types for resource_types in regions.values()
+        )
+
+
 def is_resource_filtered(resource: str, audit_resources: list) -> bool:
     """
     Check if the resource passed as argument is present in the audit_resources.
@@ -15,3 +76,25 @@ def is_resource_filtered(resource: str, audit_resources: list) -> bool:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error} ({resource})"
         )
+
+
+def is_service_filtered(
+    service: str,
+    audit_resources: list,
+    region: str = None,
+    resource_type: str = None,
+) -> bool:
+    """
+    Check if any of the audit_resources belongs to the service passed as argument, in the ARN format, and optionally to the region and resource type.
+
+    Returns True if it is filtered and False if none of the resources would match the input filters, so their listing can be skipped
+    """
+    try:
+        if not isinstance(audit_resources, AuditResources):
+            audit_resources = AuditResources(audit_resources)
+        return audit_resources.has_resources(service, region, resource_type)
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error} ({service})"
+        )
+        return True
@@ -14,14 +14,14 @@ from pytz import utc
 from tzlocal import get_localzone
 
 from prowler.config.config import (
-    aws_services_json_file,
     default_config_file_path,
     get_default_mute_file_path,
     load_and_validate_config_file,
 )
 from prowler.lib.check.utils import list_modules, recover_checks_from_service
 from prowler.lib.logger import logger
-from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
+from prowler.lib.scan_filters.scan_filters import AuditResources
+from prowler.lib.utils.utils import print_boxes
 from prowler.providers.aws.config import (
     AWS_REGION_US_EAST_1,
     AWS_STS_GLOBAL_ENDPOINT_REGION,
@@ -54,6 +54,8 @@ from prowler.providers.aws.lib.organizations.organizations import (
     get_organizations_metadata,
     parse_organizations_metadata,
 )
+from prowler.providers.aws.lib.regions.regions import read_aws_regions_file
+from prowler.providers.aws.lib.snapshot.snapshot import register_snapshot
 from prowler.providers.aws.models import (
     AWSAssumeRoleConfiguration,
     AWSAssumeRoleInfo,
@@ -67,6 +69,7 @@ from prowler.providers.aws.models import (
 )
 from prowler.providers.common.models import Audit_Metadata, Connection
 from prowler.providers.common.provider import Provider
+from prowler.providers.common.snapshot import Snapshot
 
 
 class AwsProvider(Provider):
@@ -81,7 +84,7 @@ class AwsProvider(Provider):
         _identity (AWSIdentityInfo): The AWS provider identity information.
         _session (AWSSession): The AWS provider session.
         _organizations_metadata (AWSOrganizationsInfo): The AWS Organizations metadata.
-        _audit_resources (list): The list of resources to audit.
+        _audit_resources (AuditResources): The list of resources to audit, indexed by service and region.
         _audit_config (dict): The audit configuration.
         _scan_unused_services (bool): A boolean indicating whether to scan unused services.
         _enabled_regions (set): The set of enabled regions.
@@ -98,6 +101,7 @@ class AwsProvider(Provider):
     _scan_unused_services: bool = False
     _enabled_regions: set = set()
     _mutelist: AWSMutelist
+    _snapshot: Optional[Snapshot] = None
     # TODO: this is not optional, enforce for all providers
     audit_metadata: Audit_Metadata
 
@@ -123,6 +127,7 @@ class AwsProvider(Provider):
         aws_access_key_id: str = None,
         aws_secret_access_key: str = None,
         aws_session_token: Optional[str] = None,
+        snapshot: Snapshot = None,
     ):
         """
         Initializes the AWS provider.
@@ -148,6 +153,7 @@ class AwsProvider(Provider):
             - aws_access_key_id: The AWS access key ID.
             - aws_secret_access_key: The AWS secret access key.
             - aws_session_token: The AWS session token, optional.
+            - snapshot: The snapshot to record the API responses to, or to replay them from without calling AWS.
 
         Raises:
             - ArgumentTypeError: If the input MFA ARN is invalid.
@@ -193,15 +199,28 @@ class AwsProvider(Provider):
         ######## AWS Session
         logger.info("Generating original session ...")
 
-        # TODO: Use AwsSetUpSession ?????
-        # Configure the initial AWS Session using the local credentials: profile or environment variables
-        aws_session = self.setup_session(
-            mfa=mfa,
-            profile=profile,
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            aws_session_token=aws_session_token,
-        )
+        self._snapshot = snapshot
+        if snapshot and snapshot.replay:
+            # The replayed API calls are not sent, so they do not need the local credentials nor profile
+            profile = None
+            aws_session = Session(
+                aws_access_key_id="snapshot",
+                aws_secret_access_key="snapshot",
+                region_name=snapshot.metadata.get("region_name"),
+            )
+        else:
+            # TODO: Use AwsSetUpSession ?????
+            # Configure the initial AWS Session using the local credentials: profile or environment variables
+            aws_session = self.setup_session(
+                mfa=mfa,
+                profile=profile,
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                aws_session_token=aws_session_token,
+            )
+        if snapshot:
+            snapshot.metadata.setdefault("region_name", aws_session.region_name)
+            register_snapshot(aws_session, snapshot)
         session_config = self.set_session_config(retries_max_attempts)
         # Current session and the original session points to the same session object until we get a new one, if needed
         self._session = AWSSession(
@@ -272,6 +291,8 @@ class AwsProvider(Provider):
                 assumed_role_configuration,
                 self._session,
             )
+            if snapshot:
+                register_snapshot(self._session.current_session, snapshot)
             logger.info("Audit session is the new session created assuming an IAM Role")
 
             # Modify identity for the IAM Role assumed since this will be the identity to audit with
@@ -323,6 +344,8 @@ class AwsProvider(Provider):
                 organizations_assumed_role_configuration,
                 self._session,
             )
+            if snapshot:
+                register_snapshot(aws_organizations_session, snapshot)
             logger.info(
                 "Generated new session for to get the AWS Organizations metadata"
             )
@@ -334,11 +357,13 @@ class AwsProvider(Provider):
 
         # Parse Scan Tags
         if resource_tags:
-            self._audit_resources = self.get_tagged_resources(resource_tags)
+            self._audit_resources = AuditResources(
+                self.get_tagged_resources(resource_tags)
+            )
 
         # Parse Input Resource ARNs
         if resource_arn:
-            self._audit_resources = resource_arn
+            self._audit_resources = AuditResources(resource_arn)
 
         # Get Enabled Regions
         self._enabled_regions = self.get_aws_enabled_regions(
@@ -394,7 +419,14 @@ class AwsProvider(Provider):
         return self._organizations_metadata
 
     @property
-    def audit_resources(self):
+    def snapshot(self) -> Optional[Snapshot]:
+        return self._snapshot
+
+    @property
+    def audit_resources(self) -> AuditResources:
+        # Index the audit resources once, also when they are set after the initialization
+        if not isinstance(self._audit_resources, AuditResources):
+            self._audit_resources = AuditResources(self._audit_resources)
         return self._audit_resources
 
     @property
@@ -800,7 +832,7 @@ class AwsProvider(Provider):
         checks_from_arn = set()
         is_subservice_in_checks = False
         # Handle if there are audit resources so only their services are executed
-        if self._audit_resources:
+        if self.audit_resources:
             # TODO: this should be retrieved automatically
             services_without_subservices = [
                 "guardduty",
@@ -813,9 +845,9 @@ class AwsProvider(Provider):
             ]
             service_list = set()
             sub_service_list = set()
-            for resource in self._audit_resources:
-                service = resource.split(":")[2]
-                sub_service = resource.split(":")[5].split("/")[0].replace("-", "_")
+            # Each service and resource type is parsed once, regardless of the number of audit resources
+            for service, resource_type in self.audit_resources.resource_types:
+                sub_service = resource_type.replace("-", "_")
                 # WAF Services does not have checks
                 if service != "wafv2" and service != "waf":
                     # Parse services when they are different in the ARNs
@@ -857,10 +889,13 @@ class AwsProvider(Provider):
 
             # Filter only checks with audited subservices
             for check in checks:
-                if any(sub_service in check for sub_service in sub_service_list):
-                    if not (sub_service == "policy" and "password_policy" in check):
-                        checks_from_arn.add(check)
-                        is_subservice_in_checks = True
+                if any(
+                    sub_service in check
+                    and not (sub_service == "policy" and "password_policy" in check)
+                    for sub_service in sub_service_list
+                ):
+                    checks_from_arn.add(check)
+                    is_subservice_in_checks = True
 
             if not is_subservice_in_checks:
                 checks_from_arn = checks
@@ -882,12 +917,9 @@ class AwsProvider(Provider):
             audit_resources = ["arn:aws:ec2:us-east-1:123456789012:instance/i-1234567890abcdef0"]
             regions = get_regions_from_audit_resources(audit_resources)
         """
-        audited_regions = set()
-        for resource in audit_resources:
-            region = resource.split(":")[3]
-            if region:
-                audited_regions.add(region)
-        return audited_regions
+        if not isinstance(audit_resources, AuditResources):
+            audit_resources = AuditResources(audit_resources)
+        return set(audit_resources.regions)
 
     def get_tagged_resources(self, resource_tags: list[str]) -> list[str]:
         """
@@ -1139,9 +1171,9 @@ class AwsProvider(Provider):
         try:
             checks = set()
             # TODO: self._audit_resources should be a list[ARN] instead of list[str]
-            if self._audit_resources:
+            if self.audit_resources:
                 self._identity.audited_regions = self.get_regions_from_audit_resources(
-                    self._audit_resources
+                    self.audit_resources
                 )
                 checks = self.get_checks_from_input_arn()
             return checks
@@ -1539,21 +1571,6 @@ class AwsProvider(Provider):
             raise error
 
 
-def read_aws_regions_file() -> dict:
-    """
-    Reads the AWS services JSON file and returns the parsed data as a dictionary.
-
-    Returns:
-        dict: The parsed data from the AWS services JSON file.
-    """
-    # Get JSON locally
-    actual_directory = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
-    with open_file(f"{actual_directory}/{aws_services_json_file}") as f:
-        data = parse_json_file(f)
-
-    return data
-
-
 # TODO: This can be moved to another class since it doesn't need self
 def get_aws_region_for_sts(session_region: str, regions: set[str]) -> str:
     """
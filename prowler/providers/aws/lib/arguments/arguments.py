@@ -1,9 +1,9 @@
 from argparse import ArgumentTypeError, Namespace
 from re import fullmatch, search
 
-from prowler.providers.aws.aws_provider import AwsProvider
 from prowler.providers.aws.config import ROLE_SESSION_NAME
 from prowler.providers.aws.lib.arn.arn import arn_type
+from prowler.providers.aws.lib.regions.regions import get_aws_regions
 
 
 def init_parser(self):
@@ -64,7 +64,7 @@ def init_parser(self):
         "-f",
         nargs="+",
         help="AWS region names to run Prowler against",
-        choices=AwsProvider.get_regions(partition=None),
+        choices=get_aws_regions(),
     )
     # AWS Organizations
     aws_orgs_subparser = aws_parser.add_argument_group("AWS Organizations")
@@ -119,6 +119,11 @@ def init_parser(self):
         default=None,
         help="Same as -B but do not use the assumed role credentials to put objects to the bucket, instead uses the initial credentials.",
     )
+    aws_outputs_subparser.add_argument(
+        "--output-bucket-compress",
+        action="store_true",
+        help="Gzip the output files uploaded with -B/-D, they are stored with the gzip Content-Encoding.",
+    )
 
     # Based Scans
     aws_based_scans_subparser = aws_parser.add_argument_group("AWS Based Scans")
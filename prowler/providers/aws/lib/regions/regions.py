@@ -0,0 +1,37 @@
+import os
+import pathlib
+
+from prowler.config.config import aws_services_json_file
+from prowler.lib.utils.utils import open_file, parse_json_file
+
+
+def read_aws_regions_file() -> dict:
+    """
+    Reads the AWS services JSON file and returns the parsed data as a dictionary.
+
+    Returns:
+        dict: The parsed data from the AWS services JSON file.
+    """
+    # Get JSON locally
+    actual_directory = pathlib.Path(
+        os.path.dirname(os.path.realpath(__file__))
+    ).parent.parent
+    with open_file(f"{actual_directory}/{aws_services_json_file}") as f:
+        data = parse_json_file(f)
+
+    return data
+
+
+def get_aws_regions() -> set:
+    """
+    Returns the regions of all the AWS partitions, without importing the AWS provider and its SDK.
+
+    Returns:
+        set: A set of region names.
+    """
+    return {
+        region
+        for service in read_aws_regions_file()["services"].values()
+        for partition_regions in service["regions"].values()
+        for region in partition_regions
+    }
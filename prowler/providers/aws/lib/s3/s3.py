@@ -1,10 +1,15 @@
+import gzip
 import os
+import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from os import path
 from tempfile import NamedTemporaryFile
 from typing import Optional
 
+from boto3.s3.transfer import TransferConfig
 from boto3.session import Session
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
 
 from prowler.lib.logger import logger
@@ -49,6 +54,15 @@ from prowler.providers.aws.lib.session.aws_set_up_session import (
 from prowler.providers.aws.models import AWSAssumeRoleInfo, AWSIdentityInfo, AWSSession
 from prowler.providers.common.models import Connection
 
+# Number of files uploaded at the same time
+S3_UPLOAD_MAX_WORKERS = 10
+# Files larger than this are uploaded in parts of this size
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+# Parts of a file uploaded at the same time, kept low since the files are already uploaded concurrently
+S3_MULTIPART_MAX_CONCURRENCY = 2
+# Extensions that are already compressed so they are not gzipped
+S3_COMPRESSED_EXTENSIONS = {".parquet"}
+
 
 class S3:
     """
@@ -58,11 +72,15 @@ class S3:
     - _session: An instance of the `Session` class representing the AWS session.
     - _bucket_name: A string representing the name of the S3 bucket.
     - _output_directory: A string representing the output directory path.
+    - _max_workers: An integer representing the number of files uploaded concurrently.
+    - _compress: A boolean indicating whether the files are gzipped before uploading them.
+    - _transfer_config: The `TransferConfig` shared by all the uploads.
 
     Methods:
     - __init__: Initializes a new instance of the `S3` class.
     - get_object_path: Returns the object path within the S3 bucket based on the provided output directory.
     - generate_subfolder_name_by_extension: Generates a subfolder name based on the provided file extension.
+    - upload_file: Uploads a file to the S3 bucket, gzipped if compression is enabled.
     - send_to_bucket: Sends the provided outputs to the S3 bucket.
     """
 
@@ -70,6 +88,9 @@ class S3:
     _identity: AWSIdentityInfo
     _bucket_name: str
     _output_directory: str
+    _max_workers: int
+    _compress: bool
+    _transfer_config: TransferConfig
 
     def __init__(
         self,
@@ -87,6 +108,8 @@ class S3:
         aws_session_token: Optional[str] = None,
         retries_max_attempts: int = 3,
         regions: set = set(),
+        max_workers: int = S3_UPLOAD_MAX_WORKERS,
+        compress: bool = False,
     ) -> None:
         """
         Initializes a new instance of the `S3` class.
@@ -106,12 +129,20 @@ class S3:
         - aws_session_token: The AWS session token, optional.
         - retries_max_attempts: The maximum number of retries for the AWS client.
         - regions: A set of regions to audit.
+        - max_workers: The number of files uploaded concurrently, each of them with up to S3_MULTIPART_MAX_CONCURRENCY parts at a time.
+        - compress: A boolean indicating whether to gzip the files before uploading them.
 
         Returns:
         - None
         """
+        # A single client is shared by all the uploads, with a connection per part being uploaded
+        pool_config = Config(
+            max_pool_connections=max_workers * S3_MULTIPART_MAX_CONCURRENCY
+        )
         if session:
-            self._session = session.client(__class__.__name__.lower())
+            self._session = session.client(
+                __class__.__name__.lower(), config=pool_config
+            )
         else:
             aws_setup_session = AwsSetUpSession(
                 role_arn=role_arn,
@@ -126,13 +157,23 @@ class S3:
                 retries_max_attempts=retries_max_attempts,
                 regions=regions,
             )
+            session_config = aws_setup_session._session.session_config
             self._session = aws_setup_session._session.current_session.client(
                 __class__.__name__.lower(),
-                config=aws_setup_session._session.session_config,
+                config=(
+                    session_config.merge(pool_config) if session_config else pool_config
+                ),
             )
 
         self._bucket_name = bucket_name
         self._output_directory = output_directory
+        self._max_workers = max_workers
+        self._compress = compress
+        self._transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=S3_MULTIPART_THRESHOLD,
+            max_concurrency=S3_MULTIPART_MAX_CONCURRENCY,
+        )
 
     @staticmethod
     def get_object_path(output_directory: str) -> str:
@@ -166,18 +207,62 @@ class S3:
         subfolder_name = ""
         if extension == ".ocsf.json":
             subfolder_name = "json-ocsf"
+        elif extension == ".ocsf.ndjson":
+            subfolder_name = "ndjson-ocsf"
+        elif extension == ".compact.html":
+            subfolder_name = "html-compact"
         elif extension == ".asff.json":
             subfolder_name = "json-asff"
         else:
             subfolder_name = extension.lstrip(".")
         return subfolder_name
 
+    def upload_file(self, file_name: str, object_name: str, content_type: str) -> None:
+        """
+        Upload a file to the S3 bucket using the shared client and `TransferConfig`.
+        If compression is enabled the file is gzipped into a temporary file and uploaded with the gzip `ContentEncoding`, keeping the object name.
+
+        Parameters:
+        - file_name: A string representing the path of the file to upload.
+        - object_name: A string representing the key of the object in the S3 bucket.
+        - content_type: A string representing the content type of the object.
+
+        Returns:
+        - None
+        """
+        extra_args = {"ContentType": content_type}
+        if not self._compress or any(
+            file_name.endswith(extension) for extension in S3_COMPRESSED_EXTENSIONS
+        ):
+            self._session.upload_file(
+                Filename=file_name,
+                Bucket=self._bucket_name,
+                Key=object_name,
+                ExtraArgs=extra_args,
+                Config=self._transfer_config,
+            )
+            return
+
+        extra_args["ContentEncoding"] = "gzip"
+        with NamedTemporaryFile(suffix=".gz") as compressed_file:
+            with open(file_name, "rb") as source_file:
+                with gzip.GzipFile(fileobj=compressed_file, mode="wb") as gzip_file:
+                    shutil.copyfileobj(source_file, gzip_file)
+            compressed_file.flush()
+            self._session.upload_file(
+                Filename=compressed_file.name,
+                Bucket=self._bucket_name,
+                Key=object_name,
+                ExtraArgs=extra_args,
+                Config=self._transfer_config,
+            )
+
     # TODO: Review the logic behind in Microsoft Windows
     def send_to_bucket(
         self, outputs: dict[str, list[Output]]
     ) -> dict[str, dict[str, list[str]]]:
         """
-        Send the provided outputs to the S3 bucket.
+        Send the provided outputs to the S3 bucket, uploading up to `max_workers` files concurrently.
 
         Parameters:
         - outputs: A dictionary where keys are strings and values are lists of Output objects.
@@ -185,66 +270,77 @@ class S3:
         Returns:
         - A dictionary containing two keys: "success" and "failure", each holding a dictionary where keys are strings and values are lists of strings representing the uploaded object names or tuples of object names and errors respectively.
         """
+        uploaded_objects = {"success": {}, "failure": {}}
         try:
-            uploaded_objects = {"success": {}, "failure": {}}
             extension_to_content_type = {
                 ".html": "text/html",
+                ".compact.html": "text/html",
                 ".csv": "text/csv",
                 ".ocsf.json": "application/json",
+                ".ocsf.ndjson": "application/x-ndjson",
                 ".asff.json": "application/json",
+                ".parquet": "application/vnd.apache.parquet",
             }
-            # Keys are regular and/or compliance
-            for key, output_list in outputs.items():
-                for output in output_list:
-                    try:
-                        # Object is not written to file so we need to temporarily write it
-                        if not output.file_descriptor:
-                            output.file_descriptor = NamedTemporaryFile(mode="a")
-
-                        bucket_directory = self.get_object_path(self._output_directory)
-                        basename = path.basename(output.file_descriptor.name)
-                        file_extension = output.file_extension
-
-                        if key == "compliance":
-                            object_name = f"{bucket_directory}/{key}/{basename}"
-                        else:
-                            object_name = f"{bucket_directory}/{self.generate_subfolder_name_by_extension(output.file_extension)}/{basename}"
-                        logger.info(
-                            f"Sending output file {output.file_descriptor.name} to S3 bucket {self._bucket_name}"
-                        )
-
-                        # TODO: This will need further optimization if some processes are calling this since the files are written
-                        # into the local filesystem because S3 upload file is the recommended way.
-                        # https://aws.amazon.com/blogs/developer/uploading-files-to-amazon-s3/
-                        self._session.upload_file(
-                            Filename=output.file_descriptor.name,
-                            Bucket=self._bucket_name,
-                            Key=object_name,
-                            ExtraArgs={
-                                "ContentType": extension_to_content_type[file_extension]
-                            },
-                        )
+            bucket_directory = self.get_object_path(self._output_directory)
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                uploads = []
+                # Keys are regular and/or compliance
+                for key, output_list in outputs.items():
+                    for output in output_list:
+                        object_name = None
+                        try:
+                            # Object is not written to file so we need to temporarily write it
+                            if not output.file_descriptor:
+                                output.file_descriptor = NamedTemporaryFile(mode="a")
+
+                            basename = path.basename(output.file_descriptor.name)
+                            file_extension = output.file_extension
+
+                            if key == "compliance":
+                                object_name = f"{bucket_directory}/{key}/{basename}"
+                            else:
+                                object_name = f"{bucket_directory}/{self.generate_subfolder_name_by_extension(output.file_extension)}/{basename}"
+                            logger.info(
+                                f"Sending output file {output.file_descriptor.name} to S3 bucket {self._bucket_name}"
+                            )
 
-                        if output.file_extension in uploaded_objects["success"]:
-                            uploaded_objects["success"][output.file_extension].append(
-                                object_name
+                            # TODO: This will need further optimization if some processes are calling this since the files are written
+                            # into the local filesystem because S3 upload file is the recommended way.
+                            # https://aws.amazon.com/blogs/developer/uploading-files-to-amazon-s3/
+                            uploads.append(
+                                (
+                                    file_extension,
+                                    object_name,
+                                    executor.submit(
+                                        self.upload_file,
+                                        output.file_descriptor.name,
+                                        object_name,
+                                        extension_to_content_type[file_extension],
+                                    ),
+                                )
+                            )
+                        except Exception as error:
+                            logger.error(
+                                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
                             )
-                        else:
-                            uploaded_objects["success"] = {
-                                output.file_extension: [object_name]
-                            }
+                            uploaded_objects["failure"].setdefault(
+                                output.file_extension, []
+                            ).append((object_name, error))
+
+                # Results are gathered in the order of the outputs
+                for file_extension, object_name, future in uploads:
+                    try:
+                        future.result()
+                        uploaded_objects["success"].setdefault(
+                            file_extension, []
+                        ).append(object_name)
                     except Exception as error:
                         logger.error(
                             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}] -- {error}"
                         )
-                        if output.file_extension in uploaded_objects["failure"]:
-                            uploaded_objects["failure"][output.file_extension].append(
-                                (object_name, error)
-                            )
-                        else:
-                            uploaded_objects["failure"] = {
-                                output.file_extension: [(object_name, error)]
-                            }
+                        uploaded_objects["failure"].setdefault(
+                            file_extension, []
+                        ).append((object_name, error))
 
         except Exception as error:
             logger.error(
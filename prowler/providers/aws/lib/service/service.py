@@ -1,6 +1,8 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 
 from prowler.lib.logger import logger
+from prowler.lib.scan.profiler import Profiler, get_profiler, profile_call
 from prowler.providers.aws.aws_provider import AwsProvider
 
 # TODO: review the following code
@@ -12,6 +14,18 @@ from prowler.providers.aws.aws_provider import AwsProvider
 MAX_WORKERS = 10
 
 
+def _profile_api_call(
+    profiler: Profiler, http_response, parsed, model, **kwargs
+) -> None:
+    """Adds the API call to the profiler of the scan, with the retries botocore needed and if it failed"""
+    profiler.add_api_call(
+        model.service_model.service_name,
+        model.name,
+        retries=parsed.get("ResponseMetadata", {}).get("RetryAttempts", 0),
+        error=http_response.status_code >= 300,
+    )
+
+
 class AWSService:
     """The AWSService class offers a parent class for each AWS Service to generate:
     - AWS Regional Clients
@@ -64,6 +78,18 @@ class AWSService:
         self.region = provider.get_default_region(self.service)
         self.client = self.session.client(self.service, self.region)
 
+        # Count the API calls and retries of the clients in the profiler of the scan that builds the service, bound
+        # to each client since the calls are done from the threads of the service, outside of the scan context
+        profiler = get_profiler()
+        if profiler is not None:
+            for client in [
+                self.client,
+                *getattr(self, "regional_clients", {}).values(),
+            ]:
+                client.meta.events.register(
+                    "after-call", partial(_profile_api_call, profiler)
+                )
+
         # Thread pool for __threading_call__
         self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
 
@@ -91,6 +117,10 @@ class AWSService:
                 f"{self.service.upper()} - Starting threads for '{call_name}' function to process {item_count} items..."
             )
 
+        # Time every call of the target when the scan is profiled
+        call = profile_call(
+            "threading_call", f"{self.__class__.__name__}.{call.__name__}", call
+        )
         # Submit tasks to the thread pool
         futures = [self.thread_pool.submit(call, item) for item in items]
 
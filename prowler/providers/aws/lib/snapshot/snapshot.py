@@ -0,0 +1,116 @@
+from io import BytesIO
+
+from boto3.session import Session
+from botocore.awsrequest import AWSResponse, HeadersDict
+from botocore.response import StreamingBody
+
+from prowler.lib.logger import logger
+from prowler.providers.common.snapshot import Snapshot
+
+# Key of the request in the botocore request context
+SNAPSHOT_KEY = "prowler_snapshot_key"
+# Replayed response in the botocore request context, until the after-call handlers run
+SNAPSHOT_RESPONSE = "prowler_snapshot_response"
+# Secrets of the credentials returned by STS, which are not stored in the snapshot
+REDACTED_CREDENTIALS = ("SecretAccessKey", "SessionToken")
+SNAPSHOT_RESPONSE_NOT_FOUND = "SnapshotResponseNotFound"
+
+
+def _set_request_key(params, model, context, **kwargs) -> None:
+    """Sets the snapshot key of the API call from its service, region, operation and parameters"""
+    context[SNAPSHOT_KEY] = Snapshot.get_key(
+        "aws",
+        model.service_model.service_name,
+        context.get("client_region"),
+        model.name,
+        params,
+    )
+
+
+def register_snapshot(session: Session, snapshot: Snapshot) -> None:
+    """
+    Registers the botocore event handlers that record or replay the API calls of the clients created by the session.
+
+    In record mode, the response of every API call is added to the snapshot, with the streaming bodies read and the
+    STS credentials redacted. In replay mode, the API calls return the recorded responses and are never sent, so the
+    session does not need valid credentials. The calls that were not recorded fail with the
+    SnapshotResponseNotFound error code, handled by the services as any other API error.
+
+    The responses are recorded after the botocore after-call handlers, e.g. the decoding of the IAM policy documents,
+    so in replay mode they are set once those handlers have run on an empty response.
+
+    Args:
+        session (Session): The boto3 session, it has to be registered before creating its clients.
+        snapshot (Snapshot): The snapshot to record or replay.
+    """
+
+    def record_response(http_response, parsed, context, **kwargs) -> None:
+        key = context.get(SNAPSHOT_KEY)
+        if key is None or http_response is None:
+            return
+        recorded = dict(parsed)
+        streams = []
+        for name, value in parsed.items():
+            if isinstance(value, StreamingBody):
+                content = value.read()
+                # The caller reads the body that was already consumed from a new stream
+                parsed[name] = StreamingBody(BytesIO(content), len(content))
+                recorded[name] = content
+                streams.append(name)
+        if isinstance(parsed.get("Credentials"), dict):
+            recorded["Credentials"] = {
+                name: "REDACTED" if name in REDACTED_CREDENTIALS else value
+                for name, value in parsed["Credentials"].items()
+            }
+        snapshot.record(
+            key,
+            {
+                "status_code": http_response.status_code,
+                "parsed": recorded,
+                "streams": streams,
+            },
+        )
+
+    def replay_response(model, context, **kwargs) -> tuple:
+        key = context.get(SNAPSHOT_KEY)
+        response = snapshot.get_response(key) if key else None
+        if response is None:
+            logger.warning(
+                f"{model.service_model.service_name}:{model.name} in {context.get('client_region')} is not in the snapshot"
+            )
+            response = {
+                "status_code": 404,
+                "parsed": {
+                    "Error": {
+                        "Code": SNAPSHOT_RESPONSE_NOT_FOUND,
+                        "Message": f"The {model.name} API call is not in the snapshot {snapshot.path}",
+                    },
+                    "ResponseMetadata": {"HTTPStatusCode": 404},
+                },
+                "streams": [],
+            }
+        context[SNAPSHOT_RESPONSE] = response
+        return AWSResponse(None, response["status_code"], HeadersDict(), None), {}
+
+    def set_replayed_response(parsed, context, **kwargs) -> None:
+        response = context.pop(SNAPSHOT_RESPONSE, None)
+        if response is None:
+            return
+        parsed.update(response["parsed"])
+        for name in response["streams"]:
+            parsed[name] = StreamingBody(BytesIO(parsed[name]), len(parsed[name]))
+
+    session.events.register(
+        "before-parameter-build", _set_request_key, unique_id=SNAPSHOT_KEY
+    )
+    if snapshot.replay:
+        session.events.register(
+            "before-call", replay_response, unique_id=f"{SNAPSHOT_KEY}-replay"
+        )
+        session.events.register_last(
+            "after-call", set_replayed_response, unique_id=f"{SNAPSHOT_KEY}-set"
+        )
+    else:
+        session.events.register_last(
+            "after-call", record_response, unique_id=f"{SNAPSHOT_KEY}-record"
+        )
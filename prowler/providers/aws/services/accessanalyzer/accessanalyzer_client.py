@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.accessanalyzer.accessanalyzer_service import (
     AccessAnalyzer,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-accessanalyzer_client = AccessAnalyzer(Provider.get_global_provider())
+accessanalyzer_client = ServiceClient(AccessAnalyzer)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.account.account_service import Account
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-account_client = Account(Provider.get_global_provider())
+account_client = ServiceClient(Account)
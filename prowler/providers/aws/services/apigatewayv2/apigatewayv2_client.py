@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.apigatewayv2.apigatewayv2_service import (
     ApiGatewayV2,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-apigatewayv2_client = ApiGatewayV2(Provider.get_global_provider())
+apigatewayv2_client = ServiceClient(ApiGatewayV2)
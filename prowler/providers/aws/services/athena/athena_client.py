@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.athena.athena_service import Athena
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-athena_client = Athena(Provider.get_global_provider())
+athena_client = ServiceClient(Athena)
@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.autoscaling.autoscaling_service import (
     ApplicationAutoScaling,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-applicationautoscaling_client = ApplicationAutoScaling(Provider.get_global_provider())
+applicationautoscaling_client = ServiceClient(ApplicationAutoScaling)
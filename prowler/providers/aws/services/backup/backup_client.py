@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.backup.backup_service import Backup
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-backup_client = Backup(Provider.get_global_provider())
+backup_client = ServiceClient(Backup)
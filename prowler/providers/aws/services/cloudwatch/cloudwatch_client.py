@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.cloudwatch.cloudwatch_service import CloudWatch
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-cloudwatch_client = CloudWatch(Provider.get_global_provider())
+cloudwatch_client = ServiceClient(CloudWatch)
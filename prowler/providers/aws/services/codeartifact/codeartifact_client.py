@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.codeartifact.codeartifact_service import (
     CodeArtifact,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-codeartifact_client = CodeArtifact(Provider.get_global_provider())
+codeartifact_client = ServiceClient(CodeArtifact)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.codebuild.codebuild_service import Codebuild
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-codebuild_client = Codebuild(Provider.get_global_provider())
+codebuild_client = ServiceClient(Codebuild)
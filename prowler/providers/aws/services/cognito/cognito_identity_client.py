@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.cognito.cognito_service import CognitoIdentity
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-cognito_identity_client = CognitoIdentity(Provider.get_global_provider())
+cognito_identity_client = ServiceClient(CognitoIdentity)
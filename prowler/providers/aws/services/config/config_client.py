@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.config.config_service import Config
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-config_client = Config(Provider.get_global_provider())
+config_client = ServiceClient(Config)
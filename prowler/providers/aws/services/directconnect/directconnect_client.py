@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.directconnect.directconnect_service import (
     DirectConnect,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-directconnect_client = DirectConnect(Provider.get_global_provider())
+directconnect_client = ServiceClient(DirectConnect)
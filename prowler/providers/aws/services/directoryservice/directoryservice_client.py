@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.directoryservice.directoryservice_service import (
     DirectoryService,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-directoryservice_client = DirectoryService(Provider.get_global_provider())
+directoryservice_client = ServiceClient(DirectoryService)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.dlm.dlm_service import DLM
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-dlm_client = DLM(Provider.get_global_provider())
+dlm_client = ServiceClient(DLM)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.dms.dms_service import DMS
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-dms_client = DMS(Provider.get_global_provider())
+dms_client = ServiceClient(DMS)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.drs.drs_service import DRS
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-drs_client = DRS(Provider.get_global_provider())
+drs_client = ServiceClient(DRS)
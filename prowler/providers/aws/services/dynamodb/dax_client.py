@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.dynamodb.dynamodb_service import DAX
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-dax_client = DAX(Provider.get_global_provider())
+dax_client = ServiceClient(DAX)
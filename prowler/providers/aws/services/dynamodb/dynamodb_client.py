@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.dynamodb.dynamodb_service import DynamoDB
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-dynamodb_client = DynamoDB(Provider.get_global_provider())
+dynamodb_client = ServiceClient(DynamoDB)
@@ -6,7 +6,10 @@ from botocore.client import ClientError
 from pydantic.v1 import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import (
+    is_resource_filtered,
+    is_service_filtered,
+)
 from prowler.providers.aws.lib.service.service import AWSService
 
 
@@ -61,6 +64,10 @@ class EC2(AWSService):
 
     def _describe_instances(self, regional_client):
         try:
+            if self.audit_resources and not is_service_filtered(
+                "ec2", self.audit_resources, regional_client.region, "instance"
+            ):
+                return
             describe_instances_paginator = regional_client.get_paginator(
                 "describe_instances"
             )
@@ -119,6 +126,10 @@ class EC2(AWSService):
 
     def _describe_security_groups(self, regional_client):
         try:
+            if self.audit_resources and not is_service_filtered(
+                "ec2", self.audit_resources, regional_client.region, "security-group"
+            ):
+                return
             describe_security_groups_paginator = regional_client.get_paginator(
                 "describe_security_groups"
             )
@@ -154,6 +165,10 @@ class EC2(AWSService):
 
     def _describe_network_acls(self, regional_client):
         try:
+            if self.audit_resources and not is_service_filtered(
+                "ec2", self.audit_resources, regional_client.region, "network-acl"
+            ):
+                return
             describe_network_acls_paginator = regional_client.get_paginator(
                 "describe_network_acls"
             )
@@ -349,6 +364,10 @@ class EC2(AWSService):
 
     def _describe_images(self, regional_client):
         try:
+            if self.audit_resources and not is_service_filtered(
+                "ec2", self.audit_resources, regional_client.region, "image"
+            ):
+                return
             for image in regional_client.describe_images(Owners=["self"])["Images"]:
                 arn = f"arn:{self.audited_partition}:ec2:{regional_client.region}:{self.audited_account}:image/{image['ImageId']}"
                 if not self.audit_resources or (
@@ -371,6 +390,10 @@ class EC2(AWSService):
 
     def _describe_volumes(self, regional_client):
         try:
+            if self.audit_resources and not is_service_filtered(
+                "ec2", self.audit_resources, regional_client.region, "volume"
+            ):
+                return
             describe_volumes_paginator = regional_client.get_paginator(
                 "describe_volumes"
             )
@@ -396,6 +419,10 @@ class EC2(AWSService):
 
     def _describe_ec2_addresses(self, regional_client):
         try:
+            if self.audit_resources and not is_service_filtered(
+                "ec2", self.audit_resources, regional_client.region, "eip-allocation"
+            ):
+                return
             for address in regional_client.describe_addresses()["Addresses"]:
                 public_ip = None
                 association_id = None
@@ -514,6 +541,10 @@ class EC2(AWSService):
 
     def _describe_launch_templates(self, regional_client):
         try:
+            if self.audit_resources and not is_service_filtered(
+                "ec2", self.audit_resources, regional_client.region, "launch-template"
+            ):
+                return
             describe_launch_templates_paginator = regional_client.get_paginator(
                 "describe_launch_templates"
             )
@@ -587,6 +618,13 @@ class EC2(AWSService):
 
     def _describe_vpn_endpoints(self, regional_client):
         try:
+            if self.audit_resources and not is_service_filtered(
+                "ec2",
+                self.audit_resources,
+                regional_client.region,
+                "client-vpn-endpoint",
+            ):
+                return
             describe_client_vpn_endpoints_paginator = regional_client.get_paginator(
                 "describe_client_vpn_endpoints"
             )
@@ -614,6 +652,10 @@ class EC2(AWSService):
 
     def _describe_transit_gateways(self, regional_client):
         try:
+            if self.audit_resources and not is_service_filtered(
+                "ec2", self.audit_resources, regional_client.region, "transit-gateway"
+            ):
+                return
             describe_transit_gateways_paginator = regional_client.get_paginator(
                 "describe_transit_gateways"
             )
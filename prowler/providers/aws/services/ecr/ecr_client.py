@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.ecr.ecr_service import ECR
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-ecr_client = ECR(Provider.get_global_provider())
+ecr_client = ServiceClient(ECR)
@@ -16,9 +16,22 @@ class ECR(AWSService):
         super().__init__(__class__.__name__, provider)
         self.registry_id = self.audited_account
         self.registries = {}
+        # Number of latest images per repository to get the scan findings, 0 for all the images
+        self.images_per_repository = self.audit_config.get(
+            "ecr_images_per_repository", 1
+        )
         self.__threading_call__(self._describe_registries_and_repositories)
         self.__threading_call__(self._describe_repository_policies)
-        self.__threading_call__(self._get_image_details)
+        # There is nothing to do if the repository is not scanning pushed images
+        self.__threading_call__(
+            self._get_image_details,
+            [
+                repository
+                for registry in self.registries.values()
+                for repository in registry.repositories
+                if repository.scan_on_push
+            ],
+        )
         self.__threading_call__(self._get_repository_lifecycle_policy)
         self.__threading_call__(self._get_registry_scanning_configuration)
         self.__threading_call__(self._list_tags_for_resource)
@@ -123,133 +136,117 @@ class ECR(AWSService):
                 f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _get_image_details(self, regional_client):
+    def _get_image_details(self, repository):
         logger.info("ECR - Getting images details...")
         try:
-            if regional_client.region in self.registries:
-                for repository in self.registries[regional_client.region].repositories:
-                    # There is nothing to do if the repository is not scanning pushed images
-                    if repository.scan_on_push:
-                        client = self.regional_clients[repository.region]
-                        describe_images_paginator = client.get_paginator(
-                            "describe_images"
-                        )
-                        for page in describe_images_paginator.paginate(
-                            registryId=self.registries[regional_client.region].id,
-                            repositoryName=repository.name,
-                            PaginationConfig={"PageSize": 1000},
-                        ):
-                            for image in page["imageDetails"]:
-                                # The following condition is required since sometimes
-                                # the AWS ECR API returns None using the iterator
-                                if image is not None:
-                                    artifact_media_type = image.get(
-                                        "artifactMediaType", None
-                                    )
-                                    tags = image.get("imageTags", [])
-                                    if ECR._is_artifact_scannable(
-                                        artifact_media_type, tags
-                                    ):
-                                        severity_counts = None
-                                        last_scan_status = None
-                                        image_digest = image.get("imageDigest")
-                                        latest_tag = image.get("imageTags", ["None"])[0]
-                                        image_pushed_at = image.get("imagePushedAt")
-                                        image_scan_findings_field_name = (
-                                            "imageScanFindingsSummary"
-                                        )
-                                        if "docker" in artifact_media_type:
-                                            type = "Docker"
-                                        elif "oci" in artifact_media_type:
-                                            type = "OCI"
-                                        else:
-                                            type = ""
-
-                                        # If imageScanStatus is not present or imageScanFindingsSummary is missing,
-                                        # we need to call DescribeImageScanFindings because AWS' new version of
-                                        # basic scanning does not support imageScanFindingsSummary and imageScanStatus
-                                        # in the DescribeImages API.
-                                        if "imageScanStatus" not in image:
-                                            try:
-                                                # use "image" for scan findings to get data the same way as for an image
-                                                image = (
-                                                    client.describe_image_scan_findings(
-                                                        registryId=self.registries[
-                                                            regional_client.region
-                                                        ].id,
-                                                        repositoryName=repository.name,
-                                                        imageId={
-                                                            "imageDigest": image_digest
-                                                        },
-                                                    )
-                                                )
-                                                image_scan_findings_field_name = (
-                                                    "imageScanFindings"
-                                                )
-                                            except (
-                                                client.exceptions.ImageNotFoundException
-                                            ) as error:
-                                                logger.warning(
-                                                    f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                                )
-                                                continue
-                                            except (
-                                                client.exceptions.ScanNotFoundException
-                                            ) as error:
-                                                logger.warning(
-                                                    f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                                )
-                                                continue
-                                            except Exception as error:
-                                                logger.error(
-                                                    f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                                                )
-                                                continue
-
-                                        if "imageScanStatus" in image:
-                                            last_scan_status = image["imageScanStatus"][
-                                                "status"
-                                            ]
-
-                                        if image_scan_findings_field_name in image:
-                                            severity_counts = FindingSeverityCounts(
-                                                critical=0, high=0, medium=0
-                                            )
-                                            finding_severity_counts = image[
-                                                image_scan_findings_field_name
-                                            ].get("findingSeverityCounts", {})
-                                            severity_counts.critical = (
-                                                finding_severity_counts.get(
-                                                    "CRITICAL", 0
-                                                )
-                                            )
-                                            severity_counts.high = (
-                                                finding_severity_counts.get("HIGH", 0)
-                                            )
-                                            severity_counts.medium = (
-                                                finding_severity_counts.get("MEDIUM", 0)
-                                            )
-
-                                        repository.images_details.append(
-                                            ImageDetails(
-                                                latest_tag=latest_tag,
-                                                image_pushed_at=image_pushed_at,
-                                                latest_digest=image_digest,
-                                                scan_findings_status=last_scan_status,
-                                                scan_findings_severity_count=severity_counts,
-                                                artifact_media_type=artifact_media_type,
-                                                type=type,
-                                            )
-                                        )
-                        # Sort the repository images by date pushed
-                        repository.images_details.sort(
-                            key=lambda image: image.image_pushed_at
-                        )
+            client = self.regional_clients[repository.region]
+            registry_id = self.registries[repository.region].id
+            # Get the scannable images from the DescribeImages metadata
+            images = []
+            describe_images_paginator = client.get_paginator("describe_images")
+            for page in describe_images_paginator.paginate(
+                registryId=registry_id,
+                repositoryName=repository.name,
+                PaginationConfig={"PageSize": 1000},
+            ):
+                for image in page["imageDetails"]:
+                    # The following condition is required since sometimes
+                    # the AWS ECR API returns None using the iterator
+                    if image is not None and ECR._is_artifact_scannable(
+                        image.get("artifactMediaType", None),
+                        image.get("imageTags", []),
+                    ):
+                        images.append(image)
+            # Sort the repository images by date pushed
+            images.sort(key=lambda image: image["imagePushedAt"])
+
+            # Only the latest images are needed, so the scan findings are only requested
+            # for them, starting from the latest one and skipping the images without them
+            images_details = []
+            for image in reversed(images):
+                if self.images_per_repository and (
+                    len(images_details) >= self.images_per_repository
+                ):
+                    break
+                image_details = self._get_image_scan_findings(
+                    client, registry_id, repository, image
+                )
+                if image_details:
+                    images_details.append(image_details)
+            images_details.reverse()
+            repository.images_details = images_details
 
         except Exception as error:
             logger.error(
-                f"{regional_client.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                f"{repository.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def _get_image_scan_findings(self, client, registry_id, repository, image):
+        severity_counts = None
+        last_scan_status = None
+        artifact_media_type = image.get("artifactMediaType", None)
+        image_digest = image.get("imageDigest")
+        latest_tag = image.get("imageTags", ["None"])[0]
+        image_pushed_at = image.get("imagePushedAt")
+        image_scan_findings_field_name = "imageScanFindingsSummary"
+        if "docker" in artifact_media_type:
+            type = "Docker"
+        elif "oci" in artifact_media_type:
+            type = "OCI"
+        else:
+            type = ""
+
+        # If imageScanStatus is not present or imageScanFindingsSummary is missing,
+        # we need to call DescribeImageScanFindings because AWS' new version of
+        # basic scanning does not support imageScanFindingsSummary and imageScanStatus
+        # in the DescribeImages API.
+        if "imageScanStatus" not in image:
+            try:
+                # use "image" for scan findings to get data the same way as for an image
+                image = client.describe_image_scan_findings(
+                    registryId=registry_id,
+                    repositoryName=repository.name,
+                    imageId={"imageDigest": image_digest},
+                )
+                image_scan_findings_field_name = "imageScanFindings"
+            except client.exceptions.ImageNotFoundException as error:
+                logger.warning(
+                    f"{repository.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+                return None
+            except client.exceptions.ScanNotFoundException as error:
+                logger.warning(
+                    f"{repository.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+                return None
+            except Exception as error:
+                logger.error(
+                    f"{repository.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+                return None
+
+        if "imageScanStatus" in image:
+            last_scan_status = image["imageScanStatus"]["status"]
+
+        if image_scan_findings_field_name in image:
+            finding_severity_counts = image[image_scan_findings_field_name].get(
+                "findingSeverityCounts", {}
             )
+            severity_counts = FindingSeverityCounts(
+                critical=finding_severity_counts.get("CRITICAL", 0),
+                high=finding_severity_counts.get("HIGH", 0),
+                medium=finding_severity_counts.get("MEDIUM", 0),
+            )
+
+        return ImageDetails(
+            latest_tag=latest_tag,
+            image_pushed_at=image_pushed_at,
+            latest_digest=image_digest,
+            scan_findings_status=last_scan_status,
+            scan_findings_severity_count=severity_counts,
+            artifact_media_type=artifact_media_type,
+            type=type,
+        )
 
     def _list_tags_for_resource(self, regional_client):
         logger.info("ECR - List Tags...")
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.ecs.ecs_service import ECS
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-ecs_client = ECS(Provider.get_global_provider())
+ecs_client = ServiceClient(ECS)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.eks.eks_service import EKS
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-eks_client = EKS(Provider.get_global_provider())
+eks_client = ServiceClient(EKS)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.emr.emr_service import EMR
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-emr_client = EMR(Provider.get_global_provider())
+emr_client = ServiceClient(EMR)
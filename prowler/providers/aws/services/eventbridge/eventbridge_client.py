@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.eventbridge.eventbridge_service import EventBridge
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-eventbridge_client = EventBridge(Provider.get_global_provider())
+eventbridge_client = ServiceClient(EventBridge)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.eventbridge.eventbridge_service import Schema
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-schema_client = Schema(Provider.get_global_provider())
+schema_client = ServiceClient(Schema)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.firehose.firehose_service import Firehose
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-firehose_client = Firehose(Provider.get_global_provider())
+firehose_client = ServiceClient(Firehose)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.fms.fms_service import FMS
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-fms_client = FMS(Provider.get_global_provider())
+fms_client = ServiceClient(FMS)
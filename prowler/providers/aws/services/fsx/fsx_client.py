@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.fsx.fsx_service import FSx
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-fsx_client = FSx(Provider.get_global_provider())
+fsx_client = ServiceClient(FSx)
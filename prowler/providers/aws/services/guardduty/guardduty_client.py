@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.guardduty.guardduty_service import GuardDuty
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-guardduty_client = GuardDuty(Provider.get_global_provider())
+guardduty_client = ServiceClient(GuardDuty)
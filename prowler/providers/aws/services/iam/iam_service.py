@@ -1,5 +1,7 @@
 import csv
+from collections import deque
 from datetime import datetime
+from time import sleep
 from typing import Optional
 
 from botocore.client import ClientError
@@ -7,8 +9,20 @@ from pydantic.v1 import BaseModel
 
 from prowler.config.config import encoding_format_utf_8
 from prowler.lib.logger import logger
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import (
+    is_resource_filtered,
+    is_service_filtered,
+)
 from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.services.iam.lib.privilege_escalation import (
+    PrivilegeEscalationIndex,
+)
+
+# Maximum number of service last accessed jobs in progress at the same time
+LAST_ACCESSED_JOBS_MAX_CONCURRENCY = 20
+# Seconds to wait between polls of the report jobs, doubled while they are in progress
+REPORT_JOBS_POLL_INITIAL_DELAY = 0.2
+REPORT_JOBS_POLL_MAX_DELAY = 5
 
 
 def is_service_role(role):
@@ -47,15 +61,27 @@ class IAM(AWSService):
             f"arn:{self.audited_partition}:iam::{self.audited_account}:mfa"
         )
         self.users = self._get_users()
+        # Generate the credential report and the users last accessed services in the background
+        credential_report = self.thread_pool.submit(self._get_credential_report)
+        self.last_accessed_services = {}
+        last_accessed_services = self.thread_pool.submit(
+            self._get_last_accessed_services
+        )
         self.roles = self._get_roles()
         self.account_summary = self._get_account_summary()
         self.virtual_mfa_devices = self._list_virtual_mfa_devices()
-        self.credential_report = self._get_credential_report()
         self.groups = self._get_groups()
-        self._get_group_users()
-        self._list_attached_group_policies()
-        self._list_attached_user_policies()
-        self._list_attached_role_policies()
+        # Get the attached and inline policies, the group users and the policy documents in a single paginated call
+        self._authorization_details = None
+        if self.audit_config.get("iam_bulk_inventory", True):
+            self._authorization_details = self._get_account_authorization_details()
+        if self._authorization_details:
+            self._set_entities_authorization_details()
+        else:
+            self._get_group_users()
+            self._list_attached_group_policies()
+            self._list_attached_user_policies()
+            self._list_attached_role_policies()
         self._list_mfa_devices()
         self.password_policy = self._get_password_policy()
         support_policy_arn = (
@@ -80,18 +106,23 @@ class IAM(AWSService):
         self.policies = {}
         self.policies.update(self._list_policies("AWS"))
         self.policies.update(self._list_policies("Local"))
-        self._list_policies_version(self.policies)
-        self._list_inline_user_policies()
-        self._list_inline_group_policies()
-        self._list_inline_role_policies()
+        if self._authorization_details:
+            self._set_policies_authorization_details()
+        else:
+            self._list_policies_version(self.policies)
+            self._list_inline_user_policies()
+            self._list_inline_group_policies()
+            self._list_inline_role_policies()
+        # The authorization details are only needed to fill the models
+        self._authorization_details = None
         self.service_specific_credentials = []
         self._list_service_specific_credentials()
         self.saml_providers = self._list_saml_providers()
         self.server_certificates = self._list_server_certificates()
         self.access_keys_metadata = {}
         self._get_access_keys_metadata()
-        self.last_accessed_services = {}
-        self._get_last_accessed_services()
+        self.credential_report = credential_report.result()
+        last_accessed_services.result()
         self.user_temporary_credentials_usage = {}
         self._get_user_temporary_credentials_usage()
         self.organization_features = []
@@ -106,14 +137,29 @@ class IAM(AWSService):
         self.__threading_call__(self._list_tags, self.server_certificates)
         if self.saml_providers is not None:
             self.__threading_call__(self._list_tags, self.saml_providers.values())
+        # Built the first time a check needs it, once per scan
+        self._privilege_escalation_index = None
 
     def _get_client(self):
         return self.client
 
+    @property
+    def privilege_escalation_index(self) -> PrivilegeEscalationIndex:
+        """The privilege escalation combinations allowed to the users, roles and groups by all their policies"""
+        if self._privilege_escalation_index is None:
+            self._privilege_escalation_index = PrivilegeEscalationIndex(
+                self.users, self.roles, self.groups, self.policies
+            )
+        return self._privilege_escalation_index
+
     def _get_roles(self):
         logger.info("IAM - List Roles...")
         try:
             roles = []
+            if self.audit_resources and not is_service_filtered(
+                "iam", self.audit_resources, resource_type="role"
+            ):
+                return []
             get_roles_paginator = self.client.get_paginator("list_roles")
             for page in get_roles_paginator.paginate():
                 for role in page["Roles"]:
@@ -150,10 +196,14 @@ class IAM(AWSService):
         report_is_completed = False
         credential_list = []
         try:
+            delay = REPORT_JOBS_POLL_INITIAL_DELAY
             while not report_is_completed:
                 report_status = self.client.generate_credential_report()
                 if report_status["State"] == "COMPLETE":
                     report_is_completed = True
+                else:
+                    sleep(delay)
+                    delay = min(delay * 2, REPORT_JOBS_POLL_MAX_DELAY)
             # Convert credential report to list of dictionaries
             credential = self.client.get_credential_report()["Content"].decode(
                 encoding_format_utf_8
@@ -182,6 +232,10 @@ class IAM(AWSService):
         logger.info("IAM - Get Groups...")
         try:
             groups = []
+            if self.audit_resources and not is_service_filtered(
+                "iam", self.audit_resources, resource_type="group"
+            ):
+                return []
             get_groups_paginator = self.client.get_paginator("list_groups")
             for page in get_groups_paginator.paginate():
                 for group in page["Groups"]:
@@ -282,6 +336,10 @@ class IAM(AWSService):
         try:
             get_users_paginator = self.client.get_paginator("list_users")
             users = []
+            if self.audit_resources and not is_service_filtered(
+                "iam", self.audit_resources, resource_type="user"
+            ):
+                return []
             for page in get_users_paginator.paginate():
                 for user in page["Users"]:
                     if not self.audit_resources or (
@@ -314,6 +372,134 @@ class IAM(AWSService):
         finally:
             return users
 
+    def _get_account_authorization_details(self):
+        logger.info("IAM - Get Account Authorization Details...")
+        try:
+            authorization_details = {
+                "users": {},
+                "groups": {},
+                "roles": {},
+                "policies": {},
+            }
+            get_account_authorization_details_paginator = self.client.get_paginator(
+                "get_account_authorization_details"
+            )
+            for page in get_account_authorization_details_paginator.paginate():
+                for user in page.get("UserDetailList", []):
+                    authorization_details["users"][user["Arn"]] = user
+                for group in page.get("GroupDetailList", []):
+                    authorization_details["groups"][group["Arn"]] = group
+                for role in page.get("RoleDetailList", []):
+                    authorization_details["roles"][role["Arn"]] = role
+                for policy in page.get("Policies", []):
+                    authorization_details["policies"][policy["Arn"]] = policy
+            return authorization_details
+        except Exception as error:
+            # The per-entity calls are used instead
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+
+    def _set_entities_authorization_details(self):
+        logger.info("IAM - Set Attached Policies and Group Users...")
+        try:
+            users = {user.arn: user for user in self.users}
+            group_users = {}
+            for user in self._authorization_details["users"].values():
+                for group_name in user.get("GroupList", []):
+                    group_users.setdefault(group_name, []).append(user)
+                if user["Arn"] in users:
+                    users[user["Arn"]].attached_policies = user.get(
+                        "AttachedManagedPolicies", []
+                    )
+            for role in self.roles:
+                role.attached_policies = (
+                    self._authorization_details["roles"]
+                    .get(role.arn, {})
+                    .get("AttachedManagedPolicies", [])
+                )
+
+            groups_without_users = []
+            for group in self.groups:
+                group.attached_policies = (
+                    self._authorization_details["groups"]
+                    .get(group.arn, {})
+                    .get("AttachedManagedPolicies", [])
+                )
+                members = group_users.get(group.name, [])
+                # The authorization details do not include when the password was last used
+                if all(member["Arn"] in users for member in members):
+                    group.users = [
+                        User(
+                            name=member["UserName"],
+                            arn=member["Arn"],
+                            password_last_used=users[member["Arn"]].password_last_used,
+                        )
+                        for member in members
+                    ]
+                else:
+                    groups_without_users.append(group)
+            if groups_without_users:
+                self._get_group_users(groups_without_users)
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def _set_policies_authorization_details(self):
+        logger.info("IAM - Set Policies Documents...")
+        try:
+            policies_without_version = {}
+            for arn, policy in self.policies.items():
+                policy_version = next(
+                    (
+                        version
+                        for version in self._authorization_details["policies"]
+                        .get(policy.arn, {})
+                        .get("PolicyVersionList", [])
+                        if version["VersionId"] == policy.version_id
+                    ),
+                    None,
+                )
+                if policy_version:
+                    policy.document = policy_version["Document"]
+                else:
+                    policies_without_version[arn] = policy
+            # AWS managed policies may not be included in the authorization details
+            if policies_without_version:
+                self._list_policies_version(policies_without_version)
+
+            for entities, details_key, policy_list_key in (
+                (self.users, "users", "UserPolicyList"),
+                (self.groups, "groups", "GroupPolicyList"),
+                (self.roles, "roles", "RolePolicyList"),
+            ):
+                for entity in entities:
+                    inline_policies = []
+                    for inline_policy in (
+                        self._authorization_details[details_key]
+                        .get(entity.arn, {})
+                        .get(policy_list_key, [])
+                    ):
+                        inline_policies.append(inline_policy["PolicyName"])
+                        self.policies[
+                            f"{entity.arn}:policy/{inline_policy['PolicyName']}"
+                        ] = Policy(
+                            name=inline_policy["PolicyName"],
+                            arn=entity.arn,
+                            entity=entity.name,
+                            type="Inline",
+                            attached=True,
+                            version_id="v1",
+                            document=inline_policy["PolicyDocument"],
+                        )
+                    entity.inline_policies = inline_policies
+        except Exception as error:
+            logger.error(
+                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
     def _list_virtual_mfa_devices(self):
         logger.info("IAM - List Virtual MFA Devices...")
         try:
@@ -357,10 +543,10 @@ class IAM(AWSService):
                 f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _get_group_users(self):
+    def _get_group_users(self, groups=None):
         logger.info("IAM - Get Group Users...")
         try:
-            for group in self.groups:
+            for group in groups if groups is not None else self.groups:
                 get_group_paginator = self.client.get_paginator("get_group")
                 group_users = []
                 for page in get_group_paginator.paginate(GroupName=group.name):
@@ -742,6 +928,10 @@ class IAM(AWSService):
         logger.info("IAM - List Policies...")
         try:
             policies = {}
+            if self.audit_resources and not is_service_filtered(
+                "iam", self.audit_resources, resource_type="policy"
+            ):
+                return {}
             list_policies_paginator = self.client.get_paginator("list_policies")
             for page in list_policies_paginator.paginate(
                 Scope=scope, OnlyAttached=False if scope == "Local" else True
@@ -880,34 +1070,64 @@ class IAM(AWSService):
     def _get_last_accessed_services(self):
         logger.info("IAM - Getting Last Accessed Services ...")
         try:
-            for user in self.users:
-                try:
-                    details = self.client.generate_service_last_accessed_details(
-                        Arn=user.arn
-                    )
-                    response = self.client.get_service_last_accessed_details(
-                        JobId=details["JobId"]
-                    )
-                    while response["JobStatus"] == "IN_PROGRESS":
-                        response = self.client.get_service_last_accessed_details(
-                            JobId=details["JobId"]
+            # Up to LAST_ACCESSED_JOBS_MAX_CONCURRENCY jobs are in progress, the rest wait to be submitted
+            pending_users = deque(self.users)
+            jobs = {}
+            last_accessed_services = {}
+            delay = REPORT_JOBS_POLL_INITIAL_DELAY
+            while pending_users or jobs:
+                while pending_users and len(jobs) < LAST_ACCESSED_JOBS_MAX_CONCURRENCY:
+                    user = pending_users.popleft()
+                    try:
+                        jobs[
+                            self.client.generate_service_last_accessed_details(
+                                Arn=user.arn
+                            )["JobId"]
+                        ] = user
+                    except ClientError as error:
+                        if error.response["Error"]["Code"] == "NoSuchEntity":
+                            logger.warning(
+                                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                            )
+                        else:
+                            logger.error(
+                                f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                            )
+                    except Exception as error:
+                        logger.error(
+                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                         )
-                    self.last_accessed_services[(user.name, user.arn)] = response.get(
-                        "ServicesLastAccessed", {}
-                    )
 
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchEntity":
-                        logger.warning(
-                            f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                # Poll all the jobs in progress together
+                for job_id, user in list(jobs.items()):
+                    try:
+                        response = self.client.get_service_last_accessed_details(
+                            JobId=job_id
                         )
-                    else:
+                        if response["JobStatus"] == "IN_PROGRESS":
+                            continue
+                        last_accessed_services[user.arn] = response.get(
+                            "ServicesLastAccessed", {}
+                        )
+                    except Exception as error:
                         logger.error(
                             f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                         )
-                except Exception as error:
-                    logger.error(
-                        f"{self.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    del jobs[job_id]
+                    delay = REPORT_JOBS_POLL_INITIAL_DELAY
+
+                # Wait only if no more jobs can be submitted
+                if jobs and (
+                    not pending_users or len(jobs) >= LAST_ACCESSED_JOBS_MAX_CONCURRENCY
+                ):
+                    sleep(delay)
+                    delay = min(delay * 2, REPORT_JOBS_POLL_MAX_DELAY)
+
+            # Keep the order of the users
+            for user in self.users:
+                if user.arn in last_accessed_services:
+                    self.last_accessed_services[(user.name, user.arn)] = (
+                        last_accessed_services[user.arn]
                     )
 
         except Exception as error:
@@ -1,11 +1,14 @@
 import re
 from ipaddress import ip_address, ip_network
-from typing import Optional, Tuple
-
-from py_iam_expand.actions import InvalidActionHandling, expand_actions
+from typing import Callable, Optional, Tuple
 
 from prowler.lib.logger import logger
 from prowler.providers.aws.aws_provider import read_aws_regions_file
+from prowler.providers.aws.services.iam.lib.policy_engine import (
+    PolicyDocument,
+    expand_action_pattern,
+    policy_engine,
+)
 
 
 def _get_patterns_from_standard_value(value):
@@ -21,6 +24,17 @@ def _get_patterns_from_standard_value(value):
     return patterns
 
 
+def _get_policy_document(policy: dict) -> PolicyDocument:
+    """
+    Helper function to get the normalized document of a policy from the policy engine.
+    Policies that cannot be cached are normalized for this call only.
+    """
+    document = policy_engine.get_document(policy)
+    if document is None:
+        document = PolicyDocument(policy)
+    return document
+
+
 def get_effective_actions(policy: dict) -> set[str]:
     """
     Calculates the set of effectively allowed IAM actions from a policy document.
@@ -30,6 +44,8 @@ def get_effective_actions(policy: dict) -> set[str]:
     and applies the Deny > Allow precedence. Assumes standard AWS policy
     format where Action/NotAction is a string or a list of strings.
 
+    The actions of each policy document are expanded once by the policy engine.
+
     Args:
         policy (dict): The IAM policy document.
 
@@ -39,96 +55,7 @@ def get_effective_actions(policy: dict) -> set[str]:
     if not policy or "Statement" not in policy:
         return set()
 
-    directly_allowed_actions = set()
-    directly_denied_actions = set()
-    allow_not_action_exclusions = set()
-    deny_not_action_exclusions = set()
-    has_allow_not_action_statement = False
-    has_deny_not_action_statement = False
-
-    statements = policy.get("Statement", [])
-    if not isinstance(statements, list):
-        statements = [statements]
-
-    for statement in statements:
-        effect = statement.get("Effect", "")
-        if not isinstance(effect, str):
-            continue
-        effect = effect.strip().lower()
-
-        if effect not in ["allow", "deny"]:
-            continue
-
-        actions = statement.get("Action")
-        not_actions = statement.get("NotAction")
-
-        action_patterns_to_expand = _get_patterns_from_standard_value(actions)
-        if action_patterns_to_expand:
-            expanded = set()
-            for pattern in action_patterns_to_expand:
-                expanded.update(
-                    expand_actions(
-                        pattern,
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
-            if effect == "allow":
-                directly_allowed_actions.update(expanded)
-            else:  # deny
-                directly_denied_actions.update(expanded)
-
-        not_action_patterns_to_expand = _get_patterns_from_standard_value(not_actions)
-        if not_action_patterns_to_expand:
-            expanded_exclusions = set()
-            for pattern in not_action_patterns_to_expand:
-                expanded_exclusions.update(
-                    expand_actions(
-                        pattern,
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
-            if effect == "allow":
-                allow_not_action_exclusions.update(expanded_exclusions)
-                has_allow_not_action_statement = True
-            else:  # deny
-                deny_not_action_exclusions.update(expanded_exclusions)
-                has_deny_not_action_statement = True
-
-    all_actions = None
-
-    # Actions allowed by "Allow Action" statements
-    potentially_allowed = directly_allowed_actions
-
-    # Actions allowed by "Allow NotAction" statements
-    if has_allow_not_action_statement:
-        if all_actions is None:
-            all_actions = set(
-                expand_actions(
-                    "*",
-                    InvalidActionHandling.REMOVE,
-                )
-            )
-        allowed_by_not_action = all_actions.difference(allow_not_action_exclusions)
-        potentially_allowed.update(allowed_by_not_action)
-
-    # Actions denied by "Deny Action" statements
-    potentially_denied = directly_denied_actions
-
-    # Actions denied by "Deny NotAction" statements
-    if has_deny_not_action_statement:
-        if all_actions is None:
-            all_actions = set(
-                expand_actions(
-                    "*",
-                    InvalidActionHandling.REMOVE,
-                )
-            )
-        denied_by_not_action = all_actions.difference(deny_not_action_exclusions)
-        potentially_denied.update(denied_by_not_action)
-
-    effective_actions = potentially_allowed.difference(potentially_denied)
-
-    return effective_actions
+    return set(_get_policy_document(policy).effective_actions)
 
 
 def check_full_service_access(service: str, policy: dict) -> bool:
@@ -146,81 +73,20 @@ def check_full_service_access(service: str, policy: dict) -> bool:
     if not policy or "Statement" not in policy:
         return False
 
-    service_wildcard = f"{service}:*" if service != "*" else "*"
-    all_target_service_actions = set(
-        expand_actions(
-            service_wildcard,
-            InvalidActionHandling.REMOVE,
-        )
-    )
-
-    effective_allowed_actions = get_effective_actions(policy)
-
-    if not all_target_service_actions.issubset(effective_allowed_actions):
-        return False
-
-    actions_allowed_on_all_resources = set()
-    statements = policy.get("Statement", [])
-    if not isinstance(statements, list):
-        statements = [statements]
+    document = _get_policy_document(policy)
 
-    all_aws_actions_for_inversion = None
-
-    for statement in statements:
-        effect = statement.get("Effect", "")
-        resources = statement.get("Resource", [])
-
-        if not isinstance(effect, str) or effect.strip().lower() != "allow":
-            continue
-        if isinstance(resources, str):
-            resources = [resources]
-        if "*" not in resources:
-            continue
-
-        actions = statement.get("Action")
-        not_actions = statement.get("NotAction")
-        statement_specific_allowed = set()
-
-        # Use the shared helper function instead of the duplicated one
-        action_patterns = _get_patterns_from_standard_value(actions)
-        for pattern in action_patterns:
-            statement_specific_allowed.update(
-                expand_actions(
-                    pattern,
-                    InvalidActionHandling.REMOVE,
-                )
-            )
+    def full_service_access() -> bool:
+        service_wildcard = f"{service}:*" if service != "*" else "*"
+        all_target_service_actions = expand_action_pattern(service_wildcard)
 
-        not_action_patterns = _get_patterns_from_standard_value(not_actions)
-        if not_action_patterns:
-            if all_aws_actions_for_inversion is None:
-                all_aws_actions_for_inversion = set(
-                    expand_actions(
-                        "*",
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
+        if not all_target_service_actions.issubset(document.effective_actions):
+            return False
 
-            statement_exclusions = set()
-            for pattern in not_action_patterns:
-                statement_exclusions.update(
-                    expand_actions(
-                        pattern,
-                        InvalidActionHandling.REMOVE,
-                    )
-                )
-            # Actions allowed by THIS NotAction statement
-            statement_specific_allowed.update(
-                all_aws_actions_for_inversion.difference(statement_exclusions)
-            )
-
-        actions_allowed_on_all_resources.update(
-            action
-            for action in statement_specific_allowed
-            if action in all_target_service_actions
+        return all_target_service_actions.issubset(
+            document.get_actions_allowed_on_all_resources(all_target_service_actions)
         )
 
-    return all_target_service_actions.issubset(actions_allowed_on_all_resources)
+    return document.memoize(("check_full_service_access", service), full_service_access)
 
 
 def has_public_principal(statement: dict) -> bool:
@@ -380,6 +246,25 @@ def is_condition_restricting_from_private_ip(condition_statement: dict) -> bool:
     return is_from_private_ip
 
 
+def _memoize_policy_evaluation(
+    policy: dict, key: tuple, function: Callable[[], bool]
+) -> bool:
+    """
+    Helper function to memoize the result of a policy evaluation in the policy engine by its arguments.
+    Policies or arguments that cannot be cached are evaluated for this call only.
+    """
+    if key is None:
+        return function()
+    document = policy_engine.get_document(policy)
+    if document is None:
+        return function()
+    try:
+        hash(key)
+    except TypeError:
+        return function()
+    return document.memoize(key, function)
+
+
 # TODO: Add logic for deny statements
 def is_policy_public(
     policy: dict,
@@ -400,6 +285,39 @@ def is_policy_public(
     Returns:
         bool: True if the policy allows public access, False otherwise
     """
+    if not policy:
+        return False
+    try:
+        key = (
+            "is_policy_public",
+            source_account,
+            is_cross_account_allowed,
+            tuple(not_allowed_actions),
+            check_cross_service_confused_deputy,
+        )
+    except TypeError:
+        key = None
+    return _memoize_policy_evaluation(
+        policy,
+        key,
+        lambda: _is_policy_public(
+            policy,
+            source_account,
+            is_cross_account_allowed,
+            not_allowed_actions,
+            check_cross_service_confused_deputy,
+        ),
+    )
+
+
+def _is_policy_public(
+    policy: dict,
+    source_account: str,
+    is_cross_account_allowed,
+    not_allowed_actions: list,
+    check_cross_service_confused_deputy,
+) -> bool:
+    """Evaluates is_policy_public, without the policy engine"""
     is_public = False
     if policy:
         for statement in policy.get("Statement", []):
@@ -787,7 +705,15 @@ def check_admin_access(policy: dict) -> bool:
     Returns:
         bool: True if the policy allows admin access, False otherwise.
     """
+    if not policy:
+        return None
+    return _memoize_policy_evaluation(
+        policy, ("check_admin_access",), lambda: _check_admin_access(policy)
+    )
+
 
+def _check_admin_access(policy: dict) -> bool:
+    """Evaluates check_admin_access, without the policy engine"""
     if policy:
         allowed_actions = set()
         allowed_not_actions = set()
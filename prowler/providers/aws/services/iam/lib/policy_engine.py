@@ -0,0 +1,244 @@
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import sha256
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional
+
+from py_iam_expand.actions import InvalidActionHandling, expand_actions
+
+# Maximum number of policy documents kept by the process-wide engine
+POLICY_ENGINE_MAX_SIZE = 8192
+# Maximum number of expanded action patterns, e.g. "s3:Get*"
+ACTION_PATTERNS_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=ACTION_PATTERNS_CACHE_SIZE)
+def expand_action_pattern(pattern: str) -> frozenset:
+    """
+    Returns the IAM actions matching an action pattern, removing the invalid ones.
+
+    The expansions are cached, since the same patterns are used by many policies and expanding "*" alone
+    takes more than a hundred milliseconds.
+
+    Args:
+        pattern (str): The action pattern, e.g. "s3:Get*" or "*".
+
+    Returns:
+        frozenset: The IAM actions matching the pattern.
+    """
+    return frozenset(expand_actions(pattern, InvalidActionHandling.REMOVE))
+
+
+def _get_patterns(value: Any) -> frozenset:
+    """Returns the string patterns of an Action/NotAction value, a string or a list of strings"""
+    if isinstance(value, str):
+        return frozenset([value])
+    if isinstance(value, list):
+        return frozenset(item for item in value if isinstance(item, str))
+    return frozenset()
+
+
+def _expand_patterns(patterns: frozenset) -> frozenset:
+    """Returns the IAM actions matching any of the patterns"""
+    if len(patterns) == 1:
+        return expand_action_pattern(next(iter(patterns)))
+    expanded = set()
+    for pattern in patterns:
+        expanded.update(expand_action_pattern(pattern))
+    return frozenset(expanded)
+
+
+class PolicyStatement:
+    """
+    PolicyStatement is a statement of a policy document, normalized once to evaluate it.
+
+    Attributes:
+        - effect: The effect in lowercase, "allow" or "deny", or None if the effect is not valid.
+        - actions: The Action patterns.
+        - not_actions: The NotAction patterns.
+        - resources: The Resource value, as a list if it is a single string.
+        - statement: The original statement.
+    """
+
+    __slots__ = (
+        "effect",
+        "actions",
+        "not_actions",
+        "resources",
+        "statement",
+        "_expanded_actions",
+        "_expanded_not_actions",
+    )
+
+    def __init__(self, statement: dict) -> None:
+        effect = statement.get("Effect", "")
+        effect = effect.strip().lower() if isinstance(effect, str) else ""
+        self.effect = effect if effect in ("allow", "deny") else None
+        self.actions = _get_patterns(statement.get("Action"))
+        self.not_actions = _get_patterns(statement.get("NotAction"))
+        resources = statement.get("Resource", [])
+        self.resources = [resources] if isinstance(resources, str) else resources
+        self.statement = statement
+        self._expanded_actions = None
+        self._expanded_not_actions = None
+
+    @property
+    def expanded_actions(self) -> frozenset:
+        """The IAM actions matching the Action patterns"""
+        if self._expanded_actions is None:
+            self._expanded_actions = _expand_patterns(self.actions)
+        return self._expanded_actions
+
+    @property
+    def expanded_not_actions(self) -> frozenset:
+        """The IAM actions matching the NotAction patterns"""
+        if self._expanded_not_actions is None:
+            self._expanded_not_actions = _expand_patterns(self.not_actions)
+        return self._expanded_not_actions
+
+
+class PolicyDocument:
+    """
+    PolicyDocument is a policy document normalized once, with the results of the evaluations done on it.
+
+    The allowed and denied actions are expanded the first time they are needed and the results of the helper
+    functions of prowler.providers.aws.services.iam.lib.policy are memoized by their arguments, so evaluating
+    the same document again does not expand the actions or walk the statements again.
+
+    Attributes:
+        - statements: The normalized statements.
+        - allowed_actions: The actions allowed by the Allow statements, with Action or NotAction.
+        - denied_actions: The actions denied by the Deny statements, with Action or NotAction.
+        - effective_actions: The allowed actions that are not denied.
+    """
+
+    def __init__(self, policy: dict) -> None:
+        statements = policy.get("Statement", [])
+        if not isinstance(statements, list):
+            statements = [statements]
+        self.statements = [PolicyStatement(statement) for statement in statements]
+        self._lock = Lock()
+        self._results = {}
+        self._allowed_actions = None
+        self._denied_actions = None
+        self._effective_actions = None
+
+    def _get_actions(self, effect: str) -> frozenset:
+        actions = set()
+        not_action_exclusions = set()
+        has_not_action_statement = False
+        for statement in self.statements:
+            if statement.effect != effect:
+                continue
+            actions.update(statement.expanded_actions)
+            if statement.not_actions:
+                not_action_exclusions.update(statement.expanded_not_actions)
+                has_not_action_statement = True
+        # A NotAction statement applies to every action but the excluded ones
+        if has_not_action_statement:
+            actions.update(expand_action_pattern("*").difference(not_action_exclusions))
+        return frozenset(actions)
+
+    @property
+    def allowed_actions(self) -> frozenset:
+        if self._allowed_actions is None:
+            self._allowed_actions = self._get_actions("allow")
+        return self._allowed_actions
+
+    @property
+    def denied_actions(self) -> frozenset:
+        if self._denied_actions is None:
+            self._denied_actions = self._get_actions("deny")
+        return self._denied_actions
+
+    @property
+    def effective_actions(self) -> frozenset:
+        if self._effective_actions is None:
+            self._effective_actions = self.allowed_actions.difference(
+                self.denied_actions
+            )
+        return self._effective_actions
+
+    def get_actions_allowed_on_all_resources(self, actions: frozenset) -> frozenset:
+        """Returns the given actions allowed by the Allow statements with "*" as Resource"""
+        allowed = set()
+        for statement in self.statements:
+            if statement.effect != "allow" or "*" not in statement.resources:
+                continue
+            allowed.update(actions.intersection(statement.expanded_actions))
+            if statement.not_actions:
+                allowed.update(actions.difference(statement.expanded_not_actions))
+        return frozenset(allowed)
+
+    def memoize(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Returns the result of the function for the key, calling it only the first time"""
+        try:
+            return self._results[key]
+        except KeyError:
+            pass
+        result = function()
+        with self._lock:
+            self._results[key] = result
+        return result
+
+
+class PolicyEngine:
+    """
+    PolicyEngine keeps the normalized policy documents of the process, indexed by the hash of their content.
+
+    The same customer and AWS managed policies are attached to many users, groups and roles and evaluated by many
+    checks, so each document is normalized once no matter where it comes from. The least recently used documents
+    are discarded once there are max_size of them.
+
+    Usage:
+        document = policy_engine.get_document(policy)
+        if document:
+            document.effective_actions
+    """
+
+    def __init__(self, max_size: int = POLICY_ENGINE_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self._documents = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def get_key(policy: dict) -> Optional[str]:
+        """Returns the hash of the policy content, or None if it cannot be serialized"""
+        try:
+            content = json.dumps(
+                policy, sort_keys=True, separators=(",", ":"), default=str
+            )
+        except (TypeError, ValueError):
+            return None
+        return sha256(content.encode()).hexdigest()
+
+    def get_document(self, policy: dict) -> Optional[PolicyDocument]:
+        """Returns the normalized document of the policy, or None if it is not a policy that can be cached"""
+        if not isinstance(policy, dict):
+            return None
+        key = self.get_key(policy)
+        if key is None:
+            return None
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+                return document
+        document = PolicyDocument(policy)
+        with self._lock:
+            document = self._documents.setdefault(key, document)
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+        return document
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+
+policy_engine = PolicyEngine()
@@ -1,10 +1,15 @@
-from py_iam_expand.actions import expand_actions
+from functools import lru_cache
+from typing import Iterable, Optional
 
 from prowler.lib.logger import logger
 from prowler.providers.aws.services.iam.lib.policy import get_effective_actions
+from prowler.providers.aws.services.iam.lib.policy_engine import (
+    expand_action_pattern,
+    policy_engine,
+)
 
 # Does the tool analyze both users and roles, or just one or the other? --> Everything using AttachementCount.
-# Does the tool take a principal-centric or policy-centric approach? --> Policy-centric approach.
+# Does the tool take a principal-centric or policy-centric approach? --> Policy-centric approach, PrivilegeEscalationIndex has the principal-centric view.
 # Does the tool handle resource constraints? --> We don't check if the policy affects all resources or not, we check everything.
 # Does the tool consider the permissions of service roles? --> Just checks policies.
 # Does the tool handle transitive privesc paths (i.e., attack chains)? --> Not yet.
@@ -123,6 +128,80 @@ privilege_escalation_policies_combination = {
 }
 
 
+@lru_cache(maxsize=None)
+def _get_privilege_escalation_bitsets() -> tuple:
+    """
+    Returns the action vocabulary of the privilege escalation combinations, with a bit for each action, and the
+    bitset of the actions required by each combination.
+
+    Returns:
+        tuple: The bit of each action of the vocabulary and the list of (combination patterns, required bitset).
+    """
+    combinations = []
+    action_bits = {}
+    for required_actions_patterns in privilege_escalation_policies_combination.values():
+        required_actions = set()
+        for action_pattern in required_actions_patterns:
+            required_actions.update(expand_action_pattern(action_pattern))
+        required_bitset = 0
+        for action in required_actions:
+            required_bitset |= action_bits.setdefault(action, 1 << len(action_bits))
+        combinations.append((required_actions_patterns, required_bitset))
+    return action_bits, combinations
+
+
+def get_actions_bitset(actions: Iterable[str]) -> int:
+    """
+    Returns the bitset of the given actions over the actions of the privilege escalation combinations.
+
+    Args:
+        actions (Iterable[str]): The IAM actions, e.g. the effective actions of a policy.
+
+    Returns:
+        int: The bitset, with the actions that are not in any combination left out.
+    """
+    action_bits, _ = _get_privilege_escalation_bitsets()
+    actions = actions if isinstance(actions, (set, frozenset)) else set(actions)
+    bitset = 0
+    for action, bit in action_bits.items():
+        if action in actions:
+            bitset |= bit
+    return bitset
+
+
+def get_privilege_escalation_actions(bitset: int) -> str:
+    """
+    Returns the privilege escalation combinations allowed by a bitset of actions.
+
+    Args:
+        bitset (int): The bitset of the allowed actions, see get_actions_bitset.
+
+    Returns:
+        str: A comma-separated string of the patterns of the combinations found,
+            or an empty string if none are found.
+    """
+    matched_combo_actions = set()
+    _, combinations = _get_privilege_escalation_bitsets()
+    for required_actions_patterns, required_bitset in combinations:
+        if required_bitset and bitset & required_bitset == required_bitset:
+            matched_combo_actions.update(required_actions_patterns)
+    return ", ".join(f"'{action}'" for action in sorted(matched_combo_actions))
+
+
+def _get_policy_bitsets(policy: dict) -> tuple:
+    """Returns the bitsets of the allowed and denied actions of a policy document, evaluated once per document"""
+    document = policy_engine.get_document(policy)
+    if document is None:
+        return get_actions_bitset(get_effective_actions(policy)), 0
+    return document.memoize(
+        ("privilege_escalation_bitsets",),
+        lambda: (
+            get_actions_bitset(document.allowed_actions),
+            get_actions_bitset(document.denied_actions),
+        ),
+    )
+
+
 def check_privilege_escalation(policy: dict) -> str:
     """
     Checks if the policy allows known privilege escalation combinations.
@@ -139,39 +218,90 @@ def check_privilege_escalation(policy: dict) -> str:
         return policies_affected
 
     try:
-        effective_allowed_actions = get_effective_actions(policy)
-
-        matched_combo_actions = set()
-        matched_combo_keys = set()
-
-        for (
-            combo_key,
-            required_actions_patterns,
-        ) in privilege_escalation_policies_combination.items():
-            # Expand the required actions for the current combo
-            expanded_required_actions = set()
-            for action_pattern in required_actions_patterns:
-                expanded_required_actions.update(expand_actions(action_pattern))
-
-            # Check if all expanded required actions are present in the effective actions
-            if expanded_required_actions and expanded_required_actions.issubset(
-                effective_allowed_actions
-            ):
-                # If match, store the original patterns and the key
-                matched_combo_actions.update(required_actions_patterns)
-                matched_combo_keys.add(combo_key)
-
-        if matched_combo_keys:
-            # Use the original patterns from the matched combos for the output
-            policies_affected = ", ".join(
-                f"'{action}'" for action in sorted(list(matched_combo_actions))
-            )
-            # Alternative: Output based on combo keys
-            # print("DEBUG: matched_combo_keys =", ", ".join(sorted(list(matched_combo_keys))))
-
+        allowed_bitset, denied_bitset = _get_policy_bitsets(policy)
+        policies_affected = get_privilege_escalation_actions(
+            allowed_bitset & ~denied_bitset
+        )
     except Exception as error:
         logger.error(
             f"Error checking privilege escalation for policy: {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
         )
 
     return policies_affected
+
+
+class PrivilegeEscalationIndex:
+    """
+    PrivilegeEscalationIndex has the privilege escalation combinations allowed to each IAM user, role and group by
+    all of its attached and inline policies, the users including the policies of their groups.
+
+    The allowed and denied actions of each policy document are bitsets over the actions of the combinations, computed
+    once per document, so the permissions of a principal are the union of the bitsets of its policies, without the
+    denied ones, and every combination is matched with a single bitwise operation.
+
+    Attributes:
+        - principals: The bitset of the effective actions of each principal, by ARN.
+
+    Usage:
+        index = iam_client.privilege_escalation_index
+        index.get_privilege_escalation(role.arn)
+    """
+
+    def __init__(self, users: list, roles: list, groups: list, policies: dict) -> None:
+        self.principals = {}
+        policy_bitsets = {}
+
+        def get_bitsets(arns: Iterable[str]) -> tuple:
+            allowed_bitset = denied_bitset = 0
+            for arn in arns:
+                if arn not in policy_bitsets:
+                    policy = policies.get(arn)
+                    document = getattr(policy, "document", None)
+                    policy_bitsets[arn] = (
+                        _get_policy_bitsets(document) if document else (0, 0)
+                    )
+                allowed, denied = policy_bitsets[arn]
+                allowed_bitset |= allowed
+                denied_bitset |= denied
+            return allowed_bitset, denied_bitset
+
+        def get_policy_arns(entity) -> list:
+            return [
+                attached_policy["PolicyArn"]
+                for attached_policy in entity.attached_policies
+            ] + [
+                f"{entity.arn}:policy/{inline_policy}"
+                for inline_policy in entity.inline_policies
+            ]
+
+        user_groups = {}
+        for group in groups:
+            group_policy_arns = get_policy_arns(group)
+            allowed, denied = get_bitsets(group_policy_arns)
+            self.principals[group.arn] = allowed & ~denied
+            for user in group.users:
+                user_groups.setdefault(user.arn, []).extend(group_policy_arns)
+        for user in users:
+            allowed, denied = get_bitsets(
+                get_policy_arns(user) + user_groups.get(user.arn, [])
+            )
+            self.principals[user.arn] = allowed & ~denied
+        for role in roles:
+            allowed, denied = get_bitsets(get_policy_arns(role))
+            self.principals[role.arn] = allowed & ~denied
+
+    def get_privilege_escalation(self, arn: str) -> Optional[str]:
+        """
+        Returns the privilege escalation combinations allowed to a principal.
+
+        Args:
+            arn (str): The ARN of the user, role or group.
+
+        Returns:
+            str: A comma-separated string of the privilege escalation actions found, an empty string if none are
+                found, or None if the principal is not in the index.
+        """
+        bitset = self.principals.get(arn)
+        if bitset is None:
+            return None
+        return get_privilege_escalation_actions(bitset)
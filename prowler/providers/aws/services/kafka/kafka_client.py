@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.kafka.kafka_service import Kafka
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-kafka_client = Kafka(Provider.get_global_provider())
+kafka_client = ServiceClient(Kafka)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.kafka.kafka_service import KafkaConnect
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-kafkaconnect_client = KafkaConnect(Provider.get_global_provider())
+kafkaconnect_client = ServiceClient(KafkaConnect)
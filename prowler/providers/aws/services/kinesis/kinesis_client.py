@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.kinesis.kinesis_service import Kinesis
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-kinesis_client = Kinesis(Provider.get_global_provider())
+kinesis_client = ServiceClient(Kinesis)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.lightsail.lightsail_service import Lightsail
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-lightsail_client = Lightsail(Provider.get_global_provider())
+lightsail_client = ServiceClient(Lightsail)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.mq.mq_service import MQ
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-mq_client = MQ(Provider.get_global_provider())
+mq_client = ServiceClient(MQ)
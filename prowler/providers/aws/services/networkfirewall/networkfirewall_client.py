@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.networkfirewall.networkfirewall_service import (
     NetworkFirewall,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-networkfirewall_client = NetworkFirewall(Provider.get_global_provider())
+networkfirewall_client = ServiceClient(NetworkFirewall)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.rds.rds_service import RDS
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-rds_client = RDS(Provider.get_global_provider())
+rds_client = ServiceClient(RDS)
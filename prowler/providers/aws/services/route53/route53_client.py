@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.route53.route53_service import Route53
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-route53_client = Route53(Provider.get_global_provider())
+route53_client = ServiceClient(Route53)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.route53.route53_service import Route53Domains
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-route53domains_client = Route53Domains(Provider.get_global_provider())
+route53domains_client = ServiceClient(Route53Domains)
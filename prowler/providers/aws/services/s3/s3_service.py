@@ -44,18 +44,19 @@ class S3(AWSService):
             self.audited_canonical_id = list_buckets["Owner"]["ID"]
             for bucket in list_buckets["Buckets"]:
                 try:
-                    bucket_region = self.client.get_bucket_location(
-                        Bucket=bucket["Name"]
-                    )["LocationConstraint"]
-                    if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
-                        bucket_region = "eu-west-1"
-                    if not bucket_region:  # If None, bucket_region is us-east-1
-                        bucket_region = "us-east-1"
                     # Arn
                     arn = f"arn:{self.audited_partition}:s3:::{bucket['Name']}"
+                    # Skip the location lookup of the buckets that are not audited
                     if not self.audit_resources or (
                         is_resource_filtered(arn, self.audit_resources)
                     ):
+                        bucket_region = self.client.get_bucket_location(
+                            Bucket=bucket["Name"]
+                        )["LocationConstraint"]
+                        if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
+                            bucket_region = "eu-west-1"
+                        if not bucket_region:  # If None, bucket_region is us-east-1
+                            bucket_region = "us-east-1"
                         self.regions_with_buckets.append(bucket_region)
                         # Check if there are filter regions
                         # FIXME: what if the bucket comes from a CloudTrail bucket in another audited region
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.sagemaker.sagemaker_service import SageMaker
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-sagemaker_client = SageMaker(Provider.get_global_provider())
+sagemaker_client = ServiceClient(SageMaker)
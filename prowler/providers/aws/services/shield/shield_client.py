@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.shield.shield_service import Shield
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-shield_client = Shield(Provider.get_global_provider())
+shield_client = ServiceClient(Shield)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.sqs.sqs_service import SQS
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-sqs_client = SQS(Provider.get_global_provider())
+sqs_client = ServiceClient(SQS)
@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.ssmincidents.ssmincidents_service import (
     SSMIncidents,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-ssmincidents_client = SSMIncidents(Provider.get_global_provider())
+ssmincidents_client = ServiceClient(SSMIncidents)
@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.storagegateway.storagegateway_service import (
     StorageGateway,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-storagegateway_client = StorageGateway(Provider.get_global_provider())
+storagegateway_client = ServiceClient(StorageGateway)
@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.transfer.transfer_service import Transfer
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-transfer_client = Transfer(Provider.get_global_provider())
+transfer_client = ServiceClient(Transfer)
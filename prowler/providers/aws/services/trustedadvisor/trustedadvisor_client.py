@@ -1,6 +1,6 @@
 from prowler.providers.aws.services.trustedadvisor.trustedadvisor_service import (
     TrustedAdvisor,
 )
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-trustedadvisor_client = TrustedAdvisor(Provider.get_global_provider())
+trustedadvisor_client = ServiceClient(TrustedAdvisor)
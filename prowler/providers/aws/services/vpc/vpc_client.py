@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.vpc.vpc_service import VPC
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-vpc_client = VPC(Provider.get_global_provider())
+vpc_client = ServiceClient(VPC)
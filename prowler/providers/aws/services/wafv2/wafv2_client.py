@@ -1,4 +1,4 @@
 from prowler.providers.aws.services.wafv2.wafv2_service import WAFv2
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-wafv2_client = WAFv2(Provider.get_global_provider())
+wafv2_client = ServiceClient(WAFv2)
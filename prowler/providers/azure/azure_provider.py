@@ -4,7 +4,7 @@ import re
 from argparse import ArgumentTypeError
 from itertools import chain
 from os import getenv
-from typing import Union
+from typing import Optional, Union
 from uuid import UUID
 
 import requests
@@ -58,6 +58,7 @@ from prowler.providers.azure.lib.regions.regions import get_regions_config
 from prowler.providers.azure.models import AzureIdentityInfo, AzureRegionConfig
 from prowler.providers.common.models import Audit_Metadata, Connection
 from prowler.providers.common.provider import Provider
+from prowler.providers.common.snapshot import Snapshot
 
 
 class AzureProvider(Provider):
@@ -76,6 +77,7 @@ class AzureProvider(Provider):
         _region_config (AzureRegionConfig): The region configuration for the Azure provider.
         _locations (dict): A dictionary containing the available locations for the Azure provider.
         _mutelist (AzureMutelist): The mutelist object associated with the Azure provider.
+        _snapshot (Snapshot): The snapshot to record the API responses of the services to, or to replay them from.
         audit_metadata (Audit_Metadata): The audit metadata for the Azure provider.
 
     Methods:
@@ -89,6 +91,7 @@ class AzureProvider(Provider):
         fixer_config(self): Returns the fixer configuration.
         output_options(self, options: tuple): Sets the output options for the Azure provider.
         mutelist(self) -> AzureMutelist: Returns the mutelist object associated with the Azure provider.
+        snapshot(self) -> Snapshot: Returns the snapshot of the API responses of the services, if any.
         validate_arguments(cls, az_cli_auth, sp_env_auth, browser_auth, managed_identity_auth, tenant_id): Validates the authentication arguments for the Azure provider.
         setup_region_config(cls, region): Sets up the region configuration for the Azure provider.
         print_credentials(self): Prints the Azure credentials information.
@@ -102,6 +105,7 @@ class AzureProvider(Provider):
     _region_config: AzureRegionConfig
     _locations: dict
     _mutelist: AzureMutelist
+    _snapshot: Optional[Snapshot] = None
     # TODO: this is not optional, enforce for all providers
     audit_metadata: Audit_Metadata
 
@@ -121,6 +125,7 @@ class AzureProvider(Provider):
         mutelist_content: dict = None,
         client_id: str = None,
         client_secret: str = None,
+        snapshot: Snapshot = None,
     ):
         """
         Initializes the Azure provider.
@@ -140,6 +145,7 @@ class AzureProvider(Provider):
             mutelist_content (dict): The mutelist content.
             client_id (str): The Azure client ID.
             client_secret (str): The Azure client secret.
+            snapshot (Snapshot): The snapshot to record the API responses of the services to, or to replay them from.
 
         Returns:
             None
@@ -287,6 +293,9 @@ class AzureProvider(Provider):
                 mutelist_path=mutelist_path,
             )
 
+        # Snapshot of the API responses of the services
+        self._snapshot = snapshot
+
         Provider.set_global_provider(self)
 
     @property
@@ -329,6 +338,11 @@ class AzureProvider(Provider):
         """Mutelist object associated with this Azure provider."""
         return self._mutelist
 
+    @property
+    def snapshot(self) -> Optional[Snapshot]:
+        """Returns the snapshot of the API responses of the services, if any."""
+        return self._snapshot
+
     # TODO: this should be moved to the argparse, if not we need to enforce it from the Provider
     # previously was using the AzureException
     @staticmethod
@@ -3,6 +3,13 @@ from uuid import UUID
 # Service management API
 WINDOWS_AZURE_SERVICE_MANAGEMENT_API = "797f4846-ba00-4fd7-ba43-dac1f8f63013"
 
+# Microsoft Graph JSON batching limits
+GRAPH_BATCH_MAX_REQUESTS = 20
+GRAPH_MAX_CONCURRENT_BATCHES = 10
+# Attempts of the throttled requests of a batch and seconds to wait if Retry-After is not set
+GRAPH_BATCH_MAX_ATTEMPTS = 4
+GRAPH_BATCH_DEFAULT_RETRY_AFTER = 2
+
 # Authorization policy roles
 GUEST_USER_ACCESS_NO_RESTRICTICTED = UUID("a0b1b346-4d3e-4e8b-98f8-753987be4970")
 GUEST_USER_ACCESS_RESTRICTICTED = UUID("2af84b1e-32c8-42b7-82bc-daa82404023b")
@@ -1,5 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from azure.core.pipeline.transport import RequestsTransport
+from requests.structures import CaseInsensitiveDict
+
 from prowler.lib.logger import logger
+from prowler.lib.scan.profiler import profile_call
 from prowler.providers.azure.azure_provider import AzureProvider
+from prowler.providers.common.snapshot import Snapshot
+
+MAX_WORKERS = 10
+
+
+class SnapshotSession(requests.Session):
+    """requests.Session of the Azure SDK clients that records their responses to a snapshot or replays them from it.
+
+    The requests are identified by their method, URL and body, so the authorization
+    headers are not part of the snapshot. In replay mode the requests are never sent
+    and the ones that were not recorded get an HTTP 404 response.
+    """
+
+    def __init__(self, snapshot: Snapshot):
+        super().__init__()
+        self.snapshot = snapshot
+
+    def request(self, method, url, *args, **kwargs):
+        key = Snapshot.get_key("azure", method, url, kwargs.get("data"))
+        if not self.snapshot.replay:
+            response = super().request(method, url, *args, **kwargs)
+            self.snapshot.record(
+                key,
+                {
+                    "status_code": response.status_code,
+                    "reason": response.reason,
+                    "headers": dict(response.headers),
+                    "content": response.content,
+                },
+            )
+            return response
+
+        recorded_response = self.snapshot.get_response(key)
+        if recorded_response is None:
+            logger.warning(f"{method} {url} is not in the snapshot")
+            recorded_response = {
+                "status_code": 404,
+                "reason": "Not Found",
+                "headers": {},
+                "content": b"",
+            }
+        response = requests.Response()
+        response.status_code = recorded_response["status_code"]
+        response.reason = recorded_response["reason"]
+        response.headers = CaseInsensitiveDict(recorded_response["headers"])
+        response._content = recorded_response["content"]
+        response._content_consumed = True
+        response.url = url
+        return response
 
 
 class AzureService:
@@ -13,6 +69,7 @@ class AzureService:
             provider.session,
             service,
             provider.region_config,
+            provider.snapshot,
         )
 
         self.subscriptions = provider.identity.subscriptions
@@ -20,14 +77,82 @@ class AzureService:
         self.audit_config = provider.audit_config
         self.fixer_config = provider.fixer_config
 
-    def __set_clients__(self, identity, session, service, region_config):
+        # Thread pool for __threading_call__
+        self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+    def __threading_call__(self, call, iterator=None) -> list:
+        """Run the call for every item of the iterator in the service thread pool.
+
+        All the clients share the provider credential, so the access token is cached
+        and reused across threads, and the Azure SDK retry policy already retries
+        throttled (HTTP 429) requests honoring the Retry-After header.
+
+        Args:
+            call: The function to run. Tuple items are unpacked as its arguments.
+            iterator: The items to process, by default the (subscription, client) pairs.
+
+        Returns:
+            list: The results of the calls that did not raise, in the items order.
+        """
+        items = list(iterator if iterator is not None else self.clients.items())
+
+        # Trim leading and trailing underscores from the call's name
+        call_name = call.__name__.strip("_")
+        # Add Capitalization
+        call_name = " ".join([x.capitalize() for x in call_name.split("_")])
+
+        if iterator is None:
+            logger.info(
+                f"{self.__class__.__name__} - Starting threads for '{call_name}' function across {len(items)} subscriptions..."
+            )
+        else:
+            logger.info(
+                f"{self.__class__.__name__} - Starting threads for '{call_name}' function to process {len(items)} items..."
+            )
+
+        # Time every call of the target when the scan is profiled
+        call = profile_call(
+            "threading_call", f"{self.__class__.__name__}.{call.__name__}", call
+        )
+        futures = [
+            (
+                self.thread_pool.submit(call, *item)
+                if isinstance(item, tuple)
+                else self.thread_pool.submit(call, item)
+            )
+            for item in items
+        ]
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        return results
+
+    def __set_clients__(self, identity, session, service, region_config, snapshot=None):
         clients = {}
+        # The Azure SDK clients send their requests through the snapshot, except the Microsoft Graph one
+        snapshot_arguments = {}
+        if snapshot:
+            snapshot_arguments["transport"] = RequestsTransport(
+                session=SnapshotSession(snapshot), session_owner=False
+            )
         try:
             if "GraphServiceClient" in str(service):
                 clients.update({identity.tenant_domain: service(credentials=session)})
             elif "LogsQueryClient" in str(service):
                 for display_name, id in identity.subscriptions.items():
-                    clients.update({display_name: service(credential=session)})
+                    clients.update(
+                        {
+                            display_name: service(
+                                credential=session, **snapshot_arguments
+                            )
+                        }
+                    )
             else:
                 for display_name, id in identity.subscriptions.items():
                     clients.update(
@@ -37,6 +162,7 @@ class AzureService:
                                 subscription_id=id,
                                 base_url=region_config.base_url,
                                 credential_scopes=region_config.credential_scopes,
+                                **snapshot_arguments,
                             )
                         }
                     )
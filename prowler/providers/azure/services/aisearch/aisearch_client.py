@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.aisearch.aisearch_service import AISearch
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-aisearch_client = AISearch(Provider.get_global_provider())
+aisearch_client = ServiceClient(AISearch)
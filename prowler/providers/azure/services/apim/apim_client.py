@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.apim.apim_service import APIM
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-apim_client = APIM(Provider.get_global_provider())
+apim_client = ServiceClient(APIM)
@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.app.app_service import App
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-app_client = App(Provider.get_global_provider())
+app_client = ServiceClient(App)
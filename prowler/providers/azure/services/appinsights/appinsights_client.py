@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.appinsights.appinsights_service import AppInsights
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-appinsights_client = AppInsights(Provider.get_global_provider())
+appinsights_client = ServiceClient(AppInsights)
@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.cosmosdb.cosmosdb_service import CosmosDB
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-cosmosdb_client = CosmosDB(Provider.get_global_provider())
+cosmosdb_client = ServiceClient(CosmosDB)
@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.defender.defender_service import Defender
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-defender_client = Defender(Provider.get_global_provider())
+defender_client = ServiceClient(Defender)
@@ -30,125 +30,153 @@ class Defender(AzureService):
     def _get_pricings(self):
         logger.info("Defender - Getting pricings...")
         pricings = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                pricings_list = client.pricings.list(
-                    scope_id=f"subscriptions/{self.subscriptions[subscription_name]}"
+        for subscription_pricings in self.__threading_call__(
+            self._get_subscription_pricings
+        ):
+            pricings.update(subscription_pricings)
+        return pricings
+
+    def _get_subscription_pricings(self, subscription_name, client):
+        pricings = {}
+        try:
+            pricings_list = client.pricings.list(
+                scope_id=f"subscriptions/{self.subscriptions[subscription_name]}"
+            )
+            pricings.update({subscription_name: {}})
+            for pricing in pricings_list.value:
+                pricings[subscription_name].update(
+                    {
+                        pricing.name: Pricing(
+                            resource_id=pricing.id,
+                            resource_name=pricing.name,
+                            pricing_tier=getattr(pricing, "pricing_tier", None),
+                            free_trial_remaining_time=pricing.free_trial_remaining_time,
+                            extensions=dict(
+                                [
+                                    (extension.name, extension.is_enabled)
+                                    for extension in (
+                                        pricing.extensions
+                                        if getattr(pricing, "extensions", None)
+                                        else []
+                                    )
+                                ]
+                            ),
+                        )
+                    }
                 )
-                pricings.update({subscription_name: {}})
-                for pricing in pricings_list.value:
-                    pricings[subscription_name].update(
-                        {
-                            pricing.name: Pricing(
-                                resource_id=pricing.id,
-                                resource_name=pricing.name,
-                                pricing_tier=getattr(pricing, "pricing_tier", None),
-                                free_trial_remaining_time=pricing.free_trial_remaining_time,
-                                extensions=dict(
-                                    [
-                                        (extension.name, extension.is_enabled)
-                                        for extension in (
-                                            pricing.extensions
-                                            if getattr(pricing, "extensions", None)
-                                            else []
-                                        )
-                                    ]
-                                ),
-                            )
-                        }
-                    )
-            except ResourceNotFoundError as error:
-                if "Subscription Not Registered" in error.message:
-                    logger.error(
-                        f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: Subscription Not Registered - Please register to Microsoft.Security in order to view your security status"
-                    )
-            except Exception as error:
+        except ResourceNotFoundError as error:
+            if "Subscription Not Registered" in error.message:
                 logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: Subscription Not Registered - Please register to Microsoft.Security in order to view your security status"
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return pricings
 
     def _get_auto_provisioning_settings(self):
         logger.info("Defender - Getting auto provisioning settings...")
         auto_provisioning = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                auto_provisioning_settings = client.auto_provisioning_settings.list()
-                auto_provisioning.update({subscription_name: {}})
-                for ap in auto_provisioning_settings:
-                    auto_provisioning[subscription_name].update(
-                        {
-                            ap.name: AutoProvisioningSetting(
-                                resource_id=ap.id,
-                                resource_name=ap.name,
-                                resource_type=ap.type,
-                                auto_provision=ap.auto_provision,
-                            )
-                        }
-                    )
-            except ClientAuthenticationError as error:
-                if "Subscription Not Registered" in error.message:
-                    logger.error(
-                        f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: Subscription Not Registered - Please register to Microsoft.Security in order to view your security status"
-                    )
-            except Exception as error:
+        for subscription_auto_provisioning in self.__threading_call__(
+            self._get_subscription_auto_provisioning_settings
+        ):
+            auto_provisioning.update(subscription_auto_provisioning)
+        return auto_provisioning
+
+    def _get_subscription_auto_provisioning_settings(self, subscription_name, client):
+        auto_provisioning = {}
+        try:
+            auto_provisioning_settings = client.auto_provisioning_settings.list()
+            auto_provisioning.update({subscription_name: {}})
+            for ap in auto_provisioning_settings:
+                auto_provisioning[subscription_name].update(
+                    {
+                        ap.name: AutoProvisioningSetting(
+                            resource_id=ap.id,
+                            resource_name=ap.name,
+                            resource_type=ap.type,
+                            auto_provision=ap.auto_provision,
+                        )
+                    }
+                )
+        except ClientAuthenticationError as error:
+            if "Subscription Not Registered" in error.message:
                 logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: Subscription Not Registered - Please register to Microsoft.Security in order to view your security status"
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return auto_provisioning
 
     def _get_assessments(self):
         logger.info("Defender - Getting assessments...")
         assessments = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                assessments_list = client.assessments.list(
-                    f"subscriptions/{self.subscriptions[subscription_name]}"
-                )
-                assessments.update({subscription_name: {}})
-                for assessment in assessments_list:
-                    assessments[subscription_name].update(
-                        {
-                            assessment.display_name: Assesment(
-                                resource_id=assessment.id,
-                                resource_name=assessment.name,
-                                status=assessment.status.code,
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        for subscription_assessments in self.__threading_call__(
+            self._get_subscription_assessments
+        ):
+            assessments.update(subscription_assessments)
+        return assessments
+
+    def _get_subscription_assessments(self, subscription_name, client):
+        assessments = {}
+        try:
+            assessments_list = client.assessments.list(
+                f"subscriptions/{self.subscriptions[subscription_name]}"
+            )
+            assessments.update({subscription_name: {}})
+            for assessment in assessments_list:
+                assessments[subscription_name].update(
+                    {
+                        assessment.display_name: Assesment(
+                            resource_id=assessment.id,
+                            resource_name=assessment.name,
+                            status=assessment.status.code,
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return assessments
 
     def _get_settings(self):
         logger.info("Defender - Getting settings...")
         settings = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                settings_list = client.settings.list()
-                settings.update({subscription_name: {}})
-                for setting in settings_list:
-                    settings[subscription_name].update(
-                        {
-                            setting.name: Setting(
-                                resource_id=setting.id,
-                                resource_type=setting.type,
-                                kind=setting.kind,
-                                enabled=setting.enabled,
-                            )
-                        }
-                    )
-            except ClientAuthenticationError as error:
-                if "Subscription Not Registered" in error.message:
-                    logger.error(
-                        f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: Subscription Not Registered - Please register to Microsoft.Security in order to view your security status"
-                    )
-            except Exception as error:
+        for subscription_settings in self.__threading_call__(
+            self._get_subscription_settings
+        ):
+            settings.update(subscription_settings)
+        return settings
+
+    def _get_subscription_settings(self, subscription_name, client):
+        settings = {}
+        try:
+            settings_list = client.settings.list()
+            settings.update({subscription_name: {}})
+            for setting in settings_list:
+                settings[subscription_name].update(
+                    {
+                        setting.name: Setting(
+                            resource_id=setting.id,
+                            resource_type=setting.type,
+                            kind=setting.kind,
+                            enabled=setting.enabled,
+                        )
+                    }
+                )
+        except ClientAuthenticationError as error:
+            if "Subscription Not Registered" in error.message:
                 logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: Subscription Not Registered - Please register to Microsoft.Security in order to view your security status"
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return settings
 
     def _get_security_contacts(self, token: str) -> dict[str, dict]:
@@ -225,26 +253,33 @@ class Defender(AzureService):
     def _get_iot_security_solutions(self):
         logger.info("Defender - Getting IoT Security Solutions...")
         iot_security_solutions = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                iot_security_solutions_list = (
-                    client.iot_security_solution.list_by_subscription()
-                )
-                iot_security_solutions.update({subscription_name: {}})
-                for iot_security_solution in iot_security_solutions_list:
-                    iot_security_solutions[subscription_name].update(
-                        {
-                            iot_security_solution.id: IoTSecuritySolution(
-                                resource_id=iot_security_solution.id,
-                                name=iot_security_solution.name,
-                                status=iot_security_solution.status,
-                            )
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        for subscription_iot_security_solutions in self.__threading_call__(
+            self._get_subscription_iot_security_solutions
+        ):
+            iot_security_solutions.update(subscription_iot_security_solutions)
+        return iot_security_solutions
+
+    def _get_subscription_iot_security_solutions(self, subscription_name, client):
+        iot_security_solutions = {}
+        try:
+            iot_security_solutions_list = (
+                client.iot_security_solution.list_by_subscription()
+            )
+            iot_security_solutions.update({subscription_name: {}})
+            for iot_security_solution in iot_security_solutions_list:
+                iot_security_solutions[subscription_name].update(
+                    {
+                        iot_security_solution.id: IoTSecuritySolution(
+                            resource_id=iot_security_solution.id,
+                            name=iot_security_solution.name,
+                            status=iot_security_solution.status,
+                        )
+                    }
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return iot_security_solutions
 
     def _get_jit_policies(self) -> dict[str, dict]:
@@ -261,28 +296,35 @@ class Defender(AzureService):
         """
         logger.info("Defender - Getting JIT policies...")
         jit_policies = {}
-        for subscription_name, client in self.clients.items():
-            try:
-                jit_policies[subscription_name] = {}
-                policies = client.jit_network_access_policies.list()
-                for policy in policies:
-                    vm_ids = set()
-                    for vm in getattr(policy, "virtual_machines", []):
-                        vm_ids.add(vm.id)
-                    jit_policies[subscription_name].update(
-                        {
-                            policy.id: JITPolicy(
-                                id=policy.id,
-                                name=policy.name,
-                                location=getattr(policy, "location", "Global"),
-                                vm_ids=vm_ids,
-                            ),
-                        }
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        for subscription_jit_policies in self.__threading_call__(
+            self._get_subscription_jit_policies
+        ):
+            jit_policies.update(subscription_jit_policies)
+        return jit_policies
+
+    def _get_subscription_jit_policies(self, subscription_name, client):
+        jit_policies = {}
+        try:
+            jit_policies[subscription_name] = {}
+            policies = client.jit_network_access_policies.list()
+            for policy in policies:
+                vm_ids = set()
+                for vm in getattr(policy, "virtual_machines", []):
+                    vm_ids.add(vm.id)
+                jit_policies[subscription_name].update(
+                    {
+                        policy.id: JITPolicy(
+                            id=policy.id,
+                            name=policy.name,
+                            location=getattr(policy, "location", "Global"),
+                            vm_ids=vm_ids,
+                        ),
+                    }
                 )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription_name} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
         return jit_policies
 
 
@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.entra.entra_service import Entra
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-entra_client = Entra(Provider.get_global_provider())
+entra_client = ServiceClient(Entra)
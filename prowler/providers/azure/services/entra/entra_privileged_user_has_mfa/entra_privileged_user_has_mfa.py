@@ -11,6 +11,9 @@ class entra_privileged_user_has_mfa(Check):
 
         for tenant_domain, users in entra_client.users.items():
             for user_domain_name, user in users.items():
+                # The MFA of the users whose authentication methods are unknown cannot be evaluated
+                if user.authentication_methods is None:
+                    continue
                 if is_privileged_user(
                     user, entra_client.directory_roles[tenant_domain]
                 ):
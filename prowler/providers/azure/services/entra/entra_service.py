@@ -1,16 +1,39 @@
-from asyncio import gather, get_event_loop
+from asyncio import Semaphore, gather, get_event_loop, sleep
 from typing import List, Optional
 from uuid import UUID
 
 from msgraph import GraphServiceClient
+from msgraph.generated.models.authentication_method_collection_response import (
+    AuthenticationMethodCollectionResponse,
+)
+from msgraph_core.requests.batch_request_content import BatchRequestContent
+from msgraph_core.requests.batch_request_item import BatchRequestItem
 from pydantic.v1 import BaseModel
 
 from prowler.lib.logger import logger
 from prowler.providers.azure.azure_provider import AzureProvider
-from prowler.providers.azure.config import GUEST_USER_ACCESS_NO_RESTRICTICTED
+from prowler.providers.azure.config import (
+    GRAPH_BATCH_DEFAULT_RETRY_AFTER,
+    GRAPH_BATCH_MAX_ATTEMPTS,
+    GRAPH_BATCH_MAX_REQUESTS,
+    GRAPH_MAX_CONCURRENT_BATCHES,
+    GUEST_USER_ACCESS_NO_RESTRICTICTED,
+)
 from prowler.providers.azure.lib.service.service import AzureService
 
 
+def _get_retry_after(batch_response_item) -> float:
+    """Return the seconds to wait from the Retry-After header of a throttled batch response item."""
+    headers = getattr(batch_response_item, "headers", None) or {}
+    for header, value in headers.items():
+        if header.lower() == "retry-after":
+            try:
+                return max(float(value), 0)
+            except (TypeError, ValueError):
+                break
+    return GRAPH_BATCH_DEFAULT_RETRY_AFTER
+
+
 class Entra(AzureService):
     def __init__(self, provider: AzureProvider):
         super().__init__(GraphServiceClient, provider)
@@ -43,28 +66,31 @@ class Entra(AzureService):
         users = {}
         try:
             for tenant, client in self.clients.items():
-                users_list = await client.users.get()
+                users_list = []
+                users_page = await client.users.get()
+                while users_page:
+                    users_list.extend(getattr(users_page, "value", None) or [])
+                    next_link = getattr(users_page, "odata_next_link", None)
+                    if not next_link:
+                        break
+                    users_page = await client.users.with_url(next_link).get()
+
                 users.update({tenant: {}})
                 try:
-                    for user in users_list.value:
+                    authentication_methods = (
+                        await self._get_users_authentication_methods(
+                            client, [user.id for user in users_list]
+                        )
+                    )
+                    for user in users_list:
                         users[tenant].update(
                             {
                                 user.id: User(
                                     id=user.id,
                                     name=user.display_name,
-                                    authentication_methods=[
-                                        AuthMethod(
-                                            id=auth_method.id,
-                                            type=getattr(
-                                                auth_method, "odata_type", None
-                                            ),
-                                        )
-                                        for auth_method in (
-                                            await client.users.by_user_id(
-                                                user.id
-                                            ).authentication.methods.get()
-                                        ).value
-                                    ],
+                                    authentication_methods=authentication_methods.get(
+                                        user.id, None
+                                    ),
                                 )
                             }
                         )
@@ -87,6 +113,100 @@ class Entra(AzureService):
 
         return users
 
+    async def _get_users_authentication_methods(
+        self, client: GraphServiceClient, user_ids: List[str]
+    ) -> dict:
+        """Get the authentication methods of the given users using Graph JSON batching.
+
+        The users are split in batches of GRAPH_BATCH_MAX_REQUESTS requests and the
+        batches are sent concurrently, bounded by GRAPH_MAX_CONCURRENT_BATCHES. The
+        throttled requests of a batch are sent again after their Retry-After header,
+        up to GRAPH_BATCH_MAX_ATTEMPTS times.
+
+        Args:
+            client: The Microsoft Graph client of the tenant.
+            user_ids: The IDs of the users to get the authentication methods from.
+
+        Returns:
+            dict: A dictionary with the user ID as key and its list of AuthMethod as value.
+                The users whose authentication methods could not be retrieved are not included.
+        """
+        authentication_methods = {}
+        semaphore = Semaphore(GRAPH_MAX_CONCURRENT_BATCHES)
+        permission_denied = False
+
+        async def _get_batch(batch_user_ids: List[str]):
+            nonlocal permission_denied
+            for attempt in range(GRAPH_BATCH_MAX_ATTEMPTS):
+                batch_request = BatchRequestContent()
+                for user_id in batch_user_ids:
+                    batch_request.add_request(
+                        user_id,
+                        BatchRequestItem(
+                            client.users.by_user_id(
+                                user_id
+                            ).authentication.methods.to_get_request_information(),
+                            id=user_id,
+                        ),
+                    )
+                async with semaphore:
+                    batch_response = await client.batch.post(batch_request)
+
+                status_codes = batch_response.get_response_status_codes()
+                throttled_user_ids = []
+                retry_after = 0
+                for user_id in batch_user_ids:
+                    status_code = status_codes.get(user_id, None)
+                    if status_code == 200:
+                        user_auth_methods = batch_response.response_body(
+                            user_id, AuthenticationMethodCollectionResponse
+                        )
+                        authentication_methods[user_id] = [
+                            AuthMethod(
+                                id=auth_method.id,
+                                type=getattr(auth_method, "odata_type", None),
+                            )
+                            for auth_method in (
+                                getattr(user_auth_methods, "value", None) or []
+                            )
+                        ]
+                    elif status_code == 429 and attempt < GRAPH_BATCH_MAX_ATTEMPTS - 1:
+                        throttled_user_ids.append(user_id)
+                        retry_after = max(
+                            retry_after,
+                            _get_retry_after(
+                                batch_response.get_response_by_id(user_id)
+                            ),
+                        )
+                    elif status_code == 403:
+                        permission_denied = True
+                    else:
+                        logger.error(
+                            f"Entra - Unable to get the authentication methods of user {user_id}: status code {status_code}"
+                        )
+
+                if not throttled_user_ids:
+                    break
+                logger.warning(
+                    f"Entra - Getting the authentication methods of {len(throttled_user_ids)} users was throttled, retrying in {retry_after} seconds..."
+                )
+                await sleep(retry_after)
+                batch_user_ids = throttled_user_ids
+
+        await gather(
+            *(
+                _get_batch(user_ids[index : index + GRAPH_BATCH_MAX_REQUESTS])
+                for index in range(0, len(user_ids), GRAPH_BATCH_MAX_REQUESTS)
+            )
+        )
+
+        if permission_denied:
+            logger.error(
+                "You need 'UserAuthenticationMethod.Read.All' permission to access this information. It only can be granted through Service Principal authentication."
+            )
+
+        return authentication_methods
+
     async def _get_authorization_policy(self):
         logger.info("Entra - Getting authorization policy...")
 
@@ -370,7 +490,8 @@ class AuthMethod(BaseModel):
 class User(BaseModel):
     id: str
     name: str
-    authentication_methods: List[AuthMethod] = []
+    # None if the authentication methods of the user could not be retrieved
+    authentication_methods: Optional[List[AuthMethod]] = []
 
 
 class DefaultUserRolePermissions(BaseModel):
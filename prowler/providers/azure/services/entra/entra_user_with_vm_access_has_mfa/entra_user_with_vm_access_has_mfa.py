@@ -18,6 +18,9 @@ class entra_user_with_vm_access_has_mfa(Check):
 
         for users in entra_client.users.values():
             for user in users.values():
+                # The MFA of the users whose authentication methods are unknown cannot be evaluated
+                if user.authentication_methods is None:
+                    continue
                 for (
                     subscription_name,
                     role_assigns,
@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.iam.iam_service import IAM
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-iam_client = IAM(Provider.get_global_provider())
+iam_client = ServiceClient(IAM)
@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.keyvault.keyvault_service import KeyVault
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-keyvault_client = KeyVault(Provider.get_global_provider())
+keyvault_client = ServiceClient(KeyVault)
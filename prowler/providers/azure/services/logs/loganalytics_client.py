@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.logs.logs_service import LogAnalytics
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-loganalytics_client = LogAnalytics(Provider.get_global_provider())
+loganalytics_client = ServiceClient(LogAnalytics)
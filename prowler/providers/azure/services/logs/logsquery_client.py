@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.logs.logs_service import LogsQuery
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-logsquery_client = LogsQuery(Provider.get_global_provider())
+logsquery_client = ServiceClient(LogsQuery)
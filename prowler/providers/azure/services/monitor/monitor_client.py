@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.monitor.monitor_service import Monitor
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-monitor_client = Monitor(Provider.get_global_provider())
+monitor_client = ServiceClient(Monitor)
@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.network.network_service import Network
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-network_client = Network(Provider.get_global_provider())
+network_client = ServiceClient(Network)
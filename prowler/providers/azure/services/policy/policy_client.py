@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.policy.policy_service import Policy
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-policy_client = Policy(Provider.get_global_provider())
+policy_client = ServiceClient(Policy)
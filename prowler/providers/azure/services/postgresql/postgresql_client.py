@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.postgresql.postgresql_service import PostgreSQL
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-postgresql_client = PostgreSQL(Provider.get_global_provider())
+postgresql_client = ServiceClient(PostgreSQL)
@@ -1,4 +1,4 @@
 from prowler.providers.azure.services.sqlserver.sqlserver_service import SQLServer
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 
-sqlserver_client = SQLServer(Provider.get_global_provider())
+sqlserver_client = ServiceClient(SQLServer)
@@ -16,66 +16,84 @@ class SQLServer(AzureService):
     def _get_sql_servers(self):
         logger.info("SQL Server - Getting SQL servers...")
         sql_servers = {}
-        for subscription, client in self.clients.items():
-            try:
-                sql_servers.update({subscription: []})
-                sql_servers_list = client.servers.list()
-                for sql_server in sql_servers_list:
-                    resource_group = self._get_resource_group(sql_server.id)
-                    auditing_policies = self._get_server_blob_auditing_policies(
-                        subscription, resource_group, sql_server.name
-                    )
-                    firewall_rules = self._get_firewall_rules(
-                        subscription, resource_group, sql_server.name
-                    )
-                    encryption_protector = self._get_enctyption_protectors(
-                        subscription, resource_group, sql_server.name
-                    )
-                    vulnerability_assessment = self._get_vulnerability_assesments(
-                        subscription, resource_group, sql_server.name
-                    )
-                    security_alert_policies = self._get_server_security_alert_policies(
-                        subscription, resource_group, sql_server.name
-                    )
-                    location = self._get_location(
-                        subscription, resource_group, sql_server.name
-                    )
-
-                    sql_servers[subscription].append(
-                        Server(
-                            id=sql_server.id,
-                            name=sql_server.name,
-                            public_network_access=sql_server.public_network_access,
-                            minimal_tls_version=sql_server.minimal_tls_version,
-                            administrators=ServerExternalAdministrator(
-                                sid=getattr(
-                                    getattr(sql_server, "administrators", None),
-                                    "sid",
-                                    "",
-                                ),
-                                administrator_type=getattr(
-                                    getattr(sql_server, "administrators", None),
-                                    "administrator_type",
-                                    "",
-                                ),
-                            ),
-                            auditing_policies=auditing_policies,
-                            firewall_rules=firewall_rules,
-                            encryption_protector=encryption_protector,
-                            databases=self._get_databases(
-                                subscription, resource_group, sql_server.name
-                            ),
-                            vulnerability_assessment=vulnerability_assessment,
-                            security_alert_policies=security_alert_policies,
-                            location=location,
-                        )
-                    )
-            except Exception as error:
-                logger.error(
-                    f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                )
+        subscriptions_sql_servers = []
+        for subscription, subscription_sql_servers in self.__threading_call__(
+            self._list_subscription_sql_servers
+        ):
+            sql_servers.update({subscription: []})
+            subscriptions_sql_servers.extend(
+                (subscription, sql_server) for sql_server in subscription_sql_servers
+            )
+        # The details of every server are fetched in parallel across all the subscriptions
+        for subscription, server in self.__threading_call__(
+            self._get_sql_server, subscriptions_sql_servers
+        ):
+            if server:
+                sql_servers[subscription].append(server)
         return sql_servers
 
+    def _list_subscription_sql_servers(self, subscription, client):
+        try:
+            return subscription, list(client.servers.list())
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return subscription, []
+
+    def _get_sql_server(self, subscription, sql_server):
+        try:
+            resource_group = self._get_resource_group(sql_server.id)
+            auditing_policies = self._get_server_blob_auditing_policies(
+                subscription, resource_group, sql_server.name
+            )
+            firewall_rules = self._get_firewall_rules(
+                subscription, resource_group, sql_server.name
+            )
+            encryption_protector = self._get_enctyption_protectors(
+                subscription, resource_group, sql_server.name
+            )
+            vulnerability_assessment = self._get_vulnerability_assesments(
+                subscription, resource_group, sql_server.name
+            )
+            security_alert_policies = self._get_server_security_alert_policies(
+                subscription, resource_group, sql_server.name
+            )
+            location = self._get_location(subscription, resource_group, sql_server.name)
+
+            return subscription, Server(
+                id=sql_server.id,
+                name=sql_server.name,
+                public_network_access=sql_server.public_network_access,
+                minimal_tls_version=sql_server.minimal_tls_version,
+                administrators=ServerExternalAdministrator(
+                    sid=getattr(
+                        getattr(sql_server, "administrators", None),
+                        "sid",
+                        "",
+                    ),
+                    administrator_type=getattr(
+                        getattr(sql_server, "administrators", None),
+                        "administrator_type",
+                        "",
+                    ),
+                ),
+                auditing_policies=auditing_policies,
+                firewall_rules=firewall_rules,
+                encryption_protector=encryption_protector,
+                databases=self._get_databases(
+                    subscription, resource_group, sql_server.name
+                ),
+                vulnerability_assessment=vulnerability_assessment,
+                security_alert_policies=security_alert_policies,
+                location=location,
+            )
+        except Exception as error:
+            logger.error(
+                f"Subscription name: {subscription} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return subscription, None
+
     def _get_resource_group(self, id):
         resource_group = id.split("/")[4]
         return resource_group
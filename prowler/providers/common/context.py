@@ -0,0 +1,127 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import RLock
+from typing import Any, Generator, Optional
+
+from prowler.lib.logger import logger
+from prowler.lib.scan.profiler import Profiler, profile
+from prowler.providers.common.provider import Provider
+
+_scan_context: ContextVar[Optional["ScanContext"]] = ContextVar(
+    "scan_context", default=None
+)
+
+
+def get_scan_context() -> Optional["ScanContext"]:
+    """Returns the ScanContext active in the current thread, or None outside of a scan"""
+    return _scan_context.get()
+
+
+def _get_service_name(service_class: type) -> str:
+    """Returns the name of the service class, or its representation if it has no name (e.g. a mock)"""
+    return getattr(service_class, "__name__", repr(service_class))
+
+
+class ScanContext:
+    """
+    ScanContext holds the state of a single scan, so several scans can run in the same process, one after the other
+    or concurrently in different threads, without sharing the services of other providers.
+
+    While a context is active, the module level service clients (e.g. ec2_client) resolve to the services of the
+    context, built with its provider the first time a check uses them.
+
+    Attributes:
+        - provider: The provider to scan.
+        - services: The services built for the scan, by service class.
+        - cache: A cache for the data shared by the checks of the scan, it is cleared when the scan is closed.
+        - profiler: The profiler of the scan, None if the scan is not profiled.
+
+    Usage:
+        context = ScanContext(provider)
+        with context.activate():
+            findings = check.execute()
+        context.close()
+    """
+
+    def __init__(self, provider: Provider, profiler: Optional[Profiler] = None) -> None:
+        self.provider = provider
+        self.profiler = profiler
+        self.services = {}
+        self.cache = {}
+        # Reentrant, since some services use other service clients while they are built
+        self._lock = RLock()
+
+    @contextmanager
+    def activate(self) -> Generator["ScanContext", None, None]:
+        """Makes the context the active one in the current thread until the block exits"""
+        token = _scan_context.set(self)
+        try:
+            yield self
+        finally:
+            _scan_context.reset(token)
+
+    def get_service(self, service_class: type) -> Any:
+        """Returns the service of the scan, building it with the provider of the context the first time"""
+        service = self.services.get(service_class)
+        if service is None:
+            with self._lock:
+                service = self.services.get(service_class)
+                if service is None:
+                    with profile("service", _get_service_name(service_class)):
+                        service = service_class(self.provider)
+                    self.services[service_class] = service
+        return service
+
+    def close(self) -> None:
+        """Releases the services and the cache of the scan"""
+        with self._lock:
+            for service in self.services.values():
+                thread_pool = getattr(service, "thread_pool", None)
+                if thread_pool is not None:
+                    try:
+                        thread_pool.shutdown(wait=False)
+                    except Exception as error:
+                        logger.error(
+                            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+            self.services.clear()
+            self.cache.clear()
+
+
+class ServiceClient:
+    """
+    ServiceClient is the module level client of a service (e.g. ec2_client = ServiceClient(EC2)) used by the checks.
+
+    It resolves every attribute to the service of the active ScanContext. Outside of a scan context, the service is
+    built once with the global provider when the client module is imported, as the CLI expects.
+    """
+
+    def __init__(self, service_class: type) -> None:
+        object.__setattr__(self, "_service_class", service_class)
+        object.__setattr__(self, "_service", None)
+        if get_scan_context() is None:
+            with profile("service", _get_service_name(service_class)):
+                service = service_class(Provider.get_global_provider())
+            object.__setattr__(self, "_service", service)
+
+    def _get_service(self) -> Any:
+        context = get_scan_context()
+        if context is not None:
+            return context.get_service(self._service_class)
+        if self._service is None:
+            with profile("service", _get_service_name(self._service_class)):
+                service = self._service_class(Provider.get_global_provider())
+            object.__setattr__(self, "_service", service)
+        return self._service
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_service(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._get_service(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._get_service(), name)
+
+    def __repr__(self) -> str:
+        return f"ServiceClient({_get_service_name(self._service_class)})"
@@ -9,6 +9,7 @@ from typing import Any, Optional
 from prowler.config.config import load_and_validate_config_file
 from prowler.lib.logger import logger
 from prowler.lib.mutelist.mutelist import Mutelist
+from prowler.providers.common.snapshot import Snapshot
 
 providers_path = "prowler.providers"
 
@@ -158,6 +159,13 @@ class Provider(ABC):
                 arguments.provider, arguments.fixer_config
             )
 
+            # Snapshot to record the API responses of the scan to, or to replay them from
+            snapshot = None
+            if getattr(arguments, "snapshot_record", None):
+                snapshot = Snapshot(arguments.snapshot_record)
+            elif getattr(arguments, "snapshot_replay", None):
+                snapshot = Snapshot(arguments.snapshot_replay, replay=True)
+
             if not isinstance(Provider._global, provider_class):
                 if "aws" in provider_class_name.lower():
                     provider_class(
@@ -176,6 +184,7 @@ class Provider(ABC):
                         config_path=arguments.config_file,
                         mutelist_path=arguments.mutelist_file,
                         fixer_config=fixer_config,
+                        snapshot=snapshot,
                     )
                 elif "azure" in provider_class_name.lower():
                     provider_class(
@@ -189,6 +198,7 @@ class Provider(ABC):
                         config_path=arguments.config_file,
                         mutelist_path=arguments.mutelist_file,
                         fixer_config=fixer_config,
+                        snapshot=snapshot,
                     )
                 elif "gcp" in provider_class_name.lower():
                     provider_class(
@@ -203,6 +213,7 @@ class Provider(ABC):
                         mutelist_path=arguments.mutelist_file,
                         fixer_config=fixer_config,
                         skip_api_check=arguments.skip_api_check,
+                        snapshot=snapshot,
                     )
                 elif "kubernetes" in provider_class_name.lower():
                     provider_class(
@@ -260,6 +271,8 @@ class Provider(ABC):
                         github_username=arguments.github_username,
                         personal_access_token=arguments.personal_access_token,
                         oauth_app_token=arguments.oauth_app_token,
+                        baseline_ref=arguments.baseline_ref,
+                        baseline_results_file=arguments.baseline_results_file,
                     )
                 elif "mongodbatlas" in provider_class_name.lower():
                     provider_class(
@@ -0,0 +1,140 @@
+import gzip
+import json
+from base64 import b64decode, b64encode
+from datetime import date, datetime
+from hashlib import sha256
+from threading import Lock
+from typing import Any, Optional
+
+from prowler.lib.logger import logger
+
+SNAPSHOT_VERSION = 1
+
+
+def _encode(value: Any) -> Any:
+    """Returns the value with the datetimes and bytes as tagged dicts, so it can be dumped to JSON"""
+    if isinstance(value, dict):
+        return {str(key): _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_encode(item) for item in value]
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": b64encode(value).decode()}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _decode(value: Any) -> Any:
+    """Returns the value with the tagged dicts of _encode back to datetimes and bytes"""
+    if isinstance(value, dict):
+        if len(value) == 1:
+            if "__datetime__" in value:
+                return datetime.fromisoformat(value["__datetime__"])
+            if "__date__" in value:
+                return date.fromisoformat(value["__date__"])
+            if "__bytes__" in value:
+                return b64decode(value["__bytes__"])
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def _key_default(value: Any) -> str:
+    # Dates are left out of the keys, since they are usually time windows relative to the scan time
+    if isinstance(value, (datetime, date)):
+        return "<datetime>"
+    if isinstance(value, (bytes, bytearray)):
+        return sha256(value).hexdigest()
+    return str(value)
+
+
+class Snapshot:
+    """
+    Snapshot keeps the API responses of a scan, to run the checks again later without calling the provider APIs,
+    e.g. after changing the mutelist, the configuration or a custom check.
+
+    In record mode, the providers add every API response with record() and the snapshot is written to a
+    gzip-compressed JSON file with save(). In replay mode, the file is loaded and get_response() returns the
+    recorded responses, in the same order if the same request was done more than once, repeating the last one.
+
+    Attributes:
+        - path: The path of the snapshot file.
+        - replay: True to replay the snapshot, False to record it.
+        - metadata: Provider data needed to replay the scan, e.g. the region of the AWS session.
+
+    Usage:
+        snapshot = Snapshot("scan.json.gz")
+        AwsProvider(snapshot=snapshot)
+        ...
+        snapshot.save()
+
+        AwsProvider(snapshot=Snapshot("scan.json.gz", replay=True))
+    """
+
+    def __init__(self, path: str, replay: bool = False) -> None:
+        self.path = path
+        self.replay = replay
+        self.metadata = {}
+        self._responses = {}
+        self._replayed = {}
+        self._lock = Lock()
+        if replay:
+            self._load()
+
+    @staticmethod
+    def get_key(*request: Any) -> str:
+        """Returns the key of a request from its parts, e.g. the service, region, operation and parameters"""
+        content = json.dumps(
+            request, sort_keys=True, separators=(",", ":"), default=_key_default
+        )
+        return sha256(content.encode()).hexdigest()
+
+    def record(self, key: str, response: Any) -> None:
+        """Adds the response of the request with the given key"""
+        # Encoded right away, so later changes of the caller to the response are not recorded
+        encoded_response = _encode(response)
+        with self._lock:
+            self._responses.setdefault(key, []).append(encoded_response)
+
+    def get_response(self, key: str) -> Optional[Any]:
+        """Returns the next recorded response of the request with the given key, or None if it was not recorded"""
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                return None
+            index = self._replayed.get(key, 0)
+            self._replayed[key] = index + 1
+            response = responses[min(index, len(responses) - 1)]
+        return _decode(response)
+
+    def save(self) -> None:
+        """Writes the recorded responses to the snapshot file"""
+        with self._lock:
+            content = {
+                "version": SNAPSHOT_VERSION,
+                "metadata": _encode(self.metadata),
+                "responses": self._responses,
+            }
+            with gzip.open(self.path, "wt", encoding="utf-8") as snapshot_file:
+                json.dump(content, snapshot_file, separators=(",", ":"))
+        logger.info(
+            f"Snapshot with {len(self._responses)} API requests saved to {self.path}"
+        )
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as snapshot_file:
+            content = json.load(snapshot_file)
+        if content.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Snapshot {self.path} has version {content.get('version')}, expected {SNAPSHOT_VERSION}"
+            )
+        self.metadata = _decode(content.get("metadata", {}))
+        self._responses = content.get("responses", {})
+        logger.info(
+            f"Snapshot with {len(self._responses)} API requests loaded from {self.path}"
+        )
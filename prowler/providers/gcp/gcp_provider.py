@@ -2,6 +2,7 @@ import json
 import os
 import re
 import sys
+from typing import Optional
 
 from colorama import Fore, Style
 from google.auth import default, impersonated_credentials, load_credentials_from_dict
@@ -19,6 +20,7 @@ from prowler.lib.logger import logger
 from prowler.lib.utils.utils import print_boxes
 from prowler.providers.common.models import Audit_Metadata, Connection
 from prowler.providers.common.provider import Provider
+from prowler.providers.common.snapshot import Snapshot
 from prowler.providers.gcp.config import DEFAULT_RETRY_ATTEMPTS
 from prowler.providers.gcp.exceptions.exceptions import (
     GCPInvalidProviderIdError,
@@ -65,6 +67,7 @@ class GcpProvider(Provider):
     _identity: GCPIdentityInfo
     _audit_config: dict
     _mutelist: GCPMutelist
+    _snapshot: Optional[Snapshot] = None
     # TODO: this is not optional, enforce for all providers
     audit_metadata: Audit_Metadata
 
@@ -87,6 +90,7 @@ class GcpProvider(Provider):
         refresh_token: str = None,
         service_account_key: dict = None,
         skip_api_check: bool = False,
+        snapshot: Snapshot = None,
     ):
         """
         GCP Provider constructor
@@ -109,6 +113,7 @@ class GcpProvider(Provider):
             refresh_token: str
             service_account_key: dict
             skip_api_check: bool
+            snapshot: Snapshot -> The snapshot to record the API responses of the services to, or to replay them from
 
         Raises:
             GCPNoAccesibleProjectsError if no project IDs can be accessed via Google Credentials
@@ -288,6 +293,9 @@ class GcpProvider(Provider):
                 mutelist_path=mutelist_path,
             )
 
+        # Snapshot of the API responses of the services
+        self._snapshot = snapshot
+
         Provider.set_global_provider(self)
 
     @property
@@ -337,6 +345,10 @@ class GcpProvider(Provider):
         """
         return self._mutelist
 
+    @property
+    def snapshot(self) -> Optional[Snapshot]:
+        return self._snapshot
+
     @staticmethod
     def setup_session(
         credentials_file: str,
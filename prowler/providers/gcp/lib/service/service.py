@@ -1,15 +1,211 @@
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Optional
+from weakref import WeakKeyDictionary
 
 import google_auth_httplib2
 import httplib2
 from google.oauth2.credentials import Credentials
 from googleapiclient import discovery
 from googleapiclient.discovery import Resource
+from googleapiclient.discovery_cache import get_static_doc
 
 from prowler.lib.logger import logger
+from prowler.lib.scan.profiler import profile_call
+from prowler.providers.common.context import get_scan_context
+from prowler.providers.common.snapshot import Snapshot
 from prowler.providers.gcp.config import DEFAULT_RETRY_ATTEMPTS
 from prowler.providers.gcp.gcp_provider import GcpProvider
 
+MAX_WORKERS = 10
+
+
+class GCPScanState:
+    """State shared by all the GCP services of a scan.
+
+    The enabled services of each project are shared so the Service Usage API is
+    queried only once per project during the scan, and the rate limiter and
+    metrics of each API are shared by all the services using it.
+    """
+
+    def __init__(self):
+        self.enabled_services = {}
+        self.enabled_services_lock = threading.Lock()
+        self.api_rate_limiters = {}
+        self.api_metrics = {}
+        self.api_lock = threading.Lock()
+
+    def get_api_rate_limiter(
+        self, service: str, requests_per_second: float
+    ) -> "APIRateLimiter":
+        with self.api_lock:
+            if service not in self.api_rate_limiters:
+                self.api_rate_limiters[service] = APIRateLimiter(requests_per_second)
+            return self.api_rate_limiters[service]
+
+    def get_api_metrics(self, service: str) -> "APIMetrics":
+        with self.api_lock:
+            if service not in self.api_metrics:
+                self.api_metrics[service] = APIMetrics()
+            return self.api_metrics[service]
+
+
+GCP_SCAN_STATE_CACHE_KEY = "gcp_scan_state"
+# States of the providers scanned outside of a scan context, released with them
+_provider_scan_states = WeakKeyDictionary()
+_scan_states_lock = threading.Lock()
+
+
+def get_scan_state(provider: GcpProvider) -> GCPScanState:
+    """Return the GCP state of the active scan, or of the provider outside of a scan context.
+
+    Args:
+        provider: The GCP provider of the scan.
+
+    Returns:
+        GCPScanState: The state shared by the GCP services of the scan.
+    """
+    context = get_scan_context()
+    with _scan_states_lock:
+        scan_states = context.cache if context is not None else _provider_scan_states
+        key = GCP_SCAN_STATE_CACHE_KEY if context is not None else provider
+        if key not in scan_states:
+            scan_states[key] = GCPScanState()
+        return scan_states[key]
+
+
+@lru_cache(maxsize=None)
+def get_discovery_document(service: str, api_version: str) -> Optional[str]:
+    """Return the static discovery document of a Google API, loaded once from disk.
+
+    Args:
+        service: The name of the Google API, e.g. compute.
+        api_version: The version of the Google API, e.g. v1.
+
+    Returns:
+        Optional[str]: The discovery document or None if it is not shipped with googleapiclient.
+    """
+    return get_static_doc(service, api_version)
+
+
+def build_client(
+    service: str,
+    api_version: str,
+    credentials: Credentials = None,
+    http: httplib2.Http = None,
+) -> Resource:
+    """Build a Google API client reusing the cached static discovery document.
+
+    Args:
+        service: The name of the Google API, e.g. compute.
+        api_version: The version of the Google API, e.g. v1.
+        credentials: The credentials used to authenticate the client.
+        http: An already authorized HTTP client, mutually exclusive with credentials.
+
+    Returns:
+        Resource: The Google API client.
+    """
+    discovery_document = get_discovery_document(service, api_version)
+    if discovery_document:
+        return discovery.build_from_document(
+            discovery_document, credentials=credentials, http=http
+        )
+    return discovery.build(
+        service,
+        api_version,
+        credentials=credentials,
+        http=http,
+        num_retries=DEFAULT_RETRY_ATTEMPTS,
+    )
+
+
+class APIRateLimiter:
+    """Thread-safe limiter of the requests per second sent to a GCP API."""
+
+    def __init__(self, requests_per_second: float = 0):
+        self.interval = 1 / requests_per_second if requests_per_second > 0 else 0
+        self._next_request_time = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_request_time - now
+            self._next_request_time = max(now, self._next_request_time) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class APIMetrics:
+    """Thread-safe counters of the requests sent to a GCP API and its worker pool."""
+
+    def __init__(self):
+        self.requests = 0
+        self.throttled_requests = 0
+        self.active_workers = 0
+        self.max_active_workers = 0
+        self._lock = threading.Lock()
+
+    def add_request(self, throttled: bool = False):
+        with self._lock:
+            self.requests += 1
+            if throttled:
+                self.throttled_requests += 1
+
+    def worker_started(self):
+        with self._lock:
+            self.active_workers += 1
+            self.max_active_workers = max(self.max_active_workers, self.active_workers)
+
+    def worker_finished(self):
+        with self._lock:
+            self.active_workers -= 1
+
+
+class RateLimitedHttp(httplib2.Http):
+    """httplib2.Http that applies the API rate limit and records its metrics.
+
+    Throttled responses (HTTP 429) are retried with exponential backoff by
+    googleapiclient when the request is executed with num_retries.
+
+    With a snapshot, the responses are recorded to it, identified by the method, URI
+    and body of the request, or replayed from it without sending the requests.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: APIRateLimiter,
+        metrics: APIMetrics,
+        snapshot: Snapshot = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+        self.snapshot = snapshot
+
+    def request(self, uri, method="GET", body=None, *args, **kwargs):
+        key = Snapshot.get_key("gcp", method, uri, body) if self.snapshot else None
+        if self.snapshot and self.snapshot.replay:
+            recorded_response = self.snapshot.get_response(key)
+            if recorded_response is None:
+                logger.warning(f"{method} {uri} is not in the snapshot")
+                return httplib2.Response({"status": 404}), b""
+            return (
+                httplib2.Response(recorded_response["headers"]),
+                recorded_response["content"],
+            )
+        self.rate_limiter.acquire()
+        response, content = super().request(uri, method, body, *args, **kwargs)
+        self.metrics.add_request(throttled=response.status == 429)
+        if self.snapshot:
+            self.snapshot.record(key, {"headers": dict(response), "content": content})
+        return response, content
+
 
 class GCPService:
     def __init__(
@@ -25,6 +221,20 @@ class GCPService:
         self.credentials = provider.session
         self.api_version = api_version
         self.region = region
+        self.audit_config = provider.audit_config
+        self.fixer_config = provider.fixer_config
+        self.snapshot = provider.snapshot
+        self.scan_state = get_scan_state(provider)
+        # Requests per second limit for each GCP API, disabled by default
+        max_api_requests_per_second = self.audit_config.get(
+            "max_api_requests_per_second", 0
+        )
+        if not isinstance(max_api_requests_per_second, (int, float)):
+            max_api_requests_per_second = 0
+        self.rate_limiter = self.scan_state.get_api_rate_limiter(
+            self.service, max_api_requests_per_second
+        )
+        self.metrics = self.scan_state.get_api_metrics(self.service)
         self.client = self.__generate_client__(
             self.service, api_version, self.credentials
         )
@@ -35,38 +245,76 @@ class GCPService:
             self.project_ids = self.__is_api_active__(provider.project_ids)
         self.projects = provider.projects
         self.default_project_id = provider.default_project_id
-        self.audit_config = provider.audit_config
-        self.fixer_config = provider.fixer_config
+        # Thread pool for __threading_call__
+        self.thread_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
 
     def _get_client(self):
         return self.client
 
     def __threading_call__(self, call, iterator):
-        threads = []
-        for value in iterator:
-            threads.append(threading.Thread(target=call, args=(value,)))
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join()
+        items = list(iterator)
+
+        # Trim leading and trailing underscores from the call's name
+        call_name = call.__name__.strip("_")
+        # Add Capitalization
+        call_name = " ".join([x.capitalize() for x in call_name.split("_")])
+
+        logger.info(
+            f"{self.service.upper()} - Starting threads for '{call_name}' function to process {len(items)} items..."
+        )
+
+        # Time every call of the target when the scan is profiled
+        call = profile_call(
+            "threading_call", f"{self.__class__.__name__}.{call.__name__}", call
+        )
+
+        def _call(item):
+            self.metrics.worker_started()
+            try:
+                return call(item)
+            finally:
+                self.metrics.worker_finished()
+
+        # Submit tasks to the thread pool
+        futures = [self.thread_pool.submit(_call, item) for item in items]
+
+        # Wait for all tasks to complete
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as error:
+                logger.error(
+                    f"{self.service.upper()} - {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+        logger.info(
+            f"{self.service.upper()} - '{call_name}' finished. API metrics: {self.metrics.requests} requests, {self.metrics.throttled_requests} throttled, {self.metrics.max_active_workers} max concurrent workers."
+        )
 
     def __get_AuthorizedHttp_client__(self):
         return google_auth_httplib2.AuthorizedHttp(
-            self.credentials, http=httplib2.Http()
+            self.credentials,
+            http=RateLimitedHttp(self.rate_limiter, self.metrics, self.snapshot),
         )
 
     def __is_api_active__(self, audited_project_ids):
         project_ids = []
+        enabled_services = self.__get_enabled_services__(audited_project_ids)
         for project_id in audited_project_ids:
             try:
-                client = discovery.build(
-                    "serviceusage", "v1", credentials=self.credentials
-                )
-                request = client.services().get(
-                    name=f"projects/{project_id}/services/{self.service}.googleapis.com"
-                )
-                response = request.execute(num_retries=DEFAULT_RETRY_ATTEMPTS)
-                if response.get("state") != "DISABLED":
+                if enabled_services.get(project_id) is not None:
+                    api_active = (
+                        f"{self.service}.googleapis.com" in enabled_services[project_id]
+                    )
+                else:
+                    # Fallback to query the service if the project's enabled services could not be listed
+                    client = build_client("serviceusage", "v1", self.credentials)
+                    request = client.services().get(
+                        name=f"projects/{project_id}/services/{self.service}.googleapis.com"
+                    )
+                    response = request.execute(num_retries=DEFAULT_RETRY_ATTEMPTS)
+                    api_active = response.get("state") != "DISABLED"
+                if api_active:
                     project_ids.append(project_id)
                 else:
                     logger.error(
@@ -78,6 +326,63 @@ class GCPService:
                 )
         return project_ids
 
+    def __get_enabled_services__(self, audited_project_ids) -> dict:
+        """Get the enabled services of the audited projects.
+
+        The enabled services of each project are listed only once per scan, in parallel
+        across projects, and shared with the rest of services of the scan.
+
+        Args:
+            audited_project_ids: The IDs of the audited projects.
+
+        Returns:
+            dict: The project ID as key and the set of its enabled services as value, None if they could not be listed.
+        """
+        enabled_services = self.scan_state.enabled_services
+        with self.scan_state.enabled_services_lock:
+            pending_project_ids = [
+                project_id
+                for project_id in audited_project_ids
+                if project_id not in enabled_services
+            ]
+            if pending_project_ids:
+                with ThreadPoolExecutor(
+                    max_workers=min(MAX_WORKERS, len(pending_project_ids))
+                ) as executor:
+                    for project_id, project_enabled_services in zip(
+                        pending_project_ids,
+                        executor.map(
+                            self.__list_enabled_services__, pending_project_ids
+                        ),
+                    ):
+                        enabled_services[project_id] = project_enabled_services
+            return {
+                project_id: enabled_services.get(project_id)
+                for project_id in audited_project_ids
+            }
+
+    def __list_enabled_services__(self, project_id) -> Optional[set]:
+        try:
+            enabled_services = set()
+            # Each thread needs its own client since httplib2 is not thread-safe
+            client = build_client("serviceusage", "v1", self.credentials)
+            request = client.services().list(
+                parent=f"projects/{project_id}", filter="state:ENABLED"
+            )
+            while request is not None:
+                response = request.execute(num_retries=DEFAULT_RETRY_ATTEMPTS)
+                for service in response.get("services", []):
+                    enabled_services.add(service["name"].split("/")[-1])
+                request = client.services().list_next(
+                    previous_request=request, previous_response=response
+                )
+            return enabled_services
+        except Exception as error:
+            logger.error(
+                f"{project_id} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return None
+
     def __generate_client__(
         self,
         service: str,
@@ -85,11 +390,15 @@ class GCPService:
         credentials: Credentials,
     ) -> Resource:
         try:
-            return discovery.build(
+            return build_client(
                 service,
                 api_version,
-                credentials=credentials,
-                num_retries=DEFAULT_RETRY_ATTEMPTS,
+                http=google_auth_httplib2.AuthorizedHttp(
+                    credentials,
+                    http=RateLimitedHttp(
+                        self.rate_limiter, self.metrics, self.snapshot
+                    ),
+                ),
             )
         except Exception as error:
             logger.error(
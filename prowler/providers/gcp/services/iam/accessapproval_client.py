@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 from prowler.providers.gcp.services.iam.iam_service import AccessApproval
 
-accessapproval_client = AccessApproval(Provider.get_global_provider())
+accessapproval_client = ServiceClient(AccessApproval)
@@ -1,6 +1,6 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 from prowler.providers.github.services.organization.organization_service import (
     Organization,
 )
 
-organization_client = Organization(Provider.get_global_provider())
+organization_client = ServiceClient(Organization)
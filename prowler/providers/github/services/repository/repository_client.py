@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 from prowler.providers.github.services.repository.repository_service import Repository
 
-repository_client = Repository(Provider.get_global_provider())
+repository_client = ServiceClient(Repository)
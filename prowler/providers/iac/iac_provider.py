@@ -3,8 +3,8 @@ import shutil
 import subprocess
 import sys
 import tempfile
-from os import environ
-from typing import List
+from os import environ, scandir
+from typing import Generator, Iterable, List
 
 from alive_progress import alive_bar
 from colorama import Fore, Style
@@ -14,11 +14,21 @@ from prowler.config.config import (
     default_config_file_path,
     load_and_validate_config_file,
 )
-from prowler.lib.check.models import CheckReportIAC
+from prowler.lib.check.models import CheckMetadata, CheckReportIAC
 from prowler.lib.logger import logger
 from prowler.lib.utils.utils import print_boxes
 from prowler.providers.common.models import Audit_Metadata
 from prowler.providers.common.provider import Provider
+from prowler.providers.iac.lib.incremental.incremental import (
+    get_changed_paths,
+    get_head_commit,
+    get_uncommitted_paths,
+    load_baseline_results,
+    merge_results,
+    save_baseline_results,
+    stage_changed_paths,
+)
+from prowler.providers.iac.lib.trivy.trivy import stream_trivy_results
 
 
 class IacProvider(Provider):
@@ -37,6 +47,8 @@ class IacProvider(Provider):
         github_username: str = None,
         personal_access_token: str = None,
         oauth_app_token: str = None,
+        baseline_ref: str = None,
+        baseline_results_file: str = None,
     ):
         logger.info("Instantiating IAC Provider...")
 
@@ -44,6 +56,8 @@ class IacProvider(Provider):
         self.scan_repository_url = scan_repository_url
         self.scanners = scanners
         self.exclude_path = exclude_path
+        self.baseline_ref = baseline_ref
+        self.baseline_results_file = baseline_results_file
         self.region = "global"
         self.audited_account = "local-iac"
         self._session = None
@@ -93,6 +107,9 @@ class IacProvider(Provider):
         # Mutelist (not needed for IAC since Trivy has its own mutelist logic)
         self._mutelist = None
 
+        # Parsed check metadata shared by the findings of the same Trivy rule
+        self._metadata_cache = {}
+
         self.audit_metadata = Audit_Metadata(
             provider=self._type,
             account_id=self.audited_account,
@@ -106,6 +123,10 @@ class IacProvider(Provider):
 
         Provider.set_global_provider(self)
 
+    @property
+    def incremental(self) -> bool:
+        return bool(self.baseline_ref or self.baseline_results_file)
+
     @property
     def auth_method(self):
         return self._auth_method
@@ -162,42 +183,54 @@ class IacProvider(Provider):
                 finding_description = finding["Description"]
                 finding_status = finding["Status"]
 
-            metadata_dict = {
-                "Provider": "iac",
-                "CheckID": finding_id,
-                "CheckTitle": finding["Title"],
-                "CheckType": ["Infrastructure as Code"],
-                "ServiceName": type,
-                "SubServiceName": "",
-                "ResourceIdTemplate": "",
-                "Severity": finding["Severity"],
-                "ResourceType": "iac",
-                "Description": finding_description,
-                "Risk": "",
-                "RelatedUrl": finding.get("PrimaryURL", ""),
-                "Remediation": {
-                    "Code": {
-                        "NativeIaC": "",
-                        "Terraform": "",
-                        "CLI": "",
-                        "Other": "",
-                    },
-                    "Recommendation": {
-                        "Text": finding.get("Resolution", ""),
-                        "Url": finding.get("PrimaryURL", ""),
+            # Findings of the same rule share their metadata, so it is only parsed once
+            metadata_key = (
+                finding_id,
+                finding["Title"],
+                type,
+                finding["Severity"],
+                finding_description,
+                finding.get("PrimaryURL", ""),
+                finding.get("Resolution", ""),
+            )
+            metadata = self._metadata_cache.get(metadata_key)
+            if metadata is None:
+                metadata_dict = {
+                    "Provider": "iac",
+                    "CheckID": finding_id,
+                    "CheckTitle": finding["Title"],
+                    "CheckType": ["Infrastructure as Code"],
+                    "ServiceName": type,
+                    "SubServiceName": "",
+                    "ResourceIdTemplate": "",
+                    "Severity": finding["Severity"],
+                    "ResourceType": "iac",
+                    "Description": finding_description,
+                    "Risk": "",
+                    "RelatedUrl": finding.get("PrimaryURL", ""),
+                    "Remediation": {
+                        "Code": {
+                            "NativeIaC": "",
+                            "Terraform": "",
+                            "CLI": "",
+                            "Other": "",
+                        },
+                        "Recommendation": {
+                            "Text": finding.get("Resolution", ""),
+                            "Url": finding.get("PrimaryURL", ""),
+                        },
                     },
-                },
-                "Categories": [],
-                "DependsOn": [],
-                "RelatedTo": [],
-                "Notes": "",
-            }
+                    "Categories": [],
+                    "DependsOn": [],
+                    "RelatedTo": [],
+                    "Notes": "",
+                }
 
-            # Convert metadata dict to JSON string
-            metadata = json.dumps(metadata_dict)
+                metadata = CheckMetadata.parse_raw(json.dumps(metadata_dict))
+                self._metadata_cache[metadata_key] = metadata
 
             report = CheckReportIAC(
-                metadata=metadata, finding=finding, file_path=file_path
+                metadata=metadata.copy(), finding=finding, file_path=file_path
             )
             report.status = finding_status
             report.status_extended = (
@@ -220,9 +253,13 @@ class IacProvider(Provider):
         github_username: str = None,
         personal_access_token: str = None,
         oauth_app_token: str = None,
+        full_history: bool = False,
     ) -> str:
         """
         Clone a git repository to a temporary directory, supporting GitHub authentication.
+
+        Only the last commit is fetched unless full_history is set, which incremental scans
+        need to diff against their baseline commit.
         """
         try:
             original_url = repository_url
@@ -251,7 +288,11 @@ class IacProvider(Provider):
             ) as bar:
                 try:
                     bar.title = f"-> Cloning {original_url}..."
-                    porcelain.clone(repository_url, temporary_directory, depth=1)
+                    porcelain.clone(
+                        repository_url,
+                        temporary_directory,
+                        depth=None if full_history else 1,
+                    )
                     bar.title = "-> Repository cloned successfully!"
                 except Exception as clone_error:
                     bar.title = "-> Cloning failed!"
@@ -270,12 +311,19 @@ class IacProvider(Provider):
                 getattr(self, "github_username", None),
                 getattr(self, "personal_access_token", None),
                 getattr(self, "oauth_app_token", None),
+                full_history=self.incremental,
             )
         else:
             scan_dir = self.scan_path
 
         try:
-            reports = self.run_scan(scan_dir, self.scanners, self.exclude_path)
+            # The reports are still collected since they are reused for the summary
+            if self.incremental:
+                reports = list(self.run_incremental_scan(scan_dir))
+            else:
+                reports = list(
+                    self.run_scan(scan_dir, self.scanners, self.exclude_path)
+                )
         finally:
             if temp_dir:
                 logger.info(f"Removing temporary directory {temp_dir}...")
@@ -283,9 +331,132 @@ class IacProvider(Provider):
 
         return reports
 
+    def run_incremental_scan(
+        self, directory: str
+    ) -> Generator[CheckReportIAC, None, None]:
+        """
+        Scan only the paths changed since the baseline and reuse the cached results of the rest.
+
+        With a baseline results file, the paths changed since its commit and since --baseline-ref
+        are rescanned, and a full scan is run while there is no usable baseline, so the stored
+        results always cover the whole scan path. Without a baseline results file only the
+        findings of the paths changed since --baseline-ref are reported. A full scan is run
+        when the changes cannot be computed or involve local Terraform modules.
+
+        Args:
+            directory: The directory to scan
+
+        Yields:
+            CheckReportIAC: The report of each finding
+        """
+        baseline = None
+        if self.baseline_results_file:
+            baseline = load_baseline_results(
+                self.baseline_results_file, self.scanners, self.exclude_path
+            )
+        # The cached results are merged only into a baseline that covers the whole scan path
+        if self.baseline_results_file and not baseline:
+            baseline_refs = []
+        elif baseline:
+            baseline_refs = [baseline.get("Commit"), self.baseline_ref]
+        else:
+            baseline_refs = [self.baseline_ref]
+
+        changed_paths = None
+        for baseline_ref in filter(None, dict.fromkeys(baseline_refs)):
+            ref_changed_paths = get_changed_paths(directory, baseline_ref)
+            if ref_changed_paths is None:
+                changed_paths = None
+                break
+            changed_paths = (changed_paths or set()) | ref_changed_paths
+
+        results = None
+        if changed_paths is not None:
+            if baseline:
+                changed_paths.update(baseline.get("UncommittedPaths", []))
+            logger.info(
+                f"Scanning {len(changed_paths)} paths changed since {', '.join(filter(None, baseline_refs))} ..."
+            )
+            new_results = []
+            staging_directory = tempfile.mkdtemp()
+            try:
+                rescanned_paths = stage_changed_paths(
+                    directory, changed_paths, staging_directory
+                )
+                # Nothing to scan when the changes are only deletions
+                if rescanned_paths is not None and any(scandir(staging_directory)):
+                    new_results = list(
+                        self._scan_results(
+                            staging_directory, self.scanners, self.exclude_path
+                        )
+                    )
+            finally:
+                shutil.rmtree(staging_directory)
+            if rescanned_paths is not None:
+                results = merge_results(
+                    baseline.get("Results", []) if baseline else [],
+                    new_results,
+                    rescanned_paths,
+                )
+
+        if results is None:
+            results = list(
+                self._scan_results(directory, self.scanners, self.exclude_path)
+            )
+
+        if self.baseline_results_file:
+            try:
+                save_baseline_results(
+                    self.baseline_results_file,
+                    get_head_commit(directory),
+                    get_uncommitted_paths(directory),
+                    self.scanners,
+                    self.exclude_path,
+                    results,
+                )
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+        yield from self._process_results(results)
+
     def run_scan(
         self, directory: str, scanners: list[str], exclude_path: list[str]
-    ) -> List[CheckReportIAC]:
+    ) -> Generator[CheckReportIAC, None, None]:
+        """
+        Run Trivy over the given directory and yield a report per finding.
+
+        Trivy's JSON output is consumed as a stream, so each result is turned into
+        reports as soon as it is decoded instead of after loading the whole document.
+
+        Args:
+            directory: The directory to scan
+            scanners: The Trivy scanners to run
+            exclude_path: The paths to skip
+
+        Yields:
+            CheckReportIAC: The report of each finding
+        """
+        yield from self._process_results(
+            self._scan_results(directory, scanners, exclude_path)
+        )
+
+    def _scan_results(
+        self, directory: str, scanners: list[str], exclude_path: list[str]
+    ) -> Generator[dict, None, None]:
+        """
+        Run Trivy over the given directory and yield its results (one per target) as they are read.
+
+        Args:
+            directory: The directory to scan
+            scanners: The Trivy scanners to run
+            exclude_path: The paths to skip
+
+        Yields:
+            dict: Each element of the Results array of Trivy's JSON output
+        """
+        process = None
         try:
             logger.info(f"Running IaC scan on {directory} ...")
             trivy_command = [
@@ -302,96 +473,50 @@ class IacProvider(Provider):
             ]
             if exclude_path:
                 trivy_command.extend(["--skip-dirs", ",".join(exclude_path)])
-            with alive_bar(
-                ctrl_c=False,
-                bar="blocks",
-                spinner="classic",
-                stats=False,
-                enrich_print=False,
-            ) as bar:
-                try:
-                    bar.title = f"-> Running IaC scan on {directory} ..."
-                    # Run Trivy with JSON output
-                    process = subprocess.run(
-                        trivy_command,
-                        capture_output=True,
-                        text=True,
-                    )
-                    bar.title = "-> Scan completed!"
-                except Exception as error:
-                    bar.title = "-> Scan failed!"
-                    raise error
-            # Log Trivy's stderr output with preserved log levels
-            if process.stderr:
-                for line in process.stderr.strip().split("\n"):
-                    if line.strip():
-                        # Parse Trivy's log format to extract level and message
-                        # Trivy format: timestamp level message
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            # Extract level and message
-                            level = parts[1]
-                            message = " ".join(parts[2:])
-
-                            # Map Trivy log levels to Python logging levels
-                            if level == "ERROR":
-                                logger.error(f"{message}")
-                            elif level == "WARN":
-                                logger.warning(f"{message}")
-                            elif level == "INFO":
-                                logger.info(f"{message}")
-                            elif level == "DEBUG":
-                                logger.debug(f"{message}")
-                            else:
-                                # Default to info for unknown levels
-                                logger.info(f"{message}")
-                        else:
-                            # If we can't parse the format, log as info
-                            logger.info(f"{line}")
-
-            try:
-                output = json.loads(process.stdout).get("Results", [])
-
-                if not output:
-                    logger.warning("No findings returned from Trivy scan")
-                    return []
-            except Exception as error:
-                logger.critical(
-                    f"{error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
-                )
-                sys.exit(1)
-
-            reports = []
-
-            # Process all trivy findings
-            for finding in output:
-
-                # Process Misconfigurations
-                for misconfiguration in finding.get("Misconfigurations", []):
-                    report = self._process_finding(
-                        misconfiguration, finding["Target"], finding["Type"]
-                    )
-                    reports.append(report)
-                # Process Vulnerabilities
-                for vulnerability in finding.get("Vulnerabilities", []):
-                    report = self._process_finding(
-                        vulnerability, finding["Target"], finding["Type"]
-                    )
-                    reports.append(report)
-                # Process Secrets
-                for secret in finding.get("Secrets", []):
-                    report = self._process_finding(
-                        secret, finding["Target"], finding["Class"]
-                    )
-                    reports.append(report)
-                # Process Licenses
-                for license in finding.get("Licenses", []):
-                    report = self._process_finding(
-                        license, finding["Target"], finding["Type"]
-                    )
-                    reports.append(report)
-
-            return reports
+            # Trivy's stderr goes to a temporary file so a verbose scan cannot fill
+            # the pipe and block while stdout is being read
+            with tempfile.TemporaryFile(mode="w+") as stderr_file:
+                with alive_bar(
+                    ctrl_c=False,
+                    bar="blocks",
+                    spinner="classic",
+                    stats=False,
+                    enrich_print=False,
+                ) as bar:
+                    try:
+                        bar.title = f"-> Running IaC scan on {directory} ..."
+                        # Run Trivy with JSON output
+                        process = subprocess.Popen(
+                            trivy_command,
+                            stdout=subprocess.PIPE,
+                            stderr=stderr_file,
+                            text=True,
+                        )
+                        try:
+                            results = stream_trivy_results(process.stdout)
+                            findings_found = False
+                            for finding in results:
+                                findings_found = True
+                                yield finding
+                        except ValueError as error:
+                            process.wait()
+                            stderr_file.seek(0)
+                            self._log_trivy_stderr(stderr_file.read())
+                            logger.critical(
+                                f"{error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
+                            )
+                            sys.exit(1)
+                        process.wait()
+                        bar.title = "-> Scan completed!"
+                    except Exception as error:
+                        bar.title = "-> Scan failed!"
+                        raise error
+                # Log Trivy's stderr output with preserved log levels
+                stderr_file.seek(0)
+                self._log_trivy_stderr(stderr_file.read())
+
+            if not findings_found:
+                logger.warning("No findings returned from Trivy scan")
 
         except Exception as error:
             if "No such file or directory: 'trivy'" in str(error):
@@ -403,6 +528,72 @@ class IacProvider(Provider):
                 f"{error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
             )
             sys.exit(1)
+        finally:
+            # Do not leave Trivy running if the scan is abandoned midway
+            if process is not None and process.poll() is None:
+                process.kill()
+                process.wait()
+
+    def _process_results(
+        self, results: Iterable[dict]
+    ) -> Generator[CheckReportIAC, None, None]:
+        """
+        Turn Trivy results into a report per finding.
+
+        Args:
+            results: The elements of the Results array of Trivy's JSON output
+
+        Yields:
+            CheckReportIAC: The report of each finding
+        """
+        for finding in results:
+            # Process Misconfigurations
+            for misconfiguration in finding.get("Misconfigurations", []):
+                yield self._process_finding(
+                    misconfiguration, finding["Target"], finding["Type"]
+                )
+            # Process Vulnerabilities
+            for vulnerability in finding.get("Vulnerabilities", []):
+                yield self._process_finding(
+                    vulnerability, finding["Target"], finding["Type"]
+                )
+            # Process Secrets
+            for secret in finding.get("Secrets", []):
+                yield self._process_finding(secret, finding["Target"], finding["Class"])
+            # Process Licenses
+            for license in finding.get("Licenses", []):
+                yield self._process_finding(license, finding["Target"], finding["Type"])
+
+    @staticmethod
+    def _log_trivy_stderr(stderr: str) -> None:
+        """Log Trivy's stderr output mapping its log levels to the Prowler ones."""
+        if not stderr:
+            return
+        for line in stderr.strip().split("\n"):
+            if line.strip():
+                # Parse Trivy's log format to extract level and message
+                # Trivy format: timestamp level message
+                parts = line.split()
+                if len(parts) >= 3:
+                    # Extract level and message
+                    level = parts[1]
+                    message = " ".join(parts[2:])
+
+                    # Map Trivy log levels to Python logging levels
+                    if level == "ERROR":
+                        logger.error(f"{message}")
+                    elif level == "WARN":
+                        logger.warning(f"{message}")
+                    elif level == "INFO":
+                        logger.info(f"{message}")
+                    elif level == "DEBUG":
+                        logger.debug(f"{message}")
+                    else:
+                        # Default to info for unknown levels
+                        logger.info(f"{message}")
+                else:
+                    # If we can't parse the format, log as info
+                    logger.info(f"{line}")
 
     def print_credentials(self):
         if self.scan_repository_url:
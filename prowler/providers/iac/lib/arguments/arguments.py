@@ -69,6 +69,21 @@ def init_parser(self):
         help="GitHub OAuth app token for authenticated repository cloning. If not provided, will use GITHUB_OAUTH_APP_TOKEN env var.",
     )
 
+    # Incremental Scan
+    iac_incremental_subparser = iac_parser.add_argument_group("Incremental Scan")
+    iac_incremental_subparser.add_argument(
+        "--baseline-ref",
+        dest="baseline_ref",
+        default=None,
+        help="Git commit, branch or tag to compare against. Only the paths changed since it are scanned. With --baseline-results-file, the paths changed since the stored commit are scanned too, and a full scan is run while there are no stored results.",
+    )
+    iac_incremental_subparser.add_argument(
+        "--baseline-results-file",
+        dest="baseline_results_file",
+        default=None,
+        help="File where the scan results are stored to be reused for the unchanged paths in the next scan. A full scan is run if it does not exist yet.",
+    )
+
 
 def validate_arguments(arguments):
     scan_path = getattr(arguments, "scan_path", None)
@@ -0,0 +1,314 @@
+import json
+import os
+import posixpath
+import re
+import shutil
+import tempfile
+from typing import Optional
+
+from dulwich import porcelain
+from dulwich.diff_tree import tree_changes
+from dulwich.errors import NotGitRepository
+from dulwich.objectspec import parse_commit
+from dulwich.repo import Repo
+
+from prowler.lib.logger import logger
+
+BASELINE_RESULTS_VERSION = 1
+
+# Terraform module sources that are local paths, like source = "../modules/network"
+LOCAL_MODULE_SOURCE_PATTERN = re.compile(
+    r'^\s*source\s*=\s*"(\.\.?/[^"]*)"', re.MULTILINE
+)
+
+
+def _decode_path(path) -> str:
+    return path.decode("utf-8") if isinstance(path, bytes) else path
+
+
+def _get_uncommitted_repository_paths(repository: Repo) -> set[str]:
+    """Return the staged, unstaged and untracked paths relative to the repository root."""
+    status = porcelain.status(repository)
+    paths = set()
+    for staged_paths in status.staged.values():
+        paths.update(_decode_path(path) for path in staged_paths)
+    paths.update(_decode_path(path) for path in status.unstaged)
+    paths.update(_decode_path(path) for path in status.untracked)
+    return paths
+
+
+def _relative_to_scan_path(
+    repository: Repo, scan_path: str, paths: set[str]
+) -> set[str]:
+    """Translate repository root relative paths to scan path relative ones, dropping the rest."""
+    prefix = os.path.relpath(
+        os.path.realpath(scan_path), os.path.realpath(repository.path)
+    ).replace(os.sep, "/")
+    if prefix == ".":
+        return set(paths)
+    return {
+        posixpath.relpath(path, prefix)
+        for path in paths
+        if path.startswith(f"{prefix}/")
+    }
+
+
+def get_head_commit(scan_path: str) -> Optional[str]:
+    """
+    Return the commit checked out in the git repository containing the scan path.
+
+    Args:
+        scan_path: The scanned directory.
+
+    Returns:
+        Optional[str]: The commit SHA or None if the scan path is not in a git repository.
+    """
+    try:
+        with Repo.discover(scan_path) as repository:
+            return repository.head().decode("ascii")
+    except (NotGitRepository, KeyError):
+        return None
+
+
+def get_uncommitted_paths(scan_path: str) -> list[str]:
+    """
+    Return the paths with uncommitted changes, relative to the scan path.
+
+    Args:
+        scan_path: The scanned directory.
+
+    Returns:
+        list[str]: The sorted staged, unstaged and untracked paths. Empty if the scan path is not in a git repository.
+    """
+    try:
+        with Repo.discover(scan_path) as repository:
+            return sorted(
+                _relative_to_scan_path(
+                    repository,
+                    scan_path,
+                    _get_uncommitted_repository_paths(repository),
+                )
+            )
+    except NotGitRepository:
+        return []
+
+
+def get_changed_paths(scan_path: str, baseline_ref: str) -> Optional[set[str]]:
+    """
+    Return the paths changed between the baseline ref and the working tree of the scan path.
+
+    Committed changes since the baseline plus staged, unstaged and untracked files are included,
+    as well as deleted and renamed paths.
+
+    Args:
+        scan_path: The scanned directory.
+        baseline_ref: A commit SHA, branch or tag of the repository.
+
+    Returns:
+        Optional[set[str]]: The changed paths relative to the scan path, or None if they cannot be computed.
+    """
+    try:
+        with Repo.discover(scan_path) as repository:
+            try:
+                baseline_commit = parse_commit(repository, baseline_ref)
+            except KeyError:
+                logger.warning(
+                    f"Baseline ref {baseline_ref} not found in the repository, running a full scan."
+                )
+                return None
+            head_commit = repository[repository.head()]
+            changed_paths = set()
+            for change in tree_changes(
+                repository.object_store, baseline_commit.tree, head_commit.tree
+            ):
+                for entry in (change.old, change.new):
+                    if entry is not None and entry.path is not None:
+                        changed_paths.add(_decode_path(entry.path))
+            changed_paths.update(_get_uncommitted_repository_paths(repository))
+            return _relative_to_scan_path(repository, scan_path, changed_paths)
+    except NotGitRepository:
+        logger.warning(f"{scan_path} is not a git repository, running a full scan.")
+        return None
+
+
+def get_local_module_directories(scan_path: str) -> set[tuple[str, str]]:
+    """
+    Return the Terraform modules called through a local path source.
+
+    Args:
+        scan_path: The scanned directory.
+
+    Returns:
+        set[tuple[str, str]]: The directories of the calling configuration and of the called module, relative to the
+            scan path.
+    """
+    local_modules = set()
+    for root, directories, files in os.walk(scan_path):
+        directories[:] = [name for name in directories if name != ".git"]
+        directory = os.path.relpath(root, scan_path).replace(os.sep, "/")
+        directory = "" if directory == "." else directory
+        for name in files:
+            if not name.endswith(".tf"):
+                continue
+            try:
+                with open(os.path.join(root, name), "r", encoding="utf-8") as file:
+                    sources = LOCAL_MODULE_SOURCE_PATTERN.findall(file.read())
+            except (OSError, UnicodeDecodeError):
+                continue
+            for source in sources:
+                module_directory = posixpath.normpath(posixpath.join(directory, source))
+                local_modules.add(
+                    (directory, "" if module_directory == "." else module_directory)
+                )
+    return local_modules
+
+
+def stage_changed_paths(
+    scan_path: str, changed_paths: set[str], staging_directory: str
+) -> Optional[set[str]]:
+    """
+    Copy the files of every directory with changes to the staging directory, keeping their relative paths.
+
+    Sibling files are copied as well since Trivy evaluates some frameworks, like Terraform, per directory.
+    Nothing is staged when a changed directory calls a local Terraform module or is one, since the findings of
+    a configuration depend on its modules and those cannot be evaluated apart.
+
+    Args:
+        scan_path: The scanned directory.
+        changed_paths: The changed paths relative to the scan path.
+        staging_directory: The directory that will be scanned instead of the scan path.
+
+    Returns:
+        Optional[set[str]]: The paths whose findings are replaced by the ones of the staging directory scan, or None
+            if a full scan is needed.
+    """
+    changed_directories = {posixpath.dirname(path) for path in changed_paths}
+    for calling_directory, module_directory in get_local_module_directories(scan_path):
+        if calling_directory in changed_directories or any(
+            directory == module_directory
+            or directory.startswith(f"{module_directory}/")
+            or not module_directory
+            for directory in changed_directories
+        ):
+            logger.info(
+                f"{calling_directory or '.'} calls the local module {module_directory or '.'}, running a full scan."
+            )
+            return None
+
+    rescanned_paths = set(changed_paths)
+    for directory in changed_directories:
+        source_directory = os.path.join(scan_path, directory)
+        if not os.path.isdir(source_directory):
+            continue
+        for entry in os.scandir(source_directory):
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            relative_path = posixpath.join(directory, entry.name)
+            destination = os.path.join(staging_directory, relative_path)
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            shutil.copy2(entry.path, destination)
+            rescanned_paths.add(relative_path)
+    return rescanned_paths
+
+
+def merge_results(
+    baseline_results: list[dict], new_results: list[dict], rescanned_paths: set[str]
+) -> list[dict]:
+    """
+    Merge the cached Trivy results of the unchanged files with the results of the rescanned ones.
+
+    Args:
+        baseline_results: The Trivy results of the previous scan.
+        new_results: The Trivy results of the rescanned paths.
+        rescanned_paths: The paths covered by the new scan, including deleted ones.
+
+    Returns:
+        list[dict]: The Trivy results of the whole scan path.
+    """
+    merged_results = [
+        result
+        for result in baseline_results
+        if result.get("Target") not in rescanned_paths
+    ]
+    merged_results.extend(new_results)
+    return merged_results
+
+
+def load_baseline_results(
+    baseline_results_file: str, scanners: list[str], exclude_path: list[str]
+) -> Optional[dict]:
+    """
+    Load the results stored by a previous scan.
+
+    Args:
+        baseline_results_file: The path to the baseline results file.
+        scanners: The scanners of the current scan.
+        exclude_path: The excluded paths of the current scan.
+
+    Returns:
+        Optional[dict]: The baseline or None if it is missing, invalid or was created with other options.
+    """
+    if not os.path.exists(baseline_results_file):
+        logger.info(
+            f"Baseline results file {baseline_results_file} not found, running a full scan."
+        )
+        return None
+    try:
+        with open(baseline_results_file, "r", encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+    except (OSError, ValueError) as error:
+        logger.warning(
+            f"Baseline results file {baseline_results_file} could not be read, running a full scan -- {error.__class__.__name__}: {error}"
+        )
+        return None
+    if (
+        not isinstance(baseline, dict)
+        or baseline.get("Version") != BASELINE_RESULTS_VERSION
+        or sorted(baseline.get("Scanners", [])) != sorted(scanners)
+        or sorted(baseline.get("ExcludePath", [])) != sorted(exclude_path)
+    ):
+        logger.warning(
+            f"Baseline results file {baseline_results_file} was created with different options, running a full scan."
+        )
+        return None
+    return baseline
+
+
+def save_baseline_results(
+    baseline_results_file: str,
+    commit: Optional[str],
+    uncommitted_paths: list[str],
+    scanners: list[str],
+    exclude_path: list[str],
+    results: list[dict],
+) -> None:
+    """
+    Store the Trivy results of the scan to be used as the baseline of the next one.
+
+    Args:
+        baseline_results_file: The path to the baseline results file.
+        commit: The commit the results belong to.
+        uncommitted_paths: The paths that differed from the commit, always rescanned by the next scan.
+        scanners: The scanners of the scan.
+        exclude_path: The excluded paths of the scan.
+        results: The Trivy results of the whole scan path.
+    """
+    baseline = {
+        "Version": BASELINE_RESULTS_VERSION,
+        "Commit": commit,
+        "UncommittedPaths": uncommitted_paths,
+        "Scanners": scanners,
+        "ExcludePath": exclude_path,
+        "Results": results,
+    }
+    directory = os.path.dirname(os.path.abspath(baseline_results_file))
+    os.makedirs(directory, exist_ok=True)
+    # Write to a temporary file first so an interrupted scan never leaves a truncated baseline
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as temporary_file:
+            json.dump(baseline, temporary_file)
+        os.replace(temporary_path, baseline_results_file)
+    except Exception:
+        os.remove(temporary_path)
+        raise
@@ -0,0 +1,126 @@
+import json
+from typing import Generator, TextIO
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class TrivyOutputStreamReader:
+    """Incremental reader of the JSON document written by `trivy --format json`.
+
+    Only the current chunk and the value being decoded are kept in memory, so the
+    elements of the Results array can be processed while Trivy is still writing them.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = READ_CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def _read_chunk(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while self._position < len(self._buffer):
+                if self._buffer[self._position] not in _WHITESPACE:
+                    return self._buffer[self._position]
+                self._position += 1
+            if not self._read_chunk():
+                return ""
+
+    def _next(self) -> str:
+        char = self._peek()
+        self._position += 1
+        return char
+
+    def _expect(self, expected: str):
+        char = self._next()
+        if char != expected:
+            raise ValueError(
+                f"Invalid Trivy JSON output: expected '{expected}' but found '{char}'"
+            )
+
+    def _decode_value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                # Grow the buffer geometrically so incomplete values are decoded in amortized linear time
+                target_size = 2 * (len(self._buffer) - self._position)
+                while self._read_chunk():
+                    if len(self._buffer) - self._position >= target_size:
+                        break
+                continue
+            # A scalar at the end of the buffer could be truncated, e.g. a number
+            if end == len(self._buffer) and self._read_chunk():
+                continue
+            self._position = end
+            return value
+
+    def results(self) -> Generator[dict, None, None]:
+        """Yield every element of the top-level Results array.
+
+        Raises:
+            ValueError: If the output is not a Trivy JSON report.
+            json.JSONDecodeError: If the output is not valid JSON.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._decode_value()
+            self._expect(":")
+            if key == "Results" and self._peek() == "[":
+                self._expect("[")
+                if self._peek() == "]":
+                    self._next()
+                else:
+                    while True:
+                        yield self._decode_value()
+                        separator = self._next()
+                        if separator == "]":
+                            break
+                        if separator != ",":
+                            raise ValueError(
+                                f"Invalid Trivy JSON output: unexpected '{separator}' in Results"
+                            )
+            else:
+                self._decode_value()
+            separator = self._next()
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(
+                    f"Invalid Trivy JSON output: unexpected '{separator}' after '{key}'"
+                )
+
+
+def stream_trivy_results(
+    stream: TextIO, chunk_size: int = READ_CHUNK_SIZE
+) -> Generator[dict, None, None]:
+    """Yield the elements of the Results array of a Trivy JSON report as they are read.
+
+    Args:
+        stream: The text stream with Trivy's JSON output, e.g. the stdout pipe of the process.
+        chunk_size: The number of characters read from the stream at once.
+
+    Returns:
+        Generator[dict, None, None]: Each Trivy result (target) of the report.
+    """
+    return TrivyOutputStreamReader(stream, chunk_size).results()
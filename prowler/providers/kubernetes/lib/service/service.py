@@ -1,6 +1,7 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from prowler.lib.logger import logger
+from prowler.lib.scan.profiler import profile_call
 from prowler.providers.kubernetes.kubernetes_provider import KubernetesProvider
 
 MAX_WORKERS = 10
@@ -8,6 +9,7 @@ MAX_WORKERS = 10
 
 class KubernetesService:
     def __init__(self, provider: KubernetesProvider):
+        self.service = self.__class__.__name__.lower()
         self.context = provider.identity.context
         self.api_client = provider.session.api_client
         self.audit_config = provider.audit_config
@@ -30,6 +32,10 @@ class KubernetesService:
             f"{self.service.upper()} - Starting threads for '{call_name}' function to process {item_count} items..."
         )
 
+        # Time every call of the target when the scan is profiled
+        call = profile_call(
+            "threading_call", f"{self.__class__.__name__}.{call.__name__}", call
+        )
         # Submit tasks to the thread pool
         futures = [self.thread_pool.submit(call, item) for item in items]
 
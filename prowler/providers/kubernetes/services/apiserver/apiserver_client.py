@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 from prowler.providers.kubernetes.services.apiserver.apiserver_service import APIServer
 
-apiserver_client = APIServer(Provider.get_global_provider())
+apiserver_client = ServiceClient(APIServer)
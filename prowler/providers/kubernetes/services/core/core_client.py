@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 from prowler.providers.kubernetes.services.core.core_service import Core
 
-core_client = Core(Provider.get_global_provider())
+core_client = ServiceClient(Core)
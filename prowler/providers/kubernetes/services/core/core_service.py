@@ -8,6 +8,8 @@ from prowler.lib.logger import logger
 from prowler.providers.kubernetes.kubernetes_provider import KubernetesProvider
 from prowler.providers.kubernetes.lib.service.service import KubernetesService
 
+PODS_PAGE_SIZE = 500
+
 
 class Core(KubernetesService):
     def __init__(self, provider: KubernetesProvider):
@@ -23,9 +25,16 @@ class Core(KubernetesService):
         self._in_worker_node()
 
     def _get_pods(self):
+        self.__threading_call__(self._get_namespace_pods, self.namespaces)
+
+    def _get_namespace_pods(self, namespace):
         try:
-            for namespace in self.namespaces:
-                pods = self.client.list_namespaced_pod(namespace)
+            _continue = None
+            while True:
+                # List the pods in chunks to avoid loading the whole namespace at once
+                pods = self.client.list_namespaced_pod(
+                    namespace, limit=PODS_PAGE_SIZE, _continue=_continue
+                )
                 for pod in pods.items:
                     pod_containers = {}
                     containers = pod.spec.containers if pod.spec.containers else []
@@ -87,9 +96,12 @@ class Core(KubernetesService):
                         ),
                         containers=pod_containers,
                     )
+                _continue = pods.metadata._continue if pods.metadata else None
+                if not _continue:
+                    break
         except Exception as error:
             logger.error(
-                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                f"{namespace} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
     def _list_config_maps(self):
@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 from prowler.providers.m365.services.entra.entra_service import Entra
 
-entra_client = Entra(Provider.get_global_provider())
+entra_client = ServiceClient(Entra)
@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 from prowler.providers.m365.services.purview.purview_service import Purview
 
-purview_client = Purview(Provider.get_global_provider())
+purview_client = ServiceClient(Purview)
@@ -1,4 +1,4 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 from prowler.providers.m365.services.teams.teams_service import Teams
 
-teams_client = Teams(Provider.get_global_provider())
+teams_client = ServiceClient(Teams)
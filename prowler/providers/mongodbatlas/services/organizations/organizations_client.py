@@ -1,6 +1,6 @@
-from prowler.providers.common.provider import Provider
+from prowler.providers.common.context import ServiceClient
 from prowler.providers.mongodbatlas.services.organizations.organizations_service import (
     Organizations,
 )
 
-organizations_client = Organizations(Provider.get_global_provider())
+organizations_client = ServiceClient(Organizations)
@@ -6,6 +6,7 @@ from unittest import mock
 from requests import Response
 
 from prowler.config.config import (
+    AvailableComplianceFrameworks,
     check_current_version,
     get_available_compliance_frameworks,
     load_and_validate_config_file,
@@ -354,9 +355,7 @@ config_kubernetes = {
 
 
 class Test_Config:
-    @mock.patch(
-        "prowler.config.config.requests.get", new=mock_prowler_get_latest_release
-    )
+    @mock.patch("requests.get", new=mock_prowler_get_latest_release)
     @mock.patch("prowler.config.config.prowler_version", new=MOCK_PROWLER_VERSION)
     def test_check_current_version_with_latest(self):
         assert (
@@ -364,9 +363,7 @@ class Test_Config:
             == f"Prowler {MOCK_PROWLER_VERSION} (You are running the latest version, yay!)"
         )
 
-    @mock.patch(
-        "prowler.config.config.requests.get", new=mock_prowler_get_latest_release
-    )
+    @mock.patch("requests.get", new=mock_prowler_get_latest_release)
     @mock.patch("prowler.config.config.prowler_version", new=MOCK_OLD_PROWLER_VERSION)
     def test_check_current_version_with_old(self):
         assert (
@@ -374,9 +371,7 @@ class Test_Config:
             == f"Prowler {MOCK_OLD_PROWLER_VERSION} (latest is {MOCK_PROWLER_VERSION}, upgrade for the latest features)"
         )
 
-    @mock.patch(
-        "prowler.config.config.requests.get", new=mock_prowler_get_latest_release
-    )
+    @mock.patch("requests.get", new=mock_prowler_get_latest_release)
     @mock.patch(
         "prowler.config.config.prowler_version", new=MOCK_PROWLER_MASTER_VERSION
     )
@@ -422,6 +417,18 @@ class Test_Config:
             get_available_compliance_frameworks().sort() == compliance_frameworks.sort()
         )
 
+    def test_available_compliance_frameworks_is_lazy(self):
+        available_compliance_frameworks = AvailableComplianceFrameworks()
+        with mock.patch(
+            "prowler.config.config.get_available_compliance_frameworks",
+            return_value=["cis_2.0_aws", "soc2_aws"],
+        ) as get_frameworks:
+            get_frameworks.assert_not_called()
+            assert "cis_2.0_aws" in available_compliance_frameworks
+            assert "cis_9.9_aws" not in available_compliance_frameworks
+            assert list(available_compliance_frameworks) == ["cis_2.0_aws", "soc2_aws"]
+            get_frameworks.assert_called_once()
+
     def test_load_and_validate_config_file_aws(self):
         path = pathlib.Path(os.path.dirname(os.path.realpath(__file__)))
         config_test_file = f"{path}/fixtures/config.yaml"
@@ -0,0 +1,95 @@
+import os
+
+import pandas as pd
+
+from dashboard.lib.data_store import DataStore
+
+
+class TestDataStore:
+    def setup_method(self):
+        self.reads = []
+
+    def read_file(self, path):
+        self.reads.append(path)
+        return pd.read_csv(path)
+
+    def write_file(self, path, rows, mtime_ns):
+        pd.DataFrame({"CHECK_ID": rows}).to_csv(path, index=False)
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def get_store(self, directory):
+        return DataStore(
+            lambda: sorted(str(path) for path in directory.glob("*.csv")),
+            self.read_file,
+        )
+
+    def test_refresh_new_file(self, tmp_path):
+        first_file = str(tmp_path / "first.csv")
+        self.write_file(first_file, ["check_1"], 1_000_000_000)
+        store = self.get_store(tmp_path)
+
+        assert store.refresh()
+        assert store.files == [first_file]
+
+        second_file = str(tmp_path / "second.csv")
+        self.write_file(second_file, ["check_2", "check_3"], 1_000_000_000)
+
+        assert store.refresh()
+        assert store.files == [first_file, second_file]
+        # Only the new file is read
+        assert self.reads == [first_file, second_file]
+        assert list(store.get_data()["CHECK_ID"]) == ["check_1", "check_2", "check_3"]
+
+    def test_refresh_modified_file(self, tmp_path):
+        file = str(tmp_path / "findings.csv")
+        self.write_file(file, ["check_1"], 1_000_000_000)
+        store = self.get_store(tmp_path)
+        store.refresh()
+
+        # Nothing changed
+        assert not store.refresh()
+        assert self.reads == [file]
+
+        self.write_file(file, ["check_2"], 2_000_000_000)
+
+        assert store.refresh()
+        assert self.reads == [file, file]
+        assert list(store.get_frame(file)["CHECK_ID"]) == ["check_2"]
+
+    def test_refresh_removed_file(self, tmp_path):
+        first_file = str(tmp_path / "first.csv")
+        second_file = str(tmp_path / "second.csv")
+        self.write_file(first_file, ["check_1"], 1_000_000_000)
+        self.write_file(second_file, ["check_2"], 1_000_000_000)
+        store = self.get_store(tmp_path)
+        store.refresh()
+
+        os.remove(second_file)
+
+        assert store.refresh()
+        assert store.files == [first_file]
+        assert store.get_frame(second_file) is None
+        assert list(store.get_data()["CHECK_ID"]) == ["check_1"]
+
+        os.remove(first_file)
+
+        assert store.refresh()
+        assert store.files == []
+        assert store.get_data() is None
+
+    def test_refresh_skipped_and_unreadable_files(self, tmp_path):
+        skipped_file = str(tmp_path / "skipped.csv")
+        unreadable_file = str(tmp_path / "unreadable.csv")
+        self.write_file(skipped_file, ["check_1"], 1_000_000_000)
+        self.write_file(unreadable_file, ["check_2"], 1_000_000_000)
+
+        def read_file(path):
+            if path == unreadable_file:
+                raise ValueError("Unreadable file")
+            return None
+
+        store = DataStore(lambda: [skipped_file, unreadable_file], read_file)
+
+        assert store.refresh()
+        assert store.files == []
+        assert store.get_data() is None
@@ -0,0 +1,129 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from prowler.lib.check.checks_index import (
+    CHECKS_INDEX_VERSION,
+    ChecksIndex,
+    build_checks_index,
+    checks_index_file,
+)
+from prowler.lib.check.checks_loader import load_checks_to_execute
+from prowler.lib.check.compliance_models import Compliance
+from prowler.lib.check.models import CheckMetadata, Severity
+
+
+def write_index(tmp_path, index: dict) -> str:
+    path = str(tmp_path / "checks_index.json")
+    with open(path, "w") as index_file:
+        json.dump(index, index_file)
+    return path
+
+
+class TestChecksIndex:
+    def test_checks_index_is_up_to_date(self):
+        with open(checks_index_file) as index_file:
+            index = json.load(index_file)
+
+        # Run util/generate_checks_index.py if this fails
+        assert index == build_checks_index(list(index["providers"]))
+
+    def test_checks_index_is_available(self):
+        for provider in ["aws", "azure", "gcp", "kubernetes", "m365", "github"]:
+            assert ChecksIndex(provider).is_available()
+
+    def test_outdated_checks_index(self, tmp_path):
+        with open(checks_index_file) as index_file:
+            index = json.load(index_file)
+        del index["providers"]["aws"]["checks"]["s3_bucket_default_encryption"]
+        del index["providers"]["azure"]["compliance"]["cis_2.0_azure"]
+
+        path = write_index(tmp_path, index)
+
+        assert not ChecksIndex("aws", path).is_available()
+        assert not ChecksIndex("azure", path).is_available()
+        assert ChecksIndex("gcp", path).is_available()
+
+    def test_checks_index_other_version(self, tmp_path):
+        with open(checks_index_file) as index_file:
+            index = json.load(index_file)
+        index["version"] = CHECKS_INDEX_VERSION + 1
+
+        assert not ChecksIndex("aws", write_index(tmp_path, index)).is_available()
+
+    def test_checks_index_not_found(self, tmp_path):
+        assert not ChecksIndex("aws", str(tmp_path / "missing.json")).is_available()
+
+    def test_get_bulk_checks_metadata(self):
+        bulk_checks_metadata = ChecksIndex("aws").get_bulk_checks_metadata()
+        metadata = bulk_checks_metadata["s3_bucket_default_encryption"]
+
+        assert metadata.CheckID == "s3_bucket_default_encryption"
+        assert metadata.ServiceName == "s3"
+        assert isinstance(metadata.Severity, Severity)
+        assert "encryption" in metadata.Categories
+
+    def test_get_services(self):
+        services = ChecksIndex("aws").get_services()
+
+        assert "s3" in services
+        assert "iam" in services
+        assert services == sorted(services)
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {},
+            {"check_list": ["s3_bucket_default_encryption"]},
+            {"service_list": ["s3", "iam"]},
+            {"severities": ["critical", "high"]},
+            {"severities": ["high"], "service_list": ["iam"]},
+            {"compliance_frameworks": ["cis_2.0_aws", "mitre_attack_aws"]},
+            {"categories": {"encryption", "threat-detection"}},
+        ],
+    )
+    def test_load_checks_to_execute_from_index(self, filters):
+        checks_index = ChecksIndex("aws")
+
+        checks_from_index = load_checks_to_execute(
+            provider="aws",
+            bulk_checks_metadata=checks_index.get_bulk_checks_metadata(),
+            bulk_compliance_frameworks=checks_index.get_bulk_compliance_frameworks(),
+            **filters,
+        )
+        checks = load_checks_to_execute(
+            provider="aws",
+            bulk_checks_metadata=CheckMetadata.get_bulk("aws"),
+            bulk_compliance_frameworks=(
+                Compliance.get_bulk("aws")
+                if "compliance_frameworks" in filters
+                else None
+            ),
+            **filters,
+        )
+
+        assert checks_from_index
+        assert checks_from_index == checks
+
+    def test_list_checks_imports(self):
+        # The listing commands do not import the SDKs of the providers nor the outputs
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "prowler"]
+            + ["aws", "--list-checks", "--no-banner"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        imported_modules = {
+            line.split("|")[-1].strip().split(".")[0]
+            for line in process.stderr.splitlines()
+            if line.startswith("import time:")
+        }
+
+        assert process.returncode == 0
+        assert "There are" in process.stdout
+        assert "prowler" in imported_modules
+        for module in ["boto3", "kubernetes", "pyarrow", "py_ocsf_models", "azure"]:
+            assert module not in imported_modules
@@ -93,6 +93,7 @@ class Test_Parser:
         assert not parsed.quick_inventory
         assert not parsed.output_bucket
         assert not parsed.output_bucket_no_assume
+        assert not parsed.output_bucket_compress
         assert not parsed.shodan
         assert not parsed.resource_tag
         assert not parsed.scan_unused_services
@@ -383,6 +384,11 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.slack
 
+    def test_root_parser_scan_profile(self):
+        command = [prowler_command, "--scan-profile"]
+        parsed = self.parser.parse(command)
+        assert parsed.scan_profile
+
     def test_root_parser_unix_timestamp(self):
         command = [prowler_command, "--unix-timestamp"]
         parsed = self.parser.parse(command)
@@ -1037,6 +1043,12 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.output_bucket_no_assume == bucket
 
+    def test_aws_parser_output_bucket_compress(self):
+        argument = "--output-bucket-compress"
+        command = [prowler_command, "-B", "test-bucket", argument]
+        parsed = self.parser.parse(command)
+        assert parsed.output_bucket_compress
+
     # TODO: change for the global parser
     def test_aws_parser_shodan_short(self):
         argument = "-N"
@@ -1067,6 +1079,38 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.mutelist_file == mutelist_file
 
+    def test_aws_parser_snapshot_record(self):
+        command = [prowler_command, "--snapshot-record", "scan.json.gz"]
+        parsed = self.parser.parse(command)
+        assert parsed.snapshot_record == "scan.json.gz"
+        assert parsed.snapshot_replay is None
+
+    def test_aws_parser_snapshot_replay(self):
+        command = [prowler_command, "--snapshot-replay", "scan.json.gz"]
+        parsed = self.parser.parse(command)
+        assert parsed.snapshot_replay == "scan.json.gz"
+        assert parsed.snapshot_record is None
+
+    def test_aws_parser_snapshot_record_and_replay(self):
+        command = [
+            prowler_command,
+            "--snapshot-record",
+            "scan.json.gz",
+            "--snapshot-replay",
+            "scan.json.gz",
+        ]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
+    def test_kubernetes_parser_snapshot_not_available(self):
+        command = [prowler_command, "kubernetes", "--snapshot-record", "scan.json.gz"]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+
     def test_aws_parser_resource_tags(self):
         argument = "--resource-tags"
         scan_tag1 = "Key=Value"
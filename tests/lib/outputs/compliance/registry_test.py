@@ -0,0 +1,60 @@
+import pytest
+
+from prowler.config.config import get_available_compliance_frameworks
+from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
+    AWSWellArchitected,
+)
+from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+from prowler.lib.outputs.compliance.cis.cis_github import GithubCIS
+from prowler.lib.outputs.compliance.compliance_output import ComplianceOutput
+from prowler.lib.outputs.compliance.ens.ens_azure import AzureENS
+from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
+from prowler.lib.outputs.compliance.iso27001.iso27001_nhn import NHNISO27001
+from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import AWSKISAISMSP
+from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import GCPMitreAttack
+from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365 import (
+    ProwlerThreatScoreM365,
+)
+from prowler.lib.outputs.compliance.registry import (
+    COMPLIANCE_OUTPUTS,
+    get_compliance_output_class,
+)
+
+
+class TestComplianceRegistry:
+    @pytest.mark.parametrize(
+        "provider, compliance_name, compliance_output_class",
+        [
+            ("aws", "cis_2.0_aws", AWSCIS),
+            (
+                "aws",
+                "aws_well_architected_framework_security_pillar_aws",
+                AWSWellArchitected,
+            ),
+            ("aws", "kisa_isms_p_2023_aws", AWSKISAISMSP),
+            ("aws", "soc2_aws", GenericCompliance),
+            ("azure", "ens_rd2022_azure", AzureENS),
+            ("gcp", "mitre_attack_gcp", GCPMitreAttack),
+            ("m365", "prowler_threatscore_m365", ProwlerThreatScoreM365),
+            ("nhn", "iso27001_2022_nhn", NHNISO27001),
+            ("github", "cis_1.0_github", GithubCIS),
+        ],
+    )
+    def test_get_compliance_output_class(
+        self, provider, compliance_name, compliance_output_class
+    ):
+        assert (
+            get_compliance_output_class(provider, compliance_name)
+            is compliance_output_class
+        )
+
+    def test_get_compliance_output_class_without_outputs(self):
+        assert get_compliance_output_class("iac", "cis_1.0_iac") is None
+
+    def test_every_framework_has_an_output(self):
+        for provider in COMPLIANCE_OUTPUTS:
+            for compliance_name in get_available_compliance_frameworks(provider):
+                assert issubclass(
+                    get_compliance_output_class(provider, compliance_name),
+                    ComplianceOutput,
+                )
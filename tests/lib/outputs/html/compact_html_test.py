@@ -0,0 +1,153 @@
+import base64
+import gzip
+import json
+import re
+from io import StringIO
+
+from mock import patch
+
+from prowler.lib.outputs.html.compact_html import CompactHTML
+from prowler.lib.outputs.html.html import HTML
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, set_mocked_aws_provider
+
+html_stats = {
+    "total_pass": 2,
+    "total_muted_pass": 0,
+    "total_fail": 1,
+    "total_muted_fail": 1,
+    "resources_count": 3,
+    "findings_count": 3,
+}
+
+
+def get_embedded_report(content: str) -> dict:
+    encoded = re.search(
+        r'<script id="findingsData" type="application/octet-stream">(.*?)</script>',
+        content,
+        re.S,
+    ).group(1)
+    return json.loads(gzip.decompress(base64.b64decode(encoded)))
+
+
+class TestCompactHTML:
+    def test_transform(self):
+        findings = [
+            generate_finding_output(
+                status="FAIL", resource_uid="resource-1", muted=True
+            ),
+            generate_finding_output(status="PASS", resource_uid="resource-2"),
+            generate_finding_output(
+                status="PASS",
+                resource_uid="resource-3",
+                check_id="service_other_check",
+                compliance={"CIS-2.0": ["1.1", "1.2"]},
+            ),
+        ]
+
+        output = CompactHTML(findings)
+
+        assert output.data == [
+            [0, "MUTED (FAIL)", "eu-west-1", "resource-1", "", "", 0],
+            [0, "PASS", "eu-west-1", "resource-2", "", "", 0],
+            [1, "PASS", "eu-west-1", "resource-3", "", "", 1],
+        ]
+        assert [check[0] for check in output._check_rows] == [
+            "service_test_check_id",
+            "service_other_check",
+        ]
+        assert list(output._compliances) == [
+            "test-compliance: test-compliance",
+            "CIS-2.0: 1.1, 1.2",
+        ]
+
+    def test_transform_renders_markdown_once_per_check(self):
+        findings = [
+            generate_finding_output(
+                resource_uid=f"resource-{index}", risk="**compact** risk"
+            )
+            for index in range(10)
+        ]
+
+        with patch.object(
+            HTML, "process_markdown", side_effect=lambda text: text
+        ) as mock_process_markdown:
+            CompactHTML(findings)
+
+        # Risk and recommendation of the only check
+        assert mock_process_markdown.call_count == 2
+
+    def test_batch_write_data_to_file(self):
+        mock_file = StringIO()
+        findings = [
+            generate_finding_output(
+                status="FAIL",
+                resource_uid="resource-1",
+                risk="**bold** risk",
+                remediation_recommendation_url="https://hub.prowler.com/check/check-id",
+            ),
+            generate_finding_output(status="PASS", resource_uid="resource-2"),
+        ]
+        output = CompactHTML(findings)
+        output._file_descriptor = mock_file
+        provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+
+        with patch.object(mock_file, "close", return_value=None):
+            output.batch_write_data_to_file(provider, html_stats)
+
+        content = mock_file.getvalue()
+        assert content.startswith("<!DOCTYPE html>")
+        assert content.rstrip().endswith("</html>")
+        assert "AWS Assessment Summary" in content
+        assert "resource-1" not in content
+        report = get_embedded_report(content)
+        assert report["findings"] == [
+            [0, "FAIL", "eu-west-1", "resource-1", "", "", 0],
+            [0, "PASS", "eu-west-1", "resource-2", "", "", 0],
+        ]
+        assert report["checks"] == [
+            [
+                "service_test_check_id",
+                "service_test_check_id",
+                "service",
+                "high",
+                "<strong>bold</strong> risk",
+                "",
+                "https://hub.prowler.com/check/check-id",
+            ]
+        ]
+        assert report["compliances"] == ["test-compliance: test-compliance"]
+
+    def test_batch_write_data_to_file_in_batches(self):
+        mock_file = StringIO()
+        provider = set_mocked_aws_provider(audited_regions=[AWS_REGION_EU_WEST_1])
+        output = CompactHTML(
+            [generate_finding_output(resource_uid="resource-1")], from_cli=False
+        )
+        output._file_descriptor = mock_file
+
+        with patch.object(mock_file, "close", return_value=None):
+            output.batch_write_data_to_file(provider, html_stats)
+            output._data.clear()
+            output.transform(
+                [
+                    generate_finding_output(
+                        resource_uid=f"resource-{index}", check_id="service_other_check"
+                    )
+                    for index in range(2, 200)
+                ]
+            )
+            output.close_file = True
+            output.batch_write_data_to_file(provider, html_stats)
+
+        report = get_embedded_report(mock_file.getvalue())
+        assert [finding[3] for finding in report["findings"]] == [
+            f"resource-{index}" for index in range(1, 200)
+        ]
+        assert [check[0] for check in report["checks"]] == [
+            "service_test_check_id",
+            "service_other_check",
+        ]
+
+    def test_batch_write_data_to_file_without_findings(self):
+        assert not CompactHTML([])._file_descriptor
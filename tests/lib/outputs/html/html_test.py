@@ -843,6 +843,17 @@ class TestHTML:
         result = HTML.process_markdown(None)
         assert result is None
 
+    def test_process_markdown_is_cached(self):
+        """Test that the same text is only converted once"""
+        test_text = "This text is **cached** once converted"
+        HTML.process_markdown(test_text)
+        hits = HTML.process_markdown.cache_info().hits
+
+        result = HTML.process_markdown(test_text)
+
+        assert result == "This text is <strong>cached</strong> once converted"
+        assert HTML.process_markdown.cache_info().hits == hits + 1
+
     def test_process_markdown_no_markdown(self):
         """Test that plain text without markdown is returned unchanged"""
         test_text = "This is plain text without any markdown formatting"
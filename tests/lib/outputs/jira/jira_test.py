@@ -1,5 +1,8 @@
 import base64
+import json
+import threading
 from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, PropertyMock, patch
 from urllib.parse import parse_qs, urlparse
 
@@ -14,9 +17,13 @@ from prowler.lib.outputs.jira.exceptions.exceptions import (
     JiraGetCloudIDError,
     JiraGetProjectsError,
     JiraGetProjectsResponseError,
+    JiraInvalidIssueTypeError,
+    JiraInvalidProjectKeyError,
     JiraNoProjectsError,
+    JiraNoTokenError,
     JiraRefreshTokenError,
     JiraRequiredCustomFieldsError,
+    JiraSearchIssuesError,
     JiraTestConnectionError,
 )
 from prowler.lib.outputs.jira.jira import Jira
@@ -1520,3 +1527,345 @@ class TestJiraIntegration:
         assert headers == expected_headers
         assert "Authorization" not in headers
         assert "Content-Type" not in headers
+
+
+class JiraStubHandler(BaseHTTPRequestHandler):
+    """Local Jira stub serving the search and bulk issue creation endpoints"""
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.requests.append((self.path, body))
+            if self.path.endswith("/rest/api/3/search/jql"):
+                issues = [
+                    {"fields": {"labels": ["other-label", label]}}
+                    for label in self.server.open_labels
+                    if label in body["jql"]
+                ]
+                self.reply(200, {"issues": issues, "isLast": True})
+            elif self.path.endswith("/rest/api/3/issue/bulk"):
+                if self.server.rate_limited_requests:
+                    self.server.rate_limited_requests -= 1
+                    self.reply(429, {}, headers={"Retry-After": "0"})
+                    return
+                if self.server.unavailable_requests:
+                    self.server.unavailable_requests -= 1
+                    self.reply(503, {})
+                    return
+                issues = [
+                    {"id": str(index), "key": f"TEST-{index}"}
+                    for index, _ in enumerate(body["issueUpdates"])
+                ]
+                self.server.created_issues.extend(body["issueUpdates"])
+                self.reply(201, {"issues": issues, "errors": []})
+            else:
+                self.reply(404, {})
+
+    def reply(self, status, body, headers=None):
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class TestJiraBulkIntegration:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), JiraStubHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.created_issues = []
+        self.server.open_labels = []
+        self.server.rate_limited_requests = 0
+        self.server.unavailable_requests = 0
+        server_thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        )
+        server_thread.start()
+
+        with patch.object(Jira, "get_basic_auth", return_value=None):
+            self.jira_integration = Jira(
+                user_mail="test_user_mail",
+                api_token="test_api_token",
+                domain="test_domain",
+            )
+        self.jira_integration._access_token = "test_access_token"
+        self.jira_integration._cloud_id = "test_cloud_id"
+        self.jira_integration.API_BASE_URL = (
+            f"http://127.0.0.1:{self.server.server_address[1]}/ex/jira"
+        )
+        self.jira_integration.RETRY_BACKOFF_FACTOR = 0
+
+        yield
+
+        self.server.shutdown()
+        self.server.server_close()
+
+    @staticmethod
+    def get_findings(count):
+        return [
+            {
+                "finding_uid": f"prowler-aws-check_{index}-resource-{index}",
+                "check_id": f"check_{index}",
+                "check_title": "Check Title",
+                "severity": "high",
+                "status": "FAIL",
+                "resource_uid": f"resource-{index}",
+            }
+            for index in range(count)
+        ]
+
+    def test_get_finding_label(self):
+        label = Jira.get_finding_label("prowler-aws-check resource with spaces")
+
+        assert label.startswith(Jira.FINDING_LABEL_PREFIX)
+        assert " " not in label
+        assert label == Jira.get_finding_label("prowler-aws-check resource with spaces")
+        assert label != Jira.get_finding_label("prowler-aws-check other resource")
+
+    def test_get_issue_fields(self):
+        fields = self.jira_integration.get_issue_fields(
+            project_key="TEST",
+            issue_type="Bug",
+            issue_labels=["scan"],
+            check_id="check_1",
+            severity="high",
+            status="FAIL",
+            resource_uid="resource-1",
+        )
+
+        assert fields["project"] == {"key": "TEST"}
+        assert fields["summary"] == "[Prowler] HIGH - check_1 - resource-1"
+        assert fields["issuetype"] == {"name": "Bug"}
+        assert fields["labels"] == ["scan"]
+        assert fields["description"]["type"] == "doc"
+
+    @patch.object(Jira, "get_available_issue_types", return_value=["Bug"])
+    @patch.object(Jira, "get_projects", return_value={"TEST": "Test Project"})
+    def test_send_findings_bulk_chunks_issues(
+        self, mock_get_projects, mock_get_available_issue_types
+    ):
+        # To disable vulture
+        mock_get_projects = mock_get_projects
+        mock_get_available_issue_types = mock_get_available_issue_types
+
+        result = self.jira_integration.send_findings_bulk(
+            findings=self.get_findings(120),
+            project_key="TEST",
+            issue_type="Bug",
+            issue_labels=["scan"],
+        )
+
+        assert result == {"created_count": 120, "failed_count": 0, "skipped_count": 0}
+        bulk_requests = [
+            body for path, body in self.server.requests if path.endswith("/bulk")
+        ]
+        assert sorted(len(body["issueUpdates"]) for body in bulk_requests) == [
+            20,
+            50,
+            50,
+        ]
+        assert all(
+            path.startswith("/ex/jira/test_cloud_id/")
+            for path, _ in self.server.requests
+        )
+        created_labels = [
+            issue["fields"]["labels"] for issue in self.server.created_issues
+        ]
+        assert all(labels[0] == "scan" for labels in created_labels)
+        assert len({labels[1] for labels in created_labels}) == 120
+
+    @patch.object(Jira, "get_available_issue_types", return_value=["Bug"])
+    @patch.object(Jira, "get_projects", return_value={"TEST": "Test Project"})
+    def test_send_findings_bulk_skips_open_and_repeated_findings(
+        self, mock_get_projects, mock_get_available_issue_types
+    ):
+        # To disable vulture
+        mock_get_projects = mock_get_projects
+        mock_get_available_issue_types = mock_get_available_issue_types
+
+        findings = self.get_findings(3)
+        self.server.open_labels = [Jira.get_finding_label(findings[0]["finding_uid"])]
+
+        result = self.jira_integration.send_findings_bulk(
+            findings=findings + [findings[1]], project_key="TEST", issue_type="Bug"
+        )
+
+        assert result == {"created_count": 2, "failed_count": 0, "skipped_count": 2}
+        search_requests = [
+            body for path, body in self.server.requests if path.endswith("/jql")
+        ]
+        assert len(search_requests) == 1
+        assert search_requests[0]["jql"].startswith(
+            'project = "TEST" AND statusCategory != Done AND labels in ('
+        )
+        assert [issue["fields"]["summary"] for issue in self.server.created_issues] == [
+            "[Prowler] HIGH - check_1 - resource-1",
+            "[Prowler] HIGH - check_2 - resource-2",
+        ]
+
+    @patch.object(Jira, "get_available_issue_types", return_value=["Bug"])
+    @patch.object(Jira, "get_projects", return_value={"TEST": "Test Project"})
+    def test_send_findings_bulk_without_deduplication(
+        self, mock_get_projects, mock_get_available_issue_types
+    ):
+        # To disable vulture
+        mock_get_projects = mock_get_projects
+        mock_get_available_issue_types = mock_get_available_issue_types
+
+        findings = self.get_findings(2)
+        self.server.open_labels = [Jira.get_finding_label(findings[0]["finding_uid"])]
+
+        result = self.jira_integration.send_findings_bulk(
+            findings=findings,
+            project_key="TEST",
+            issue_type="Bug",
+            deduplicate=False,
+        )
+
+        assert result == {"created_count": 2, "failed_count": 0, "skipped_count": 0}
+        assert not any(path.endswith("/jql") for path, _ in self.server.requests)
+
+    @patch.object(Jira, "get_available_issue_types", return_value=["Bug"])
+    @patch.object(Jira, "get_projects", return_value={"TEST": "Test Project"})
+    def test_send_findings_bulk_retries_rate_limited_requests(
+        self, mock_get_projects, mock_get_available_issue_types
+    ):
+        # To disable vulture
+        mock_get_projects = mock_get_projects
+        mock_get_available_issue_types = mock_get_available_issue_types
+
+        self.server.rate_limited_requests = 2
+
+        result = self.jira_integration.send_findings_bulk(
+            findings=self.get_findings(10), project_key="TEST", issue_type="Bug"
+        )
+
+        assert result == {"created_count": 10, "failed_count": 0, "skipped_count": 0}
+        bulk_requests = [
+            path for path, _ in self.server.requests if path.endswith("/bulk")
+        ]
+        assert len(bulk_requests) == 3
+
+    @patch.object(Jira, "get_available_issue_types", return_value=["Bug"])
+    @patch.object(Jira, "get_projects", return_value={"TEST": "Test Project"})
+    def test_send_findings_bulk_partial_errors(
+        self, mock_get_projects, mock_get_available_issue_types
+    ):
+        # To disable vulture
+        mock_get_projects = mock_get_projects
+        mock_get_available_issue_types = mock_get_available_issue_types
+
+        mock_response = MagicMock()
+        mock_response.status_code = 400
+        mock_response.json.return_value = {
+            "issues": [],
+            "errors": [
+                {
+                    "status": 400,
+                    "failedElementNumber": 0,
+                    "elementErrors": {
+                        "errors": {"customfield_10000": "Team is required."}
+                    },
+                }
+            ],
+        }
+
+        with patch.object(
+            self.jira_integration.session, "post", return_value=mock_response
+        ):
+            result = self.jira_integration.send_findings_bulk(
+                findings=self.get_findings(1),
+                project_key="TEST",
+                issue_type="Bug",
+                deduplicate=False,
+            )
+
+        assert result == {"created_count": 0, "failed_count": 1, "skipped_count": 0}
+
+    @patch.object(Jira, "get_available_issue_types", return_value=["Bug"])
+    @patch.object(Jira, "get_projects", return_value={"TEST": "Test Project"})
+    def test_send_findings_bulk_search_error(
+        self, mock_get_projects, mock_get_available_issue_types
+    ):
+        # To disable vulture
+        mock_get_projects = mock_get_projects
+        mock_get_available_issue_types = mock_get_available_issue_types
+
+        mock_response = MagicMock()
+        mock_response.status_code = 401
+        mock_response.text = "Unauthorized"
+
+        with patch.object(
+            self.jira_integration.session, "post", return_value=mock_response
+        ):
+            with pytest.raises(JiraSearchIssuesError):
+                self.jira_integration.send_findings_bulk(
+                    findings=self.get_findings(1), project_key="TEST", issue_type="Bug"
+                )
+
+    @patch.object(Jira, "get_available_issue_types", return_value=["Bug"])
+    @patch.object(Jira, "get_projects", return_value={"TEST": "Test Project"})
+    def test_send_findings_bulk_does_not_retry_unavailable_requests(
+        self, mock_get_projects, mock_get_available_issue_types
+    ):
+        # To disable vulture
+        mock_get_projects = mock_get_projects
+        mock_get_available_issue_types = mock_get_available_issue_types
+
+        self.server.unavailable_requests = 1
+
+        result = self.jira_integration.send_findings_bulk(
+            findings=self.get_findings(10), project_key="TEST", issue_type="Bug"
+        )
+
+        # The issues could have been created, so the request is not sent again
+        assert result == {"created_count": 0, "failed_count": 10, "skipped_count": 0}
+        bulk_requests = [
+            path for path, _ in self.server.requests if path.endswith("/bulk")
+        ]
+        assert len(bulk_requests) == 1
+
+    def test_send_findings_bulk_no_token(self):
+        with patch.object(Jira, "get_access_token", return_value=None):
+            with pytest.raises(JiraNoTokenError):
+                self.jira_integration.send_findings_bulk(
+                    findings=self.get_findings(1), project_key="TEST", issue_type="Bug"
+                )
+
+    @patch.object(Jira, "get_available_issue_types", return_value=["Bug"])
+    @patch.object(Jira, "get_projects", return_value={"TEST": "Test Project"})
+    def test_send_findings_bulk_invalid_issue_type(
+        self, mock_get_projects, mock_get_available_issue_types
+    ):
+        # To disable vulture
+        mock_get_projects = mock_get_projects
+        mock_get_available_issue_types = mock_get_available_issue_types
+
+        with pytest.raises(JiraInvalidIssueTypeError):
+            self.jira_integration.send_findings_bulk(
+                findings=self.get_findings(1), project_key="TEST", issue_type="Task"
+            )
+
+        assert self.server.requests == []
+
+    @patch.object(Jira, "get_projects", return_value={"TEST": "Test Project"})
+    def test_send_findings_bulk_invalid_project_key(self, mock_get_projects):
+        # To disable vulture
+        mock_get_projects = mock_get_projects
+
+        with pytest.raises(JiraInvalidProjectKeyError):
+            self.jira_integration.send_findings_bulk(
+                findings=self.get_findings(1), project_key="OTHER", issue_type="Bug"
+            )
+
+        assert self.server.requests == []
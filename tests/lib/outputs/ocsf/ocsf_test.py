@@ -1,7 +1,9 @@
+import gzip
 import json
 from datetime import datetime, timezone
 from io import StringIO
 
+import pytest
 import requests
 from freezegun import freeze_time
 from mock import patch
@@ -260,6 +262,116 @@ class TestOCSF:
         content = mock_file.read()
         assert json.loads(content) == expected_json_output
 
+    @pytest.mark.parametrize(
+        "finding_output",
+        [
+            generate_finding_output(
+                status="FAIL",
+                severity="critical",
+                timestamp=datetime.now(),
+                resource_tags={"env": "prod", "teams": ["a", "b"]},
+                compliance={"CIS-2.0": ["1.1", "1.2"]},
+                remediation_recommendation_url="https://example.com",
+            ),
+            generate_finding_output(
+                muted=True, severity="informational", timestamp=1700000000
+            ),
+            generate_finding_output(provider="azure", partition=None),
+            generate_finding_output(provider="kubernetes", region="namespace: default"),
+        ],
+    )
+    def test_write_findings_matches_transform(self, tmp_path, finding_output):
+        detection_finding = OCSF([finding_output]).data[0]
+        output = OCSF(findings=[], file_path=str(tmp_path / "output.ocsf.json"))
+
+        output.write_findings([finding_output])
+
+        with open(tmp_path / "output.ocsf.json") as output_file:
+            assert json.load(output_file) == [
+                json.loads(detection_finding.json(exclude_none=True))
+            ]
+
+    def test_get_detection_finding_without_organization(self):
+        finding_output = generate_finding_output(provider="github")
+        finding_output.account_organization_uid = None
+        finding_output.account_organization_name = None
+
+        finding_dict = OCSF.get_detection_finding(finding_output).dict(
+            exclude_none=True
+        )
+
+        assert "tenant_uid" not in finding_dict["metadata"]
+        assert finding_dict["cloud"]["org"] == {}
+
+    def test_write_findings_without_organization_matches_transform(self, tmp_path):
+        finding_output = generate_finding_output(provider="github")
+        finding_output.account_organization_uid = None
+        finding_output.account_organization_name = None
+        detection_finding = OCSF([finding_output]).data[0]
+        output = OCSF(findings=[], file_path=str(tmp_path / "output.ocsf.ndjson"))
+
+        output.write_findings([finding_output])
+
+        with open(tmp_path / "output.ocsf.ndjson") as output_file:
+            assert json.loads(output_file.read()) == json.loads(
+                detection_finding.json(exclude_none=True)
+            )
+
+    def test_write_findings(self, tmp_path):
+        findings = [
+            generate_finding_output(status="FAIL", resource_uid="resource-1"),
+            generate_finding_output(status="PASS", resource_uid="resource-2"),
+        ]
+        output = OCSF(findings=[], file_path=str(tmp_path / "output.ocsf.json"))
+
+        output.write_findings(iter(findings))
+
+        assert output.file_descriptor.closed
+        assert output.data == []
+        with open(tmp_path / "output.ocsf.json") as output_file:
+            content = output_file.read()
+        assert "\n" not in content
+        assert json.loads(content) == [
+            json.loads(finding.json(exclude_none=True))
+            for finding in OCSF(findings).data
+        ]
+
+    def test_write_findings_ndjson_gzip(self, tmp_path):
+        findings = [
+            generate_finding_output(status="FAIL", resource_uid="resource-1"),
+            generate_finding_output(status="PASS", resource_uid="resource-2"),
+        ]
+        output = OCSF(findings=[], file_path=str(tmp_path / "output.ocsf.ndjson.gz"))
+
+        output.write_findings(findings)
+
+        with gzip.open(tmp_path / "output.ocsf.ndjson.gz", "rt") as output_file:
+            lines = output_file.read().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            json.loads(OCSF.get_detection_finding(finding).json(exclude_none=True))
+            for finding in findings
+        ]
+
+    def test_write_findings_ndjson_only_by_extension(self, tmp_path):
+        output_directory = tmp_path / "exports.ndjson"
+        output_directory.mkdir()
+        output = OCSF(
+            findings=[], file_path=str(output_directory / "output.ocsf.json.gz")
+        )
+
+        output.write_findings([generate_finding_output()])
+
+        with gzip.open(output_directory / "output.ocsf.json.gz", "rt") as output_file:
+            assert len(json.load(output_file)) == 1
+
+    def test_write_findings_without_findings(self, tmp_path):
+        output = OCSF(findings=[], file_path=str(tmp_path / "output.ocsf.json"))
+
+        output.write_findings([])
+
+        with open(tmp_path / "output.ocsf.json") as output_file:
+            assert json.load(output_file) == []
+
     def test_batch_write_data_to_file_without_findings(self):
         assert not OCSF([])._file_descriptor
 
@@ -0,0 +1,80 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.parquet.parquet import Parquet
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+
+
+class TestParquet:
+    def test_output_transform(self):
+        finding = generate_finding_output(status="FAIL", muted=True)
+        output = Parquet([finding])
+
+        assert output.data == [CSV.get_finding_dict(finding)]
+
+    def test_parquet_write_to_file(self, tmp_path):
+        findings = [
+            generate_finding_output(status="FAIL", severity="critical", muted=True),
+            generate_finding_output(resource_details=""),
+        ]
+        file_path = f"{tmp_path}/prowler-output.parquet"
+
+        output = Parquet(findings, file_path=file_path)
+        output.batch_write_data_to_file()
+
+        assert output.file_descriptor.closed
+        table = pq.read_table(file_path)
+        assert table.column_names == list(CSV.get_finding_dict(findings[0]).keys())
+        assert table.schema.field("MUTED").type == pa.bool_()
+        assert table.schema.field("CHECK_ID").type == pa.dictionary(
+            pa.int32(), pa.string()
+        )
+        assert table.schema.field("FINDING_UID").type == pa.string()
+
+        rows = table.to_pylist()
+        assert rows[0]["STATUS"] == "FAIL"
+        assert rows[0]["SEVERITY"] == "critical"
+        assert rows[0]["MUTED"] is True
+        assert rows[0]["CHECK_ID"] == "service_test_check_id"
+        assert rows[0]["TIMESTAMP"] == str(findings[0].timestamp)
+        assert rows[1]["STATUS"] == "PASS"
+        assert rows[1]["MUTED"] is False
+        assert rows[1]["RESOURCE_DETAILS"] == ""
+
+    def test_parquet_write_in_batches(self, tmp_path):
+        output = Parquet(
+            findings=[generate_finding_output(region="eu-west-1")],
+            file_path=f"{tmp_path}/prowler-output",
+            file_extension=".parquet",
+            from_cli=False,
+        )
+        output.batch_write_data_to_file()
+        output._data.clear()
+        assert not output.file_descriptor.closed
+
+        output.transform(
+            [
+                generate_finding_output(region="us-east-1"),
+                generate_finding_output(region="us-east-1"),
+            ]
+        )
+        output.close_file = True
+        output.batch_write_data_to_file()
+        assert output.file_descriptor.closed
+
+        parquet_file = pq.ParquetFile(f"{tmp_path}/prowler-output.parquet")
+        assert parquet_file.metadata.num_row_groups == 2
+        assert parquet_file.read().column("REGION").to_pylist() == [
+            "eu-west-1",
+            "us-east-1",
+            "us-east-1",
+        ]
+
+    def test_batch_write_data_to_file_without_findings(self):
+        assert not Parquet([])._file_descriptor
+
+    def test_parquet_with_file_path(self):
+        parquet = Parquet(findings=[], file_path="test.parquet")
+
+        assert parquet.file_extension == ".parquet"
@@ -0,0 +1,210 @@
+from types import SimpleNamespace
+
+from prowler.lib.outputs.compliance.compliance import display_compliance_table
+from prowler.lib.outputs.statistics import FindingsStatistics
+from tests.lib.outputs.compliance.fixtures import (
+    MITRE_ATTACK_AWS,
+    MITRE_ATTACK_AWS_NAME,
+)
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+
+
+class TestFindingsStatistics:
+    def test_get_stats(self):
+        findings_statistics = FindingsStatistics(
+            [
+                generate_finding_output(
+                    status="PASS", severity="critical", resource_uid="resource_1"
+                ),
+                generate_finding_output(
+                    status="FAIL", severity="high", resource_uid="resource_1"
+                ),
+                generate_finding_output(
+                    status="FAIL",
+                    severity="low",
+                    muted=True,
+                    resource_uid="resource_2",
+                ),
+                generate_finding_output(status="MANUAL", resource_uid="resource_3"),
+            ]
+        )
+
+        stats = findings_statistics.get_stats()
+
+        assert stats["total_pass"] == 1
+        assert stats["total_muted_pass"] == 0
+        assert stats["total_fail"] == 2
+        assert stats["total_muted_fail"] == 1
+        assert stats["resources_count"] == 3
+        assert stats["findings_count"] == 3
+        assert stats["total_critical_severity_pass"] == 1
+        assert stats["total_critical_severity_fail"] == 0
+        assert stats["total_high_severity_fail"] == 1
+        assert stats["total_low_severity_fail"] == 1
+        assert stats["total_informational_severity_pass"] == 0
+        assert stats["all_fails_are_muted"] is False
+        assert findings_statistics.findings_count == 4
+        assert findings_statistics.manual_count == 1
+        assert findings_statistics.has_results()
+
+    def test_add_incrementally(self):
+        findings_statistics = FindingsStatistics()
+        assert not findings_statistics.has_results()
+
+        findings_statistics.add(generate_finding_output(status="MANUAL"))
+        assert not findings_statistics.has_results()
+
+        findings_statistics.add(generate_finding_output(status="FAIL", muted=True))
+        assert findings_statistics.has_results()
+        assert findings_statistics.get_stats()["all_fails_are_muted"] is True
+
+    def test_services_and_check_status_count(self):
+        findings_statistics = FindingsStatistics(
+            [
+                generate_finding_output(
+                    status="FAIL",
+                    severity="critical",
+                    service_name="s3",
+                    check_id="s3_bucket_public_access",
+                ),
+                generate_finding_output(
+                    status="FAIL",
+                    severity="critical",
+                    service_name="s3",
+                    check_id="s3_bucket_public_access",
+                ),
+                generate_finding_output(
+                    status="PASS",
+                    muted=True,
+                    service_name="ec2",
+                    check_id="ec2_instance_public_ip",
+                ),
+            ]
+        )
+
+        assert findings_statistics.services == {
+            "s3": {
+                "Provider": "aws",
+                "Total": 2,
+                "Pass": 0,
+                "Critical": 2,
+                "High": 0,
+                "Medium": 0,
+                "Low": 0,
+                "Muted": 0,
+            },
+            "ec2": {
+                "Provider": "aws",
+                "Total": 1,
+                "Pass": 1,
+                "Critical": 0,
+                "High": 0,
+                "Medium": 0,
+                "Low": 0,
+                "Muted": 1,
+            },
+        }
+        assert findings_statistics.check_status_count == {
+            ("s3_bucket_public_access", "FAIL", False): 2,
+            ("ec2_instance_public_ip", "PASS", True): 1,
+        }
+
+    def test_check_report_findings(self):
+        check_metadata = SimpleNamespace(
+            CheckID="ec2_instance_public_ip",
+            ServiceName="ec2",
+            Provider="aws",
+            Severity="medium",
+        )
+        findings = [
+            SimpleNamespace(check_metadata=check_metadata, status="FAIL", muted=False),
+            SimpleNamespace(check_metadata=check_metadata, status="PASS", muted=False),
+        ]
+
+        findings_statistics = FindingsStatistics(findings)
+
+        assert findings_statistics.fail_count == 1
+        assert findings_statistics.pass_count == 1
+        assert findings_statistics.services["ec2"]["Medium"] == 1
+        assert findings_statistics.resources == set()
+
+    def test_get_framework_check_status_count(self):
+        other_compliance = SimpleNamespace(Framework="CIS")
+        bulk_checks_metadata = {
+            "ec2_instance_public_ip": SimpleNamespace(
+                Compliance=[MITRE_ATTACK_AWS, other_compliance]
+            ),
+            "s3_bucket_public_access": SimpleNamespace(Compliance=[other_compliance]),
+        }
+        findings_statistics = FindingsStatistics(
+            [
+                generate_finding_output(
+                    status="FAIL", service_name="ec2", check_id="ec2_instance_public_ip"
+                ),
+                generate_finding_output(
+                    status="FAIL", service_name="ec2", check_id="ec2_instance_public_ip"
+                ),
+                generate_finding_output(
+                    status="PASS",
+                    muted=True,
+                    service_name="ec2",
+                    check_id="ec2_instance_public_ip",
+                ),
+                generate_finding_output(
+                    status="FAIL", service_name="s3", check_id="s3_bucket_public_access"
+                ),
+            ]
+        )
+
+        # The checks without compliances in the framework are skipped
+        assert list(
+            findings_statistics.get_framework_check_status_count(
+                bulk_checks_metadata,
+                lambda compliance: compliance.Framework == MITRE_ATTACK_AWS.Framework,
+            )
+        ) == [
+            ([MITRE_ATTACK_AWS], "FAIL", False, 2),
+            ([MITRE_ATTACK_AWS], "PASS", True, 1),
+        ]
+
+    def test_compliance_table_tallies_findings_per_check(self, capsys):
+        bulk_checks_metadata = {
+            "ec2_instance_public_ip": SimpleNamespace(Compliance=[MITRE_ATTACK_AWS]),
+            "guardduty_is_enabled": SimpleNamespace(Compliance=[MITRE_ATTACK_AWS]),
+        }
+        findings = [
+            generate_finding_output(
+                status="FAIL", service_name="ec2", check_id="ec2_instance_public_ip"
+            ),
+            generate_finding_output(
+                status="FAIL", service_name="ec2", check_id="ec2_instance_public_ip"
+            ),
+            generate_finding_output(
+                status="PASS",
+                service_name="guardduty",
+                check_id="guardduty_is_enabled",
+            ),
+            generate_finding_output(
+                status="FAIL",
+                muted=True,
+                service_name="guardduty",
+                check_id="guardduty_is_enabled",
+            ),
+        ]
+
+        display_compliance_table(
+            findings,
+            bulk_checks_metadata,
+            MITRE_ATTACK_AWS_NAME,
+            "output_filename",
+            "output_directory",
+            False,
+            findings_statistics=FindingsStatistics(findings),
+        )
+
+        output = capsys.readouterr().out
+        assert "50.0% (2) FAIL" in output
+        assert "25.0% (1) PASS" in output
+        assert "25.0% (1) MUTED" in output
+        assert "Initial Access" in output
+        assert "FAIL(2)" in output
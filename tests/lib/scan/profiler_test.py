@@ -0,0 +1,224 @@
+import json
+from threading import Barrier, Thread
+
+from mock import MagicMock
+
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.scan.profiler import (
+    Profiler,
+    display_profile_summary,
+    get_profiler,
+    profile,
+    profile_call,
+    profiled,
+    set_profiler,
+)
+from prowler.providers.common.context import ScanContext
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+
+
+class FakeClock:
+    """Clock that only moves when the test advances it"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class Writer:
+    @profiled("output")
+    def write(self, clock):
+        clock.advance(3)
+        return "written"
+
+
+class TestProfiler:
+    def test_nested_timings(self):
+        clock = FakeClock()
+        profiler = Profiler(clock=clock)
+
+        with profiler.time("check", "ec2_ami_public"):
+            clock.advance(1)
+            # The service is built by the first check that uses it
+            with profiler.time("service", "EC2"):
+                clock.advance(5)
+            clock.advance(2)
+        with profiler.time("check", "ec2_ami_public"):
+            clock.advance(4)
+
+        check = profiler.timings[("check", "ec2_ami_public")]
+        service = profiler.timings[("service", "EC2")]
+        assert (check.count, check.total, check.self_time, check.max) == (
+            2,
+            12.0,
+            7.0,
+            8.0,
+        )
+        assert (service.count, service.total, service.self_time, service.max) == (
+            1,
+            5.0,
+            5.0,
+            5.0,
+        )
+        assert [
+            (category, name) for category, name, _ in profiler.get_slowest(limit=1)
+        ] == [("check", "ec2_ami_public")]
+
+    def test_profile_without_profiler(self):
+        def call():
+            return "result"
+
+        with profile("check", "ec2_ami_public"):
+            pass
+
+        assert get_profiler() is None
+        assert profile_call("threading_call", "EC2.call", call) is call
+
+    def test_profile_with_profiler(self):
+        clock = FakeClock()
+        profiler = Profiler(clock=clock)
+        set_profiler(profiler)
+        try:
+            with profile("check", "ec2_ami_public"):
+                clock.advance(2)
+            for _ in range(3):
+                profile_call("threading_call", "EC2._describe", clock.advance)(1)
+            assert Writer().write(clock) == "written"
+        finally:
+            set_profiler(None)
+
+        assert profiler.timings[("check", "ec2_ami_public")].total == 2.0
+        assert profiler.timings[("threading_call", "EC2._describe")].count == 3
+        assert profiler.timings[("threading_call", "EC2._describe")].total == 3.0
+        assert profiler.timings[("output", "Writer.write")].total == 3.0
+
+    def test_profile_with_scan_context(self):
+        global_profiler = Profiler()
+        scan_profiler = Profiler()
+        set_profiler(global_profiler)
+        try:
+            with ScanContext(MagicMock(), scan_profiler).activate():
+                assert get_profiler() is scan_profiler
+                with profile("check", "ec2_ami_public"):
+                    pass
+            # A scan that is not profiled is not counted in the global profiler
+            with ScanContext(MagicMock()).activate():
+                assert get_profiler() is None
+                with profile("check", "s3_bucket_public_access"):
+                    pass
+            assert get_profiler() is global_profiler
+        finally:
+            set_profiler(None)
+
+        assert list(scan_profiler.timings) == [("check", "ec2_ami_public")]
+        assert global_profiler.timings == {}
+
+    def test_profile_concurrent_scan_contexts(self):
+        profilers = [Profiler(), Profiler(), None]
+        barrier = Barrier(len(profilers))
+
+        def run_scan(index, profiler):
+            with ScanContext(MagicMock(), profiler).activate():
+                # All the scans are active at the same time
+                barrier.wait()
+                with profile("check", f"check_{index}"):
+                    barrier.wait()
+
+        threads = [
+            Thread(target=run_scan, args=(index, profiler))
+            for index, profiler in enumerate(profilers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert list(profilers[0].timings) == [("check", "check_0")]
+        assert list(profilers[1].timings) == [("check", "check_1")]
+        assert get_profiler() is None
+
+    def test_output_writers(self, tmp_path):
+        profiler = Profiler()
+        set_profiler(profiler)
+        try:
+            csv = CSV(
+                findings=[generate_finding_output()],
+                file_path=str(tmp_path / "output.csv"),
+            )
+            csv.batch_write_data_to_file()
+        finally:
+            set_profiler(None)
+
+        assert ("output", "CSV.transform") in profiler.timings
+        assert ("output", "CSV.batch_write_data_to_file") in profiler.timings
+
+    def test_save(self, tmp_path):
+        clock = FakeClock()
+        profiler = Profiler(clock=clock)
+        with profiler.time("service", "S3"):
+            clock.advance(1.5)
+        with profiler.time("service", "EC2"):
+            clock.advance(2.5)
+        profiler.add_api_call("s3", "ListBuckets")
+        profiler.add_api_call("ec2", "DescribeInstances", retries=2, error=True)
+        profiler.add_api_call("ec2", "DescribeInstances")
+
+        path = str(tmp_path / "output.profile.json")
+        profiler.save(path)
+
+        with open(path) as profile_file:
+            assert json.load(profile_file) == {
+                "duration": 4.0,
+                "timings": [
+                    {
+                        "category": "service",
+                        "name": "EC2",
+                        "count": 1,
+                        "total": 2.5,
+                        "self": 2.5,
+                        "max": 2.5,
+                    },
+                    {
+                        "category": "service",
+                        "name": "S3",
+                        "count": 1,
+                        "total": 1.5,
+                        "self": 1.5,
+                        "max": 1.5,
+                    },
+                ],
+                "api_calls": [
+                    {
+                        "service": "ec2",
+                        "operation": "DescribeInstances",
+                        "calls": 2,
+                        "retries": 2,
+                        "errors": 1,
+                    },
+                    {
+                        "service": "s3",
+                        "operation": "ListBuckets",
+                        "calls": 1,
+                        "retries": 0,
+                        "errors": 0,
+                    },
+                ],
+            }
+
+    def test_display_profile_summary(self, capsys):
+        clock = FakeClock()
+        profiler = Profiler(clock=clock)
+        with profiler.time("check", "ec2_ami_public"):
+            clock.advance(1)
+        profiler.add_api_call("ec2", "DescribeImages")
+
+        display_profile_summary(profiler)
+
+        output = capsys.readouterr().out
+        assert "ec2_ami_public" in output
+        assert "DescribeImages" in output
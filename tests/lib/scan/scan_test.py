@@ -1,9 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
 from importlib.machinery import FileFinder
 from pkgutil import ModuleInfo
 from unittest import mock
 
 import pytest
+from boto3 import client, session
 from mock import MagicMock, patch
+from moto import mock_aws
 
 from prowler.lib.scan.exceptions.exceptions import (
     ScanInvalidCategoryError,
@@ -13,9 +16,10 @@ from prowler.lib.scan.exceptions.exceptions import (
     ScanInvalidSeverityError,
     ScanInvalidStatusError,
 )
+from prowler.lib.scan.profiler import Profiler, get_profiler
 from prowler.lib.scan.scan import Scan, get_service_checks_to_execute
 from tests.lib.outputs.fixtures.fixtures import generate_finding_output
-from tests.providers.aws.utils import set_mocked_aws_provider
+from tests.providers.aws.utils import AWS_REGION_EU_WEST_1, set_mocked_aws_provider
 
 finding = generate_finding_output(
     status="PASS",
@@ -392,3 +396,98 @@ class TestScan:
         results = list(scan.scan(custom_checks_metadata))
 
         assert results[0] == (100.0, [])
+
+    @mock_aws
+    def test_scan_concurrent_scans_are_isolated(self):
+        sts_client = client("sts", region_name=AWS_REGION_EU_WEST_1)
+        accounts = {
+            "111111111111": ("repository-a", True),
+            "222222222222": ("repository-b", False),
+        }
+        providers = {}
+        for account, (repository_name, scan_on_push) in accounts.items():
+            # Each scan uses the credentials of a role of its account
+            credentials = sts_client.assume_role(
+                RoleArn=f"arn:aws:iam::{account}:role/prowler",
+                RoleSessionName="prowler",
+            )["Credentials"]
+            audit_session = session.Session(
+                aws_access_key_id=credentials["AccessKeyId"],
+                aws_secret_access_key=credentials["SecretAccessKey"],
+                aws_session_token=credentials["SessionToken"],
+                region_name=AWS_REGION_EU_WEST_1,
+            )
+            audit_session.client("ecr").create_repository(
+                repositoryName=repository_name,
+                imageScanningConfiguration={"scanOnPush": scan_on_push},
+            )
+            providers[account] = set_mocked_aws_provider(
+                [AWS_REGION_EU_WEST_1],
+                audited_account=account,
+                audited_account_arn=f"arn:aws:iam::{account}:root",
+                audit_session=audit_session,
+                create_default_organization=False,
+            )
+
+        def run_scan(provider):
+            scan = Scan(
+                provider, checks=["ecr_repositories_scan_images_on_push_enabled"]
+            )
+            findings = [finding for _, findings in scan.scan() for finding in findings]
+            return scan, findings
+
+        with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+            scans = {
+                account: executor.submit(run_scan, provider)
+                for account, provider in providers.items()
+            }
+
+        for account, (repository_name, scan_on_push) in accounts.items():
+            scan, findings = scans[account].result()
+            assert len(findings) == 1
+            assert findings[0].account_uid == account
+            assert findings[0].resource_name == repository_name
+            assert (
+                findings[0].resource_uid
+                == f"arn:aws:ecr:{AWS_REGION_EU_WEST_1}:{account}:repository/{repository_name}"
+            )
+            assert findings[0].status == ("PASS" if scan_on_push else "FAIL")
+            # The services of the scan are released when it finishes
+            assert scan.context.services == {}
+
+    @mock_aws
+    def test_scan_profiler(self):
+        client("ecr", region_name=AWS_REGION_EU_WEST_1).create_repository(
+            repositoryName="repository"
+        )
+        provider = set_mocked_aws_provider([AWS_REGION_EU_WEST_1])
+        # A deterministic clock that moves one second every time it is read
+        ticks = iter(range(1_000_000))
+        profiler = Profiler(clock=lambda: float(next(ticks)))
+
+        scan = Scan(
+            provider,
+            checks=["ecr_repositories_scan_images_on_push_enabled"],
+            profiler=profiler,
+        )
+        findings = [finding for _, findings in scan.scan() for finding in findings]
+
+        assert len(findings) == 1
+        assert scan.profiler is profiler
+        # The profiler is only active while the scan runs
+        assert get_profiler() is None
+        check = profiler.timings[
+            ("check", "ecr_repositories_scan_images_on_push_enabled")
+        ]
+        service = profiler.timings[("service", "ECR")]
+        assert check.count == 1
+        assert service.count == 1
+        # The service is built by the check, so it is not part of the check self time
+        assert check.self_time == check.total - service.total
+        assert (
+            profiler.timings[
+                ("threading_call", "ECR._describe_registries_and_repositories")
+            ].count
+            == 1
+        )
+        assert profiler.api_calls[("ecr", "DescribeRepositories")]["calls"] == 1
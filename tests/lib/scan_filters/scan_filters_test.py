@@ -1,4 +1,8 @@
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import (
+    AuditResources,
+    is_resource_filtered,
+    is_service_filtered,
+)
 
 
 class Test_Scan_Filters:
@@ -14,3 +18,57 @@ class Test_Scan_Filters:
             "arn:aws:iam::123456789012:user/test1", audit_resources
         )
         assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+
+    def test_is_resource_filtered_audit_resources(self):
+        audit_resources = AuditResources(
+            [
+                "arn:aws:iam::123456789012:user/test_user",
+                "arn:aws:s3:::test_bucket",
+            ]
+        )
+        assert is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test_user", audit_resources
+        )
+        assert not is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test1", audit_resources
+        )
+        assert audit_resources == [
+            "arn:aws:iam::123456789012:user/test_user",
+            "arn:aws:s3:::test_bucket",
+        ]
+
+    def test_audit_resources_index(self):
+        audit_resources = AuditResources(
+            [
+                "arn:aws:ec2:us-east-1:123456789012:instance/i-1234567890abcdef0",
+                "arn:aws:ec2:eu-west-1:123456789012:security-group/sg-12345678",
+                "arn:aws:iam::123456789012:role/test_role",
+                "arn:aws:lambda:eu-west-1:123456789012:function:test_function",
+                "not-an-arn",
+            ]
+        )
+        assert audit_resources.regions == {"us-east-1", "eu-west-1"}
+        assert audit_resources.resource_types == {
+            ("ec2", "instance"),
+            ("ec2", "security-group"),
+            ("iam", "role"),
+            ("lambda", "function"),
+        }
+        assert audit_resources.has_resources("ec2")
+        assert audit_resources.has_resources("ec2", "us-east-1", "instance")
+        assert not audit_resources.has_resources("ec2", "us-east-1", "security-group")
+        assert not audit_resources.has_resources("ec2", "us-west-2")
+        assert audit_resources.has_resources("iam", resource_type="role")
+        assert not audit_resources.has_resources("iam", resource_type="user")
+        assert not audit_resources.has_resources("s3")
+
+    def test_is_service_filtered(self):
+        audit_resources = [
+            "arn:aws:iam::123456789012:user/test_user",
+            "arn:aws:s3:::test_bucket",
+        ]
+        assert is_service_filtered("iam", audit_resources)
+        assert is_service_filtered("iam", audit_resources, resource_type="user")
+        assert not is_service_filtered("iam", audit_resources, resource_type="role")
+        assert not is_service_filtered("ec2", audit_resources, "us-east-1")
+        assert is_service_filtered("s3", AuditResources(audit_resources), "")
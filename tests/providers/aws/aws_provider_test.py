@@ -964,7 +964,7 @@ aws:
         )
 
         with patch(
-            "prowler.providers.aws.aws_provider.parse_json_file",
+            "prowler.providers.aws.lib.regions.regions.parse_json_file",
             return_value={
                 "services": {
                     "ec2": {
@@ -1002,7 +1002,7 @@ aws:
         aws_provider = AwsProvider()
 
         with patch(
-            "prowler.providers.aws.aws_provider.parse_json_file",
+            "prowler.providers.aws.lib.regions.regions.parse_json_file",
             return_value={
                 "services": {
                     "ec2": {
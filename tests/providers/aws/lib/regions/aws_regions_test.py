@@ -0,0 +1,15 @@
+from prowler.providers.aws.aws_provider import AwsProvider
+from prowler.providers.aws.lib.regions.regions import (
+    get_aws_regions,
+    read_aws_regions_file,
+)
+
+
+class TestAWSRegions:
+    def test_read_aws_regions_file(self):
+        data = read_aws_regions_file()
+
+        assert "us-east-1" in data["services"]["ec2"]["regions"]["aws"]
+
+    def test_get_aws_regions(self):
+        assert get_aws_regions() == AwsProvider.get_regions(partition=None)
@@ -1,3 +1,4 @@
+import gzip
 from os import path, remove
 from pathlib import Path
 from unittest import mock
@@ -15,7 +16,7 @@ from prowler.providers.aws.lib.s3.exceptions.exceptions import (
     S3InvalidBucketNameError,
     S3InvalidBucketRegionError,
 )
-from prowler.providers.aws.lib.s3.s3 import S3
+from prowler.providers.aws.lib.s3.s3 import S3, S3_MULTIPART_MAX_CONCURRENCY
 from prowler.providers.common.models import Connection
 from tests.lib.outputs.compliance.fixtures import ISO27001_2013_AWS
 from tests.lib.outputs.fixtures.fixtures import generate_finding_output
@@ -301,6 +302,107 @@ class TestS3:
             == "text/csv"
         )
 
+    @mock_aws
+    def test_s3_connection_pool(self):
+        current_session = boto3.session.Session(region_name=AWS_REGION_US_EAST_1)
+
+        s3 = S3(
+            session=current_session,
+            bucket_name=S3_BUCKET_NAME,
+            output_directory=CURRENT_DIRECTORY,
+            max_workers=4,
+        )
+
+        # Every part uploaded concurrently by every upload thread gets a connection
+        assert s3._transfer_config.max_concurrency == S3_MULTIPART_MAX_CONCURRENCY
+        assert (
+            s3._session.meta.config.max_pool_connections
+            == 4 * S3_MULTIPART_MAX_CONCURRENCY
+        )
+
+    @mock_aws
+    def test_send_to_s3_bucket_multiple_outputs(self):
+        # Create bucket
+        current_session = boto3.session.Session(region_name=AWS_REGION_US_EAST_1)
+        client = current_session.client("s3")
+        client.create_bucket(Bucket=S3_BUCKET_NAME)
+
+        s3 = S3(
+            session=current_session,
+            bucket_name=S3_BUCKET_NAME,
+            output_directory=CURRENT_DIRECTORY,
+            max_workers=2,
+        )
+
+        csv = CSV(findings=[FINDING], file_extension=".csv")
+        html = HTML(findings=[FINDING], file_extension=".html")
+        compliance = [
+            AWSISO27001(
+                findings=[FINDING],
+                compliance=ISO27001_2013_AWS,
+                file_extension=".csv",
+            )
+            for _ in range(3)
+        ]
+
+        s3_send_result = s3.send_to_bucket(
+            outputs={"regular": [csv, html], "compliance": compliance}
+        )
+
+        assert s3_send_result["failure"] == {}
+        assert len(s3_send_result["success"][".csv"]) == 4
+        assert len(s3_send_result["success"][".html"]) == 1
+        # Results keep the order of the outputs
+        assert s3_send_result["success"][".csv"][0].endswith(
+            f"/csv/{path.basename(csv.file_descriptor.name)}"
+        )
+        assert all(
+            "/compliance/" in object_name
+            for object_name in s3_send_result["success"][".csv"][1:]
+        )
+        for object_names in s3_send_result["success"].values():
+            for object_name in object_names:
+                client.head_object(Bucket=S3_BUCKET_NAME, Key=object_name)
+
+    @mock_aws
+    def test_send_to_s3_bucket_compressed(self):
+        # Create bucket
+        current_session = boto3.session.Session(region_name=AWS_REGION_US_EAST_1)
+        client = current_session.client("s3")
+        client.create_bucket(Bucket=S3_BUCKET_NAME)
+
+        s3 = S3(
+            session=current_session,
+            bucket_name=S3_BUCKET_NAME,
+            output_directory=CURRENT_DIRECTORY,
+            compress=True,
+        )
+
+        extension = ".csv"
+        csv_file = f"test-compressed{extension}"
+        csv = CSV(
+            findings=[FINDING],
+            file_path=f"{CURRENT_DIRECTORY}/{csv_file}",
+        )
+        csv.batch_write_data_to_file()
+
+        s3_send_result = s3.send_to_bucket(outputs={"regular": [csv]})
+
+        assert s3_send_result["failure"] == {}
+        uploaded_object_name = s3_send_result["success"][extension][0]
+        assert uploaded_object_name.endswith(f"/csv/{csv_file}")
+
+        uploaded_object = client.get_object(
+            Bucket=S3_BUCKET_NAME,
+            Key=uploaded_object_name,
+        )
+        assert uploaded_object["ContentType"] == "text/csv"
+        assert uploaded_object["ContentEncoding"] == "gzip"
+        with open(f"{CURRENT_DIRECTORY}/{csv_file}", "rb") as file:
+            assert gzip.decompress(uploaded_object["Body"].read()) == file.read()
+
+        remove(f"{CURRENT_DIRECTORY}/{csv_file}")
+
     def test_get_get_object_path_with_prowler(self):
         output_directory = "/Users/admin/prowler/"
         assert (
@@ -323,6 +425,7 @@ class TestS3:
 
     def test_generate_subfolder_name_by_extension_json_ocsf(self):
         assert S3.generate_subfolder_name_by_extension(".ocsf.json") == "json-ocsf"
+        assert S3.generate_subfolder_name_by_extension(".ocsf.ndjson") == "ndjson-ocsf"
 
     @mock_aws
     def test_test_connection_S3(self):
@@ -1,6 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from botocore.exceptions import ClientError
 from mock import patch
+from moto import mock_aws
 
+from prowler.lib.scan.profiler import Profiler, set_profiler
 from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.common.context import ScanContext
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_ARN,
     AWS_ACCOUNT_NUMBER,
@@ -152,3 +159,42 @@ class TestAWSService:
             service.get_unknown_arn(region="eu-west-1", resource_type="bucket")
             == f"arn:aws:{service_name}:eu-west-1:{AWS_ACCOUNT_NUMBER}:bucket/unknown"
         )
+
+    @mock_aws
+    def test_AWSService_profile_api_calls(self):
+        provider = set_mocked_aws_provider()
+        profiler = Profiler()
+        set_profiler(profiler)
+        try:
+            service = AWSService("s3", provider)
+            service.client.list_buckets()
+            service.client.list_buckets()
+            with pytest.raises(ClientError):
+                service.client.get_bucket_policy(Bucket="unknown")
+        finally:
+            set_profiler(None)
+        # The calls of the services built when the scan is not profiled are not counted
+        AWSService("s3", provider).client.list_buckets()
+
+        assert profiler.api_calls == {
+            ("s3", "ListBuckets"): {"calls": 2, "retries": 0, "errors": 0},
+            ("s3", "GetBucketPolicy"): {"calls": 1, "retries": 0, "errors": 1},
+        }
+
+    @mock_aws
+    def test_AWSService_profile_api_calls_per_scan(self):
+        provider = set_mocked_aws_provider()
+        profiler = Profiler()
+        with ScanContext(provider, profiler).activate():
+            profiled_service = AWSService("s3", provider)
+        with ScanContext(provider).activate():
+            unprofiled_service = AWSService("s3", provider)
+
+        # The calls are counted in the profiler of the scan that built the service, from any thread
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            executor.submit(profiled_service.client.list_buckets).result()
+            executor.submit(unprofiled_service.client.list_buckets).result()
+
+        assert profiler.api_calls == {
+            ("s3", "ListBuckets"): {"calls": 1, "retries": 0, "errors": 0},
+        }
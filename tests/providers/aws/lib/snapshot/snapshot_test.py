@@ -0,0 +1,147 @@
+import socket
+from unittest import mock
+
+import pytest
+from boto3 import client, session
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from prowler.lib.scan.scan import Scan
+from prowler.providers.aws.aws_provider import AwsProvider
+from prowler.providers.aws.lib.snapshot.snapshot import (
+    SNAPSHOT_RESPONSE_NOT_FOUND,
+    register_snapshot,
+)
+from prowler.providers.common.snapshot import Snapshot
+from tests.providers.aws.utils import AWS_ACCOUNT_NUMBER, AWS_REGION_US_EAST_1
+
+CHECKS = [
+    "cloudtrail_multi_region_enabled",
+    "ecr_repositories_scan_images_on_push_enabled",
+    "iam_policy_allows_privilege_escalation",
+    "iam_user_mfa_enabled_console_access",
+    "s3_bucket_default_encryption",
+    "s3_bucket_object_versioning",
+]
+
+
+def no_network(*args, **kwargs):
+    raise OSError("The network is disabled")
+
+
+def get_findings(provider: AwsProvider) -> list:
+    scan = Scan(provider, checks=CHECKS)
+    return sorted(
+        (
+            finding.metadata.CheckID,
+            finding.status,
+            finding.status_extended,
+            finding.resource_uid,
+        )
+        for _, findings in scan.scan()
+        for finding in findings
+    )
+
+
+def replay_session(path: str) -> session.Session:
+    replay_session = session.Session(
+        aws_access_key_id="snapshot",
+        aws_secret_access_key="snapshot",
+        region_name=AWS_REGION_US_EAST_1,
+    )
+    register_snapshot(replay_session, Snapshot(path, replay=True))
+    return replay_session
+
+
+class TestAWSSnapshot:
+    def test_replay_scan_without_network(self, tmp_path):
+        path = str(tmp_path / "scan.json.gz")
+        with mock_aws():
+            client("s3", region_name=AWS_REGION_US_EAST_1).create_bucket(
+                Bucket="bucket"
+            )
+            iam_client = client("iam")
+            iam_client.create_user(UserName="user")
+            iam_client.create_policy(
+                PolicyName="privilege-escalation",
+                PolicyDocument='{"Version": "2012-10-17", "Statement": [{"Effect": "Allow", "Action": ["iam:PassRole", "ec2:RunInstances"], "Resource": "*"}]}',
+            )
+            client("ecr", region_name=AWS_REGION_US_EAST_1).create_repository(
+                repositoryName="repository"
+            )
+
+            snapshot = Snapshot(path)
+            recorded_findings = get_findings(
+                AwsProvider(regions={AWS_REGION_US_EAST_1}, snapshot=snapshot)
+            )
+            snapshot.save()
+
+        with mock.patch.object(socket.socket, "connect", no_network):
+            provider = AwsProvider(
+                regions={AWS_REGION_US_EAST_1},
+                snapshot=Snapshot(path, replay=True),
+            )
+            replayed_findings = get_findings(provider)
+
+        assert provider.identity.account == AWS_ACCOUNT_NUMBER
+        assert len(recorded_findings) >= len(CHECKS)
+        assert replayed_findings == recorded_findings
+
+    @mock_aws
+    def test_streaming_body_and_credentials(self, tmp_path):
+        path = str(tmp_path / "scan.json.gz")
+        snapshot = Snapshot(path)
+        record_session = session.Session(region_name=AWS_REGION_US_EAST_1)
+        register_snapshot(record_session, snapshot)
+        s3_client = record_session.client("s3")
+        s3_client.create_bucket(Bucket="bucket")
+        s3_client.put_object(Bucket="bucket", Key="key", Body=b"content")
+
+        # The caller still gets the body that was recorded
+        assert (
+            s3_client.get_object(Bucket="bucket", Key="key")["Body"].read()
+            == b"content"
+        )
+        credentials = record_session.client("sts").assume_role(
+            RoleArn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:role/role",
+            RoleSessionName="prowler",
+        )["Credentials"]
+        snapshot.save()
+
+        with mock.patch.object(socket.socket, "connect", no_network):
+            session_to_replay = replay_session(path)
+            replayed_body = (
+                session_to_replay.client("s3")
+                .get_object(Bucket="bucket", Key="key")["Body"]
+                .read()
+            )
+            replayed_credentials = session_to_replay.client("sts").assume_role(
+                RoleArn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:role/role",
+                RoleSessionName="prowler",
+            )["Credentials"]
+
+        assert replayed_body == b"content"
+        assert replayed_credentials["AccessKeyId"] == credentials["AccessKeyId"]
+        assert replayed_credentials["SecretAccessKey"] == "REDACTED"
+        assert replayed_credentials["SessionToken"] == "REDACTED"
+
+    @mock_aws
+    def test_replay_errors(self, tmp_path):
+        path = str(tmp_path / "scan.json.gz")
+        snapshot = Snapshot(path)
+        record_session = session.Session(region_name=AWS_REGION_US_EAST_1)
+        register_snapshot(record_session, snapshot)
+        with pytest.raises(ClientError):
+            record_session.client("iam").get_user(UserName="user")
+        snapshot.save()
+
+        with mock.patch.object(socket.socket, "connect", no_network):
+            iam_client = replay_session(path).client("iam")
+            # The recorded error is raised again
+            with pytest.raises(iam_client.exceptions.NoSuchEntityException):
+                iam_client.get_user(UserName="user")
+            # The calls that were not recorded fail like any other API error
+            with pytest.raises(ClientError) as error:
+                iam_client.get_user(UserName="other-user")
+
+        assert error.value.response["Error"]["Code"] == SNAPSHOT_RESPONSE_NOT_FOUND
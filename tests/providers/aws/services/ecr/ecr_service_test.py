@@ -273,7 +273,9 @@ class Test_ECR_Service:
             repositoryName=repo_name,
             imageScanningConfiguration={"scanOnPush": True},
         )
-        aws_provider = set_mocked_aws_provider()
+        aws_provider = set_mocked_aws_provider(
+            audit_config={"ecr_images_per_repository": 0}
+        )
         ecr = ECR(aws_provider)
 
         assert len(ecr.registries) == 1
@@ -363,6 +365,95 @@ class Test_ECR_Service:
             == "application/vnd.docker.container.image.v1+json"
         )
 
+    # Test get the latest image details
+    @mock_aws
+    def test_get_image_details_latest_image(self):
+        ecr_client = client("ecr", region_name=AWS_REGION_EU_WEST_1)
+        ecr_client.create_repository(
+            repositoryName=repo_name,
+            imageScanningConfiguration={"scanOnPush": True},
+        )
+        aws_provider = set_mocked_aws_provider()
+        ecr = ECR(aws_provider)
+
+        images_details = (
+            ecr.registries[AWS_REGION_EU_WEST_1].repositories[0].images_details
+        )
+        assert len(images_details) == 1
+        assert images_details[0].image_pushed_at == datetime(2023, 1, 2)
+        assert images_details[0].latest_tag == "test-tag4"
+        assert images_details[0].scan_findings_status == "FAILED"
+        assert images_details[0].scan_findings_severity_count is None
+
+    # Test the scan findings are only requested for the latest images of each repository
+    @mock_aws
+    def test_get_image_details_scan_findings_calls(self):
+        ecr_client = client("ecr", region_name=AWS_REGION_EU_WEST_1)
+        repositories = [f"{repo_name}-{index}" for index in range(3)]
+        for repository in repositories:
+            ecr_client.create_repository(
+                repositoryName=repository,
+                imageScanningConfiguration={"scanOnPush": True},
+            )
+        ecr_client.create_repository(
+            repositoryName=f"{repo_name}-no-scan",
+            imageScanningConfiguration={"scanOnPush": False},
+        )
+        calls = []
+
+        def mock_make_api_call_many_images(self, operation_name, kwarg):
+            calls.append((operation_name, kwarg))
+            if operation_name == "DescribeImages":
+                return {
+                    "imageDetails": [
+                        {
+                            "imageDigest": f"sha256:{kwarg['repositoryName']}-{index}",
+                            "imageTags": [f"tag-{index}"],
+                            "imagePushedAt": datetime(2023, 1, 1, 0, index),
+                            "artifactMediaType": "application/vnd.docker.container.image.v1+json",
+                        }
+                        # The images are not returned in the order they were pushed
+                        for index in reversed(range(50))
+                    ]
+                }
+            return mock_make_api_call(self, operation_name, kwarg)
+
+        with patch(
+            "botocore.client.BaseClient._make_api_call",
+            new=mock_make_api_call_many_images,
+        ):
+            for images_per_repository, scan_findings_calls in [
+                (1, 3),
+                (2, 6),
+                (0, 150),
+            ]:
+                calls.clear()
+                aws_provider = set_mocked_aws_provider(
+                    audit_config={"ecr_images_per_repository": images_per_repository},
+                    create_default_organization=False,
+                )
+                ecr = ECR(aws_provider)
+
+                assert len([call for call in calls if call[0] == "DescribeImages"]) == 3
+                scan_findings = [
+                    call[1]["imageId"]["imageDigest"]
+                    for call in calls
+                    if call[0] == "DescribeImageScanFindings"
+                ]
+                assert len(scan_findings) == scan_findings_calls
+                for repository in ecr.registries[AWS_REGION_EU_WEST_1].repositories:
+                    if not repository.scan_on_push:
+                        assert repository.images_details == []
+                        continue
+                    images_details = repository.images_details
+                    assert len(images_details) == scan_findings_calls // 3
+                    assert images_details[-1].latest_tag == "tag-49"
+                    assert images_details[-1].latest_digest in scan_findings
+                    assert images_details[-1].scan_findings_severity_count.critical == 3
+                    assert images_details == sorted(
+                        images_details, key=lambda image: image.image_pushed_at
+                    )
+
     # Test get ECR Registries Scanning Configuration
     @mock_aws
     def test_get_registry_scanning_configuration(self):
@@ -1,4 +1,7 @@
 from json import dumps
+from random import uniform
+from threading import Lock
+from time import time
 from uuid import uuid4
 
 import botocore
@@ -74,6 +77,38 @@ def mock_make_api_call(self, operation_name, kwargs):
     return make_api_call(self, operation_name, kwargs)
 
 
+class StubbedLastAccessedClient:
+    """
+    IAM client that completes each service last accessed job after the delay of its user
+    """
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.jobs = {}
+        self.in_progress = 0
+        self.max_in_progress = 0
+        self.lock = Lock()
+
+    def generate_service_last_accessed_details(self, Arn):
+        job_id = str(uuid4())
+        with self.lock:
+            self.jobs[job_id] = (Arn, time() + self.delays[Arn])
+            self.in_progress += 1
+            self.max_in_progress = max(self.max_in_progress, self.in_progress)
+        return {"JobId": job_id}
+
+    def get_service_last_accessed_details(self, JobId):
+        arn, completion_time = self.jobs[JobId]
+        if time() < completion_time:
+            return {"JobStatus": "IN_PROGRESS"}
+        with self.lock:
+            self.in_progress -= 1
+        return {
+            "JobStatus": "COMPLETED",
+            "ServicesLastAccessed": [{"ServiceNamespace": arn}],
+        }
+
+
 # Patch every AWS call using Boto3
 @patch("botocore.client.BaseClient._make_api_call", new=mock_make_api_call)
 class Test_IAM_Service:
@@ -1048,3 +1083,228 @@ nTTxU4a7x1naFxzYXK1iQ1vMARKMjDb19QEJIEJKZlDK4uS7yMlf1nFS
         assert iam.entities_attached_to_cloudshell_policy["Users"] == [user_name]
         assert iam.entities_attached_to_cloudshell_policy["Groups"] == [group_name]
         assert iam.entities_attached_to_cloudshell_policy["Roles"] == [role_name]
+
+    # Test IAM bulk inventory with Get Account Authorization Details
+    @mock_aws(config={"iam": {"load_aws_managed_policies": True}})
+    def test_account_authorization_details_same_as_per_entity(self):
+        iam_client = client("iam")
+        policy_arn = iam_client.create_policy(
+            PolicyName="policy1",
+            PolicyDocument=dumps(INLINE_POLICY_NOT_ADMIN),
+        )["Policy"]["Arn"]
+        iam_client.create_policy_version(
+            PolicyArn=policy_arn,
+            PolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {"Effect": "Allow", "Action": "s3:ListBucket", "Resource": "*"}
+                    ],
+                }
+            ),
+            SetAsDefault=True,
+        )
+        for username in ("user1", "user2"):
+            iam_client.create_user(UserName=username)
+        iam_client.put_user_policy(
+            UserName="user1",
+            PolicyName="user-inline",
+            PolicyDocument=dumps(INLINE_POLICY_NOT_ADMIN),
+        )
+        iam_client.attach_user_policy(UserName="user1", PolicyArn=policy_arn)
+        iam_client.create_group(GroupName="group1")
+        iam_client.create_group(GroupName="group2")
+        iam_client.add_user_to_group(GroupName="group1", UserName="user1")
+        iam_client.add_user_to_group(GroupName="group1", UserName="user2")
+        iam_client.put_group_policy(
+            GroupName="group1",
+            PolicyName="group-inline",
+            PolicyDocument=dumps(INLINE_POLICY_NOT_ADMIN),
+        )
+        iam_client.attach_group_policy(
+            GroupName="group1", PolicyArn=SECURITY_AUDIT_POLICY_ARN
+        )
+        iam_client.create_role(
+            RoleName="role1",
+            AssumeRolePolicyDocument=dumps(ASSUME_ROLE_POLICY_DOCUMENT),
+        )
+        iam_client.put_role_policy(
+            RoleName="role1",
+            PolicyName="role-inline",
+            PolicyDocument=dumps(INLINE_POLICY_NOT_ADMIN),
+        )
+        iam_client.attach_role_policy(
+            RoleName="role1", PolicyArn=READ_ONLY_ACCESS_POLICY_ARN
+        )
+
+        bulk_iam = IAM(
+            set_mocked_aws_provider(
+                [AWS_REGION_US_EAST_1], audit_config={"iam_bulk_inventory": True}
+            )
+        )
+        with patch.object(IAM, "_get_account_authorization_details") as bulk_call:
+            per_entity_iam = IAM(
+                set_mocked_aws_provider(
+                    [AWS_REGION_US_EAST_1],
+                    audit_config={"iam_bulk_inventory": False},
+                    create_default_organization=False,
+                )
+            )
+        bulk_call.assert_not_called()
+
+        assert bulk_iam.users == per_entity_iam.users
+        assert bulk_iam.groups == per_entity_iam.groups
+        assert bulk_iam.roles == per_entity_iam.roles
+        assert bulk_iam.policies == per_entity_iam.policies
+        assert list(bulk_iam.policies) == list(per_entity_iam.policies)
+
+        assert bulk_iam.users[0].inline_policies == ["user-inline"]
+        assert bulk_iam.users[0].attached_policies == [
+            {"PolicyName": "policy1", "PolicyArn": policy_arn}
+        ]
+        group1 = next(group for group in bulk_iam.groups if group.name == "group1")
+        assert [user.name for user in group1.users] == ["user1", "user2"]
+        assert group1.inline_policies == ["group-inline"]
+        assert bulk_iam.roles[0].attached_policies[0]["PolicyArn"] == (
+            READ_ONLY_ACCESS_POLICY_ARN
+        )
+        assert bulk_iam.policies[policy_arn].version_id == "v2"
+        assert bulk_iam.policies[policy_arn].document["Statement"][0]["Action"] == (
+            "s3:ListBucket"
+        )
+        assert (
+            bulk_iam.policies[f"{bulk_iam.roles[0].arn}:policy/role-inline"].document
+            == INLINE_POLICY_NOT_ADMIN
+        )
+
+    @mock_aws
+    def test_account_authorization_details_error_falls_back_to_per_entity(self):
+        iam_client = client("iam")
+        iam_client.create_user(UserName="user1")
+        iam_client.put_user_policy(
+            UserName="user1",
+            PolicyName="user-inline",
+            PolicyDocument=dumps(INLINE_POLICY_NOT_ADMIN),
+        )
+
+        def mock_make_api_call_access_denied(self, operation_name, kwargs):
+            if operation_name == "GetAccountAuthorizationDetails":
+                raise botocore.exceptions.ClientError(
+                    {"Error": {"Code": "AccessDenied", "Message": "Access Denied"}},
+                    operation_name,
+                )
+            return mock_make_api_call(self, operation_name, kwargs)
+
+        with patch(
+            "botocore.client.BaseClient._make_api_call",
+            new=mock_make_api_call_access_denied,
+        ):
+            iam = IAM(set_mocked_aws_provider([AWS_REGION_US_EAST_1]))
+
+        assert iam.users[0].inline_policies == ["user-inline"]
+        assert iam.policies[f"{iam.users[0].arn}:policy/user-inline"].document == (
+            INLINE_POLICY_NOT_ADMIN
+        )
+
+    # Test IAM Last Accessed Services jobs
+    @mock_aws
+    def test_get_last_accessed_services_jobs_run_concurrently(self):
+        iam_client = client("iam")
+        for index in range(20):
+            iam_client.create_user(UserName=f"user{index}")
+        iam = IAM(set_mocked_aws_provider([AWS_REGION_US_EAST_1]))
+        delays = {user.arn: uniform(0.1, 0.5) for user in iam.users}
+        iam.client = StubbedLastAccessedClient(delays)
+        iam.last_accessed_services = {}
+
+        with patch(
+            "prowler.providers.aws.services.iam.iam_service.REPORT_JOBS_POLL_INITIAL_DELAY",
+            new=0.01,
+        ):
+            with patch(
+                "prowler.providers.aws.services.iam.iam_service.REPORT_JOBS_POLL_MAX_DELAY",
+                new=0.05,
+            ):
+                start = time()
+                iam._get_last_accessed_services()
+                elapsed = time() - start
+
+        # The jobs are polled together, so it takes as long as the slowest job
+        assert elapsed < max(delays.values()) + 0.5
+        assert elapsed < sum(delays.values()) / 2
+        assert iam.client.max_in_progress == 20
+        assert list(iam.last_accessed_services) == [
+            (user.name, user.arn) for user in iam.users
+        ]
+        for (_, user_arn), services in iam.last_accessed_services.items():
+            assert services == [{"ServiceNamespace": user_arn}]
+
+    @mock_aws
+    def test_get_last_accessed_services_jobs_concurrency_cap(self):
+        iam_client = client("iam")
+        for index in range(12):
+            iam_client.create_user(UserName=f"user{index}")
+        iam = IAM(set_mocked_aws_provider([AWS_REGION_US_EAST_1]))
+        iam.client = StubbedLastAccessedClient(
+            {user.arn: uniform(0.01, 0.1) for user in iam.users}
+        )
+        iam.last_accessed_services = {}
+
+        with patch(
+            "prowler.providers.aws.services.iam.iam_service.LAST_ACCESSED_JOBS_MAX_CONCURRENCY",
+            new=5,
+        ):
+            with patch(
+                "prowler.providers.aws.services.iam.iam_service.REPORT_JOBS_POLL_INITIAL_DELAY",
+                new=0.01,
+            ):
+                iam._get_last_accessed_services()
+
+        assert iam.client.max_in_progress == 5
+        assert len(iam.last_accessed_services) == 12
+
+    @mock_aws
+    def test_privilege_escalation_index(self):
+        iam_client = client("iam")
+        role_name = "test-role"
+        role = iam_client.create_role(
+            RoleName=role_name,
+            AssumeRolePolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {
+                            "Effect": "Allow",
+                            "Principal": {"Service": "ec2.amazonaws.com"},
+                            "Action": "sts:AssumeRole",
+                        }
+                    ],
+                }
+            ),
+        )["Role"]
+        iam_client.put_role_policy(
+            RoleName=role_name,
+            PolicyName="pass-role",
+            PolicyDocument=dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {
+                            "Effect": "Allow",
+                            "Action": ["iam:PassRole", "ec2:RunInstances"],
+                            "Resource": "*",
+                        }
+                    ],
+                }
+            ),
+        )
+        user = iam_client.create_user(UserName="user1")["User"]
+
+        iam = IAM(set_mocked_aws_provider([AWS_REGION_US_EAST_1]))
+        index = iam.privilege_escalation_index
+
+        assert iam.privilege_escalation_index is index
+        assert index.get_privilege_escalation(role["Arn"]) == (
+            "'ec2:RunInstances', 'iam:PassRole'"
+        )
+        assert index.get_privilege_escalation(user["Arn"]) == ""
@@ -0,0 +1,320 @@
+import random
+from functools import lru_cache
+
+from py_iam_expand.actions import InvalidActionHandling, expand_actions
+
+from prowler.providers.aws.services.iam.lib.policy import (
+    _check_admin_access,
+    _get_patterns_from_standard_value,
+    _is_policy_public,
+    check_admin_access,
+    check_full_service_access,
+    get_effective_actions,
+    is_policy_public,
+)
+from prowler.providers.aws.services.iam.lib.policy_engine import (
+    PolicyEngine,
+    policy_engine,
+)
+
+TRUSTED_AWS_ACCOUNT_NUMBER = "123456789012"
+
+ACTION_PATTERNS = [
+    "*",
+    "s3:*",
+    "s3:Get*",
+    "s3:GetObject",
+    "s3:PutObject",
+    "ec2:Describe*",
+    "ec2:RunInstances",
+    "iam:*",
+    "iam:PassRole",
+    "iam:Create*",
+    "lambda:InvokeFunction",
+    "sts:AssumeRole",
+    "kms:Decrypt",
+    "S3:getobject",
+    "invalid:Action",
+]
+RESOURCES = ["*", ["*"], "arn:aws:s3:::bucket/*", ["arn:aws:s3:::bucket", "*"]]
+PRINCIPALS = [
+    "*",
+    {"AWS": "*"},
+    {"AWS": f"arn:aws:iam::{TRUSTED_AWS_ACCOUNT_NUMBER}:root"},
+    {"AWS": ["arn:aws:iam::111122223333:root"]},
+    {"Service": "lambda.amazonaws.com"},
+]
+CONDITIONS = [
+    {"StringEquals": {"aws:SourceAccount": TRUSTED_AWS_ACCOUNT_NUMBER}},
+    {"StringEquals": {"aws:PrincipalOrgID": "o-123456789012"}},
+    {"IpAddress": {"aws:SourceIp": "10.0.0.0/8"}},
+]
+
+
+def generate_policy(generator: random.Random) -> dict:
+    """Returns a random policy document with the Action, NotAction, Resource, Principal and Condition variants"""
+    statements = []
+    for _ in range(generator.randint(1, 4)):
+        statement = {
+            "Effect": generator.choice(["Allow", "Allow", "Deny", " allow ", "Audit"])
+        }
+        patterns = generator.sample(ACTION_PATTERNS, generator.randint(1, 3))
+        value = patterns[0] if len(patterns) == 1 else patterns
+        statement["NotAction" if generator.random() < 0.2 else "Action"] = value
+        if generator.random() < 0.1:
+            statement["NotResource"] = "arn:aws:s3:::bucket"
+        else:
+            statement["Resource"] = generator.choice(RESOURCES)
+        if generator.random() < 0.5:
+            statement["Principal"] = generator.choice(PRINCIPALS)
+        if generator.random() < 0.3:
+            statement["Condition"] = generator.choice(CONDITIONS)
+        statements.append(statement)
+    if len(statements) == 1 and generator.random() < 0.2:
+        return {"Version": "2012-10-17", "Statement": statements[0]}
+    return {"Version": "2012-10-17", "Statement": statements}
+
+
+@lru_cache(maxsize=None)
+def reference_expand_actions(pattern: str) -> frozenset:
+    return frozenset(expand_actions(pattern, InvalidActionHandling.REMOVE))
+
+
+def reference_get_effective_actions(policy: dict) -> set[str]:
+    """get_effective_actions as it was before the policy engine"""
+    if not policy or "Statement" not in policy:
+        return set()
+
+    directly_allowed_actions = set()
+    directly_denied_actions = set()
+    allow_not_action_exclusions = set()
+    deny_not_action_exclusions = set()
+    has_allow_not_action_statement = False
+    has_deny_not_action_statement = False
+
+    statements = policy.get("Statement", [])
+    if not isinstance(statements, list):
+        statements = [statements]
+
+    for statement in statements:
+        effect = statement.get("Effect", "")
+        if not isinstance(effect, str):
+            continue
+        effect = effect.strip().lower()
+        if effect not in ["allow", "deny"]:
+            continue
+
+        expanded = set()
+        for pattern in _get_patterns_from_standard_value(statement.get("Action")):
+            expanded.update(reference_expand_actions(pattern))
+        if effect == "allow":
+            directly_allowed_actions.update(expanded)
+        else:
+            directly_denied_actions.update(expanded)
+
+        not_action_patterns = _get_patterns_from_standard_value(
+            statement.get("NotAction")
+        )
+        if not_action_patterns:
+            expanded_exclusions = set()
+            for pattern in not_action_patterns:
+                expanded_exclusions.update(reference_expand_actions(pattern))
+            if effect == "allow":
+                allow_not_action_exclusions.update(expanded_exclusions)
+                has_allow_not_action_statement = True
+            else:
+                deny_not_action_exclusions.update(expanded_exclusions)
+                has_deny_not_action_statement = True
+
+    all_actions = reference_expand_actions("*")
+    if has_allow_not_action_statement:
+        directly_allowed_actions.update(
+            all_actions.difference(allow_not_action_exclusions)
+        )
+    if has_deny_not_action_statement:
+        directly_denied_actions.update(
+            all_actions.difference(deny_not_action_exclusions)
+        )
+    return directly_allowed_actions.difference(directly_denied_actions)
+
+
+def reference_check_full_service_access(service: str, policy: dict) -> bool:
+    """check_full_service_access as it was before the policy engine"""
+    if not policy or "Statement" not in policy:
+        return False
+
+    service_wildcard = f"{service}:*" if service != "*" else "*"
+    all_target_service_actions = reference_expand_actions(service_wildcard)
+    if not all_target_service_actions.issubset(reference_get_effective_actions(policy)):
+        return False
+
+    actions_allowed_on_all_resources = set()
+    statements = policy.get("Statement", [])
+    if not isinstance(statements, list):
+        statements = [statements]
+    for statement in statements:
+        effect = statement.get("Effect", "")
+        resources = statement.get("Resource", [])
+        if not isinstance(effect, str) or effect.strip().lower() != "allow":
+            continue
+        if isinstance(resources, str):
+            resources = [resources]
+        if "*" not in resources:
+            continue
+
+        statement_specific_allowed = set()
+        for pattern in _get_patterns_from_standard_value(statement.get("Action")):
+            statement_specific_allowed.update(reference_expand_actions(pattern))
+        not_action_patterns = _get_patterns_from_standard_value(
+            statement.get("NotAction")
+        )
+        if not_action_patterns:
+            statement_exclusions = set()
+            for pattern in not_action_patterns:
+                statement_exclusions.update(reference_expand_actions(pattern))
+            statement_specific_allowed.update(
+                reference_expand_actions("*").difference(statement_exclusions)
+            )
+        actions_allowed_on_all_resources.update(
+            action
+            for action in statement_specific_allowed
+            if action in all_target_service_actions
+        )
+
+    return all_target_service_actions.issubset(actions_allowed_on_all_resources)
+
+
+class Test_PolicyEngine:
+    def setup_method(self):
+        policy_engine.clear()
+
+    def test_get_effective_actions_parity(self):
+        generator = random.Random(0)
+        for _ in range(300):
+            policy = generate_policy(generator)
+            assert get_effective_actions(policy) == reference_get_effective_actions(
+                policy
+            )
+
+    def test_check_full_service_access_parity(self):
+        generator = random.Random(1)
+        for _ in range(300):
+            policy = generate_policy(generator)
+            for service in ["s3", "ec2", "iam", "*"]:
+                assert check_full_service_access(
+                    service, policy
+                ) == reference_check_full_service_access(service, policy)
+
+    def test_check_admin_access_parity(self):
+        generator = random.Random(2)
+        for _ in range(300):
+            policy = generate_policy(generator)
+            assert check_admin_access(policy) == _check_admin_access(policy)
+            # The memoized result
+            assert check_admin_access(policy) == _check_admin_access(policy)
+
+    def test_is_policy_public_parity(self):
+        generator = random.Random(3)
+        arguments = [
+            ("", True, [], False),
+            (TRUSTED_AWS_ACCOUNT_NUMBER, False, [], False),
+            (TRUSTED_AWS_ACCOUNT_NUMBER, True, ["s3:PutObject"], False),
+            (TRUSTED_AWS_ACCOUNT_NUMBER, True, [], True),
+        ]
+        for _ in range(300):
+            policy = generate_policy(generator)
+            # is_policy_public expects a list of statements
+            if not isinstance(policy["Statement"], list):
+                continue
+            for argument in arguments:
+                assert is_policy_public(policy, *argument) == _is_policy_public(
+                    policy, *argument
+                )
+
+    def test_same_content_same_document(self):
+        policy = {
+            "Version": "2012-10-17",
+            "Statement": [{"Effect": "Allow", "Action": "s3:*", "Resource": "*"}],
+        }
+        same_policy = {
+            "Statement": [{"Resource": "*", "Action": "s3:*", "Effect": "Allow"}],
+            "Version": "2012-10-17",
+        }
+
+        document = policy_engine.get_document(policy)
+
+        assert policy_engine.get_document(same_policy) is document
+        assert len(policy_engine) == 1
+        assert get_effective_actions(same_policy) == set(document.effective_actions)
+        assert check_full_service_access("s3", same_policy)
+        assert document.memoize(("check_full_service_access", "s3"), None) is True
+
+    def test_effective_actions_are_not_shared(self):
+        policy = {
+            "Version": "2012-10-17",
+            "Statement": [{"Effect": "Allow", "Action": "s3:Get*", "Resource": "*"}],
+        }
+
+        get_effective_actions(policy).add("ec2:RunInstances")
+
+        assert "ec2:RunInstances" not in get_effective_actions(policy)
+
+    def test_changed_policy_is_evaluated_again(self):
+        policy = {
+            "Version": "2012-10-17",
+            "Statement": [{"Effect": "Allow", "Action": "s3:*", "Resource": "*"}],
+        }
+        assert not check_admin_access(policy)
+
+        policy["Statement"][0]["Action"] = "*"
+
+        assert check_admin_access(policy)
+        assert len(policy_engine) == 2
+
+    def test_policy_not_serializable(self):
+        policy = {
+            "Version": "2012-10-17",
+            "Statement": [{"Effect": "Allow", "Action": "s3:*", "Resource": "*"}],
+            object(): "not a string key",
+        }
+
+        assert PolicyEngine.get_key(policy) is None
+        assert policy_engine.get_document(policy) is None
+        assert get_effective_actions(policy) == reference_get_effective_actions(policy)
+        assert len(policy_engine) == 0
+
+    def test_is_policy_public_arguments_not_hashable(self):
+        policy = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Principal": {"AWS": "arn:aws:iam::111122223333:root"},
+                    "Action": "s3:GetObject",
+                    "Resource": "*",
+                }
+            ],
+        }
+        arguments = [
+            (TRUSTED_AWS_ACCOUNT_NUMBER, True, None, False),
+            (TRUSTED_AWS_ACCOUNT_NUMBER, False, None, False),
+        ]
+
+        # The calls whose arguments cannot be a key are not memoized, not even under a shared key
+        for argument in arguments:
+            assert is_policy_public(policy, *argument) == _is_policy_public(
+                policy, *argument
+            )
+        assert is_policy_public(policy, *arguments[1])
+
+    def test_max_size(self):
+        engine = PolicyEngine(max_size=2)
+        policies = [
+            {"Statement": [{"Effect": "Allow", "Action": action, "Resource": "*"}]}
+            for action in ["s3:GetObject", "s3:PutObject", "iam:PassRole"]
+        ]
+        documents = [engine.get_document(policy) for policy in policies]
+
+        assert len(engine) == 2
+        assert engine.get_document(policies[2]) is documents[2]
+        assert engine.get_document(policies[0]) is not documents[0]
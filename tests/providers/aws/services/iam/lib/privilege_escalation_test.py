@@ -1,8 +1,36 @@
+import random
+from functools import lru_cache
+
+from py_iam_expand.actions import expand_actions
+
+from prowler.providers.aws.services.iam.iam_service import Group, Policy, Role, User
+from prowler.providers.aws.services.iam.lib.policy import get_effective_actions
+from prowler.providers.aws.services.iam.lib.policy_engine import policy_engine
 from prowler.providers.aws.services.iam.lib.privilege_escalation import (
+    PrivilegeEscalationIndex,
     check_privilege_escalation,
     privilege_escalation_policies_combination,
 )
 
+AWS_ACCOUNT_NUMBER = "123456789012"
+
+ACTION_PATTERNS = [
+    "iam:PassRole",
+    "iam:Put*",
+    "iam:CreatePolicyVersion",
+    "iam:AttachRolePolicy",
+    "iam:CreateAccessKey",
+    "ec2:RunInstances",
+    "lambda:CreateFunction",
+    "lambda:InvokeFunction",
+    "lambda:*",
+    "glue:CreateDevEndpoint",
+    "cloudformation:CreateStack",
+    "sts:AssumeRole",
+    "s3:GetObject",
+    "ec2:Describe*",
+]
+
 
 # Helper function to parse the output string into a set for easier comparison
 def parse_result_string(result_str: str) -> set:
@@ -13,6 +41,43 @@ def parse_result_string(result_str: str) -> set:
     return set(part.strip("'") for part in result_str.split(", "))
 
 
+@lru_cache(maxsize=None)
+def reference_expand_actions(action_pattern: str) -> frozenset:
+    return frozenset(expand_actions(action_pattern))
+
+
+def reference_check_privilege_escalation(policy: dict) -> str:
+    """check_privilege_escalation as it was before the action bitsets"""
+    effective_allowed_actions = get_effective_actions(policy)
+    matched_combo_actions = set()
+    for required_actions_patterns in privilege_escalation_policies_combination.values():
+        expanded_required_actions = set()
+        for action_pattern in required_actions_patterns:
+            expanded_required_actions.update(reference_expand_actions(action_pattern))
+        if expanded_required_actions and expanded_required_actions.issubset(
+            effective_allowed_actions
+        ):
+            matched_combo_actions.update(required_actions_patterns)
+    return ", ".join(f"'{action}'" for action in sorted(matched_combo_actions))
+
+
+def generate_statements(generator: random.Random, not_action: bool) -> list:
+    """Returns random Allow and Deny statements over actions of the privilege escalation combinations"""
+    statements = []
+    for _ in range(generator.randint(1, 3)):
+        statement = {
+            "Effect": "Deny" if generator.random() < 0.15 else "Allow",
+            "Resource": "*",
+        }
+        patterns = generator.sample(ACTION_PATTERNS, generator.randint(1, 4))
+        if not_action and generator.random() < 0.2:
+            statement["NotAction"] = patterns
+        else:
+            statement["Action"] = patterns
+        statements.append(statement)
+    return statements
+
+
 class Test_PrivilegeEscalation:
     def test_check_privilege_escalation_no_priv_escalation(self):
         policy = {
@@ -169,3 +234,179 @@ class Test_PrivilegeEscalation:
                 assert (
                     f"'{pattern}'" in result
                 ), f"Expected pattern '{pattern}' not found in result: {result}"
+
+    def test_check_privilege_escalation_parity(self):
+        generator = random.Random(0)
+        policy_engine.clear()
+        for _ in range(300):
+            policy = {
+                "Version": "2012-10-17",
+                "Statement": generate_statements(generator, not_action=True),
+            }
+            assert check_privilege_escalation(
+                policy
+            ) == reference_check_privilege_escalation(policy)
+
+
+class Test_PrivilegeEscalationIndex:
+    def test_index_parity_10k_roles(self):
+        """
+        Every role of a synthetic account gets the same combinations as its policies merged in a single document.
+
+        The policies have no NotAction statements, since the exclusions of NotAction statements of different policies
+        cannot be merged in a single document.
+        """
+        generator = random.Random(0)
+        policies = {}
+        for index in range(300):
+            arn = f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:policy/policy{index}"
+            policies[arn] = Policy(
+                name=f"policy{index}",
+                arn=arn,
+                entity="ABCDEFG",
+                version_id="v1",
+                type="Custom",
+                attached=True,
+                document={
+                    "Version": "2012-10-17",
+                    "Statement": generate_statements(generator, not_action=False),
+                },
+            )
+        policy_arns = list(policies)
+        roles = []
+        for index in range(10_000):
+            arn = f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:role/role{index}"
+            inline_policies = []
+            if generator.random() < 0.3:
+                inline_policies.append("inline")
+                policies[f"{arn}:policy/inline"] = Policy(
+                    name="inline",
+                    arn=f"{arn}:policy/inline",
+                    entity="ABCDEFG",
+                    version_id="v1",
+                    type="Inline",
+                    attached=True,
+                    document={
+                        "Version": "2012-10-17",
+                        "Statement": generate_statements(generator, not_action=False),
+                    },
+                )
+            roles.append(
+                Role(
+                    name=f"role{index}",
+                    arn=arn,
+                    assume_role_policy={},
+                    is_service_role=False,
+                    attached_policies=[
+                        {"PolicyArn": policy_arn, "PolicyName": policy_arn[-8:]}
+                        for policy_arn in generator.sample(
+                            policy_arns, generator.randint(0, 4)
+                        )
+                    ],
+                    inline_policies=inline_policies,
+                )
+            )
+
+        index = PrivilegeEscalationIndex([], roles, [], policies)
+
+        assert len(index.principals) == 10_000
+        for role in roles:
+            role_policy_arns = [
+                attached_policy["PolicyArn"]
+                for attached_policy in role.attached_policies
+            ] + [f"{role.arn}:policy/{name}" for name in role.inline_policies]
+            merged_policy = {
+                "Version": "2012-10-17",
+                "Statement": [
+                    statement
+                    for policy_arn in role_policy_arns
+                    for statement in policies[policy_arn].document["Statement"]
+                ],
+            }
+            assert index.get_privilege_escalation(
+                role.arn
+            ) == reference_check_privilege_escalation(merged_policy)
+
+    def test_index_users_with_group_policies(self):
+        pass_role_policy = Policy(
+            name="pass-role",
+            arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:policy/pass-role",
+            entity="ABCDEFG",
+            version_id="v1",
+            type="Custom",
+            attached=True,
+            document={
+                "Version": "2012-10-17",
+                "Statement": [
+                    {"Effect": "Allow", "Action": "iam:PassRole", "Resource": "*"}
+                ],
+            },
+        )
+        user = User(
+            name="user",
+            arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/user",
+            attached_policies=[
+                {"PolicyArn": pass_role_policy.arn, "PolicyName": "pass-role"}
+            ],
+            inline_policies=[],
+        )
+        other_user = User(
+            name="other-user",
+            arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/other-user",
+            attached_policies=[
+                {"PolicyArn": pass_role_policy.arn, "PolicyName": "pass-role"}
+            ],
+            inline_policies=["deny-ec2"],
+        )
+        group = Group(
+            name="group",
+            arn=f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:group/group",
+            inline_policies=["ec2"],
+            users=[user, other_user],
+        )
+        policies = {
+            pass_role_policy.arn: pass_role_policy,
+            f"{group.arn}:policy/ec2": Policy(
+                name="ec2",
+                arn=f"{group.arn}:policy/ec2",
+                entity="ABCDEFG",
+                version_id="v1",
+                type="Inline",
+                attached=True,
+                document={
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {
+                            "Effect": "Allow",
+                            "Action": "ec2:RunInstances",
+                            "Resource": "*",
+                        }
+                    ],
+                },
+            ),
+            f"{other_user.arn}:policy/deny-ec2": Policy(
+                name="deny-ec2",
+                arn=f"{other_user.arn}:policy/deny-ec2",
+                entity="ABCDEFG",
+                version_id="v1",
+                type="Inline",
+                attached=True,
+                document={
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {"Effect": "Deny", "Action": "ec2:*", "Resource": "*"}
+                    ],
+                },
+            ),
+        }
+
+        index = PrivilegeEscalationIndex([user, other_user], [], [group], policies)
+
+        assert index.get_privilege_escalation(user.arn) == (
+            "'ec2:RunInstances', 'iam:PassRole'"
+        )
+        assert index.get_privilege_escalation(other_user.arn) == ""
+        assert index.get_privilege_escalation(group.arn) == ""
+        assert (
+            index.get_privilege_escalation("arn:aws:iam::111122223333:role/x") is None
+        )
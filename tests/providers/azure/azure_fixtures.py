@@ -37,6 +37,7 @@ def set_mocked_azure_provider(
     provider.identity.locations = locations
     provider.identity = identity
     provider.audit_config = audit_config
+    provider.snapshot = None
     provider.region_config = azure_region_config
 
     return provider
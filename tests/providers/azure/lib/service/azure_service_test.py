@@ -0,0 +1,59 @@
+import threading
+import time
+
+from azure.mgmt.storage import StorageManagementClient
+
+from prowler.providers.azure.lib.service.service import MAX_WORKERS, AzureService
+from prowler.providers.azure.models import AzureIdentityInfo
+from tests.providers.azure.azure_fixtures import (
+    AZURE_SUBSCRIPTION_ID,
+    AZURE_SUBSCRIPTION_NAME,
+    set_mocked_azure_provider,
+)
+
+
+class TestAzureService:
+    def test_AzureService_init(self):
+        service = AzureService(StorageManagementClient, set_mocked_azure_provider())
+
+        assert (
+            service.clients[AZURE_SUBSCRIPTION_ID].__class__.__name__
+            == "StorageManagementClient"
+        )
+        assert service.subscriptions == {AZURE_SUBSCRIPTION_ID: AZURE_SUBSCRIPTION_NAME}
+        assert service.thread_pool._max_workers == MAX_WORKERS
+
+    def test_threading_call_across_subscriptions(self):
+        subscriptions = {f"subscription-{index}": str(index) for index in range(50)}
+        service = AzureService(
+            StorageManagementClient,
+            set_mocked_azure_provider(
+                identity=AzureIdentityInfo(subscriptions=subscriptions)
+            ),
+        )
+
+        active_threads = set()
+        lock = threading.Lock()
+
+        def call(subscription, client):
+            with lock:
+                active_threads.add(threading.current_thread().name)
+            time.sleep(0.001)
+            return subscription, client.__class__.__name__
+
+        results = service.__threading_call__(call)
+
+        assert results == [
+            (subscription, "StorageManagementClient") for subscription in subscriptions
+        ]
+        assert len(active_threads) <= MAX_WORKERS
+
+    def test_threading_call_with_iterator_and_exceptions(self):
+        service = AzureService(StorageManagementClient, set_mocked_azure_provider())
+
+        def call(item):
+            if item == 1:
+                raise ValueError("error")
+            return item * 2
+
+        assert service.__threading_call__(call, [0, 1, 2]) == [0, 4]
@@ -1,8 +1,11 @@
-from unittest.mock import patch
+from asyncio import run
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
+from prowler.providers.azure.config import GRAPH_BATCH_MAX_ATTEMPTS
 from prowler.providers.azure.models import AzureIdentityInfo
 from prowler.providers.azure.services.entra.entra_service import (
+    AuthMethod,
     AuthorizationPolicy,
     ConditionalAccessPolicy,
     DirectoryRole,
@@ -223,3 +226,152 @@ class Test_Entra_Service:
             ]
             == []
         )
+
+
+class Test_Entra_Service_Get_Users:
+    @staticmethod
+    def _mock_graph_client(users_pages, auth_methods):
+        client = Mock()
+        client.users.get = AsyncMock(return_value=users_pages[0])
+        client.users.with_url.return_value.get = AsyncMock(side_effect=users_pages[1:])
+
+        batch_sizes = []
+
+        async def batch_post(batch_request):
+            batch_sizes.append(len(batch_request.requests))
+            batch_response = Mock()
+            batch_response.get_response_status_codes.return_value = {
+                user_id: 200 for user_id in batch_request.requests
+            }
+            batch_response.response_body.side_effect = lambda user_id, _: Mock(
+                value=auth_methods.get(user_id, [])
+            )
+            return batch_response
+
+        client.batch.post = batch_post
+        return client, batch_sizes
+
+    def test_get_users_all_pages_batched(self):
+        users = [
+            Mock(id=f"id-{index}", display_name=f"User {index}") for index in range(45)
+        ]
+        users_pages = [
+            Mock(value=users[:30], odata_next_link="https://next-page"),
+            Mock(value=users[30:], odata_next_link=None),
+        ]
+        auth_methods = {
+            "id-0": [Mock(id="auth-0", odata_type="#microsoft.graph.method")]
+        }
+        client, batch_sizes = self._mock_graph_client(users_pages, auth_methods)
+
+        entra_client = Entra.__new__(Entra)
+        entra_client.clients = {DOMAIN: client}
+        users_result = run(entra_client._get_users())
+
+        assert len(users_result[DOMAIN]) == 45
+        assert users_result[DOMAIN]["id-44"].name == "User 44"
+        assert users_result[DOMAIN]["id-0"].authentication_methods == [
+            AuthMethod(id="auth-0", type="#microsoft.graph.method")
+        ]
+        assert users_result[DOMAIN]["id-1"].authentication_methods == []
+        client.users.with_url.assert_called_once_with("https://next-page")
+        assert sorted(batch_sizes) == [5, 20, 20]
+
+    def test_get_users_authentication_methods_forbidden(self):
+        users_pages = [
+            Mock(
+                value=[Mock(id="id-1", display_name="User 1")],
+                odata_next_link=None,
+            )
+        ]
+        client, _ = self._mock_graph_client(users_pages, {})
+
+        async def forbidden_batch_post(batch_request):
+            batch_response = Mock()
+            batch_response.get_response_status_codes.return_value = {
+                user_id: 403 for user_id in batch_request.requests
+            }
+            return batch_response
+
+        client.batch.post = forbidden_batch_post
+
+        entra_client = Entra.__new__(Entra)
+        entra_client.clients = {DOMAIN: client}
+        users_result = run(entra_client._get_users())
+
+        # The authentication methods are unknown, not empty
+        assert users_result[DOMAIN]["id-1"].authentication_methods is None
+
+    @staticmethod
+    def _throttled_batch_post(throttled_responses, auth_methods):
+        """Batch post throttling every request the first throttled_responses times"""
+        batch_user_ids = []
+
+        async def batch_post(batch_request):
+            batch_user_ids.append(sorted(batch_request.requests))
+            throttled = len(batch_user_ids) <= throttled_responses
+            batch_response = Mock()
+            batch_response.get_response_status_codes.return_value = {
+                user_id: 429 if throttled else 200 for user_id in batch_request.requests
+            }
+            batch_response.get_response_by_id.return_value = Mock(
+                headers={"Retry-After": "3"}
+            )
+            batch_response.response_body.side_effect = lambda user_id, _: Mock(
+                value=auth_methods.get(user_id, [])
+            )
+            return batch_response
+
+        return batch_post, batch_user_ids
+
+    def test_get_users_authentication_methods_throttled(self):
+        users_pages = [
+            Mock(
+                value=[
+                    Mock(id="id-1", display_name="User 1"),
+                    Mock(id="id-2", display_name="User 2"),
+                ],
+                odata_next_link=None,
+            )
+        ]
+        client, _ = self._mock_graph_client(users_pages, {})
+        client.batch.post, batch_user_ids = self._throttled_batch_post(
+            1, {"id-1": [Mock(id="auth-1", odata_type="#microsoft.graph.method")]}
+        )
+
+        entra_client = Entra.__new__(Entra)
+        entra_client.clients = {DOMAIN: client}
+        with patch(
+            "prowler.providers.azure.services.entra.entra_service.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            users_result = run(entra_client._get_users())
+
+        # The throttled requests are sent again after the Retry-After header
+        mock_sleep.assert_awaited_once_with(3.0)
+        assert batch_user_ids == [["id-1", "id-2"], ["id-1", "id-2"]]
+        assert users_result[DOMAIN]["id-1"].authentication_methods == [
+            AuthMethod(id="auth-1", type="#microsoft.graph.method")
+        ]
+        assert users_result[DOMAIN]["id-2"].authentication_methods == []
+
+    def test_get_users_authentication_methods_always_throttled(self):
+        users_pages = [
+            Mock(
+                value=[Mock(id="id-1", display_name="User 1")],
+                odata_next_link=None,
+            )
+        ]
+        client, _ = self._mock_graph_client(users_pages, {})
+        client.batch.post, batch_user_ids = self._throttled_batch_post(10, {})
+
+        entra_client = Entra.__new__(Entra)
+        entra_client.clients = {DOMAIN: client}
+        with patch(
+            "prowler.providers.azure.services.entra.entra_service.sleep",
+            new_callable=AsyncMock,
+        ):
+            users_result = run(entra_client._get_users())
+
+        assert len(batch_user_ids) == GRAPH_BATCH_MAX_ATTEMPTS
+        assert users_result[DOMAIN]["id-1"].authentication_methods is None
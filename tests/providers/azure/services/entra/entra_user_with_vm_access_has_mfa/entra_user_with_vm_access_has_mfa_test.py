@@ -306,3 +306,64 @@ class Test_iam_assignment_priviledge_access_vm_has_mfa:
                 check = entra_user_with_vm_access_has_mfa()
                 result = check.execute()
                 assert len(result) == 0
+
+    def test_entra_user_with_vm_access_has_mfa_unknown_authentication_methods(self):
+        iam_client = mock.MagicMock
+        role_assigment_id = str(uuid4())
+        entra_client = mock.MagicMock
+        user_id = str(uuid4())
+
+        with (
+            mock.patch(
+                "prowler.providers.common.provider.Provider.get_global_provider",
+                return_value=set_mocked_azure_provider(),
+            ),
+            mock.patch(
+                "prowler.providers.azure.services.entra.entra_user_with_vm_access_has_mfa.entra_user_with_vm_access_has_mfa.iam_client",
+                new=iam_client,
+            ),
+        ):
+            with (
+                mock.patch(
+                    "prowler.providers.common.provider.Provider.get_global_provider",
+                    return_value=set_mocked_azure_provider(),
+                ),
+                mock.patch(
+                    "prowler.providers.azure.services.entra.entra_user_with_vm_access_has_mfa.entra_user_with_vm_access_has_mfa.entra_client",
+                    new=entra_client,
+                ),
+            ):
+                from prowler.providers.azure.services.entra.entra_service import User
+                from prowler.providers.azure.services.entra.entra_user_with_vm_access_has_mfa.entra_user_with_vm_access_has_mfa import (
+                    entra_user_with_vm_access_has_mfa,
+                )
+                from prowler.providers.azure.services.iam.iam_service import (
+                    RoleAssignment,
+                )
+
+                iam_client.role_assignments = {
+                    AZURE_SUBSCRIPTION_ID: {
+                        role_assigment_id: RoleAssignment(
+                            id=role_assigment_id,
+                            name="test",
+                            scope=AZURE_SUBSCRIPTION_ID,
+                            role_id=VIRTUAL_MACHINE_ADMINISTRATOR_LOGIN_ROLE_ID,
+                            agent_type="User",
+                            agent_id=user_id,
+                        )
+                    }
+                }
+
+                entra_client.users = {
+                    DOMAIN: {
+                        f"test@{DOMAIN}": User(
+                            id=user_id,
+                            name="test",
+                            authentication_methods=None,
+                        )
+                    }
+                }
+
+                check = entra_user_with_vm_access_has_mfa()
+                result = check.execute()
+                assert len(result) == 0
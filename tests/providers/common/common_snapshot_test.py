@@ -0,0 +1,78 @@
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from prowler.providers.common.snapshot import Snapshot
+
+
+class TestSnapshot:
+    def test_record_save_and_replay(self, tmp_path):
+        path = str(tmp_path / "scan.json.gz")
+        response = {
+            "Buckets": [
+                {
+                    "Name": "bucket",
+                    "CreationDate": datetime(2024, 1, 1, tzinfo=timezone.utc),
+                }
+            ],
+            "Body": b"\x00content",
+            "Count": 1,
+            "Truncated": False,
+        }
+        snapshot = Snapshot(path)
+        snapshot.metadata["region_name"] = "eu-west-1"
+        key = Snapshot.get_key("aws", "s3", "eu-west-1", "ListBuckets", {})
+        snapshot.record(key, response)
+        snapshot.save()
+
+        replayed_snapshot = Snapshot(path, replay=True)
+
+        assert replayed_snapshot.replay
+        assert replayed_snapshot.metadata == {"region_name": "eu-west-1"}
+        assert replayed_snapshot.get_response(key) == response
+        assert replayed_snapshot.get_response("unknown") is None
+        with gzip.open(path, "rt") as snapshot_file:
+            assert json.load(snapshot_file)["version"] == 1
+
+    def test_recorded_response_does_not_change(self):
+        snapshot = Snapshot("scan.json.gz")
+        response = {"Users": [{"UserName": "user"}]}
+
+        snapshot.record("key", response)
+        response["Users"].append({"UserName": "other-user"})
+        replayed_response = snapshot.get_response("key")
+        replayed_response["Users"].clear()
+
+        assert snapshot.get_response("key") == {"Users": [{"UserName": "user"}]}
+
+    def test_repeated_requests_are_replayed_in_order(self):
+        snapshot = Snapshot("scan.json.gz")
+        snapshot.record("key", {"State": "STARTED"})
+        snapshot.record("key", {"State": "COMPLETE"})
+
+        assert snapshot.get_response("key") == {"State": "STARTED"}
+        assert snapshot.get_response("key") == {"State": "COMPLETE"}
+        # The last response is repeated
+        assert snapshot.get_response("key") == {"State": "COMPLETE"}
+
+    def test_get_key(self):
+        now = datetime.now(timezone.utc)
+
+        assert Snapshot.get_key("aws", {"b": 1, "a": 2}) == Snapshot.get_key(
+            "aws", {"a": 2, "b": 1}
+        )
+        assert Snapshot.get_key("aws", {"a": 1}) != Snapshot.get_key("aws", {"a": 2})
+        # The time windows of the requests do not change the key
+        assert Snapshot.get_key("aws", {"StartTime": now}) == Snapshot.get_key(
+            "aws", {"StartTime": now - timedelta(days=1)}
+        )
+
+    def test_replay_other_version(self, tmp_path):
+        path = str(tmp_path / "scan.json.gz")
+        with gzip.open(path, "wt") as snapshot_file:
+            json.dump({"version": 0, "metadata": {}, "responses": {}}, snapshot_file)
+
+        with pytest.raises(ValueError):
+            Snapshot(path, replay=True)
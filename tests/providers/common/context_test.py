@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from prowler.providers.common.context import (
+    ScanContext,
+    ServiceClient,
+    get_scan_context,
+)
+
+
+class Service:
+    def __init__(self, provider):
+        self.provider = provider
+        self.thread_pool = ThreadPoolExecutor(max_workers=1)
+
+
+class TestScanContext:
+    def test_get_service(self):
+        provider = mock.MagicMock()
+        context = ScanContext(provider)
+
+        service = context.get_service(Service)
+
+        assert service.provider is provider
+        assert context.get_service(Service) is service
+        assert context.services == {Service: service}
+
+    def test_activate(self):
+        context = ScanContext(mock.MagicMock())
+        assert get_scan_context() is None
+
+        with context.activate():
+            assert get_scan_context() is context
+            with ScanContext(mock.MagicMock()).activate() as other_context:
+                assert get_scan_context() is other_context
+            assert get_scan_context() is context
+
+        assert get_scan_context() is None
+
+    def test_close(self):
+        context = ScanContext(mock.MagicMock())
+        service = context.get_service(Service)
+        context.cache["key"] = "value"
+
+        context.close()
+
+        assert context.services == {}
+        assert context.cache == {}
+        assert service.thread_pool._shutdown
+
+
+class TestServiceClient:
+    def test_service_client_without_context(self):
+        global_provider = mock.MagicMock()
+        with mock.patch(
+            "prowler.providers.common.provider.Provider.get_global_provider",
+            return_value=global_provider,
+        ):
+            service_client = ServiceClient(Service)
+
+        assert service_client.provider is global_provider
+        service_client.audit_config = {"key": "value"}
+        assert service_client.audit_config == {"key": "value"}
+
+    def test_service_client_with_context(self):
+        global_provider = mock.MagicMock()
+        with mock.patch(
+            "prowler.providers.common.provider.Provider.get_global_provider",
+            return_value=global_provider,
+        ):
+            service_client = ServiceClient(Service)
+        contexts = [ScanContext(mock.MagicMock()) for _ in range(2)]
+
+        def get_provider(context):
+            with context.activate():
+                return service_client.provider
+
+        with ThreadPoolExecutor(max_workers=len(contexts)) as executor:
+            providers = list(executor.map(get_provider, contexts))
+
+        assert providers == [context.provider for context in contexts]
+        assert service_client.provider is global_provider
+
+    def test_service_client_imported_in_context(self):
+        context = ScanContext(mock.MagicMock())
+        with mock.patch(
+            "prowler.providers.common.provider.Provider.get_global_provider"
+        ) as get_global_provider:
+            with context.activate():
+                service_client = ServiceClient(Service)
+                # The service is not built until a check uses it
+                assert context.services == {}
+                assert service_client.provider is context.provider
+            get_global_provider.assert_not_called()
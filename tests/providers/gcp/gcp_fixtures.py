@@ -29,6 +29,7 @@ def set_mocked_gcp_provider(
     }
     provider.project_ids = project_ids
     provider.default_project_id = GCP_PROJECT_ID
+    provider.snapshot = None
     provider.identity = GCPIdentityInfo(
         profile=profile,
     )
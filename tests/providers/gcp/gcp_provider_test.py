@@ -88,6 +88,7 @@ class TestGCPProvider:
             assert gcp_provider.default_project_id == "test-project"
             assert gcp_provider.identity == GCPIdentityInfo(profile="default")
             assert gcp_provider.audit_config == {
+                "max_api_requests_per_second": 0,
                 "shodan_api_key": None,
                 "max_unused_account_days": 180,
             }
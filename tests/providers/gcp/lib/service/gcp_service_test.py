@@ -0,0 +1,241 @@
+import threading
+import time
+
+from google.auth.credentials import AnonymousCredentials
+from mock import MagicMock, patch
+
+from prowler.providers.common.context import ScanContext
+from prowler.providers.gcp.lib.service.service import (
+    MAX_WORKERS,
+    APIMetrics,
+    APIRateLimiter,
+    GCPService,
+    RateLimitedHttp,
+    build_client,
+    get_discovery_document,
+    get_scan_state,
+)
+from tests.providers.gcp.gcp_fixtures import GCP_PROJECT_ID, set_mocked_gcp_provider
+
+GCP_PROJECT_ID_2 = "210987654321"
+
+
+def mock_serviceusage_client(enabled_services: dict):
+    client = MagicMock()
+
+    def mock_list(parent, filter):
+        request = MagicMock()
+        request.execute.return_value = {
+            "services": [
+                {"name": f"{parent}/services/{service}"}
+                for service in enabled_services[parent.split("/")[-1]]
+            ]
+        }
+        return request
+
+    client.services().list = MagicMock(side_effect=mock_list)
+    client.services().list_next.return_value = None
+    return client
+
+
+class TestGCPService:
+    def test_build_client_uses_cached_static_discovery_document(self):
+        get_discovery_document.cache_clear()
+        build_client("compute", "v1", AnonymousCredentials())
+        client = build_client("compute", "v1", AnonymousCredentials())
+
+        assert get_discovery_document.cache_info().misses == 1
+        assert get_discovery_document.cache_info().hits == 1
+        assert hasattr(client, "instances")
+
+    def test_is_api_active_lists_enabled_services_once_per_project(self):
+        provider = set_mocked_gcp_provider([GCP_PROJECT_ID, GCP_PROJECT_ID_2])
+        provider.skip_api_check = False
+        serviceusage_client = mock_serviceusage_client(
+            {
+                GCP_PROJECT_ID: ["compute.googleapis.com", "iam.googleapis.com"],
+                GCP_PROJECT_ID_2: ["iam.googleapis.com"],
+            }
+        )
+        with (
+            patch(
+                "prowler.providers.gcp.lib.service.service.GCPService.__generate_client__",
+                return_value=MagicMock(),
+            ),
+            patch(
+                "prowler.providers.gcp.lib.service.service.build_client",
+                return_value=serviceusage_client,
+            ),
+        ):
+            compute = GCPService("compute", provider)
+            iam = GCPService("iam", provider)
+
+        assert compute.project_ids == [GCP_PROJECT_ID]
+        assert iam.project_ids == [GCP_PROJECT_ID, GCP_PROJECT_ID_2]
+        assert serviceusage_client.services().list.call_count == 2
+
+    def test_is_api_active_fallback_when_listing_fails(self):
+        provider = set_mocked_gcp_provider([GCP_PROJECT_ID])
+        provider.skip_api_check = False
+        serviceusage_client = MagicMock()
+        serviceusage_client.services().list.side_effect = Exception("Forbidden")
+        serviceusage_client.services().get().execute.return_value = {"state": "ENABLED"}
+        with (
+            patch(
+                "prowler.providers.gcp.lib.service.service.GCPService.__generate_client__",
+                return_value=MagicMock(),
+            ),
+            patch(
+                "prowler.providers.gcp.lib.service.service.build_client",
+                return_value=serviceusage_client,
+            ),
+        ):
+            compute = GCPService("compute", provider)
+
+        assert compute.project_ids == [GCP_PROJECT_ID]
+        assert get_scan_state(provider).enabled_services[GCP_PROJECT_ID] is None
+
+    def test_enabled_services_are_not_shared_across_scans(self):
+        provider = set_mocked_gcp_provider([GCP_PROJECT_ID])
+        provider.skip_api_check = False
+        other_provider = set_mocked_gcp_provider([GCP_PROJECT_ID])
+        other_provider.skip_api_check = False
+        serviceusage_client = mock_serviceusage_client(
+            {GCP_PROJECT_ID: ["compute.googleapis.com"]}
+        )
+        with (
+            patch(
+                "prowler.providers.gcp.lib.service.service.GCPService.__generate_client__",
+                return_value=MagicMock(),
+            ),
+            patch(
+                "prowler.providers.gcp.lib.service.service.build_client",
+                return_value=serviceusage_client,
+            ),
+        ):
+            GCPService("compute", provider)
+            GCPService("iam", provider)
+            # Other providers, e.g. with other credentials, list the enabled services again
+            GCPService("compute", other_provider)
+            # And so do the scans, even with the same provider
+            for _ in range(2):
+                scan_context = ScanContext(provider)
+                with scan_context.activate():
+                    GCPService("compute", provider)
+                    GCPService("iam", provider)
+                scan_context.close()
+
+        assert serviceusage_client.services().list.call_count == 4
+        assert get_scan_state(provider) is not get_scan_state(other_provider)
+
+    def test_api_rate_limiters_and_metrics_are_not_shared_across_scans(self):
+        provider = set_mocked_gcp_provider([GCP_PROJECT_ID])
+        provider.skip_api_check = True
+        with patch(
+            "prowler.providers.gcp.lib.service.service.GCPService.__generate_client__",
+            return_value=MagicMock(),
+        ):
+            services = []
+            for max_api_requests_per_second in (10, 20):
+                provider.audit_config = {
+                    "max_api_requests_per_second": max_api_requests_per_second
+                }
+                scan_context = ScanContext(provider)
+                with scan_context.activate():
+                    services.append(
+                        (
+                            GCPService("compute", provider),
+                            GCPService("compute", provider),
+                        )
+                    )
+                scan_context.close()
+
+        # The services of a scan share the API rate limiter and metrics
+        for compute, other_compute in services:
+            assert compute.rate_limiter is other_compute.rate_limiter
+            assert compute.metrics is other_compute.metrics
+        # Every scan uses its own limit and counts its own requests
+        first_scan_compute, second_scan_compute = services[0][0], services[1][0]
+        assert first_scan_compute.rate_limiter.interval == 1 / 10
+        assert second_scan_compute.rate_limiter.interval == 1 / 20
+        assert first_scan_compute.metrics is not second_scan_compute.metrics
+
+    def test_threading_call_bounded_pool(self):
+        provider = set_mocked_gcp_provider([GCP_PROJECT_ID])
+        provider.skip_api_check = True
+        provider.audit_config = {}
+        with patch(
+            "prowler.providers.gcp.lib.service.service.GCPService.__generate_client__",
+            return_value=MagicMock(),
+        ):
+            service = GCPService("storage", provider)
+
+        processed = []
+        active_threads = set()
+        lock = threading.Lock()
+
+        def call(item):
+            with lock:
+                active_threads.add(threading.current_thread().name)
+            time.sleep(0.001)
+            with lock:
+                processed.append(item)
+
+        service.__threading_call__(call, range(500))
+
+        assert sorted(processed) == list(range(500))
+        assert len(active_threads) <= MAX_WORKERS
+        assert service.metrics.max_active_workers <= MAX_WORKERS
+        assert service.metrics.active_workers == 0
+
+    def test_threading_call_handles_exceptions(self):
+        provider = set_mocked_gcp_provider([GCP_PROJECT_ID])
+        provider.skip_api_check = True
+        provider.audit_config = {}
+        with patch(
+            "prowler.providers.gcp.lib.service.service.GCPService.__generate_client__",
+            return_value=MagicMock(),
+        ):
+            service = GCPService("storage", provider)
+
+        processed = []
+
+        def call(item):
+            if item == 1:
+                raise ValueError("error")
+            processed.append(item)
+
+        service.__threading_call__(call, [0, 1, 2])
+
+        assert sorted(processed) == [0, 2]
+
+
+class TestAPIRateLimiter:
+    def test_acquire_without_limit(self):
+        rate_limiter = APIRateLimiter()
+        start = time.monotonic()
+        for _ in range(100):
+            rate_limiter.acquire()
+        assert time.monotonic() - start < 0.1
+
+    def test_acquire_with_limit(self):
+        rate_limiter = APIRateLimiter(requests_per_second=100)
+        start = time.monotonic()
+        for _ in range(11):
+            rate_limiter.acquire()
+        assert time.monotonic() - start >= 0.09
+
+
+class TestRateLimitedHttp:
+    def test_request_counts_throttled_responses(self):
+        metrics = APIMetrics()
+        http = RateLimitedHttp(APIRateLimiter(), metrics)
+        with patch(
+            "httplib2.Http.request",
+            side_effect=[(MagicMock(status=429), b""), (MagicMock(status=200), b"")],
+        ):
+            http.request("https://compute.googleapis.com")
+            http.request("https://compute.googleapis.com")
+
+        assert metrics.requests == 2
+        assert metrics.throttled_requests == 1
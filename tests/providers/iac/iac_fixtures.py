@@ -1,3 +1,7 @@
+import os
+
+from dulwich import porcelain
+
 # IAC Provider Constants
 DEFAULT_SCAN_PATH = "."
 
@@ -288,3 +292,47 @@ def get_empty_trivy_output():
 def get_invalid_trivy_output():
     """Return invalid JSON output as string"""
     return "invalid json output"
+
+
+def get_trivy_process(stdout: str):
+    """Return a mocked Trivy process streaming the given output"""
+    import io
+    from unittest.mock import MagicMock
+
+    process = MagicMock()
+    process.stdout = io.StringIO(stdout)
+    process.poll.return_value = 0
+    process.wait.return_value = 0
+    return process
+
+
+def write_file(directory, path, content="content"):
+    """Write a file creating its parent directories"""
+    file_path = os.path.join(directory, path)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "w") as file:
+        file.write(content)
+
+
+def commit_all(repository_path, message="commit"):
+    """Commit every change of a local git repository and return the commit SHA"""
+    with porcelain.open_repo_closing(repository_path) as repository:
+        status = porcelain.status(repository)
+        paths = [
+            os.path.join(
+                repository_path, path.decode() if isinstance(path, bytes) else path
+            )
+            for path in list(status.unstaged) + list(status.untracked)
+        ]
+        existing_paths = [path for path in paths if os.path.exists(path)]
+        deleted_paths = [path for path in paths if not os.path.exists(path)]
+        if existing_paths:
+            porcelain.add(repository, existing_paths)
+        if deleted_paths:
+            porcelain.remove(repository, deleted_paths, cached=True)
+        return porcelain.commit(
+            repository,
+            message=message.encode(),
+            author=b"Prowler <prowler@example.com>",
+            committer=b"Prowler <prowler@example.com>",
+        ).decode()
@@ -0,0 +1,201 @@
+import json
+import os
+
+from dulwich import porcelain
+
+from prowler.providers.iac.lib.incremental.incremental import (
+    BASELINE_RESULTS_VERSION,
+    get_changed_paths,
+    get_head_commit,
+    get_local_module_directories,
+    get_uncommitted_paths,
+    load_baseline_results,
+    merge_results,
+    save_baseline_results,
+    stage_changed_paths,
+)
+from tests.providers.iac.iac_fixtures import commit_all, write_file
+
+
+def init_repository(tmp_path):
+    repository_path = str(tmp_path / "repository")
+    porcelain.init(repository_path)
+    write_file(repository_path, "main.tf")
+    write_file(repository_path, "modules/network/main.tf")
+    write_file(repository_path, "modules/network/variables.tf")
+    write_file(repository_path, "k8s/deployment.yaml")
+    return repository_path, commit_all(repository_path, "baseline")
+
+
+class TestIacIncremental:
+    def test_get_head_commit(self, tmp_path):
+        repository_path, baseline_commit = init_repository(tmp_path)
+
+        assert get_head_commit(repository_path) == baseline_commit
+        assert get_head_commit(str(tmp_path)) is None
+
+    def test_get_changed_paths_committed_changes(self, tmp_path):
+        repository_path, baseline_commit = init_repository(tmp_path)
+        write_file(repository_path, "modules/network/main.tf", "changed")
+        os.remove(os.path.join(repository_path, "k8s/deployment.yaml"))
+        commit_all(repository_path, "change")
+
+        assert get_changed_paths(repository_path, baseline_commit) == {
+            "modules/network/main.tf",
+            "k8s/deployment.yaml",
+        }
+
+    def test_get_changed_paths_uncommitted_changes(self, tmp_path):
+        repository_path, baseline_commit = init_repository(tmp_path)
+        write_file(repository_path, "main.tf", "changed")
+        write_file(repository_path, "new/Dockerfile")
+
+        assert get_changed_paths(repository_path, baseline_commit) == {
+            "main.tf",
+            "new/Dockerfile",
+        }
+        assert get_uncommitted_paths(repository_path) == ["main.tf", "new/Dockerfile"]
+
+    def test_get_changed_paths_scan_path_subdirectory(self, tmp_path):
+        repository_path, baseline_commit = init_repository(tmp_path)
+        write_file(repository_path, "main.tf", "changed")
+        write_file(repository_path, "modules/network/variables.tf", "changed")
+
+        assert get_changed_paths(
+            os.path.join(repository_path, "modules"), baseline_commit
+        ) == {"network/variables.tf"}
+
+    def test_get_changed_paths_unknown_ref(self, tmp_path):
+        repository_path, _ = init_repository(tmp_path)
+
+        assert get_changed_paths(repository_path, "does-not-exist") is None
+
+    def test_get_changed_paths_not_a_repository(self, tmp_path):
+        assert get_changed_paths(str(tmp_path), "HEAD") is None
+
+    def test_stage_changed_paths(self, tmp_path):
+        repository_path, _ = init_repository(tmp_path)
+        staging_directory = str(tmp_path / "staging")
+        os.makedirs(staging_directory)
+
+        rescanned_paths = stage_changed_paths(
+            repository_path,
+            {"modules/network/main.tf", "deleted/main.tf"},
+            staging_directory,
+        )
+
+        assert rescanned_paths == {
+            "modules/network/main.tf",
+            "modules/network/variables.tf",
+            "deleted/main.tf",
+        }
+        assert sorted(
+            os.listdir(os.path.join(staging_directory, "modules/network"))
+        ) == [
+            "main.tf",
+            "variables.tf",
+        ]
+        assert not os.path.exists(os.path.join(staging_directory, "main.tf"))
+
+    def test_get_local_module_directories(self, tmp_path):
+        repository_path, _ = init_repository(tmp_path)
+        write_file(
+            repository_path,
+            "main.tf",
+            'module "network" {\n  source = "./modules/network"\n}\n'
+            'module "remote" {\n  source = "terraform-aws-modules/vpc/aws"\n}\n',
+        )
+        write_file(
+            repository_path,
+            "environments/prod/main.tf",
+            'module "network" {\n  source  = "../../modules/network"\n}\n',
+        )
+
+        assert get_local_module_directories(repository_path) == {
+            ("", "modules/network"),
+            ("environments/prod", "modules/network"),
+        }
+
+    def test_stage_changed_paths_local_modules(self, tmp_path):
+        repository_path, _ = init_repository(tmp_path)
+        write_file(
+            repository_path,
+            "environments/prod/main.tf",
+            'module "network" {\n  source = "../../modules/network"\n}\n',
+        )
+        staging_directory = str(tmp_path / "staging")
+        os.makedirs(staging_directory)
+
+        # A changed configuration calling a local module or a changed local module need a full scan
+        for changed_path in ["environments/prod/main.tf", "modules/network/main.tf"]:
+            assert (
+                stage_changed_paths(repository_path, {changed_path}, staging_directory)
+                is None
+            )
+        assert not os.listdir(staging_directory)
+        assert stage_changed_paths(
+            repository_path, {"k8s/deployment.yaml"}, staging_directory
+        ) == {"k8s/deployment.yaml"}
+
+    def test_merge_results(self):
+        baseline_results = [
+            {"Target": "main.tf", "Misconfigurations": [{"ID": "old"}]},
+            {"Target": "k8s/deployment.yaml", "Misconfigurations": [{"ID": "kept"}]},
+            {"Target": "deleted.tf", "Misconfigurations": [{"ID": "deleted"}]},
+        ]
+        new_results = [{"Target": "main.tf", "Misconfigurations": [{"ID": "new"}]}]
+
+        assert merge_results(
+            baseline_results, new_results, {"main.tf", "deleted.tf"}
+        ) == [
+            {"Target": "k8s/deployment.yaml", "Misconfigurations": [{"ID": "kept"}]},
+            {"Target": "main.tf", "Misconfigurations": [{"ID": "new"}]},
+        ]
+
+    def test_save_and_load_baseline_results(self, tmp_path):
+        baseline_results_file = str(tmp_path / "baseline" / "results.json")
+        results = [{"Target": "main.tf", "Misconfigurations": []}]
+
+        save_baseline_results(
+            baseline_results_file,
+            "abc123",
+            ["main.tf"],
+            ["misconfig", "secret"],
+            [],
+            results,
+        )
+        baseline = load_baseline_results(
+            baseline_results_file, ["secret", "misconfig"], []
+        )
+
+        assert baseline == {
+            "Version": BASELINE_RESULTS_VERSION,
+            "Commit": "abc123",
+            "UncommittedPaths": ["main.tf"],
+            "Scanners": ["misconfig", "secret"],
+            "ExcludePath": [],
+            "Results": results,
+        }
+        assert os.listdir(tmp_path / "baseline") == ["results.json"]
+
+    def test_load_baseline_results_different_options(self, tmp_path):
+        baseline_results_file = str(tmp_path / "results.json")
+        save_baseline_results(baseline_results_file, "abc123", [], ["vuln"], [], [])
+
+        assert load_baseline_results(baseline_results_file, ["secret"], []) is None
+        assert (
+            load_baseline_results(baseline_results_file, ["vuln"], ["vendor"]) is None
+        )
+
+    def test_load_baseline_results_missing_or_invalid(self, tmp_path):
+        baseline_results_file = str(tmp_path / "results.json")
+
+        assert load_baseline_results(baseline_results_file, ["vuln"], []) is None
+
+        with open(baseline_results_file, "w") as file:
+            file.write("{invalid")
+        assert load_baseline_results(baseline_results_file, ["vuln"], []) is None
+
+        with open(baseline_results_file, "w") as file:
+            json.dump({"Version": 0}, file)
+        assert load_baseline_results(baseline_results_file, ["vuln"], []) is None
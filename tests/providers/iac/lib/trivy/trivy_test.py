@@ -0,0 +1,72 @@
+import io
+import json
+
+import pytest
+
+from prowler.providers.iac.lib.trivy.trivy import stream_trivy_results
+from tests.providers.iac.iac_fixtures import (
+    SAMPLE_TRIVY_OUTPUT,
+    get_empty_trivy_output,
+    get_invalid_trivy_output,
+    get_sample_trivy_json_output,
+)
+
+
+class TestStreamTrivyResults:
+    def test_stream_trivy_results(self):
+        results = list(
+            stream_trivy_results(io.StringIO(get_sample_trivy_json_output()))
+        )
+
+        assert results == SAMPLE_TRIVY_OUTPUT["Results"]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64])
+    def test_stream_trivy_results_small_chunks(self, chunk_size):
+        output = json.dumps(
+            {
+                "SchemaVersion": 2,
+                "ArtifactName": ".",
+                "Results": SAMPLE_TRIVY_OUTPUT["Results"],
+                "Trailing": [1, 2.5, None, True],
+            },
+            indent=2,
+        )
+
+        results = list(stream_trivy_results(io.StringIO(output), chunk_size))
+
+        assert results == SAMPLE_TRIVY_OUTPUT["Results"]
+
+    def test_stream_trivy_results_large_output(self):
+        targets = [
+            {
+                "Target": f"module_{index}/main.tf",
+                "Type": "terraform",
+                "Misconfigurations": [{"ID": f"AVD-{index}", "Message": "x" * 512}],
+            }
+            for index in range(2000)
+        ]
+        output = json.dumps({"Results": targets})
+
+        results = stream_trivy_results(io.StringIO(output), 4096)
+
+        assert next(results) == targets[0]
+        assert list(results) == targets[1:]
+
+    def test_stream_trivy_results_empty(self):
+        assert list(stream_trivy_results(io.StringIO(get_empty_trivy_output()))) == []
+        assert list(stream_trivy_results(io.StringIO("{}"))) == []
+        assert list(stream_trivy_results(io.StringIO('{"Results": null}'))) == []
+
+    @pytest.mark.parametrize(
+        "output",
+        [
+            get_invalid_trivy_output(),
+            "null",
+            "",
+            '{"Results": [{"Target": "main.tf"}',
+            '{"Results": [{"Target": "main.tf"} {"Target": "other.tf"}]}',
+        ],
+    )
+    def test_stream_trivy_results_invalid_output(self, output):
+        with pytest.raises(ValueError):
+            list(stream_trivy_results(io.StringIO(output), 8))
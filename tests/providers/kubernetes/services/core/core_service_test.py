@@ -0,0 +1,91 @@
+from mock import patch
+
+from kubernetes import client
+from prowler.providers.kubernetes.services.core.core_service import PODS_PAGE_SIZE, Core
+from tests.providers.kubernetes.kubernetes_fixtures import (
+    KUBERNETES_NAMESPACE,
+    set_mocked_kubernetes_provider,
+)
+
+
+class FakeCoreV1Api:
+    """Fake Kubernetes API server paginating the pods with limit and continue tokens."""
+
+    def __init__(self, pods_per_namespace: dict):
+        self.pods_per_namespace = pods_per_namespace
+        self.list_namespaced_pod_calls = []
+
+    def list_namespaced_pod(self, namespace, limit=None, _continue=None):
+        self.list_namespaced_pod_calls.append((namespace, limit, _continue))
+        start = int(_continue) if _continue else 0
+        end = start + limit
+        pods = self.pods_per_namespace.get(namespace, [])
+        return client.V1PodList(
+            items=pods[start:end],
+            metadata=client.V1ListMeta(_continue=str(end) if end < len(pods) else None),
+        )
+
+    def list_config_map_for_all_namespaces(self):
+        return client.V1ConfigMapList(items=[])
+
+    def list_node(self):
+        return client.V1NodeList(items=[])
+
+
+def build_pod(namespace: str, index: int) -> client.V1Pod:
+    return client.V1Pod(
+        metadata=client.V1ObjectMeta(
+            name=f"pod-{index}", uid=f"{namespace}-{index}", namespace=namespace
+        ),
+        spec=client.V1PodSpec(
+            containers=[
+                client.V1Container(
+                    name="container",
+                    image="nginx",
+                    security_context=client.V1SecurityContext(privileged=True),
+                )
+            ],
+            host_network=True,
+        ),
+        status=client.V1PodStatus(phase="Running"),
+    )
+
+
+class TestCoreService:
+    def test_get_pods_paginated_across_namespaces(self):
+        namespaces = [KUBERNETES_NAMESPACE, "kube-system"]
+        pods_per_namespace = {
+            KUBERNETES_NAMESPACE: [
+                build_pod(KUBERNETES_NAMESPACE, index)
+                for index in range(PODS_PAGE_SIZE * 2 + 1)
+            ],
+            "kube-system": [build_pod("kube-system", 0)],
+        }
+        fake_api = FakeCoreV1Api(pods_per_namespace)
+        provider = set_mocked_kubernetes_provider()
+        provider.namespaces = namespaces
+
+        with patch(
+            "prowler.providers.kubernetes.services.core.core_service.client.CoreV1Api",
+            return_value=fake_api,
+        ):
+            core = Core(provider)
+
+        assert len(core.pods) == PODS_PAGE_SIZE * 2 + 2
+        assert sorted(fake_api.list_namespaced_pod_calls, key=str) == sorted(
+            [
+                (KUBERNETES_NAMESPACE, PODS_PAGE_SIZE, None),
+                (KUBERNETES_NAMESPACE, PODS_PAGE_SIZE, str(PODS_PAGE_SIZE)),
+                (KUBERNETES_NAMESPACE, PODS_PAGE_SIZE, str(PODS_PAGE_SIZE * 2)),
+                ("kube-system", PODS_PAGE_SIZE, None),
+            ],
+            key=str,
+        )
+
+        pod = core.pods[f"{KUBERNETES_NAMESPACE}-0"]
+        assert pod.name == "pod-0"
+        assert pod.namespace == KUBERNETES_NAMESPACE
+        assert pod.host_network
+        assert pod.status_phase == "Running"
+        assert pod.containers["container"].image == "nginx"
+        assert pod.containers["container"].security_context["privileged"]
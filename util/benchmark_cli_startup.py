@@ -0,0 +1,153 @@
+"""
+Benchmark of the CLI startup.
+
+It runs common invocations of the CLI with `python -X importtime`, reporting the
+wall time, the time spent importing modules and the slowest top-level imports of
+each one. It exits with an error if an invocation takes longer than its import
+time threshold or imports one of the modules it must not import, e.g. the SDK of
+another provider, to catch startup regressions.
+
+Usage:
+    python util/benchmark_cli_startup.py
+    python util/benchmark_cli_startup.py --runs 5 --top 10
+    python util/benchmark_cli_startup.py --threshold-factor 2
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Invocations as (arguments, import time threshold in seconds, modules that must not be imported)
+INVOCATIONS = [
+    (
+        ["--version"],
+        1.0,
+        ["boto3", "kubernetes", "pyarrow", "py_ocsf_models", "azure", "google"],
+    ),
+    (
+        ["aws", "--list-checks"],
+        1.0,
+        ["boto3", "kubernetes", "pyarrow", "py_ocsf_models", "azure", "google"],
+    ),
+    (
+        ["aws", "--list-services"],
+        1.0,
+        ["boto3", "kubernetes", "pyarrow", "py_ocsf_models", "azure", "google"],
+    ),
+    (
+        ["aws", "--list-compliance"],
+        1.0,
+        ["boto3", "kubernetes", "pyarrow", "py_ocsf_models", "azure", "google"],
+    ),
+    (
+        ["aws", "--list-checks", "--compliance", "cis_2.0_aws"],
+        1.0,
+        ["boto3", "kubernetes", "pyarrow", "py_ocsf_models", "azure", "google"],
+    ),
+    (
+        ["azure", "--list-checks"],
+        1.0,
+        ["boto3", "kubernetes", "pyarrow", "py_ocsf_models", "azure", "google"],
+    ),
+    (
+        ["kubernetes", "--list-categories"],
+        1.0,
+        ["boto3", "kubernetes", "pyarrow", "py_ocsf_models", "azure", "google"],
+    ),
+]
+
+
+def parse_importtime(stderr: str) -> tuple[float, dict[str, float], list[str]]:
+    """
+    Parses the output of `python -X importtime`.
+
+    Returns:
+        tuple: The total import time, the cumulative time of every top-level import, both in seconds, and the
+            imported modules.
+    """
+    total = 0.0
+    top_level_imports = {}
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative, module = line.removeprefix("import time:").split("|")
+        total += int(self_time) / 1_000_000
+        modules.append(module.strip())
+        # Nested imports are indented under the module that imports them
+        if not module.startswith("  "):
+            top_level_imports[module.strip()] = int(cumulative) / 1_000_000
+    return total, top_level_imports, modules
+
+
+def run(arguments: list[str]) -> tuple[float, float, dict[str, float], list[str]]:
+    """Runs the CLI and returns the wall time, import time, top-level imports and imported modules"""
+    # The version is only printed when it is the sole argument, so it cannot take --no-banner
+    if arguments != ["--version"]:
+        arguments = [*arguments, "--no-banner"]
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "prowler", *arguments],
+        cwd=ROOT_DIRECTORY,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    wall_time = time.perf_counter() - start
+    import_time, top_level_imports, modules = parse_importtime(process.stderr)
+    return wall_time, import_time, top_level_imports, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--runs", type=int, default=3, help="Runs of every invocation, the best counts."
+    )
+    parser.add_argument(
+        "--top", type=int, default=5, help="Slowest top-level imports to show."
+    )
+    parser.add_argument(
+        "--threshold-factor",
+        type=float,
+        default=1.0,
+        help="Factor applied to the thresholds, e.g. for slower CI machines.",
+    )
+    arguments = parser.parse_args()
+
+    regressions = []
+    for invocation, threshold, forbidden_modules in INVOCATIONS:
+        results = [run(invocation) for _ in range(arguments.runs)]
+        wall_time, import_time, top_level_imports, modules = min(
+            results, key=lambda result: result[1]
+        )
+        print(
+            f"prowler {' '.join(invocation)}: {wall_time:.2f}s, imports {import_time:.2f}s"
+        )
+        for module, cumulative in sorted(
+            top_level_imports.items(), key=lambda item: item[1], reverse=True
+        )[: arguments.top]:
+            print(f"  {cumulative:.3f}s {module}")
+
+        threshold *= arguments.threshold_factor
+        if import_time > threshold:
+            regressions.append(
+                f"prowler {' '.join(invocation)} imports take {import_time:.2f}s, more than {threshold:.2f}s"
+            )
+        imported = {module.split(".")[0] for module in modules}
+        for module in forbidden_modules:
+            if module in imported:
+                regressions.append(f"prowler {' '.join(invocation)} imports {module}")
+
+    if regressions:
+        print("\nStartup regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
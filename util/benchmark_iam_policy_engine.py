@@ -0,0 +1,130 @@
+"""
+Benchmark of the IAM policy engine.
+
+It evaluates synthetic policy documents with the helpers of
+prowler/providers/aws/services/iam/lib/policy.py, as the IAM checks do, once
+with the policy engine and once clearing its caches before every evaluation,
+which is the cost of evaluating every document from scratch.
+
+Usage:
+    python util/benchmark_iam_policy_engine.py --policies 5000 --unique 500
+    python util/benchmark_iam_policy_engine.py --policies 2000 --uncached-sample 200
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prowler.providers.aws.services.iam.lib.policy import (  # noqa: E402
+    check_admin_access,
+    check_full_service_access,
+    get_effective_actions,
+    is_policy_public,
+)
+from prowler.providers.aws.services.iam.lib.policy_engine import (  # noqa: E402
+    expand_action_pattern,
+    policy_engine,
+)
+
+ACTION_PATTERNS = [
+    "*",
+    "s3:*",
+    "s3:Get*",
+    "s3:List*",
+    "s3:PutObject",
+    "ec2:Describe*",
+    "ec2:RunInstances",
+    "iam:*",
+    "iam:PassRole",
+    "iam:Get*",
+    "lambda:*",
+    "lambda:InvokeFunction",
+    "sts:AssumeRole",
+    "kms:Decrypt",
+    "dynamodb:*",
+    "logs:CreateLogStream",
+]
+RESOURCES = ["*", "arn:aws:s3:::bucket/*", "arn:aws:iam::123456789012:role/*"]
+
+
+def generate_policies(policies: int, unique: int, seed: int) -> list:
+    """Returns the policy documents, with unique different contents, like the managed policies attached to many entities"""
+    generator = random.Random(seed)
+    contents = []
+    for _ in range(unique):
+        statements = []
+        for _ in range(generator.randint(1, 5)):
+            actions = generator.sample(ACTION_PATTERNS, generator.randint(1, 4))
+            statements.append(
+                {
+                    "Effect": "Deny" if generator.random() < 0.2 else "Allow",
+                    ("NotAction" if generator.random() < 0.1 else "Action"): actions,
+                    "Resource": generator.choice(RESOURCES),
+                }
+            )
+        contents.append(statements)
+    # Each document is a new dict, as returned by the IAM API for every entity
+    return [
+        {"Version": "2012-10-17", "Statement": generator.choice(contents)}
+        for _ in range(policies)
+    ]
+
+
+def evaluate(policy: dict) -> None:
+    get_effective_actions(policy)
+    check_admin_access(policy)
+    for service in ["s3", "iam", "*"]:
+        check_full_service_access(service, policy)
+    is_policy_public(policy, "123456789012")
+
+
+def benchmark(name: str, policies: list, clear_caches: bool) -> float:
+    policy_engine.clear()
+    expand_action_pattern.cache_clear()
+    start = time.perf_counter()
+    for policy in policies:
+        if clear_caches:
+            policy_engine.clear()
+            expand_action_pattern.cache_clear()
+        evaluate(policy)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name}: {len(policies)} policies in {elapsed:.2f}s "
+        f"({len(policies) / elapsed:,.0f} policies/s)"
+    )
+    return elapsed / len(policies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--policies", type=int, default=5_000)
+    parser.add_argument(
+        "--unique", type=int, default=500, help="Different policy contents."
+    )
+    parser.add_argument(
+        "--uncached-sample",
+        type=int,
+        default=500,
+        help="Policies evaluated without the caches, 0 to skip it.",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+
+    policies = generate_policies(arguments.policies, arguments.unique, arguments.seed)
+
+    engine = benchmark("Policy engine", policies, clear_caches=False)
+    print(f"  Documents in the engine: {len(policy_engine)}")
+
+    if arguments.uncached_sample:
+        uncached = benchmark(
+            "Without caches", policies[: arguments.uncached_sample], clear_caches=True
+        )
+        print(f"  Speedup: {uncached / engine:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Benchmark of the JSON-OCSF output.
+
+It writes synthetic findings with the streaming writer (`OCSF.write_findings`), which
+serializes the dictionaries of `OCSF.get_finding_dict`, and, for a sample of them, with the
+in-memory path (`OCSF.transform` plus `batch_write_data_to_file`), which builds the
+py-ocsf-models, and reports the speedup of the former.
+
+Usage:
+    python util/benchmark_ocsf_output.py --findings 1000000 --legacy-sample 10000
+    python util/benchmark_ocsf_output.py --format ndjson --gzip
+"""
+
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prowler.lib.check.models import (  # noqa: E402
+    CheckMetadata,
+    Code,
+    Recommendation,
+    Remediation,
+)
+from prowler.lib.outputs.finding import Finding  # noqa: E402
+from prowler.lib.outputs.ocsf.ocsf import OCSF  # noqa: E402
+
+SEVERITIES = ["critical", "high", "medium", "low", "informational"]
+REGIONS = ["eu-west-1", "us-east-1", "ap-south-1"]
+
+
+def generate_findings(count: int):
+    """Yield synthetic findings, only one of them is alive at a time."""
+    metadata = [
+        CheckMetadata(
+            Provider="aws",
+            CheckID=f"service_check_{index}",
+            CheckTitle=f"Check {index}",
+            CheckType=["Software and Configuration Checks"],
+            ServiceName="service",
+            SubServiceName="",
+            ResourceIdTemplate="",
+            Severity=SEVERITIES[index % len(SEVERITIES)],
+            ResourceType="AwsResource",
+            Description="Check description " * 10,
+            Risk="Check risk " * 10,
+            RelatedUrl="https://docs.aws.amazon.com",
+            Remediation=Remediation(
+                Code=Code(NativeIaC="", Terraform="", CLI="", Other=""),
+                Recommendation=Recommendation(
+                    Text="Recommendation", Url="https://docs.aws.amazon.com"
+                ),
+            ),
+            Categories=["encryption"],
+            DependsOn=[],
+            RelatedTo=[],
+            Notes="",
+        )
+        for index in range(len(SEVERITIES) * 20)
+    ]
+    timestamp = datetime.now()
+    for index in range(count):
+        yield Finding(
+            auth_method="profile: default",
+            timestamp=timestamp,
+            account_uid="123456789012",
+            account_name="benchmark",
+            account_organization_uid="o-benchmark",
+            account_organization_name="benchmark",
+            account_tags={"environment": "benchmark"},
+            uid=f"prowler-aws-benchmark-{index}",
+            status="FAIL" if index % 3 else "PASS",
+            status_extended=f"Resource {index} is not compliant.",
+            muted=index % 10 == 0,
+            resource_uid=f"arn:aws:service:eu-west-1:123456789012:resource/{index}",
+            resource_metadata={"Id": index, "Name": f"resource-{index}"},
+            resource_name=f"resource-{index}",
+            resource_details="",
+            resource_tags={"owner": "benchmark", "index": str(index)},
+            partition="aws",
+            region=REGIONS[index % len(REGIONS)],
+            compliance={"CIS-2.0": ["1.1", "1.2"], "ISO27001-2013": ["A.10.1"]},
+            metadata=metadata[index % len(metadata)],
+        )
+
+
+def benchmark(name: str, function) -> float:
+    """Runs the writer and returns its throughput in findings per second."""
+    start = time.perf_counter()
+    findings = function()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name}: {findings} findings in {elapsed:.2f}s "
+        f"({findings / elapsed:,.0f} findings/s)"
+    )
+    return findings / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--findings", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["json", "ndjson"], default="json")
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument(
+        "--legacy-sample",
+        type=int,
+        default=10_000,
+        help="Findings written with the in-memory path, 0 to skip it.",
+    )
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as output_directory:
+        suffix = ".ocsf.ndjson" if arguments.format == "ndjson" else ".ocsf.json"
+        if arguments.gzip:
+            suffix += ".gz"
+        file_path = os.path.join(output_directory, f"benchmark{suffix}")
+
+        def stream():
+            OCSF(findings=[], file_path=file_path).write_findings(
+                generate_findings(arguments.findings)
+            )
+            return arguments.findings
+
+        streaming_throughput = benchmark("Streaming writer", stream)
+        print(f"  Output size: {os.path.getsize(file_path) / 1024 / 1024:.1f} MiB")
+
+        if arguments.legacy_sample:
+            legacy_path = os.path.join(output_directory, "legacy.ocsf.json")
+
+            def legacy():
+                output = OCSF(
+                    findings=list(generate_findings(arguments.legacy_sample)),
+                    file_path=legacy_path,
+                )
+                output.batch_write_data_to_file()
+                return arguments.legacy_sample
+
+            legacy_throughput = benchmark("In-memory writer", legacy)
+            print(
+                f"  Streaming speedup: {streaming_throughput / legacy_throughput:.1f}x"
+            )
+
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        max_rss /= 1024
+    print(f"Peak memory: {max_rss / 1024:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Generate the checks index used by the listing commands of the CLI.
+
+It writes prowler/config/checks_index.json with the metadata of the checks and the
+checks of the compliance frameworks of every provider, so `--list-checks`,
+`--list-services`, `--list-categories` and `--list-compliance` do not load all the
+metadata files. Run it after adding, removing or changing checks or compliance
+frameworks, the CLI ignores the index of a provider that is outdated.
+
+Usage:
+    python util/generate_checks_index.py
+    python util/generate_checks_index.py --provider aws --provider azure
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prowler.lib.check.checks_index import (  # noqa: E402
+    build_checks_index,
+    checks_index_file,
+)
+from prowler.providers.common.provider import Provider  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--provider",
+        action="append",
+        help="Provider to index, all the providers with checks by default.",
+    )
+    parser.add_argument("--output", default=checks_index_file)
+    arguments = parser.parse_args()
+
+    # The IaC provider checks are the Trivy rules, they are not listed from the metadata files
+    providers = arguments.provider or [
+        provider for provider in Provider.get_available_providers() if provider != "iac"
+    ]
+    index = build_checks_index(providers)
+    with open(arguments.output, "w", encoding="utf-8") as index_file:
+        json.dump(index, index_file, indent=1, sort_keys=True)
+        index_file.write("\n")
+
+    for provider, provider_index in index["providers"].items():
+        print(
+            f"{provider}: {len(provider_index['checks'])} checks, {len(provider_index['compliance'])} compliance frameworks"
+        )
+    print(f"Checks index written to {arguments.output}")
+
+
+if __name__ == "__main__":
+    main()